@@ -0,0 +1,15 @@
+#!/bin/bash
+
+set -e
+
+LOGLEVEL=${CELERY_LOGLEVEL:-INFO}
+
+mkdir -p tmp
+
+# Set defaults for OTEL
+export OTEL_SERVICE_NAME="${OTEL_SERVICE_NAME:-openklant-beat}"
+
+echo "Starting celery beat"
+exec celery --workdir src --app openklant.celery beat \
+    -l $LOGLEVEL \
+    -s ../tmp/celerybeat-schedule
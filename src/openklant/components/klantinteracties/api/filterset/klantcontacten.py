@@ -188,9 +188,11 @@ class KlantcontactFilterSet(FilterSet):
         return queryset.filter(Exists(subquery))
 
     def filter_betrokkene_digitaal_adres(self, queryset, name, value):
-        subquery = Betrokkene.objects.filter(
-            klantcontact_id=OuterRef("pk"),
-            digitaaladres__adres__icontains=value,
+        # filter the digitale adressen first, so the trigram index on the adres can be
+        # used instead of scanning the adressen of every betrokkene
+        subquery = DigitaalAdres.objects.filter(
+            adres__icontains=value,
+            betrokkene__klantcontact_id=OuterRef("pk"),
         )
         return queryset.filter(Exists(subquery))
 
@@ -13,6 +13,7 @@ from openklant.components.klantinteracties.models.partijen import (
     PartijIdentificator,
     Vertegenwoordigden,
 )
+from openklant.components.klantinteracties.zoeken import search_partijen
 from openklant.components.utils.filters import ExpandFilter, URLViewFilter
 
 
@@ -206,6 +207,27 @@ class PartijFilterSet(FilterSet):
             return queryset.none()
 
 
+class PartijZoekFilterSet(FilterSet):
+    q = filters.CharFilter(
+        required=True,
+        min_length=2,
+        method="filter_q",
+        help_text=_(
+            "Zoek partijen op (een deel van) de naam, een adres, een digitaal adres of "
+            "het object ID van een partij-identificator. De partijen die het best "
+            "overeenkomen worden als eerste teruggegeven."
+        ),
+    )
+    expand = ExpandFilter(serializer_class=PartijSerializer)
+
+    class Meta:
+        model = Partij
+        fields = ("q",)
+
+    def filter_q(self, queryset, name, value):
+        return search_partijen(queryset, value)
+
+
 class VertegenwoordigdenFilterSet(FilterSet):
     vertegenwoordigende_partij__url = URLViewFilter(
         help_text=_(
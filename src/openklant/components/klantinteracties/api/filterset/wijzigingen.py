@@ -0,0 +1,18 @@
+from django.utils.translation import gettext_lazy as _
+
+from django_filters.rest_framework import filters
+from vng_api_common.filtersets import FilterSet
+
+from openklant.components.klantinteracties.models.constants import WijzigingResource
+from openklant.components.klantinteracties.models.wijzigingen import Wijziging
+
+
+class WijzigingFilterSet(FilterSet):
+    resource = filters.ChoiceFilter(
+        choices=WijzigingResource.choices,
+        help_text=_("Geef alleen de wijzigingen van deze soort resource terug."),
+    )
+
+    class Meta:
+        model = Wijziging
+        fields = ("resource",)
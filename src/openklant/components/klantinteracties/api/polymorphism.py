@@ -15,6 +15,8 @@ from vng_api_common.polymorphism import (
     PolymorphicSerializerMetaclass as VngPolymorphicSerializerMetaclass,
 )
 
+from openklant.components.utils.compiled import compile_polymorphic, register_compiler
+
 logger = structlog.stdlib.get_logger(__name__)
 
 
@@ -157,5 +159,12 @@ class PolymorphicSerializer(
         super().__init__(instance, data, **kwargs)
 
     def to_representation(self, instance):
-        self.discriminator.context = self.context
+        # the discriminator is removed if the group field isn't requested
+        if self.discriminator is not None:
+            self.discriminator.context = self.context
         return super().to_representation(instance)
+
+
+# the discriminator only receives the context, which the compiled representation
+# passes to the serializers of the discriminator as well
+register_compiler(PolymorphicSerializer.to_representation)(compile_polymorphic)
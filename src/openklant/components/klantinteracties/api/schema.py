@@ -283,5 +283,6 @@ custom_settings = {
         },
         {"name": "rekeningnummers"},
         {"name": "vertegenwoordigingen"},
+        {"name": "wijzigingen"},
     ],
 }
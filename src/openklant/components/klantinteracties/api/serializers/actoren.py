@@ -16,11 +16,16 @@ from openklant.components.klantinteracties.models.actoren import (
     OrganisatorischeEenheid,
 )
 from openklant.components.klantinteracties.models.constants import SoortActor
+from openklant.components.utils.api import (
+    HyperlinkedModelSerializer,
+    ReferenceListSerializer,
+)
 
 
-class ActorForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class ActorForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Actor
+        list_serializer_class = ReferenceListSerializer
         fields = (
             "uuid",
             "url",
@@ -17,13 +17,19 @@ from openklant.components.klantinteracties.models.digitaal_adres import (
 )
 from openklant.components.klantinteracties.models.klantcontacten import Betrokkene
 from openklant.components.klantinteracties.models.partijen import Partij
+from openklant.components.utils.api import (
+    HyperlinkedModelSerializer,
+    ReferenceListSerializer,
+)
+from openklant.utils.identity_map import get_object
 from openklant.utils.serializers import get_field_value
 from openklant.utils.validators import phonenumber_regex
 
 
-class DigitaalAdresForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class DigitaalAdresForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = DigitaalAdres
+        list_serializer_class = ReferenceListSerializer
         fields = (
             "uuid",
             "url",
@@ -38,7 +44,7 @@ class DigitaalAdresForeignKeySerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class DigitaalAdresSerializer(serializers.HyperlinkedModelSerializer):
+class DigitaalAdresSerializer(HyperlinkedModelSerializer):
     from openklant.components.klantinteracties.api.serializers.klantcontacten import (
         BetrokkeneForeignKeySerializer,
     )
@@ -206,13 +212,13 @@ class DigitaalAdresSerializer(serializers.HyperlinkedModelSerializer):
     def update(self, instance, validated_data):
         if "partij" in validated_data:
             if partij := validated_data.pop("partij", None):
-                partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+                partij = get_object(Partij, partij["uuid"])
 
             validated_data["partij"] = partij
 
         if "betrokkene" in validated_data:
             if betrokkene := validated_data.pop("betrokkene", None):
-                betrokkene = Betrokkene.objects.get(uuid=str(betrokkene.get("uuid")))
+                betrokkene = get_object(Betrokkene, betrokkene["uuid"])
 
             validated_data["betrokkene"] = betrokkene
 
@@ -221,11 +227,9 @@ class DigitaalAdresSerializer(serializers.HyperlinkedModelSerializer):
     @transaction.atomic
     def create(self, validated_data):
         if partij := validated_data.pop("partij", None):
-            validated_data["partij"] = Partij.objects.get(uuid=str(partij.get("uuid")))
+            validated_data["partij"] = get_object(Partij, partij["uuid"])
 
         if betrokkene := validated_data.pop("betrokkene", None):
-            validated_data["betrokkene"] = Betrokkene.objects.get(
-                uuid=str(betrokkene.get("uuid"))
-            )
+            validated_data["betrokkene"] = get_object(Betrokkene, betrokkene["uuid"])
 
         return super().create(validated_data)
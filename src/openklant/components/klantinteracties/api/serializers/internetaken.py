@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import extend_schema_serializer
@@ -16,9 +17,11 @@ from openklant.components.klantinteracties.models.actoren import Actor
 from openklant.components.klantinteracties.models.constants import Taakstatus
 from openklant.components.klantinteracties.models.internetaken import InterneTaak
 from openklant.components.klantinteracties.models.klantcontacten import Klantcontact
+from openklant.components.utils.api import HyperlinkedModelSerializer
+from openklant.utils.identity_map import get_object, prefetch_objects
 
 
-class InterneTaakForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class InterneTaakForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = InterneTaak
         fields = (
@@ -36,7 +39,7 @@ class InterneTaakForeignKeySerializer(serializers.HyperlinkedModelSerializer):
 
 
 @extend_schema_serializer(deprecate_fields=["toegewezen_aan_actor", "nummer"])
-class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
+class InterneTaakSerializer(HyperlinkedModelSerializer):
     toegewezen_aan_actor = ActorForeignKeySerializer(
         required=False,
         allow_null=False,
@@ -58,6 +61,14 @@ class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
         source="klantcontact",
     )
 
+    # the actoren in the order in which they were assigned to the interne taak
+    prefetch_related_lookups = (
+        Prefetch(
+            "actoren",
+            queryset=Actor.objects.order_by("internetakenactorenthoughmodel__pk"),
+        ),
+    )
+
     class Meta:
         model = InterneTaak
         fields = (
@@ -85,6 +96,13 @@ class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
+        if (
+            "actoren" in getattr(instance, "_prefetched_objects_cache", {})
+            and instance.actoren.all().ordered
+        ):
+            # the ordered actoren are already used by the fields
+            return response
+
         actoren_query = instance.actoren.order_by("internetakenactorenthoughmodel__pk")
         response["toegewezen_aan_actor"] = ActorForeignKeySerializer(
             actoren_query.first(), context={**self.context}
@@ -125,7 +143,8 @@ class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
         else:
             actor_uuids = [glom(actoren, "first.uuid", skip_exc=PathAccessError)]
 
-        return [Actor.objects.get(uuid=uuid) for uuid in actor_uuids]
+        prefetch_objects(Actor, actor_uuids)
+        return [get_object(Actor, uuid) for uuid in actor_uuids]
 
     def validate(self, attrs):
         self._validate_actoren()
@@ -150,9 +169,7 @@ class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
         actoren = validated_data.pop("actoren", None)
         klantcontact_uuid = str(validated_data.pop("klantcontact").get("uuid"))
 
-        validated_data["klantcontact"] = Klantcontact.objects.get(
-            uuid=klantcontact_uuid
-        )
+        validated_data["klantcontact"] = get_object(Klantcontact, klantcontact_uuid)
 
         internetaak = super().create(validated_data)
         if actoren:
@@ -171,14 +188,14 @@ class InterneTaakSerializer(serializers.HyperlinkedModelSerializer):
 
         if "klantcontact" in validated_data:
             if klantcontact := validated_data.pop("klantcontact", None):
-                validated_data["klantcontact"] = Klantcontact.objects.get(
-                    uuid=str(klantcontact.get("uuid"))
+                validated_data["klantcontact"] = get_object(
+                    Klantcontact, klantcontact["uuid"]
                 )
 
         return super().update(instance, validated_data)
 
 
-class KlantcontactInterneTaakSerializer(serializers.HyperlinkedModelSerializer):
+class KlantcontactInterneTaakSerializer(HyperlinkedModelSerializer):
     actor = ActorForeignKeySerializer(
         required=True,
         allow_null=False,
@@ -1,9 +1,12 @@
+from uuid import UUID
+
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 import structlog
 from drf_spectacular.utils import extend_schema_field, extend_schema_serializer
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from vng_api_common.serializers import GegevensGroepSerializer, NestedGegevensGroepMixin
 from vng_api_common.utils import get_help_text
 
@@ -25,11 +28,14 @@ from openklant.components.klantinteracties.api.validators import (
     bijlage_exists,
     klantcontact_exists,
     onderwerpobject_exists,
+    partij_exists,
 )
+from openklant.components.klantinteracties.constants import BulkResultaat
 from openklant.components.klantinteracties.models.actoren import (
     Actor,
     ActorKlantcontact,
 )
+from openklant.components.klantinteracties.models.constants import Wijzigingsactie
 from openklant.components.klantinteracties.models.klantcontacten import (
     Betrokkene,
     Bijlage,
@@ -37,11 +43,19 @@ from openklant.components.klantinteracties.models.klantcontacten import (
     Onderwerpobject,
 )
 from openklant.components.klantinteracties.models.partijen import Partij
+from openklant.components.klantinteracties.versies import (
+    deferred_versies,
+    schedule_versie_update,
+)
+from openklant.components.klantinteracties.wijzigingen import record_wijzigingen
+from openklant.components.utils.api import HyperlinkedModelSerializer
+from openklant.utils.decorators import handle_db_exceptions
+from openklant.utils.identity_map import get_object
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
-class BetrokkeneForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class BetrokkeneForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Betrokkene
         fields = (
@@ -58,7 +72,7 @@ class BetrokkeneForeignKeySerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class KlantcontactForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class KlantcontactForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Klantcontact
         fields = (
@@ -75,7 +89,7 @@ class KlantcontactForeignKeySerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class OnderwerpobjectForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class OnderwerpobjectForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Onderwerpobject
         fields = (
@@ -95,7 +109,7 @@ class OnderwerpobjectForeignKeySerializer(serializers.HyperlinkedModelSerializer
         }
 
 
-class BijlageForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class BijlageForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Bijlage
         fields = (
@@ -142,9 +156,7 @@ class ContactnaamSerializer(GegevensGroepSerializer):
         gegevensgroep = "contactnaam"
 
 
-class BetrokkeneSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
-):
+class BetrokkeneSerializer(NestedGegevensGroepMixin, HyperlinkedModelSerializer):
     from openklant.components.klantinteracties.api.serializers.partijen import (
         PartijForeignKeySerializer,
     )
@@ -234,14 +246,14 @@ class BetrokkeneSerializer(
     def update(self, instance, validated_data):
         if "partij" in validated_data:
             if partij := validated_data.pop("partij", None):
-                partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+                partij = get_object(Partij, partij["uuid"])
 
             validated_data["partij"] = partij
 
         if "klantcontact" in validated_data:
             if klantcontact := validated_data.pop("klantcontact", None):
-                validated_data["klantcontact"] = Klantcontact.objects.get(
-                    uuid=str(klantcontact.get("uuid"))
+                validated_data["klantcontact"] = get_object(
+                    Klantcontact, klantcontact["uuid"]
                 )
 
         return super().update(instance, validated_data)
@@ -249,12 +261,10 @@ class BetrokkeneSerializer(
     @transaction.atomic
     def create(self, validated_data):
         klantcontact_uuid = str(validated_data.pop("klantcontact").get("uuid"))
-        validated_data["klantcontact"] = Klantcontact.objects.get(
-            uuid=klantcontact_uuid
-        )
+        validated_data["klantcontact"] = get_object(Klantcontact, klantcontact_uuid)
 
         if partij := validated_data.pop("partij", None):
-            partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+            partij = get_object(Partij, partij["uuid"])
 
         validated_data["partij"] = partij
 
@@ -262,7 +272,7 @@ class BetrokkeneSerializer(
 
 
 @extend_schema_serializer(deprecate_fields=["nummer"])
-class KlantcontactSerializer(serializers.HyperlinkedModelSerializer):
+class KlantcontactSerializer(HyperlinkedModelSerializer):
     from openklant.components.klantinteracties.api.serializers.internetaken import (
         InterneTaakForeignKeySerializer,
     )
@@ -304,6 +314,14 @@ class KlantcontactSerializer(serializers.HyperlinkedModelSerializer):
         ),
     )
 
+    # relations used by `get_had_betrokken_actoren`
+    prefetch_related_lookups = (
+        "actorklantcontact_set__actor__geautomatiseerdeactor",
+        "actorklantcontact_set__actor__medewerker",
+        "actorklantcontact_set__actor__organisatorischeeenheid",
+    )
+    field_sources = {"had_betrokken_actoren": ("actorklantcontact_set",)}
+
     inclusion_serializers = {
         # 1 level
         "had_betrokkenen": f"{SERIALIZER_PATH}.klantcontacten.BetrokkeneSerializer",
@@ -370,9 +388,7 @@ class OnderwerpobjectidentificatorSerializer(GegevensGroepSerializer):
         gegevensgroep = "onderwerpobjectidentificator"
 
 
-class OnderwerpobjectSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
-):
+class OnderwerpobjectSerializer(NestedGegevensGroepMixin, HyperlinkedModelSerializer):
     klantcontact = KlantcontactForeignKeySerializer(
         required=False,
         allow_null=True,
@@ -415,17 +431,13 @@ class OnderwerpobjectSerializer(
     def update(self, instance, validated_data):
         if "klantcontact" in validated_data:
             if klantcontact := validated_data.pop("klantcontact", None):
-                klantcontact = Klantcontact.objects.get(
-                    uuid=str(klantcontact.get("uuid"))
-                )
+                klantcontact = get_object(Klantcontact, klantcontact["uuid"])
 
             validated_data["klantcontact"] = klantcontact
 
         if "was_klantcontact" in validated_data:
             if was_klantcontact := validated_data.pop("was_klantcontact", None):
-                was_klantcontact = Klantcontact.objects.get(
-                    uuid=str(was_klantcontact.get("uuid"))
-                )
+                was_klantcontact = get_object(Klantcontact, was_klantcontact["uuid"])
 
             validated_data["was_klantcontact"] = was_klantcontact
 
@@ -434,12 +446,10 @@ class OnderwerpobjectSerializer(
     @transaction.atomic
     def create(self, validated_data):
         if klantcontact := validated_data.pop("klantcontact", None):
-            klantcontact = Klantcontact.objects.get(uuid=str(klantcontact.get("uuid")))
+            klantcontact = get_object(Klantcontact, klantcontact["uuid"])
 
         if was_klantcontact := validated_data.pop("was_klantcontact", None):
-            was_klantcontact = Klantcontact.objects.get(
-                uuid=str(was_klantcontact.get("uuid"))
-            )
+            was_klantcontact = get_object(Klantcontact, was_klantcontact["uuid"])
 
         validated_data["klantcontact"] = klantcontact
         validated_data["was_klantcontact"] = was_klantcontact
@@ -453,9 +463,7 @@ class BijlageIdentificatorSerializer(GegevensGroepSerializer):
         gegevensgroep = "bijlageidentificator"
 
 
-class BijlageSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
-):
+class BijlageSerializer(NestedGegevensGroepMixin, HyperlinkedModelSerializer):
     was_bijlage_van_klantcontact = KlantcontactForeignKeySerializer(
         required=False,
         allow_null=True,
@@ -492,9 +500,7 @@ class BijlageSerializer(
     def update(self, instance, validated_data):
         if "klantcontact" in validated_data:
             if klantcontact := validated_data.pop("klantcontact", None):
-                klantcontact = Klantcontact.objects.get(
-                    uuid=str(klantcontact.get("uuid"))
-                )
+                klantcontact = get_object(Klantcontact, klantcontact["uuid"])
             validated_data["klantcontact"] = klantcontact
 
         return super().update(instance, validated_data)
@@ -502,14 +508,14 @@ class BijlageSerializer(
     @transaction.atomic
     def create(self, validated_data):
         if klantcontact := validated_data.pop("klantcontact", None):
-            validated_data["klantcontact"] = Klantcontact.objects.get(
-                uuid=str(klantcontact.get("uuid"))
+            validated_data["klantcontact"] = get_object(
+                Klantcontact, klantcontact["uuid"]
             )
 
         return super().create(validated_data)
 
 
-class ActorKlantcontactSerializer(serializers.HyperlinkedModelSerializer):
+class ActorKlantcontactSerializer(HyperlinkedModelSerializer):
     actor = ActorForeignKeySerializer(
         required=True,
         help_text=get_help_text("klantinteracties.ActorKlantcontact", "actor"),
@@ -551,14 +557,14 @@ class ActorKlantcontactSerializer(serializers.HyperlinkedModelSerializer):
     def update(self, instance, validated_data):
         if "actor" in validated_data:
             if actor := validated_data.pop("actor", None):
-                actor = Actor.objects.get(uuid=str(actor.get("uuid")))
+                actor = get_object(Actor, actor["uuid"])
 
             validated_data["actor"] = actor
 
         if "klantcontact" in validated_data:
             if klantcontact := validated_data.pop("klantcontact", None):
-                validated_data["klantcontact"] = Klantcontact.objects.get(
-                    uuid=str(klantcontact.get("uuid"))
+                validated_data["klantcontact"] = get_object(
+                    Klantcontact, klantcontact["uuid"]
                 )
 
         return super().update(instance, validated_data)
@@ -566,12 +572,10 @@ class ActorKlantcontactSerializer(serializers.HyperlinkedModelSerializer):
     @transaction.atomic
     def create(self, validated_data):
         actor_uuid = str(validated_data.pop("actor").get("uuid"))
-        validated_data["actor"] = Actor.objects.get(uuid=actor_uuid)
+        validated_data["actor"] = get_object(Actor, actor_uuid)
 
         klantcontact_uuid = str(validated_data.pop("klantcontact").get("uuid"))
-        validated_data["klantcontact"] = Klantcontact.objects.get(
-            uuid=klantcontact_uuid
-        )
+        validated_data["klantcontact"] = get_object(Klantcontact, klantcontact_uuid)
 
         return super().create(validated_data)
 
@@ -629,3 +633,200 @@ class MaakKlantcontactSerializer(serializers.Serializer):
             "betrokkene": betrokkene,
             "onderwerpobject": onderwerpobject,
         }
+
+
+# the unique fields of a klantcontact which can be given in a bulk request
+KLANTCONTACT_UNIQUE_FIELDS = ("nummer", "referentienummer")
+
+
+class MaakKlantcontactBulkSerializer(MaakKlantcontactSerializer):
+    """
+    Klantcontact in een bulkverzoek, met de betrokkene en het onderwerpobject.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # the references and the uniqueness of the unique fields of all items are
+        # checked at once by `bulk_maak_klantcontacten`
+        for field_name in KLANTCONTACT_UNIQUE_FIELDS:
+            field = self.fields["klantcontact"].fields[field_name]
+            field.validators = [
+                validator
+                for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        was_partij = self.fields["betrokkene"].fields["was_partij"]
+        was_partij.fields["uuid"].validators.remove(partij_exists)
+        was_klantcontact = self.fields["onderwerpobject"].fields["was_klantcontact"]
+        was_klantcontact.fields["uuid"].validators.remove(klantcontact_exists)
+
+
+class MaakKlantcontactBulkResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField(
+        help_text=_("De positie van het klantcontact in het verzoek."),
+    )
+    resultaat = serializers.ChoiceField(
+        choices=BulkResultaat.choices,
+        help_text=_("Het resultaat van het verwerken van het klantcontact."),
+    )
+    klantcontact = KlantcontactForeignKeySerializer(
+        allow_null=True,
+        help_text=_("Het aangemaakte klantcontact."),
+    )
+    betrokkene = BetrokkeneForeignKeySerializer(
+        allow_null=True,
+        help_text=_("De aangemaakte betrokkene bij het klantcontact."),
+    )
+    onderwerpobject = OnderwerpobjectForeignKeySerializer(
+        allow_null=True,
+        help_text=_("Het aangemaakte onderwerpobject van het klantcontact."),
+    )
+    fouten = serializers.DictField(
+        allow_null=True,
+        help_text=_("De validatiefouten van een ongeldig klantcontact."),
+    )
+
+
+def get_reference_uuid(item: dict, field: str, reference: str) -> UUID | None:
+    if (data := item.get(field)) and (value := data.get(reference)):
+        return value["uuid"]
+    return None
+
+
+@handle_db_exceptions
+@transaction.atomic
+@deferred_versies()
+def bulk_maak_klantcontacten(
+    items: list[dict],
+) -> list[tuple[Klantcontact, Betrokkene | None, Onderwerpobject | None] | dict]:
+    """
+    Create the validated klantcontacten of a bulk request, with their betrokkene and
+    onderwerpobject.
+
+    The partijen and klantcontacten which are referenced by the items, and the
+    klantcontacten with the same nummer or referentienummer, are looked up with a
+    single query each, after which the objects are inserted with one query per model. For every item,
+    ``(klantcontact, betrokkene, onderwerpobject)`` or the validation errors of the
+    item are returned.
+    """
+    partij_uuids = [get_reference_uuid(item, "betrokkene", "partij") for item in items]
+    was_klantcontact_uuids = [
+        get_reference_uuid(item, "onderwerpobject", "was_klantcontact")
+        for item in items
+    ]
+    unique_values = {
+        field: [item["klantcontact"].get(field) for item in items]
+        for field in KLANTCONTACT_UNIQUE_FIELDS
+    }
+
+    partijen = Partij.objects.in_bulk(
+        [uuid for uuid in partij_uuids if uuid], field_name="uuid"
+    )
+    was_klantcontacten = Klantcontact.objects.in_bulk(
+        [uuid for uuid in was_klantcontact_uuids if uuid], field_name="uuid"
+    )
+    existing_values = {
+        field: set(
+            Klantcontact.objects.filter(
+                **{f"{field}__in": [value for value in values if value]}
+            ).values_list(field, flat=True)
+        )
+        for field, values in unique_values.items()
+    }
+
+    results: list[
+        tuple[Klantcontact, Betrokkene | None, Onderwerpobject | None] | dict
+    ] = []
+    seen_values = {field: set() for field in KLANTCONTACT_UNIQUE_FIELDS}
+    for index, (item, partij_uuid, was_klantcontact_uuid) in enumerate(
+        zip(items, partij_uuids, was_klantcontact_uuids)
+    ):
+        errors = {}
+        klantcontact_errors = {}
+        for field, values in unique_values.items():
+            value = values[index]
+            if not value:
+                continue
+
+            if value in existing_values[field]:
+                klantcontact_errors[field] = [
+                    _("Er bestaat al een klantcontact met eenzelfde {field}.").format(
+                        field=field
+                    )
+                ]
+            elif value in seen_values[field]:
+                klantcontact_errors[field] = [
+                    _("`{field}` komt meerdere keren voor in het verzoek.").format(
+                        field=field
+                    )
+                ]
+            seen_values[field].add(value)
+        if klantcontact_errors:
+            errors["klantcontact"] = klantcontact_errors
+        if partij_uuid and partij_uuid not in partijen:
+            errors["betrokkene"] = {
+                "was_partij": {"uuid": [_("Partij object bestaat niet.")]}
+            }
+        if was_klantcontact_uuid and was_klantcontact_uuid not in was_klantcontacten:
+            errors["onderwerpobject"] = {
+                "was_klantcontact": {"uuid": [_("Klantcontact object bestaat niet.")]}
+            }
+
+        if errors:
+            results.append(errors)
+            continue
+
+        klantcontact = Klantcontact(**item["klantcontact"])
+
+        betrokkene = None
+        if betrokkene_data := item.get("betrokkene"):
+            betrokkene = Betrokkene(
+                klantcontact=klantcontact,
+                partij=partijen.get(partij_uuid),
+            )
+            for field, value in betrokkene_data.items():
+                if field != "partij":
+                    setattr(betrokkene, field, value)
+
+        onderwerpobject = None
+        if onderwerpobject_data := item.get("onderwerpobject"):
+            onderwerpobject = Onderwerpobject(
+                klantcontact=klantcontact,
+                was_klantcontact=was_klantcontacten.get(was_klantcontact_uuid),
+            )
+            for field, value in onderwerpobject_data.items():
+                if field != "was_klantcontact":
+                    setattr(onderwerpobject, field, value)
+
+        results.append((klantcontact, betrokkene, onderwerpobject))
+
+    created = [result for result in results if isinstance(result, tuple)]
+    if not created:
+        return results
+
+    klantcontacten = [klantcontact for klantcontact, _b, _o in created]
+    betrokkenen = [betrokkene for _k, betrokkene, _o in created if betrokkene]
+    onderwerpobjecten = [
+        onderwerpobject for _k, _b, onderwerpobject in created if onderwerpobject
+    ]
+    Klantcontact.objects.bulk_create(klantcontacten)
+    Betrokkene.objects.bulk_create(betrokkenen)
+    Onderwerpobject.objects.bulk_create(onderwerpobjecten)
+
+    # the signals which change the versions of the partijen and record the changes
+    # aren't sent by bulk operations
+    for betrokkene in betrokkenen:
+        if betrokkene.partij_id:
+            schedule_versie_update(Partij, betrokkene.partij_id)
+
+    for model, objs in (
+        (Klantcontact, klantcontacten),
+        (Betrokkene, betrokkenen),
+        (Onderwerpobject, onderwerpobjecten),
+    ):
+        record_wijzigingen(
+            model, [obj.uuid for obj in objs], Wijzigingsactie.aangemaakt
+        )
+
+    return results
@@ -1,7 +1,10 @@
 import datetime
-from collections import Counter
+import operator
+from collections import Counter, defaultdict
+from functools import reduce
 
 from django.db import transaction
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import extend_schema_field, extend_schema_serializer
@@ -31,7 +34,12 @@ from openklant.components.klantinteracties.api.validators import (
     partij_identificator_exists,
     partij_is_organisatie,
 )
-from openklant.components.klantinteracties.models.constants import SoortPartij
+from openklant.components.klantinteracties.constants import BulkResultaat
+from openklant.components.klantinteracties.models.constants import (
+    PartijIdentificatorCodeSoortObjectId,
+    SoortPartij,
+    Wijzigingsactie,
+)
 from openklant.components.klantinteracties.models.digitaal_adres import DigitaalAdres
 from openklant.components.klantinteracties.models.partijen import (
     Categorie,
@@ -48,11 +56,54 @@ from openklant.components.klantinteracties.models.validators import (
     PartijIdentificatorTypesValidator,
     PartijIdentificatorUniquenessValidator,
 )
+from openklant.components.klantinteracties.signals import ZOEKDOCUMENT_MODELS
+from openklant.components.klantinteracties.versies import (
+    deferred_versies,
+    schedule_versie_update,
+)
+from openklant.components.klantinteracties.wijzigingen import record_wijzigingen
+from openklant.components.klantinteracties.zoeken import (
+    deferred_zoekdocumenten,
+    schedule_zoekdocument_update,
+)
+from openklant.components.utils.api import HyperlinkedModelSerializer
 from openklant.utils.decorators import handle_db_exceptions
+from openklant.utils.identity_map import get_object
 from openklant.utils.serializers import get_field_instance_by_uuid, get_field_value
 
+IdentificatorKey = tuple[str, str, str, str]
+
+# the fields which identify a partij-identificator which isn't a sub identificator
+IDENTIFICATOR_FIELDS = (
+    "partij_identificator_code_objecttype",
+    "partij_identificator_code_soort_object_id",
+    "partij_identificator_object_id",
+    "partij_identificator_code_register",
+)
+
+# the fields of a partij which are set by a bulk request
+PARTIJ_BULK_FIELDS = (
+    "interne_notitie",
+    "soort_partij",
+    "indicatie_geheimhouding",
+    "voorkeurstaal",
+    "indicatie_actief",
+)
+PARTIJ_BULK_UPDATE_FIELDS = [
+    *PARTIJ_BULK_FIELDS,
+    "versie",
+    *(field.name for field in Partij.bezoekadres.mapping.values()),
+    *(field.name for field in Partij.correspondentieadres.mapping.values()),
+]
+
+PARTIJ_IDENTIFICATIE_MODELS = {
+    SoortPartij.contactpersoon: Contactpersoon,
+    SoortPartij.persoon: Persoon,
+    SoortPartij.organisatie: Organisatie,
+}
+
 
-class PartijForeignkeyBaseSerializer(serializers.HyperlinkedModelSerializer):
+class PartijForeignkeyBaseSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Partij
         fields = (
@@ -77,7 +128,7 @@ class PartijForeignKeySerializer(PartijForeignkeyBaseSerializer):
         }
 
 
-class CategorieForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class CategorieForeignKeySerializer(HyperlinkedModelSerializer):
     """Let op: Dit attribuut is EXPERIMENTEEL."""
 
     class Meta:
@@ -98,13 +149,16 @@ class CategorieForeignKeySerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class CategorieRelatieForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class CategorieRelatieForeignKeySerializer(HyperlinkedModelSerializer):
     """Let op: Dit attribuut is EXPERIMENTEEL."""
 
     categorie_naam = serializers.SerializerMethodField(
         help_text=_("De naam van de gelinkte categorie.")
     )
 
+    # relations used by `get_categorie_naam`
+    prefetch_related_lookups = ("categorie",)
+
     class Meta:
         model = CategorieRelatie
         fields = (
@@ -128,7 +182,7 @@ class CategorieRelatieForeignKeySerializer(serializers.HyperlinkedModelSerialize
             return obj.categorie.naam
 
 
-class PartijIdentificatorForeignkeySerializer(serializers.HyperlinkedModelSerializer):
+class PartijIdentificatorForeignkeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = PartijIdentificator
         fields = (
@@ -188,7 +242,7 @@ class CorrespondentieadresSerializer(GegevensGroepSerializer):
         }
 
 
-class CategorieSerializer(serializers.HyperlinkedModelSerializer):
+class CategorieSerializer(HyperlinkedModelSerializer):
     """Let op: Dit endpoint is EXPERIMENTEEL."""
 
     class Meta:
@@ -208,7 +262,7 @@ class CategorieSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class CategorieRelatieSerializer(serializers.HyperlinkedModelSerializer):
+class CategorieRelatieSerializer(HyperlinkedModelSerializer):
     """Let op: Dit endpoint is EXPERIMENTEEL."""
 
     partij = PartijForeignkeyBaseSerializer(
@@ -256,13 +310,13 @@ class CategorieRelatieSerializer(serializers.HyperlinkedModelSerializer):
     def update(self, instance, validated_data):
         if "partij" in validated_data:
             if partij := validated_data.pop("partij", None):
-                partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+                partij = get_object(Partij, partij["uuid"])
 
             validated_data["partij"] = partij
 
         if "categorie" in validated_data:
             if categorie := validated_data.pop("categorie", None):
-                categorie = Categorie.objects.get(uuid=str(categorie.get("uuid")))
+                categorie = get_object(Categorie, categorie["uuid"])
 
             validated_data["categorie"] = categorie
 
@@ -275,10 +329,10 @@ class CategorieRelatieSerializer(serializers.HyperlinkedModelSerializer):
                 "%Y-%m-%d"
             )
         if partij := validated_data.pop("partij", None):
-            partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+            partij = get_object(Partij, partij["uuid"])
 
         if categorie := validated_data.pop("categorie", None):
-            categorie = Categorie.objects.get(uuid=str(categorie.get("uuid")))
+            categorie = get_object(Categorie, categorie["uuid"])
 
         validated_data["partij"] = partij
         validated_data["categorie"] = categorie
@@ -358,7 +412,7 @@ class ContactpersoonSerializer(NestedGegevensGroepMixin, serializers.ModelSerial
     def update(self, instance, validated_data):
         if "werkte_voor_partij" in validated_data:
             if partij := validated_data.pop("werkte_voor_partij", None):
-                partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+                partij = get_object(Partij, partij["uuid"])
 
             validated_data["werkte_voor_partij"] = partij
 
@@ -367,7 +421,7 @@ class ContactpersoonSerializer(NestedGegevensGroepMixin, serializers.ModelSerial
     @transaction.atomic
     def create(self, validated_data):
         if partij := validated_data.pop("werkte_voor_partij", None):
-            partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+            partij = get_object(Partij, partij["uuid"])
 
         validated_data["werkte_voor_partij"] = partij
 
@@ -389,7 +443,7 @@ class PartijIdentificatorGroepTypeSerializer(GegevensGroepSerializer):
 
 @extend_schema_serializer(deprecate_fields=["andere_partij_identificator"])
 class PartijIdentificatorSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
+    NestedGegevensGroepMixin, HyperlinkedModelSerializer
 ):
     identificeerde_partij = PartijForeignKeySerializer(
         required=False,
@@ -555,6 +609,10 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
         ),
     )
 
+    # relations used by `get_vertegenwoordigden`
+    prefetch_related_lookups = ("vertegenwoordigende__vertegenwoordigde_partij",)
+    field_sources = {"vertegenwoordigden": ("vertegenwoordigende",)}
+
     inclusion_serializers = {
         # 1 level
         "digitale_adressen": f"{SERIALIZER_PATH}.digitaal_adres.DigitaalAdresSerializer",
@@ -637,6 +695,75 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
 
         return attrs
 
+    def set_related_objects(self, partij: Partij, model, uuids: list) -> None:
+        """
+        Link the objects with the given UUIDs to the partij and unlink its other
+        objects.
+
+        The current objects are fetched with a single query, after which the objects
+        are unlinked and linked with one ``UPDATE`` query each. ``QuerySet.update``
+        doesn't send signals, so the changes are recorded here.
+        """
+        positions = {uuid: position for position, uuid in enumerate(uuids)}
+        objects = model.objects.filter(Q(partij=partij) | Q(uuid__in=uuids))
+        unlinked = [obj for obj in objects if obj.uuid not in positions]
+        linked = sorted(
+            (
+                obj
+                for obj in objects
+                if obj.uuid in positions and obj.partij_id != partij.pk
+            ),
+            key=lambda obj: positions[obj.uuid],
+        )
+        if not unlinked and not linked:
+            return
+
+        model.objects.filter(pk__in=[obj.pk for obj in unlinked]).update(partij=None)
+        if model is DigitaalAdres:
+            self.unset_standaard_adressen(partij, linked)
+        model.objects.filter(pk__in=[obj.pk for obj in linked]).update(partij=partij)
+        record_wijzigingen(
+            model, [obj.uuid for obj in unlinked + linked], Wijzigingsactie.gewijzigd
+        )
+
+        # the objects which are moved from another partij are no longer part of it
+        partij_ids = {partij.pk} | {
+            obj.partij_id for obj in linked if obj.partij_id is not None
+        }
+        for partij_id in partij_ids:
+            schedule_versie_update(Partij, partij_id)
+            if model in ZOEKDOCUMENT_MODELS:
+                schedule_zoekdocument_update(partij_id)
+
+    def unset_standaard_adressen(
+        self, partij: Partij, linked: list[DigitaalAdres]
+    ) -> None:
+        """
+        There can only be one default address per `soort_digitaal_adres` and `partij`,
+        like in `DigitaalAdres.save` the last address which is linked is kept.
+        """
+        standaard_adressen = {
+            digitaal_adres.soort_digitaal_adres: digitaal_adres.pk
+            for digitaal_adres in linked
+            if digitaal_adres.is_standaard_adres
+        }
+        if not standaard_adressen:
+            return
+
+        previous_standaard_adressen = DigitaalAdres.objects.filter(
+            Q(partij=partij)
+            | Q(pk__in=[digitaal_adres.pk for digitaal_adres in linked]),
+            ~Q(pk__in=standaard_adressen.values()),
+            soort_digitaal_adres__in=standaard_adressen,
+            is_standaard_adres=True,
+        )
+        record_wijzigingen(
+            DigitaalAdres,
+            previous_standaard_adressen.values_list("uuid", flat=True),
+            Wijzigingsactie.gewijzigd,
+        )
+        previous_standaard_adressen.update(is_standaard_adres=False)
+
     def update_or_create_partij_identificator(self, partij_identificator):
         sub_identificator_van = partij_identificator["sub_identificator_van"]
         if isinstance(sub_identificator_van, PartijIdentificator):
@@ -648,9 +775,7 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
         )
         partij_identificator_serializer.is_valid(raise_exception=True)
         if "uuid" in partij_identificator:
-            instance = PartijIdentificator.objects.get(
-                uuid=partij_identificator["uuid"]
-            )
+            instance = get_object(PartijIdentificator, partij_identificator["uuid"])
             partij_identificator_serializer.update(
                 instance, partij_identificator_serializer.validated_data
             )
@@ -661,31 +786,18 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
 
     @handle_db_exceptions
     @transaction.atomic
+    @deferred_zoekdocumenten()
+    @deferred_versies()
     def update(self, instance, validated_data):
         method = self.context.get("request").method
         partij_identificatie = validated_data.pop("partij_identificatie", None)
         partij_identificatoren = validated_data.pop("partijidentificator_set", None)
         if "digitaaladres_set" in validated_data:
-            existing_digitale_adressen = instance.digitaaladres_set.all()
             digitaaladres_set = validated_data.pop("digitaaladres_set") or []
             digitaal_adres_uuids = [
                 digitaal_adres["uuid"] for digitaal_adres in digitaaladres_set
             ]
-
-            # unset relation of digitaal adres that weren't given with the update
-            for digitaal_adres in existing_digitale_adressen:
-                if digitaal_adres.uuid not in digitaal_adres_uuids:
-                    digitaal_adres.partij = None
-                    digitaal_adres.save()
-
-            # create relation between digitaal adres and partij of new entries
-            for digitaal_adres_uuid in digitaal_adres_uuids:
-                if digitaal_adres_uuid not in existing_digitale_adressen.values_list(
-                    "uuid", flat=True
-                ):
-                    digitaal_adres = DigitaalAdres.objects.get(uuid=digitaal_adres_uuid)
-                    digitaal_adres.partij = instance
-                    digitaal_adres.save()
+            self.set_related_objects(instance, DigitaalAdres, digitaal_adres_uuids)
 
         if "voorkeurs_digitaal_adres" in validated_data:
             if voorkeurs_digitaal_adres := validated_data.pop(
@@ -726,35 +838,18 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
                                 }
                             )
 
-                voorkeurs_digitaal_adres = DigitaalAdres.objects.get(
-                    uuid=str(voorkeurs_digitaal_adres_uuid)
+                voorkeurs_digitaal_adres = get_object(
+                    DigitaalAdres, voorkeurs_digitaal_adres_uuid
                 )
 
             validated_data["voorkeurs_digitaal_adres"] = voorkeurs_digitaal_adres
 
         if "rekeningnummer_set" in validated_data:
-            existing_rekeningnummers = instance.rekeningnummer_set.all()
             rekeningnummer_set = validated_data.pop("rekeningnummer_set") or []
             rekeningnummers_uuids = [
                 rekeningnummer["uuid"] for rekeningnummer in rekeningnummer_set
             ]
-
-            # unset relation of rekeningnummer that weren't given with the update
-            for rekeningnummer in existing_rekeningnummers:
-                if rekeningnummer.uuid not in rekeningnummers_uuids:
-                    rekeningnummer.partij = None
-                    rekeningnummer.save()
-
-            # create relation between rekeningnummer and partij of new entries
-            for rekeninnummers_uuid in rekeningnummers_uuids:
-                if rekeninnummers_uuid not in existing_rekeningnummers.values_list(
-                    "uuid", flat=True
-                ):
-                    rekeningnummer = Rekeningnummer.objects.get(
-                        uuid=rekeninnummers_uuid
-                    )
-                    rekeningnummer.partij = instance
-                    rekeningnummer.save()
+            self.set_related_objects(instance, Rekeningnummer, rekeningnummers_uuids)
 
         if "voorkeurs_rekeningnummer" in validated_data:
             if voorkeurs_rekeningnummer := validated_data.pop(
@@ -795,8 +890,8 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
                                 }
                             )
 
-                voorkeurs_rekeningnummer = Rekeningnummer.objects.get(
-                    uuid=str(voorkeurs_rekeningnummer_uuid)
+                voorkeurs_rekeningnummer = get_object(
+                    Rekeningnummer, voorkeurs_rekeningnummer_uuid
                 )
 
             validated_data["voorkeurs_rekeningnummer"] = voorkeurs_rekeningnummer
@@ -838,6 +933,8 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
 
     @handle_db_exceptions
     @transaction.atomic
+    @deferred_zoekdocumenten()
+    @deferred_versies()
     def create(self, validated_data):
         partij_identificatie = validated_data.pop("partij_identificatie", None)
         digitale_adressen = validated_data.pop("digitaaladres_set", None)
@@ -858,8 +955,8 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
                         )
                     }
                 )
-            voorkeurs_digitaal_adres = DigitaalAdres.objects.get(
-                uuid=str(voorkeurs_digitaal_adres_uuid)
+            voorkeurs_digitaal_adres = get_object(
+                DigitaalAdres, voorkeurs_digitaal_adres_uuid
             )
 
         if voorkeurs_rekeningnummer := validated_data.pop(
@@ -876,8 +973,8 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
                         )
                     }
                 )
-            voorkeurs_rekeningnummer = Rekeningnummer.objects.get(
-                uuid=str(voorkeurs_rekeningnummer_uuid)
+            voorkeurs_rekeningnummer = get_object(
+                Rekeningnummer, voorkeurs_rekeningnummer_uuid
             )
 
         if vertegenwoordigde := validated_data.pop("vertegenwoordigde", None):
@@ -905,20 +1002,18 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
             serializer.create(partij_identificatie)
 
         if digitale_adressen:
-            for digitaal_adres in digitale_adressen:
-                digitaal_adres = DigitaalAdres.objects.get(
-                    uuid=str(digitaal_adres["uuid"])
-                )
-                digitaal_adres.partij = partij
-                digitaal_adres.save()
+            self.set_related_objects(
+                partij,
+                DigitaalAdres,
+                [digitaal_adres["uuid"] for digitaal_adres in digitale_adressen],
+            )
 
         if rekeningnummers:
-            for rekeningnummer in rekeningnummers:
-                rekeningnummer = Rekeningnummer.objects.get(
-                    uuid=str(rekeningnummer["uuid"])
-                )
-                rekeningnummer.partij = partij
-                rekeningnummer.save()
+            self.set_related_objects(
+                partij,
+                Rekeningnummer,
+                [rekeningnummer["uuid"] for rekeningnummer in rekeningnummers],
+            )
 
         if partij_identificatoren:
             for partij_identificator in partij_identificatoren:
@@ -930,7 +1025,347 @@ class PartijSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
         return partij
 
 
-class VertegenwoordigdenSerializer(serializers.HyperlinkedModelSerializer):
+class PartijBulkIdentificatorSerializer(serializers.Serializer):
+    andere_partij_identificator = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=200,
+        help_text=get_help_text(
+            "klantinteracties.PartijIdentificator", "andere_partij_identificator"
+        ),
+    )
+    partij_identificator = PartijIdentificatorGroepTypeSerializer(
+        required=True,
+        allow_null=False,
+        help_text=_(
+            "Gegevens die een partij in een basisregistratie "
+            "of ander extern register uniek identificeren."
+        ),
+    )
+
+    def validate(self, attrs):
+        partij_identificator = attrs["partij_identificator"]
+        PartijIdentificatorTypesValidator()(
+            code_objecttype=partij_identificator["code_objecttype"],
+            code_soort_object_id=partij_identificator["code_soort_object_id"],
+            object_id=partij_identificator["object_id"],
+            code_register=partij_identificator["code_register"],
+        )
+        # a vestigingsnummer is only unique within its kvk_nummer (the
+        # `sub_identificator_van`), which can't be given in a bulk request
+        if (
+            partij_identificator["code_soort_object_id"]
+            == PartijIdentificatorCodeSoortObjectId.vestigingsnummer.value
+        ):
+            raise serializers.ValidationError(
+                {
+                    "partij_identificator": _(
+                        "Een PartijIdentificator met codeSoortObjectId = "
+                        "`vestigingsnummer` kan niet in een bulkverzoek worden "
+                        "aangemaakt, omdat hiervoor een `subIdentificatorVan` "
+                        "verplicht is."
+                    )
+                },
+                code="invalid",
+            )
+        return super().validate(attrs)
+
+
+class PartijBulkSerializer(NestedGegevensGroepMixin, PolymorphicSerializer):
+    """
+    Partij in een bulkverzoek, die wordt gevonden aan de hand van de
+    partij-identificatoren.
+    """
+
+    discriminator = Discriminator(
+        discriminator_field="soort_partij",
+        mapping={
+            SoortPartij.contactpersoon: ContactpersoonSerializer(),
+            SoortPartij.persoon: PersoonSerializer(),
+            SoortPartij.organisatie: OrganisatieSerializer(),
+        },
+        same_model=False,
+        group_field="partij_identificatie",
+    )
+    partij_identificatoren = PartijBulkIdentificatorSerializer(
+        many=True,
+        allow_empty=False,
+        help_text=_(
+            "Partij-identificatoren waarmee een bestaande partij wordt gevonden. "
+            "Partij-identificatoren die nog niet bestaan worden aan de partij "
+            "toegevoegd. Partij-identificatoren met codeSoortObjectId = "
+            "`vestigingsnummer` worden niet ondersteund."
+        ),
+    )
+    bezoekadres = PartijBezoekadresSerializer(
+        required=False,
+        allow_null=True,
+        help_text=_(
+            "Adres waarop de partij door gemeente bezocht wil worden. "
+            "Dit mag afwijken van voor de verstrekker eventueel in een "
+            "basisregistratie bekende adressen."
+        ),
+    )
+    correspondentieadres = CorrespondentieadresSerializer(
+        required=False,
+        allow_null=True,
+        help_text=_(
+            "Adres waarop de partij post van de gemeente wil ontvangen. "
+            "Dit mag afwijken van voor de verstrekker eventueel in een "
+            "basisregistratie bekende adressen."
+        ),
+    )
+
+    class Meta:
+        model = Partij
+        fields = (
+            "interne_notitie",
+            "partij_identificatoren",
+            "soort_partij",
+            "indicatie_geheimhouding",
+            "voorkeurstaal",
+            "indicatie_actief",
+            "bezoekadres",
+            "correspondentieadres",
+        )
+
+    def validate_partij_identificatoren(self, attrs):
+        soorten = [
+            item["partij_identificator"]["code_soort_object_id"] for item in attrs
+        ]
+        if max(Counter(soorten).values()) > 1:
+            raise serializers.ValidationError(
+                _("`CodeSoortObjectId` moet uniek zijn voor de Partij."),
+                code="duplicated",
+            )
+        return attrs
+
+
+class PartijBulkResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField(
+        help_text=_("De positie van de partij in het verzoek."),
+    )
+    resultaat = serializers.ChoiceField(
+        choices=BulkResultaat.choices,
+        help_text=_("Het resultaat van het verwerken van de partij."),
+    )
+    partij = PartijForeignkeyBaseSerializer(
+        allow_null=True,
+        help_text=_("De aangemaakte of bijgewerkte partij."),
+    )
+    fouten = serializers.DictField(
+        allow_null=True,
+        help_text=_("De validatiefouten van een ongeldige partij."),
+    )
+
+
+def get_identificator_key(partij_identificator: dict) -> IdentificatorKey:
+    return (
+        partij_identificator["code_objecttype"],
+        partij_identificator["code_soort_object_id"],
+        partij_identificator["object_id"],
+        partij_identificator["code_register"],
+    )
+
+
+@handle_db_exceptions
+@transaction.atomic
+@deferred_zoekdocumenten()
+@deferred_versies()
+def bulk_upsert_partijen(
+    items: list[dict],
+) -> list[tuple[Partij, bool] | dict]:
+    """
+    Create or update the validated partijen of a bulk request.
+
+    Existing partijen are found with a single query on the (globally unique)
+    partij-identificatoren, after which all partijen are inserted or updated with one
+    ``INSERT ... ON CONFLICT`` query. For every item, ``(partij, created)`` or the
+    validation errors of the item are returned.
+    """
+    keys = [
+        [
+            get_identificator_key(identificator["partij_identificator"])
+            for identificator in item["partij_identificatoren"]
+        ]
+        for item in items
+    ]
+    all_keys = [key for item_keys in keys for key in item_keys]
+
+    # the existing identificatoren with the partij they belong to, and the fields of
+    # those partijen which aren't set by a bulk request
+    existing = {}
+    existing_partijen = {}
+    if all_keys:
+        identificatoren = PartijIdentificator.objects.filter(
+            reduce(
+                operator.or_,
+                (Q(**dict(zip(IDENTIFICATOR_FIELDS, key))) for key in all_keys),
+            ),
+            sub_identificator_van__isnull=True,
+        ).values_list(
+            *IDENTIFICATOR_FIELDS, "pk", "partij_id", "partij__uuid", "partij__nummer"
+        )
+        for *key, pk, partij_id, partij_uuid, partij_nummer in identificatoren:
+            existing[tuple(key)] = (pk, partij_id)
+            if partij_id:
+                existing_partijen[partij_id] = (partij_uuid, partij_nummer)
+
+    # the identificatoren of the existing partijen per soort
+    partij_soorten = defaultdict(dict)
+    for partij_id, *key in PartijIdentificator.objects.filter(
+        partij_id__in=existing_partijen
+    ).values_list("partij_id", *IDENTIFICATOR_FIELDS):
+        partij_soorten[partij_id][key[1]] = tuple(key)
+
+    results: list[tuple[Partij, bool] | dict] = []
+    partijen = []
+    seen_keys = set()
+    for item, item_keys in zip(items, keys):
+        partij_ids = {
+            existing[key][1]
+            for key in item_keys
+            if key in existing and existing[key][1]
+        }
+
+        error = None
+        if seen_keys.intersection(item_keys):
+            error = _("`PartijIdentificator` komt meerdere keren voor in het verzoek.")
+        elif len(partij_ids) > 1:
+            error = _("De partij-identificatoren horen bij verschillende partijen.")
+        elif partij_ids:
+            soorten = partij_soorten[next(iter(partij_ids))]
+            if any(key[1] in soorten and soorten[key[1]] != key for key in item_keys):
+                error = _("`CodeSoortObjectId` moet uniek zijn voor de Partij.")
+
+        seen_keys.update(item_keys)
+        if error:
+            results.append({"partij_identificatoren": [error]})
+            continue
+
+        partij = Partij(
+            **{
+                field: value
+                for field, value in item.items()
+                if field in PARTIJ_BULK_FIELDS
+            }
+        )
+        partij.bezoekadres = item.get("bezoekadres")
+        partij.correspondentieadres = item.get("correspondentieadres")
+
+        created = not partij_ids
+        if not created:
+            partij.uuid, partij.nummer = existing_partijen[partij_ids.pop()]
+
+        partijen.append(partij)
+        results.append((partij, created))
+
+    if not partijen:
+        return results
+
+    Partij.objects.bulk_create(
+        partijen,
+        update_conflicts=True,
+        unique_fields=["uuid"],
+        update_fields=PARTIJ_BULK_UPDATE_FIELDS,
+    )
+
+    upserted = [
+        (item, result[0])
+        for item, result in zip(items, results)
+        if isinstance(result, tuple)
+    ]
+
+    # replace the partij-identificatie of the partijen for which it is given
+    identificaties = [
+        (item, partij)
+        for item, partij in upserted
+        if item.get("partij_identificatie") is not None
+    ]
+    partij_ids = [partij.pk for _item, partij in identificaties]
+    werkte_voor_partijen = Partij.objects.in_bulk(
+        [
+            str(item["partij_identificatie"]["werkte_voor_partij"]["uuid"])
+            for item, _partij in identificaties
+            if item["partij_identificatie"].get("werkte_voor_partij")
+        ],
+        field_name="uuid",
+    )
+    new_identificaties = defaultdict(list)
+    for model in PARTIJ_IDENTIFICATIE_MODELS.values():
+        model.objects.filter(partij_id__in=partij_ids).delete()
+
+    for item, partij in identificaties:
+        model = PARTIJ_IDENTIFICATIE_MODELS[partij.soort_partij]
+        identificatie = model(partij=partij)
+        for field, value in item["partij_identificatie"].items():
+            if field == "werkte_voor_partij" and value:
+                value = werkte_voor_partijen[str(value["uuid"])]
+            setattr(identificatie, field, value)
+        new_identificaties[model].append(identificatie)
+
+    for model, objs in new_identificaties.items():
+        model.objects.bulk_create(objs)
+
+    # add the identificatoren which don't exist yet, and link the existing
+    # identificatoren without partij
+    new_identificatoren = []
+    linked_identificatoren = []
+    for item, partij in upserted:
+        for identificator in item["partij_identificatoren"]:
+            key = get_identificator_key(identificator["partij_identificator"])
+            if key not in existing:
+                partij_identificator = PartijIdentificator(
+                    partij=partij,
+                    andere_partij_identificator=identificator.get(
+                        "andere_partij_identificator", ""
+                    ),
+                )
+                partij_identificator.partij_identificator = identificator[
+                    "partij_identificator"
+                ]
+                new_identificatoren.append(partij_identificator)
+            elif existing[key][1] is None:
+                linked_identificatoren.append(
+                    PartijIdentificator(pk=existing[key][0], partij=partij)
+                )
+
+    PartijIdentificator.objects.bulk_create(new_identificatoren)
+    PartijIdentificator.objects.bulk_update(linked_identificatoren, ["partij"])
+
+    # the signals which update the search documents and record the changes aren't
+    # sent by bulk operations
+    for _item, partij in upserted:
+        schedule_zoekdocument_update(partij.pk)
+
+    upserted_partijen = [result for result in results if isinstance(result, tuple)]
+    record_wijzigingen(
+        Partij,
+        [partij.uuid for partij, created in upserted_partijen if created],
+        Wijzigingsactie.aangemaakt,
+    )
+    record_wijzigingen(
+        Partij,
+        [partij.uuid for partij, created in upserted_partijen if not created],
+        Wijzigingsactie.gewijzigd,
+    )
+    record_wijzigingen(
+        PartijIdentificator,
+        [identificator.uuid for identificator in new_identificatoren],
+        Wijzigingsactie.aangemaakt,
+    )
+    record_wijzigingen(
+        PartijIdentificator,
+        PartijIdentificator.objects.filter(
+            pk__in=[identificator.pk for identificator in linked_identificatoren]
+        ).values_list("uuid", flat=True),
+        Wijzigingsactie.gewijzigd,
+    )
+
+    return results
+
+
+class VertegenwoordigdenSerializer(HyperlinkedModelSerializer):
     vertegenwoordigende_partij = PartijForeignKeySerializer(
         required=True,
         help_text=_("'Partij' die een andere 'Partij' vertegenwoordigde."),
@@ -996,16 +1431,16 @@ class VertegenwoordigdenSerializer(serializers.HyperlinkedModelSerializer):
             if vertegenwoordigende_partij := validated_data.pop(
                 "vertegenwoordigende_partij", None
             ):
-                validated_data["vertegenwoordigende_partij"] = Partij.objects.get(
-                    uuid=str(vertegenwoordigende_partij.get("uuid"))
+                validated_data["vertegenwoordigende_partij"] = get_object(
+                    Partij, vertegenwoordigende_partij["uuid"]
                 )
 
         if "vertegenwoordigde_partij" in validated_data:
             if vertegenwoordigde_partij := validated_data.pop(
                 "vertegenwoordigde_partij", None
             ):
-                validated_data["vertegenwoordigde_partij"] = Partij.objects.get(
-                    uuid=str(vertegenwoordigde_partij.get("uuid"))
+                validated_data["vertegenwoordigde_partij"] = get_object(
+                    Partij, vertegenwoordigde_partij["uuid"]
                 )
 
         return super().update(instance, validated_data)
@@ -1015,15 +1450,15 @@ class VertegenwoordigdenSerializer(serializers.HyperlinkedModelSerializer):
         vertegenwoordigende_partij_uuid = str(
             validated_data.pop("vertegenwoordigende_partij").get("uuid")
         )
-        validated_data["vertegenwoordigende_partij"] = Partij.objects.get(
-            uuid=vertegenwoordigende_partij_uuid
+        validated_data["vertegenwoordigende_partij"] = get_object(
+            Partij, vertegenwoordigende_partij_uuid
         )
 
         vertegenwoordigde_partij_uuid = str(
             validated_data.pop("vertegenwoordigde_partij").get("uuid")
         )
-        validated_data["vertegenwoordigde_partij"] = Partij.objects.get(
-            uuid=vertegenwoordigde_partij_uuid
+        validated_data["vertegenwoordigde_partij"] = get_object(
+            Partij, vertegenwoordigde_partij_uuid
         )
 
         return super().create(validated_data)
@@ -1,16 +1,20 @@
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import serializers
-
 from openklant.components.klantinteracties.api.validators import Rekeningnummer_exists
 from openklant.components.klantinteracties.models.partijen import Partij
 from openklant.components.klantinteracties.models.rekeningnummers import Rekeningnummer
+from openklant.components.utils.api import (
+    HyperlinkedModelSerializer,
+    ReferenceListSerializer,
+)
+from openklant.utils.identity_map import get_object
 
 
-class RekeningnummerForeignKeySerializer(serializers.HyperlinkedModelSerializer):
+class RekeningnummerForeignKeySerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Rekeningnummer
+        list_serializer_class = ReferenceListSerializer
         fields = (
             "uuid",
             "url",
@@ -27,7 +31,7 @@ class RekeningnummerForeignKeySerializer(serializers.HyperlinkedModelSerializer)
         }
 
 
-class RekeningnummerSerializer(serializers.HyperlinkedModelSerializer):
+class RekeningnummerSerializer(HyperlinkedModelSerializer):
     from openklant.components.klantinteracties.api.serializers.partijen import (
         PartijForeignKeySerializer,
     )
@@ -55,7 +59,7 @@ class RekeningnummerSerializer(serializers.HyperlinkedModelSerializer):
     @transaction.atomic
     def create(self, validated_data):
         if partij := validated_data.pop("partij", None):
-            validated_data["partij"] = Partij.objects.get(uuid=str(partij.get("uuid")))
+            validated_data["partij"] = get_object(Partij, partij["uuid"])
 
         return super().create(validated_data)
 
@@ -63,7 +67,7 @@ class RekeningnummerSerializer(serializers.HyperlinkedModelSerializer):
     def update(self, instance, validated_data):
         if "partij" in validated_data:
             if partij := validated_data.pop("partij", None):
-                partij = Partij.objects.get(uuid=str(partij.get("uuid")))
+                partij = get_object(Partij, partij["uuid"])
 
             validated_data["partij"] = partij
 
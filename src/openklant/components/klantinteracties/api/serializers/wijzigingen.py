@@ -0,0 +1,35 @@
+from django.utils.translation import gettext_lazy as _
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from openklant.components.klantinteracties.models.wijzigingen import Wijziging
+from openklant.components.utils.api import get_detail_url
+
+
+class WijzigingSerializer(serializers.ModelSerializer):
+    uuid = serializers.UUIDField(
+        source="resource_uuid",
+        read_only=True,
+        help_text=_("Unieke (technische) identificatiecode van de resource."),
+    )
+    url = serializers.SerializerMethodField(
+        help_text=_(
+            "De unieke URL van de resource binnen deze API. Een verwijderde resource "
+            "is niet meer op te vragen."
+        ),
+    )
+
+    class Meta:
+        model = Wijziging
+        fields = ("resource", "uuid", "url", "actie", "tijdstip")
+        read_only_fields = fields
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_url(self, obj: Wijziging) -> str:
+        return get_detail_url(
+            f"klantinteracties:{obj.resource}-detail",
+            obj.resource_uuid,
+            request=self.context.get("request"),
+        )
@@ -0,0 +1,334 @@
+"""
+Benchmark of the main endpoints of the API, with a JSON report which can be compared
+between releases.
+
+These are not collected by the default test run, run them explicitly with::
+
+    src/manage.py test openklant.components.klantinteracties --pattern "benchmark_api.py"
+
+The database is seeded with ``BENCHMARK_PARTIJEN`` partijen (10,000 by default), each
+with a persoon, a digitaal adres and a partij-identificator, and twice as many
+klantcontacten, each with a betrokkene and an onderwerpobject. The data is the same
+for every run with the same scale.
+
+Each scenario is requested ``BENCHMARK_REPEAT`` times (20 by default), after which the
+latency percentiles, the number of queries and the peak memory allocated by Python
+for a single request are printed and written to ``BENCHMARK_REPORT``
+(``benchmark_api.json`` by default).
+"""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from itertools import batched
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.api.tests.factories import (
+    BetrokkeneDataFactory,
+    KlantContactDataFactory,
+    OnderwerpObjectDataFactory,
+)
+from openklant.components.klantinteracties.models.constants import SoortPartij
+from openklant.components.klantinteracties.models.digitaal_adres import DigitaalAdres
+from openklant.components.klantinteracties.models.klantcontacten import (
+    Betrokkene,
+    Klantcontact,
+    Onderwerpobject,
+)
+from openklant.components.klantinteracties.models.partijen import (
+    Partij,
+    PartijIdentificator,
+    Persoon,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+
+PARTIJEN = int(os.environ.get("BENCHMARK_PARTIJEN", 10_000))
+KLANTCONTACTEN = PARTIJEN * 2
+REPEAT = int(os.environ.get("BENCHMARK_REPEAT", 20))
+REPORT = os.environ.get("BENCHMARK_REPORT", "benchmark_api.json")
+
+BATCH_SIZE = 5_000
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    url: str
+    params: dict = field(default_factory=dict)
+    data: dict | None = None
+
+
+@dataclass
+class Measurement:
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    queries: int
+    peak_memory_kb: float
+
+
+def bulk_create(model, objs) -> None:
+    for batch in batched(objs, BATCH_SIZE):
+        model.objects.bulk_create(batch)
+
+
+def seed() -> None:
+    bulk_create(
+        Partij,
+        (
+            Partij(
+                nummer=f"{i:010d}",
+                soort_partij=SoortPartij.persoon,
+                indicatie_actief=True,
+                interne_notitie=f"partij {i}",
+            )
+            for i in range(PARTIJEN)
+        ),
+    )
+    partij_ids = list(Partij.objects.order_by("pk").values_list("pk", flat=True))
+
+    bulk_create(
+        Persoon,
+        (
+            Persoon(
+                partij_id=partij_id,
+                contactnaam_voornaam=f"Voornaam {i}",
+                contactnaam_achternaam=f"Achternaam {i}",
+            )
+            for i, partij_id in enumerate(partij_ids)
+        ),
+    )
+    bulk_create(
+        DigitaalAdres,
+        (
+            DigitaalAdres(
+                partij_id=partij_id,
+                soort_digitaal_adres="email",
+                adres=f"partij{i}@example.com",
+                omschrijving="e-mail",
+            )
+            for i, partij_id in enumerate(partij_ids)
+        ),
+    )
+    bulk_create(
+        PartijIdentificator,
+        (
+            PartijIdentificator(
+                partij_id=partij_id,
+                partij_identificator_code_objecttype="natuurlijk_persoon",
+                partij_identificator_code_soort_object_id="bsn",
+                partij_identificator_object_id=f"{i:09d}",
+                partij_identificator_code_register="brp",
+            )
+            for i, partij_id in enumerate(partij_ids)
+        ),
+    )
+
+    bulk_create(
+        Klantcontact,
+        (
+            Klantcontact(
+                kanaal="telefoon",
+                onderwerp=f"vraag {i % 100}",
+                inhoud=f"gesprek {i}",
+                taal="nld",
+                vertrouwelijk=False,
+            )
+            for i in range(KLANTCONTACTEN)
+        ),
+    )
+    klantcontact_ids = list(
+        Klantcontact.objects.order_by("pk").values_list("pk", flat=True)
+    )
+    bulk_create(
+        Betrokkene,
+        (
+            Betrokkene(
+                klantcontact_id=klantcontact_id,
+                partij_id=partij_ids[i % PARTIJEN],
+                rol="klant",
+                initiator=True,
+                contactnaam_achternaam=f"Achternaam {i % PARTIJEN}",
+            )
+            for i, klantcontact_id in enumerate(klantcontact_ids)
+        ),
+    )
+    bulk_create(
+        Onderwerpobject,
+        (
+            Onderwerpobject(
+                klantcontact_id=klantcontact_id,
+                onderwerpobjectidentificator_code_objecttype="zaak",
+                onderwerpobjectidentificator_code_soort_object_id="identificatie",
+                onderwerpobjectidentificator_object_id=f"ZAAK-{i}",
+                onderwerpobjectidentificator_code_register="zrc",
+            )
+            for i, klantcontact_id in enumerate(klantcontact_ids)
+        ),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def percentile(timings: list[float], n: int) -> float:
+    return round(statistics.quantiles(timings, n=100, method="inclusive")[n - 1], 2)
+
+
+class APIBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        seed()
+
+    def get_scenarios(self) -> list[Scenario]:
+        partij = Partij.objects.order_by("pk")[PARTIJEN // 2]
+        klantcontact = Klantcontact.objects.order_by("pk")[KLANTCONTACTEN // 2]
+        partijen_url = reverse("klantinteracties:partij-list")
+        partij_url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": partij.uuid}
+        )
+        klantcontacten_url = reverse("klantinteracties:klantcontact-list")
+        klantcontact_url = reverse(
+            "klantinteracties:klantcontact-detail", kwargs={"uuid": klantcontact.uuid}
+        )
+
+        return [
+            Scenario("partijen list", "get", partijen_url, {"pageSize": 100}),
+            Scenario("partijen detail", "get", partij_url),
+            Scenario(
+                "partijen list expand",
+                "get",
+                partijen_url,
+                {"pageSize": 100, "expand": "digitaleAdressen,betrokkenen"},
+            ),
+            Scenario(
+                "partijen filter identificator",
+                "get",
+                partijen_url,
+                {"partijIdentificator__objectId": f"{PARTIJEN // 3:09d}"},
+            ),
+            Scenario(
+                "klantcontacten list", "get", klantcontacten_url, {"pageSize": 100}
+            ),
+            Scenario("klantcontacten detail", "get", klantcontact_url),
+            Scenario(
+                "klantcontacten list expand",
+                "get",
+                klantcontacten_url,
+                {
+                    "pageSize": 100,
+                    "expand": "hadBetrokkenen,gingOverOnderwerpobjecten,"
+                    "hadBetrokkenen.wasPartij",
+                },
+            ),
+            Scenario(
+                "klantcontacten filter onderwerp",
+                "get",
+                klantcontacten_url,
+                {"onderwerp": "vraag 42"},
+            ),
+            Scenario(
+                "klantcontacten create",
+                "post",
+                klantcontacten_url,
+                data=KlantContactDataFactory.create(nummer=None),
+            ),
+            Scenario(
+                "partijen update",
+                "patch",
+                partij_url,
+                data={"interneNotitie": "gewijzigd"},
+            ),
+            Scenario(
+                "maak-klantcontact create",
+                "post",
+                reverse("klantinteracties:maak-klantcontact-list"),
+                data={
+                    "klantcontact": KlantContactDataFactory.create(nummer=None),
+                    "betrokkene": BetrokkeneDataFactory.create(
+                        wasPartij={"uuid": str(partij.uuid)}
+                    ),
+                    "onderwerpobject": OnderwerpObjectDataFactory.create(),
+                },
+            ),
+        ]
+
+    def request(self, scenario: Scenario):
+        if scenario.method == "get":
+            response = self.client.get(scenario.url, scenario.params)
+        else:
+            response = getattr(self.client, scenario.method)(
+                scenario.url, scenario.data
+            )
+        self.assertLess(response.status_code, 300, response.content)
+        return response
+
+    def measure(self, scenario: Scenario) -> Measurement:
+        timings = []
+        queries = []
+        for _ in range(REPEAT):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                self.request(scenario)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context))
+
+        # tracing the allocations slows down the requests, so the memory is measured
+        # separately
+        tracemalloc.start()
+        try:
+            self.request(scenario)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return Measurement(
+            p50_ms=percentile(timings, 50),
+            p90_ms=percentile(timings, 90),
+            p99_ms=percentile(timings, 99),
+            queries=int(statistics.median(queries)),
+            peak_memory_kb=round(peak / 1024, 1),
+        )
+
+    def test_api(self):
+        # the first request authenticates the token
+        self.client.get(reverse("klantinteracties:partij-list"), {"pageSize": 1})
+
+        measurements = {}
+        print(
+            f"\nAPI on {PARTIJEN} partijen and {KLANTCONTACTEN} klantcontacten "
+            f"({REPEAT} requests per scenario)"
+        )
+        print(
+            f"  {'scenario':<32} | {'p50':>9} | {'p90':>9} | {'p99':>9} | "
+            f"{'queries':>7} | {'memory':>10}"
+        )
+        for scenario in self.get_scenarios():
+            measurement = self.measure(scenario)
+            measurements[scenario.name] = asdict(measurement)
+            print(
+                f"  {scenario.name:<32} | {measurement.p50_ms:6.1f} ms | "
+                f"{measurement.p90_ms:6.1f} ms | {measurement.p99_ms:6.1f} ms | "
+                f"{measurement.queries:>7} | {measurement.peak_memory_kb:7.1f} kB"
+            )
+
+        report = {
+            "partijen": PARTIJEN,
+            "klantcontacten": KLANTCONTACTEN,
+            "repeat": REPEAT,
+            "postgres": connection.cursor().connection.info.server_version,
+            "scenarios": measurements,
+        }
+        with open(REPORT, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"  report written to {REPORT}")
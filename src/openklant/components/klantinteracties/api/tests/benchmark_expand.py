@@ -0,0 +1,108 @@
+"""
+Micro-benchmarks for the ``?expand=`` rendering of the klantcontacten list endpoint.
+
+These are not collected by the default test run, run them explicitly with::
+
+    src/manage.py test openklant.components.klantinteracties --pattern "benchmark_*.py"
+"""
+
+import statistics
+import time
+
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    BetrokkeneFactory,
+    DigitaalAdresFactory,
+    InterneTaakFactory,
+    KlantcontactFactory,
+    OnderwerpobjectFactory,
+    PartijFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.utils.expansion import InclusionTree
+
+PAGE_SIZES = (10, 50, 100)
+REPEAT = 5
+
+EXPAND_OPTIONS = {
+    "none": "",
+    "depth 1": "hadBetrokkenen,gingOverOnderwerpobjecten,leiddeTotInterneTaken",
+    "depth 2": (
+        "hadBetrokkenen,gingOverOnderwerpobjecten,leiddeTotInterneTaken,"
+        "hadBetrokkenen.wasPartij,hadBetrokkenen.digitaleAdressen"
+    ),
+}
+
+
+def _median_ms(func, repeat: int = REPEAT) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+class InclusionTreeBenchmark(APITestCase):
+    def test_add_node_scales_linearly(self):
+        print("\nInclusionTree.add_node (parents x children per parent)")
+
+        for parents in (100, 1_000, 10_000):
+
+            def build():
+                tree = InclusionTree()
+                for i in range(parents):
+                    tree.add_node(id=f"kc{i}", value={}, label="", many=False)
+                for i in range(parents):
+                    for j in range(3):
+                        tree.add_node(
+                            id=f"b{i}-{j}",
+                            value={"url": f"b{i}-{j}"},
+                            label="betrokkenen",
+                            many=True,
+                            parent_id=f"kc{i}",
+                        )
+                tree.display_tree()
+
+            print(f"  {parents:>6} x 3: {_median_ms(build):8.2f} ms")
+
+
+class ExpandRendererBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        partijen = PartijFactory.create_batch(20, voorkeurs_digitaal_adres=None)
+
+        for i in range(max(PAGE_SIZES)):
+            klantcontact = KlantcontactFactory.create()
+            partij = partijen[i % len(partijen)]
+            betrokkene = BetrokkeneFactory.create(
+                klantcontact=klantcontact, partij=partij
+            )
+            DigitaalAdresFactory.create(partij=None, betrokkene=betrokkene)
+            OnderwerpobjectFactory.create(
+                klantcontact=klantcontact, was_klantcontact=None
+            )
+            InterneTaakFactory.create(klantcontact=klantcontact)
+
+    def test_klantcontacten_list(self):
+        url = reverse("klantinteracties:klantcontact-list")
+
+        print("\nExpandJSONRenderer on klantcontacten list (median time per request)")
+        print(f"  {'page size':>9} | " + " | ".join(f"{k:>9}" for k in EXPAND_OPTIONS))
+
+        for page_size in PAGE_SIZES:
+            row = []
+            for expand in EXPAND_OPTIONS.values():
+                params = {"pageSize": page_size}
+                if expand:
+                    params["expand"] = expand
+
+                def request():
+                    response = self.client.get(url, params)
+                    self.assertEqual(response.status_code, 200)
+
+                row.append(_median_ms(request))
+
+            print(f"  {page_size:>9} | " + " | ".join(f"{t:6.1f} ms" for t in row))
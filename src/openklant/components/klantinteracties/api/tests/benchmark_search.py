@@ -0,0 +1,98 @@
+"""
+Benchmark of the substring (``icontains``) filters of the klantcontacten list endpoint.
+
+These are not collected by the default test run, run them explicitly with::
+
+    src/manage.py test openklant.components.klantinteracties --pattern "benchmark_search.py"
+
+The klantcontacten are generated in the database, 5 million by default. Use the
+``BENCHMARK_KLANTCONTACTEN`` environment variable for a different number.
+"""
+
+import os
+import statistics
+import time
+
+from django.db import connection
+
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.klantcontacten import Klantcontact
+from openklant.components.token.tests.api_testcase import APITestCase
+
+KLANTCONTACTEN = int(os.environ.get("BENCHMARK_KLANTCONTACTEN", 5_000_000))
+REPEAT = 5
+
+# (filter, value), the values match a single klantcontact or many klantcontacten
+SEARCHES = (
+    ("onderwerp", "c4ca4238a0b923820dcc509a6f75849b"),
+    ("onderwerp", "vraag over"),
+    ("inhoud", "8f14e45fceea167a5a36dedd4bea2543"),
+    ("inhoud", "gesprek"),
+    ("reactie", "c51ce410c124a10e0db5e4b97fc2af39"),
+)
+
+
+def _median_ms(func, repeat: int = REPEAT) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+class SearchBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Klantcontact._meta.db_table} (
+                    uuid, kanaal, onderwerp, inhoud, reactie, hoofd_onderwerp_type,
+                    verdere_actie_ondernomen, taal, vertrouwelijk, plaatsgevonden_op,
+                    metadata
+                )
+                SELECT
+                    gen_random_uuid(),
+                    'telefoon',
+                    'vraag over ' || md5(i::text),
+                    'gesprek met klant ' || md5((i * 7)::text),
+                    'antwoord ' || md5((i * 13)::text),
+                    '',
+                    false,
+                    'nld',
+                    false,
+                    now() - i * interval '1 second',
+                    '{{}}'
+                FROM generate_series(1, %s) AS i
+                """,
+                [KLANTCONTACTEN],
+            )
+            cursor.execute(f"ANALYZE {Klantcontact._meta.db_table}")
+
+    def _uses_index(self, field: str, value: str) -> bool:
+        queryset = Klantcontact.objects.filter(**{f"{field}__icontains": value})
+        plan = queryset.explain()
+        return f"klantcontact_{field}_trgm" in plan
+
+    def test_klantcontacten_search(self):
+        url = reverse("klantinteracties:klantcontact-list")
+
+        print(
+            f"\nSubstring search on {KLANTCONTACTEN} klantcontacten "
+            "(median time per request)"
+        )
+        for field, value in SEARCHES:
+
+            def request():
+                response = self.client.get(url, {field: value})
+                self.assertEqual(response.status_code, 200)
+
+            index = "trigram index" if self._uses_index(field, value) else "seq scan"
+            print(
+                f"  {field:>9} = {value[:20]:<20} | "
+                f"{_median_ms(request):9.1f} ms | {index}"
+            )
@@ -1,9 +1,13 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext as _
 
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 from vng_api_common.tests import get_validation_errors, reverse, reverse_lazy
 
 from openklant.components.klantinteracties.models.constants import SoortPartij
+from openklant.components.klantinteracties.models.digitaal_adres import DigitaalAdres
 from openklant.components.klantinteracties.models.partijen import (
     Partij,
     PartijIdentificator,
@@ -2302,6 +2306,136 @@ class PartijTests(APITestCase):
             received_adressen[0]["url"], f"http://testserver{expected_url}"
         )
 
+    def test_update_partij_number_of_queries(self):
+        # the serializers are imported through the URLs, in the right order
+        from openklant.components.klantinteracties.api.serializers.partijen import (
+            PartijSerializer,
+        )
+
+        def update(count):
+            partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+            other_partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+            DigitaalAdresFactory.create_batch(count, partij=partij, betrokkene=None)
+            RekeningnummerFactory.create_batch(count, partij=partij)
+            # both addresses which are moved from another partij and new ones
+            digitale_adressen = [
+                *DigitaalAdresFactory.create_batch(
+                    count, partij=other_partij, betrokkene=None
+                ),
+                *DigitaalAdresFactory.create_batch(count, betrokkene=None),
+            ]
+            rekeningnummers = RekeningnummerFactory.create_batch(count)
+
+            url = reverse(
+                "klantinteracties:partij-detail", kwargs={"uuid": str(partij.uuid)}
+            )
+            serializer = PartijSerializer(
+                partij,
+                data={
+                    "digitale_adressen": [
+                        {"uuid": str(digitaal_adres.uuid)}
+                        for digitaal_adres in digitale_adressen
+                    ],
+                    "rekeningnummers": [
+                        {"uuid": str(rekeningnummer.uuid)}
+                        for rekeningnummer in rekeningnummers
+                    ],
+                },
+                partial=True,
+                context={"request": APIRequestFactory().patch(url)},
+            )
+            serializer.is_valid(raise_exception=True)
+
+            with CaptureQueriesContext(connection) as queries:
+                serializer.save()
+
+            self.assertEqual(
+                set(partij.digitaaladres_set.all()), set(digitale_adressen)
+            )
+            self.assertEqual(set(partij.rekeningnummer_set.all()), set(rekeningnummers))
+            self.assertFalse(other_partij.digitaaladres_set.exists())
+            return len(queries)
+
+        self.assertEqual(update(2), update(20))
+
+    def test_update_partij_number_of_queries_references(self):
+        # the referenced objects are looked up with a single query
+        def update(count):
+            partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+            digitale_adressen = DigitaalAdresFactory.create_batch(
+                count, partij=None, betrokkene=None
+            )
+            rekeningnummers = RekeningnummerFactory.create_batch(count)
+            url = reverse(
+                "klantinteracties:partij-detail", kwargs={"uuid": str(partij.uuid)}
+            )
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(
+                    url,
+                    {
+                        "digitaleAdressen": [
+                            {"uuid": str(digitaal_adres.uuid)}
+                            for digitaal_adres in digitale_adressen
+                        ],
+                        "voorkeursDigitaalAdres": {
+                            "uuid": str(digitale_adressen[0].uuid)
+                        },
+                        "rekeningnummers": [
+                            {"uuid": str(rekeningnummer.uuid)}
+                            for rekeningnummer in rekeningnummers
+                        ],
+                    },
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(partij.digitaaladres_set.count(), count)
+            return len(queries)
+
+        # the first request authenticates the token
+        update(1)
+
+        self.assertEqual(update(2), update(20))
+
+    def test_update_partij_standaard_adres(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        standaard_adres = DigitaalAdresFactory.create(
+            partij=partij,
+            betrokkene=None,
+            soort_digitaal_adres="email",
+            is_standaard_adres=True,
+        )
+        digitaal_adres = DigitaalAdresFactory.create(
+            partij=None,
+            betrokkene=None,
+            soort_digitaal_adres="email",
+            is_standaard_adres=True,
+        )
+        detail_url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(partij.uuid)}
+        )
+
+        response = self.client.patch(
+            detail_url,
+            {
+                "digitaleAdressen": [
+                    {"uuid": str(standaard_adres.uuid)},
+                    {"uuid": str(digitaal_adres.uuid)},
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # there can only be one default address per soort
+        self.assertEqual(
+            list(
+                DigitaalAdres.objects.filter(
+                    partij=partij, is_standaard_adres=True
+                ).values_list("pk", flat=True)
+            ),
+            [digitaal_adres.pk],
+        )
+
 
 class NestedPartijIdentificatorTests(APITestCase):
     list_url = reverse_lazy("klantinteracties:partij-list")
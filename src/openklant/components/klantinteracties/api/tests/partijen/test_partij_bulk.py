@@ -0,0 +1,319 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.constants import SoortPartij
+from openklant.components.klantinteracties.models.partijen import (
+    Organisatie,
+    Partij,
+    PartijIdentificator,
+    Persoon,
+)
+from openklant.components.klantinteracties.models.tests.factories import (
+    BsnPartijIdentificatorFactory,
+    KvkNummerPartijIdentificatorFactory,
+    OrganisatieFactory,
+    PartijFactory,
+    PersoonFactory,
+    VestigingsnummerPartijIdentificatorFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+
+
+def get_persoon(bsn: str = "296648875", achternaam: str = "Bozeman") -> dict:
+    return {
+        "soortPartij": SoortPartij.persoon.value,
+        "indicatieActief": True,
+        "partijIdentificatie": {
+            "contactnaam": {
+                "voorletters": "P",
+                "voornaam": "Phil",
+                "voorvoegselAchternaam": "",
+                "achternaam": achternaam,
+            }
+        },
+        "partijIdentificatoren": [
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "natuurlijk_persoon",
+                    "codeSoortObjectId": "bsn",
+                    "objectId": bsn,
+                    "codeRegister": "brp",
+                }
+            }
+        ],
+    }
+
+
+def get_organisatie(kvk_nummer: str = "12345678", naam: str = "Maykin") -> dict:
+    return {
+        "soortPartij": SoortPartij.organisatie.value,
+        "indicatieActief": True,
+        "partijIdentificatie": {"naam": naam},
+        "partijIdentificatoren": [
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "niet_natuurlijk_persoon",
+                    "codeSoortObjectId": "kvk_nummer",
+                    "objectId": kvk_nummer,
+                    "codeRegister": "hr",
+                }
+            }
+        ],
+    }
+
+
+class PartijBulkTests(APITestCase):
+    url = reverse("klantinteracties:partij-bulk")
+
+    def test_create(self):
+        response = self.client.post(self.url, [get_persoon(), get_organisatie()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        persoon = Persoon.objects.get()
+        organisatie = Organisatie.objects.get()
+        self.assertEqual(persoon.contactnaam_achternaam, "Bozeman")
+        self.assertEqual(organisatie.naam, "Maykin")
+        self.assertEqual(
+            persoon.partij.partijidentificator_set.get().partij_identificator_object_id,
+            "296648875",
+        )
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "index": 0,
+                    "resultaat": "aangemaakt",
+                    "partij": {
+                        "uuid": str(persoon.partij.uuid),
+                        "url": f"http://testserver{reverse('klantinteracties:partij-detail', kwargs={'uuid': persoon.partij.uuid})}",
+                    },
+                    "fouten": None,
+                },
+                {
+                    "index": 1,
+                    "resultaat": "aangemaakt",
+                    "partij": {
+                        "uuid": str(organisatie.partij.uuid),
+                        "url": f"http://testserver{reverse('klantinteracties:partij-detail', kwargs={'uuid': organisatie.partij.uuid})}",
+                    },
+                    "fouten": None,
+                },
+            ],
+        )
+
+    def test_update(self):
+        partij = PartijFactory.create(
+            soort_partij=SoortPartij.persoon,
+            interne_notitie="notitie",
+            indicatie_actief=False,
+        )
+        PersoonFactory.create(partij=partij, contactnaam_achternaam="Smit")
+        identificator = BsnPartijIdentificatorFactory.create(partij=partij)
+
+        response = self.client.post(self.url, [get_persoon()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["resultaat"], "bijgewerkt")
+        self.assertEqual(response.json()[0]["partij"]["uuid"], str(partij.uuid))
+
+        partij.refresh_from_db()
+        self.assertEqual(partij.interne_notitie, "")
+        self.assertTrue(partij.indicatie_actief)
+        self.assertEqual(partij.persoon.contactnaam_achternaam, "Bozeman")
+        self.assertEqual(Persoon.objects.count(), 1)
+        self.assertEqual(partij.partijidentificator_set.get(), identificator)
+
+    def test_update_adds_identificatoren(self):
+        partij = PartijFactory.create(soort_partij=SoortPartij.organisatie)
+        OrganisatieFactory.create(partij=partij)
+        KvkNummerPartijIdentificatorFactory.create(partij=partij)
+        data = get_organisatie()
+        data["partijIdentificatoren"].append(
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "niet_natuurlijk_persoon",
+                    "codeSoortObjectId": "rsin",
+                    "objectId": "296648875",
+                    "codeRegister": "hr",
+                }
+            }
+        )
+
+        response = self.client.post(self.url, [data])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["resultaat"], "bijgewerkt")
+        self.assertEqual(Partij.objects.count(), 1)
+        self.assertCountEqual(
+            partij.partijidentificator_set.values_list(
+                "partij_identificator_object_id", flat=True
+            ),
+            ["12345678", "296648875"],
+        )
+
+    def test_invalid_items_are_skipped(self):
+        invalid = get_persoon(bsn="123456789")
+
+        response = self.client.post(self.url, [invalid, get_organisatie()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(results[0]["resultaat"], "ongeldig")
+        self.assertIsNone(results[0]["partij"])
+        self.assertIn("partijIdentificatoren", results[0]["fouten"])
+        self.assertEqual(results[1]["resultaat"], "aangemaakt")
+        self.assertEqual(Partij.objects.get().soort_partij, SoortPartij.organisatie)
+
+    def test_duplicated_identificator(self):
+        response = self.client.post(
+            self.url, [get_organisatie(), get_organisatie(naam="Open Klant")]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(results[0]["resultaat"], "aangemaakt")
+        self.assertEqual(results[1]["resultaat"], "ongeldig")
+        self.assertEqual(
+            results[1]["fouten"],
+            {
+                "partijIdentificatoren": [
+                    "`PartijIdentificator` komt meerdere keren voor in het verzoek."
+                ]
+            },
+        )
+        self.assertEqual(Organisatie.objects.get().naam, "Maykin")
+
+    def test_identificatoren_of_different_partijen(self):
+        KvkNummerPartijIdentificatorFactory.create()
+        KvkNummerPartijIdentificatorFactory.create(
+            partij_identificator_code_soort_object_id="rsin",
+            partij_identificator_object_id="296648875",
+        )
+        data = get_organisatie()
+        data["partijIdentificatoren"].append(
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "niet_natuurlijk_persoon",
+                    "codeSoortObjectId": "rsin",
+                    "objectId": "296648875",
+                    "codeRegister": "hr",
+                }
+            }
+        )
+
+        response = self.client.post(self.url, [data])
+
+        self.assertEqual(response.json()[0]["resultaat"], "ongeldig")
+        self.assertEqual(
+            response.json()[0]["fouten"],
+            {
+                "partijIdentificatoren": [
+                    "De partij-identificatoren horen bij verschillende partijen."
+                ]
+            },
+        )
+
+    def test_identificator_locally_unique(self):
+        partij = PartijFactory.create(soort_partij=SoortPartij.organisatie)
+        KvkNummerPartijIdentificatorFactory.create(partij=partij)
+        KvkNummerPartijIdentificatorFactory.create(
+            partij=partij,
+            partij_identificator_code_soort_object_id="rsin",
+            partij_identificator_object_id="296648875",
+        )
+        data = get_organisatie()
+        data["partijIdentificatoren"].append(
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "niet_natuurlijk_persoon",
+                    "codeSoortObjectId": "rsin",
+                    "objectId": "123456782",
+                    "codeRegister": "hr",
+                }
+            }
+        )
+
+        response = self.client.post(self.url, [data])
+
+        self.assertEqual(response.json()[0]["resultaat"], "ongeldig")
+        self.assertEqual(PartijIdentificator.objects.count(), 2)
+
+    def test_vestigingsnummer_not_allowed(self):
+        data = get_organisatie()
+        data["partijIdentificatoren"].append(
+            {
+                "partijIdentificator": {
+                    "codeObjecttype": "vestiging",
+                    "codeSoortObjectId": "vestigingsnummer",
+                    "objectId": "296648875154",
+                    "codeRegister": "hr",
+                }
+            }
+        )
+
+        response = self.client.post(self.url, [data])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.json()[0]
+        self.assertEqual(result["resultaat"], "ongeldig")
+        self.assertIn("partijIdentificatoren", result["fouten"])
+        self.assertFalse(Partij.objects.exists())
+        self.assertFalse(PartijIdentificator.objects.exists())
+
+    def test_update_partij_with_vestigingsnummer(self):
+        partij = PartijFactory.create(soort_partij=SoortPartij.organisatie)
+        OrganisatieFactory.create(partij=partij)
+        kvk_nummer = KvkNummerPartijIdentificatorFactory.create(partij=partij)
+        VestigingsnummerPartijIdentificatorFactory.create(
+            partij=partij, sub_identificator_van=kvk_nummer
+        )
+
+        response = self.client.post(self.url, [get_organisatie(naam="Open Klant")])
+        # a repeated sync finds the same partij
+        self.client.post(self.url, [get_organisatie(naam="Open Klant")])
+
+        self.assertEqual(response.json()[0]["resultaat"], "bijgewerkt")
+        self.assertEqual(response.json()[0]["partij"]["uuid"], str(partij.uuid))
+        self.assertEqual(Partij.objects.get().organisatie.naam, "Open Klant")
+        self.assertEqual(PartijIdentificator.objects.count(), 2)
+
+    def test_number_of_queries(self):
+        def bulk(kvk_nummers):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.url,
+                    [get_organisatie(kvk_nummer) for kvk_nummer in kvk_nummers],
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        # the first request authenticates the token
+        bulk(["10000000"])
+
+        self.assertEqual(
+            bulk([f"{20000000 + index}" for index in range(2)]),
+            bulk([f"{30000000 + index}" for index in range(20)]),
+        )
+        self.assertEqual(
+            bulk([f"{20000000 + index}" for index in range(2)]),
+            bulk([f"{30000000 + index}" for index in range(20)]),
+        )
+        self.assertEqual(Partij.objects.count(), 23)
+
+    def test_no_list(self):
+        response = self.client.post(self.url, get_persoon())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(PARTIJEN_BULK_MAX_SIZE=1)
+    def test_max_size(self):
+        response = self.client.post(self.url, [get_persoon(), get_organisatie()])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Partij.objects.exists())
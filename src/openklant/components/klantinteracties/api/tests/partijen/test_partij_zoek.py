@@ -0,0 +1,217 @@
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.partijen import (
+    Partij,
+    PartijZoekdocument,
+)
+from openklant.components.klantinteracties.models.tests.factories import (
+    BsnPartijIdentificatorFactory,
+    DigitaalAdresFactory,
+    OrganisatieFactory,
+    PartijFactory,
+    PersoonFactory,
+)
+from openklant.components.klantinteracties.zoeken import get_zoektekst
+from openklant.components.token.tests.api_testcase import APITestCase
+
+
+class PartijZoekTests(APITestCase):
+    url = reverse("klantinteracties:partij-zoek")
+
+    def setUp(self):
+        super().setUp()
+        self.partij = PartijFactory.create(
+            voorkeurs_digitaal_adres=None,
+            bezoekadres_straatnaam="Kalverstraat",
+            bezoekadres_huisnummer=12,
+            bezoekadres_postcode="1012AB",
+            bezoekadres_stad="Amsterdam",
+        )
+        PersoonFactory.create(
+            partij=self.partij,
+            contactnaam_voornaam="Johanna",
+            contactnaam_voorvoegsel_achternaam="de",
+            contactnaam_achternaam="Vries",
+        )
+        DigitaalAdresFactory.create(
+            partij=self.partij, betrokkene=None, adres="johanna@example.com"
+        )
+        BsnPartijIdentificatorFactory.create(partij=self.partij)
+
+        self.other = PartijFactory.create(
+            voorkeurs_digitaal_adres=None,
+            bezoekadres_stad="Utrecht",
+        )
+        OrganisatieFactory.create(partij=self.other, naam="Vries Bouw")
+
+    def search(self, q: str) -> list:
+        response = self.client.get(self.url, {"q": q})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result["uuid"] for result in response.json()["results"]]
+
+    def test_search_name(self):
+        self.assertEqual(self.search("johanna de vries"), [str(self.partij.uuid)])
+        self.assertEqual(self.search("Vries Bou"), [str(self.other.uuid)])
+
+    def test_search_start_of_word(self):
+        self.assertEqual(self.search("joh"), [str(self.partij.uuid)])
+
+    def test_search_part_of_word(self):
+        self.assertEqual(self.search("example"), [str(self.partij.uuid)])
+
+    def test_search_adres(self):
+        self.assertEqual(self.search("kalverstraat 12"), [str(self.partij.uuid)])
+        self.assertEqual(self.search("amsterdam"), [str(self.partij.uuid)])
+
+    def test_search_postcode(self):
+        self.assertEqual(self.search("1012AB"), [str(self.partij.uuid)])
+        self.assertEqual(self.search("1012 ab"), [str(self.partij.uuid)])
+
+    def test_search_identificator(self):
+        self.assertEqual(self.search("296648875"), [str(self.partij.uuid)])
+
+    def test_search_ranked(self):
+        self.assertEqual(
+            self.search("vries"), [str(self.other.uuid), str(self.partij.uuid)]
+        )
+
+    def test_search_special_characters(self):
+        self.assertEqual(self.search("vries & (bouw | !)"), [str(self.other.uuid)])
+        self.assertEqual(self.search("&|"), [])
+
+    def test_search_paginated(self):
+        response = self.client.get(self.url, {"q": "vries", "pageSize": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(data["results"][0]["uuid"], str(self.other.uuid))
+        self.assertIsNotNone(data["next"])
+
+    def test_search_cursor(self):
+        response = self.client.get(
+            self.url, {"q": "vries", "pageSize": 1, "cursor": ""}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["results"][0]["uuid"], str(self.other.uuid))
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["results"][0]["uuid"], str(self.partij.uuid))
+        self.assertIsNone(data["next"])
+
+    def test_search_expand(self):
+        response = self.client.get(
+            self.url, {"q": "johanna", "expand": "digitaleAdressen"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [result] = response.json()["results"]
+        self.assertEqual(
+            result["_expand"]["digitaleAdressen"][0]["adres"], "johanna@example.com"
+        )
+
+    def test_search_required(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["name"], "q")
+
+    def test_search_too_short(self):
+        response = self.client.get(self.url, {"q": "j"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_updated_partij_is_found(self):
+        url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(self.partij.uuid)}
+        )
+        response = self.client.patch(
+            url,
+            {
+                "soortPartij": "persoon",
+                "partijIdentificatie": {
+                    "contactnaam": {
+                        "voorletters": "J",
+                        "voornaam": "Johanna",
+                        "voorvoegselAchternaam": "",
+                        "achternaam": "Jansen",
+                    }
+                },
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.search("jansen"), [str(self.partij.uuid)])
+        self.assertEqual(self.search("vries"), [str(self.other.uuid)])
+
+
+class PartijZoekdocumentTests(APITestCase):
+    def test_document_is_updated(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        persoon = PersoonFactory.create(partij=partij, contactnaam_achternaam="Smit")
+        digitaal_adres = DigitaalAdresFactory.create(
+            partij=partij, betrokkene=None, adres="smit@example.com"
+        )
+
+        self.assertEqual(partij.zoekdocument.tekst, get_zoektekst(partij))
+        self.assertIn("smit@example.com", PartijZoekdocument.objects.get().tekst)
+
+        digitaal_adres.delete()
+        persoon.contactnaam_achternaam = "Bakker"
+        persoon.save()
+
+        zoekdocument = PartijZoekdocument.objects.get()
+        self.assertNotIn("smit@example.com", zoekdocument.tekst)
+        self.assertIn("Bakker", zoekdocument.tekst)
+
+    def test_document_is_deleted_with_partij(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        PersoonFactory.create(partij=partij)
+        DigitaalAdresFactory.create(partij=partij, betrokkene=None)
+
+        partij.delete()
+        Partij.objects.all().delete()
+
+        self.assertFalse(PartijZoekdocument.objects.exists())
+
+    def test_bulk_upsert_updates_document(self):
+        def bulk(naam):
+            return self.client.post(
+                reverse("klantinteracties:partij-bulk"),
+                [
+                    {
+                        "soortPartij": "organisatie",
+                        "indicatieActief": True,
+                        "partijIdentificatie": {"naam": naam},
+                        "partijIdentificatoren": [
+                            {
+                                "partijIdentificator": {
+                                    "codeObjecttype": "niet_natuurlijk_persoon",
+                                    "codeSoortObjectId": "kvk_nummer",
+                                    "objectId": "12345678",
+                                    "codeRegister": "hr",
+                                }
+                            }
+                        ],
+                    }
+                ],
+            )
+
+        response = bulk("Maykin")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(PartijZoekdocument.objects.get().tekst, "Maykin 12345678")
+
+        response = bulk("Maykin Media")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            PartijZoekdocument.objects.get().tekst, "Maykin Media 12345678"
+        )
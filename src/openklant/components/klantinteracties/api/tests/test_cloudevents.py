@@ -4,6 +4,7 @@ from unittest.mock import patch
 from django.test import override_settings
 
 from freezegun.api import freeze_time
+from notifications_api_common.models import NotificationTypes
 from rest_framework import status
 from vng_api_common.tests import reverse
 
@@ -16,6 +17,7 @@ from openklant.components.klantinteracties.models.tests.factories import (
     OnderwerpobjectFactory,
 )
 from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.utils.models import OutboxNotification
 
 MOCKED_CLOUDEVENT_ID = "f347fd1f-dac1-4870-9dd0-f6c00edf4bf7"
 FROZEN_TIME = "2025-10-10"
@@ -456,3 +458,76 @@ class OnderwerpobjectCloudEventTest(APITestCase):
         assert second_payload["data"]["linkTo"] == expected_link_to
         assert second_payload["data"]["label"] == str(self.klantcontact)
         assert second_payload["data"]["linkObjectType"] == "Onderwerpobject"
+
+
+@freeze_time("2025-10-10")
+@patch("notifications_api_common.tasks.send_cloudevent.delay")
+@override_settings(
+    NOTIFICATIONS_SOURCE="ok-test",
+    ENABLE_CLOUD_EVENTS=True,
+    NOTIFICATIONS_OUTBOX_ENABLED=True,
+)
+class OnderwerpobjectCloudEventOutboxTest(APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.klantcontact = KlantcontactFactory(onderwerp="Mijn Klantcontact Onderwerp")
+        self.zaak_uuid = uuid.UUID("a7b3c8d9-e4f5-6a7b-8c9d-e0f1a2b3c4d5")
+
+    def test_cloudevents_are_stored_in_outbox(self, mock_send_cloudevent):
+        url = reverse("klantinteracties:onderwerpobject-list")
+        data = {
+            "klantcontact": {"uuid": str(self.klantcontact.uuid)},
+            "onderwerpobjectidentificator": {
+                "codeObjecttype": "zaak",
+                "object_id": str(self.zaak_uuid),
+                "codeRegister": "open-zaak",
+                "codeSoortObjectId": "uuid",
+            },
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        detail_url = response.json()["url"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(detail_url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        mock_send_cloudevent.assert_not_called()
+
+        notifications = OutboxNotification.objects.order_by("pk")
+        assert [notification.type for notification in notifications] == [
+            NotificationTypes.cloudevent,
+            NotificationTypes.cloudevent,
+        ]
+        assert [notification.message["type"] for notification in notifications] == [
+            ZAAK_GEKOPPELD,
+            ZAAK_ONTKOPPELD,
+        ]
+        for notification in notifications:
+            assert notification.message["source"] == "ok-test"
+            assert notification.message["subject"] == str(self.zaak_uuid)
+            assert notification.message["data"]["linkTo"] == detail_url
+
+    @override_settings(NOTIFICATIONS_SOURCE="")
+    def test_no_cloudevent_without_source(self, mock_send_cloudevent):
+        url = reverse("klantinteracties:onderwerpobject-list")
+        data = {
+            "klantcontact": {"uuid": str(self.klantcontact.uuid)},
+            "onderwerpobjectidentificator": {
+                "codeObjecttype": "zaak",
+                "object_id": str(self.zaak_uuid),
+                "codeRegister": "open-zaak",
+                "codeSoortObjectId": "uuid",
+            },
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not OutboxNotification.objects.exists()
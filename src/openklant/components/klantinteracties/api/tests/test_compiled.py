@@ -0,0 +1,151 @@
+from django.test import override_settings
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    ActorKlantcontactFactory,
+    BetrokkeneFactory,
+    BijlageFactory,
+    BsnPartijIdentificatorFactory,
+    CategorieRelatieFactory,
+    ContactpersoonFactory,
+    DigitaalAdresFactory,
+    InterneTaakFactory,
+    KlantcontactFactory,
+    MedewerkerFactory,
+    OnderwerpobjectFactory,
+    OrganisatieFactory,
+    PartijFactory,
+    PersoonFactory,
+    RekeningnummerFactory,
+    VertegenwoordigdenFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.utils.compiled import CompiledListSerializer
+
+
+class CompiledRepresentationTests(APITestCase):
+    """
+    The compiled representation renders exactly the same responses as the
+    serializers.
+    """
+
+    def setUp(self):
+        super().setUp()
+        persoon = PersoonFactory.create(
+            partij__voorkeurs_digitaal_adres=None,
+            partij__nummer="1234567890",
+            partij__bezoekadres_straatnaam="Kalverstraat",
+            partij__bezoekadres_huisnummer=1,
+            contactnaam_achternaam="Vries",
+        )
+        self.partij = persoon.partij
+        digitaal_adres = DigitaalAdresFactory.create(
+            partij=self.partij, betrokkene=None
+        )
+        self.partij.voorkeurs_digitaal_adres = digitaal_adres
+        self.partij.save()
+        RekeningnummerFactory.create(partij=self.partij)
+        BsnPartijIdentificatorFactory.create(partij=self.partij)
+        CategorieRelatieFactory.create(partij=self.partij)
+
+        organisatie = OrganisatieFactory.create(partij__voorkeurs_digitaal_adres=None)
+        ContactpersoonFactory.create(
+            partij__voorkeurs_digitaal_adres=None, werkte_voor_partij=organisatie.partij
+        )
+        VertegenwoordigdenFactory.create(
+            vertegenwoordigende_partij=self.partij,
+            vertegenwoordigde_partij=organisatie.partij,
+        )
+        PartijFactory.create(voorkeurs_digitaal_adres=None, soort_partij="persoon")
+
+        klantcontact = KlantcontactFactory.create()
+        betrokkene = BetrokkeneFactory.create(
+            klantcontact=klantcontact,
+            partij=self.partij,
+            bezoekadres_straatnaam="Kalverstraat",
+        )
+        DigitaalAdresFactory.create(partij=None, betrokkene=betrokkene)
+        OnderwerpobjectFactory.create(klantcontact=klantcontact)
+        BijlageFactory.create(klantcontact=klantcontact)
+        ActorKlantcontactFactory.create(
+            klantcontact=klantcontact, actor=MedewerkerFactory.create().actor
+        )
+        InterneTaakFactory.create(klantcontact=klantcontact)
+        KlantcontactFactory.create()
+
+    def get_content(self, response) -> bytes:
+        if response.streaming:
+            return b"".join(response.streaming_content)
+        return response.content
+
+    def assertSameResponse(self, url: str, params=None):
+        with override_settings(API_COMPILED_REPRESENTATION=False):
+            expected = self.client.get(url, params)
+        with override_settings(API_COMPILED_REPRESENTATION=True):
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_content(response), self.get_content(expected))
+        return response
+
+    def test_partijen(self):
+        response = self.assertSameResponse(reverse("klantinteracties:partij-list"))
+
+        self.assertIsInstance(
+            response.data["results"].serializer, CompiledListSerializer
+        )
+        self.assertEqual(len(response.json()["results"]), 4)
+
+    def test_partijen_fields(self):
+        url = reverse("klantinteracties:partij-list")
+
+        self.assertSameResponse(url, {"fields": "uuid,nummer,bezoekadres"})
+        self.assertSameResponse(url, {"fields": "partijIdentificatie"})
+        self.assertSameResponse(url, {"fields": "digitaleAdressen,vertegenwoordigden"})
+
+    def test_partijen_filter(self):
+        self.assertSameResponse(
+            reverse("klantinteracties:partij-list"), {"soortPartij": "organisatie"}
+        )
+
+    def test_klantcontacten(self):
+        response = self.assertSameResponse(
+            reverse("klantinteracties:klantcontact-list")
+        )
+
+        self.assertIsInstance(
+            response.data["results"].serializer, CompiledListSerializer
+        )
+
+    def test_klantcontacten_fields(self):
+        self.assertSameResponse(
+            reverse("klantinteracties:klantcontact-list"),
+            {"fields": "uuid,hadBetrokkenen,gingOverOnderwerpobjecten"},
+        )
+
+    def test_expand(self):
+        response = self.assertSameResponse(
+            reverse("klantinteracties:klantcontact-list"),
+            {"expand": "hadBetrokkenen,hadBetrokkenen.wasPartij"},
+        )
+
+        # the expanded resources are rendered by the serializers
+        self.assertNotIsInstance(
+            response.data["results"].serializer, CompiledListSerializer
+        )
+
+    def test_export(self):
+        for name in ("partij", "klantcontact"):
+            for formaat in ("ndjson", "csv"):
+                with self.subTest(name=name, formaat=formaat):
+                    self.assertSameResponse(
+                        reverse(f"klantinteracties:{name}-export"),
+                        {"formaat": formaat},
+                    )
+
+    def test_retrieve(self):
+        self.assertSameResponse(
+            reverse("klantinteracties:partij-detail", kwargs={"uuid": self.partij.uuid})
+        )
@@ -0,0 +1,208 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    ActorKlantcontactFactory,
+    BetrokkeneFactory,
+    CategorieFactory,
+    CategorieRelatieFactory,
+    DigitaalAdresFactory,
+    KlantcontactFactory,
+    MedewerkerFactory,
+    PartijFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+
+
+class PartijConditionalRequestTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.partij = PartijFactory.create(
+            voorkeurs_digitaal_adres=None, soort_partij="persoon"
+        )
+        self.url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(self.partij.uuid)}
+        )
+
+    def get_etag(self, url=None, **params) -> str:
+        response = self.client.get(url or self.url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response["ETag"]
+
+    def test_retrieve_not_modified(self):
+        etag = self.get_etag()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        # only the partij is queried, the related objects aren't prefetched
+        self.assertEqual(len(queries), 1)
+
+    def test_retrieve_weak_etag(self):
+        etag = self.get_etag()
+
+        response = self.client.get(
+            self.url, headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_modified(self):
+        etag = self.get_etag()
+
+        self.partij.interne_notitie = "gewijzigd"
+        self.partij.save()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["interneNotitie"], "gewijzigd")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_related_objects_modified(self):
+        etags = [self.get_etag()]
+
+        digitaal_adres = DigitaalAdresFactory.create(partij=self.partij)
+        etags.append(self.get_etag())
+
+        digitaal_adres.delete()
+        etags.append(self.get_etag())
+
+        categorie_relatie = CategorieRelatieFactory.create(
+            partij=self.partij, categorie=CategorieFactory.create()
+        )
+        etags.append(self.get_etag())
+
+        categorie_relatie.categorie.naam = "gewijzigd"
+        categorie_relatie.categorie.save()
+        etags.append(self.get_etag())
+
+        self.assertEqual(len(set(etags)), len(etags))
+
+    def test_retrieve_related_object_moved(self):
+        digitaal_adres = DigitaalAdresFactory.create(partij=self.partij)
+        etag = self.get_etag()
+
+        digitaal_adres.partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        digitaal_adres.save()
+
+        self.assertNotEqual(self.get_etag(), etag)
+
+    def test_representation(self):
+        etag = self.get_etag()
+
+        self.assertNotEqual(self.get_etag(fields="uuid"), etag)
+
+        response = self.client.get(self.url, {"expand": "digitaleAdressen"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # the expanded resources are not part of the version
+        self.assertNotIn("ETag", response)
+
+    def test_list_not_modified(self):
+        url = reverse("klantinteracties:partij-list")
+        etag = self.get_etag(url)
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        PartijFactory.create(voorkeurs_digitaal_adres=None)
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_pagination(self):
+        PartijFactory.create(voorkeurs_digitaal_adres=None)
+        url = reverse("klantinteracties:partij-list")
+
+        first = self.get_etag(url, pageSize=1)
+        second = self.get_etag(url, pageSize=1, page=2)
+
+        self.assertNotEqual(first, second)
+
+        # a partij on another page changes the count of the first page
+        self.partij.delete()
+
+        self.assertNotEqual(self.get_etag(url, pageSize=1), first)
+
+    def test_update_if_match(self):
+        etag = self.get_etag()
+
+        response = self.client.patch(
+            self.url, {"interneNotitie": "gewijzigd"}, headers={"If-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response["ETag"], self.get_etag())
+
+    def test_update_if_match_modified(self):
+        etag = self.get_etag()
+        DigitaalAdresFactory.create(partij=self.partij)
+
+        response = self.client.patch(
+            self.url, {"interneNotitie": "gewijzigd"}, headers={"If-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.partij.refresh_from_db()
+        self.assertEqual(self.partij.interne_notitie, "")
+
+
+class KlantcontactConditionalRequestTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        self.klantcontact = KlantcontactFactory.create()
+        BetrokkeneFactory.create(klantcontact=self.klantcontact, partij=self.partij)
+
+        self.url = reverse("klantinteracties:klantcontact-list")
+        self.params = {"hadBetrokkene__wasPartij__uuid": str(self.partij.uuid)}
+
+    def test_list_not_modified(self):
+        response = self.client.get(self.url, self.params)
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.url, self.params, headers={"If-None-Match": etag}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        # only the count and the page are queried
+        self.assertEqual(len(queries), 2)
+
+    def test_list_related_objects_modified(self):
+        etag = self.client.get(self.url, self.params)["ETag"]
+
+        medewerker = MedewerkerFactory.create()
+        ActorKlantcontactFactory.create(
+            actor=medewerker.actor, klantcontact=self.klantcontact
+        )
+        response = self.client.get(self.url, self.params)
+
+        self.assertNotEqual(response["ETag"], etag)
+        etag = response["ETag"]
+
+        medewerker.actor.naam = "gewijzigd"
+        medewerker.actor.save()
+        response = self.client.get(
+            self.url, self.params, headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"][0]["hadBetrokkenActoren"][0]["naam"],
+            "gewijzigd",
+        )
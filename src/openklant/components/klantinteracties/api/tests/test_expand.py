@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from vng_api_common.tests import get_validation_errors, reverse
 from vng_api_common.viewsets import UNKNOWN_PARAMETERS_CODE
@@ -7,11 +10,15 @@ from openklant.components.klantinteracties.models.tests.factories import (
     ActorKlantcontactFactory,
     BetrokkeneFactory,
     BijlageFactory,
+    CategorieFactory,
+    CategorieRelatieFactory,
     DigitaalAdresFactory,
     InterneTaakFactory,
     KlantcontactFactory,
+    MedewerkerFactory,
     OnderwerpobjectFactory,
     PartijFactory,
+    VertegenwoordigdenFactory,
 )
 from openklant.components.token.tests.api_testcase import APITestCase
 
@@ -457,3 +464,74 @@ class ExpandTests(APITestCase):
         self.assertTrue(response.json()["_expand"])
         self.assertTrue(response.json()["_expand"]["hadBetrokkenen"])
         self.assertTrue(response.json()["_expand"]["leiddeTotInterneTaken"])
+
+
+class ExpandQueryCountTests(APITestCase):
+    """
+    The number of queries of an expanded list must not depend on the number of
+    objects in the page.
+    """
+
+    def create_klantcontact(self):
+        klantcontact = KlantcontactFactory.create()
+        actor = MedewerkerFactory.create().actor
+        ActorKlantcontactFactory.create(actor=actor, klantcontact=klantcontact)
+        InterneTaakFactory.create(klantcontact=klantcontact, actoren=[actor])
+        OnderwerpobjectFactory.create(klantcontact=klantcontact, was_klantcontact=None)
+        BijlageFactory.create(klantcontact=klantcontact)
+
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        CategorieRelatieFactory.create(partij=partij, categorie=CategorieFactory())
+        VertegenwoordigdenFactory.create(
+            vertegenwoordigende_partij=partij,
+            vertegenwoordigde_partij__voorkeurs_digitaal_adres=None,
+        )
+        betrokkene = BetrokkeneFactory.create(klantcontact=klantcontact, partij=partij)
+        DigitaalAdresFactory.create(partij=partij, betrokkene=betrokkene)
+
+    def assertQueryCountIsConstant(self, url, expand):
+        self.create_klantcontact()
+        # the token is cached after the first request
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as single:
+            response = self.client.get(url, {"expand": expand})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["results"][0]["_expand"])
+
+        for _ in range(4):
+            self.create_klantcontact()
+
+        with CaptureQueriesContext(connection) as multiple:
+            response = self.client.get(url, {"expand": expand})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(response.json()["count"], 4)
+        self.assertEqual(len(multiple), len(single))
+
+    def test_klantcontacten(self):
+        self.assertQueryCountIsConstant(
+            reverse("klantinteracties:klantcontact-list"),
+            "hadBetrokkenen,hadBetrokkenen.wasPartij,hadBetrokkenen.digitaleAdressen,"
+            "leiddeTotInterneTaken,gingOverOnderwerpobjecten,omvatteBijlagen",
+        )
+
+    def test_partijen(self):
+        self.assertQueryCountIsConstant(
+            reverse("klantinteracties:partij-list"),
+            "betrokkenen,betrokkenen.hadKlantcontact,digitaleAdressen,"
+            "categorieRelaties",
+        )
+
+    def test_betrokkenen(self):
+        self.assertQueryCountIsConstant(
+            reverse("klantinteracties:betrokkene-list"), "digitaleAdressen"
+        )
+
+    def test_digitale_adressen(self):
+        self.assertQueryCountIsConstant(
+            reverse("klantinteracties:digitaaladres-list"),
+            "verstrektDoorBetrokkene,verstrektDoorBetrokkene.hadKlantcontact,"
+            "verstrektDoorBetrokkene.hadKlantcontact.leiddeTotInterneTaken",
+        )
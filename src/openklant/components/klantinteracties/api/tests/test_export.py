@@ -0,0 +1,174 @@
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    BetrokkeneFactory,
+    DigitaalAdresFactory,
+    KlantcontactFactory,
+    PartijFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.utils.mixins import ExportMixin
+
+
+class PartijExportTests(APITestCase):
+    url = reverse("klantinteracties:partij-export")
+    list_url = reverse("klantinteracties:partij-list")
+
+    def setUp(self):
+        super().setUp()
+        self.partijen = [
+            PartijFactory.create(voorkeurs_digitaal_adres=None, soort_partij="persoon")
+            for _ in range(3)
+        ]
+        for partij in self.partijen:
+            DigitaalAdresFactory.create(partij=partij)
+
+    def get_content(self, response) -> str:
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="partijen.ndjson"'
+        )
+        rows = [json.loads(line) for line in self.get_content(response).splitlines()]
+
+        # the partijen are exported like they are listed
+        data = self.client.get(self.list_url).json()
+        self.assertEqual(rows, data["results"])
+
+    def test_export_csv(self):
+        response = self.client.get(self.url, {"formaat": "csv"})
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+
+        data = self.client.get(self.list_url).json()["results"]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows[0]), list(data[0]))
+        self.assertEqual(rows[0]["uuid"], data[0]["uuid"])
+        self.assertEqual(
+            rows[0]["indicatieActief"], json.dumps(data[0]["indicatieActief"])
+        )
+        # nested objects are written as JSON
+        self.assertEqual(
+            json.loads(rows[0]["digitaleAdressen"]), data[0]["digitaleAdressen"]
+        )
+
+    def test_export_csv_empty(self):
+        response = self.client.get(
+            self.url, {"formaat": "csv", "fields": "uuid,nummer", "nummer": "0"}
+        )
+
+        self.assertEqual(self.get_content(response), "uuid,nummer\r\n")
+
+    def test_export_filters(self):
+        partij = self.partijen[1]
+
+        response = self.client.get(self.url, {"nummer": partij.nummer})
+
+        rows = self.get_content(response).splitlines()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(json.loads(rows[0])["uuid"], str(partij.uuid))
+
+    def test_export_fields(self):
+        response = self.client.get(self.url, {"formaat": "csv", "fields": "uuid"})
+
+        rows = list(csv.reader(io.StringIO(self.get_content(response))))
+        self.assertEqual(rows[0], ["uuid"])
+        self.assertEqual(
+            {row[0] for row in rows[1:]},
+            {str(partij.uuid) for partij in self.partijen},
+        )
+
+    def test_constant_number_of_queries(self):
+        self.get_content(self.client.get(self.url))
+        with CaptureQueriesContext(connection) as queries:
+            self.get_content(self.client.get(self.url))
+
+        for _ in range(3):
+            partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+            DigitaalAdresFactory.create(partij=partij)
+
+        with self.assertNumQueries(len(queries)):
+            self.get_content(self.client.get(self.url))
+
+    @patch.object(ExportMixin, "export_chunk_size", 2)
+    def test_export_in_chunks(self):
+        with CaptureQueriesContext(connection) as queries:
+            content = self.get_content(self.client.get(self.url))
+
+        self.assertEqual(len(content.splitlines()), 3)
+
+        # the related objects are prefetched per chunk
+        prefetch_queries = [
+            query
+            for query in queries.captured_queries
+            if 'FROM "klantinteracties_digitaaladres"' in query["sql"]
+        ]
+        self.assertEqual(len(prefetch_queries), 2)
+
+    def test_invalid_format(self):
+        response = self.client.get(self.url, {"formaat": "xml"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "invalid-choice")
+
+    def test_unknown_parameter(self):
+        response = self.client.get(self.url, {"page": "2"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_expand(self):
+        response = self.client.get(self.url, {"expand": "digitaleAdressen"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "unsupported")
+
+    def test_unauthenticated(self):
+        response = APIClient().get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class KlantcontactExportTests(APITestCase):
+    url = reverse("klantinteracties:klantcontact-export")
+
+    @patch.object(ExportMixin, "export_chunk_size", 1)
+    def test_export_filters(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        klantcontacten = KlantcontactFactory.create_batch(2)
+        for klantcontact in klantcontacten:
+            BetrokkeneFactory.create(klantcontact=klantcontact, partij=partij)
+        KlantcontactFactory.create()
+
+        response = self.client.get(
+            self.url, {"hadBetrokkene__wasPartij__uuid": str(partij.uuid)}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="klantcontacten.ndjson"',
+        )
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(
+            {row["uuid"] for row in rows},
+            {str(klantcontact.uuid) for klantcontact in klantcontacten},
+        )
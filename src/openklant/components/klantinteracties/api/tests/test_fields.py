@@ -0,0 +1,224 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    ActorKlantcontactFactory,
+    BetrokkeneFactory,
+    DigitaalAdresFactory,
+    KlantcontactFactory,
+    MedewerkerFactory,
+    PartijFactory,
+    PersoonFactory,
+    VertegenwoordigdenFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.utils.fieldsets import get_sources_of_field
+
+
+class PartijFieldsTests(APITestCase):
+    url = reverse("klantinteracties:partij-list")
+
+    def setUp(self):
+        super().setUp()
+        self.partij = PartijFactory.create(
+            voorkeurs_digitaal_adres=None,
+            soort_partij="persoon",
+            nummer="1234567890",
+            interne_notitie="notitie",
+            bezoekadres_straatnaam="Kalverstraat",
+            bezoekadres_huisnummer=1,
+        )
+        PersoonFactory.create(partij=self.partij, contactnaam_achternaam="Vries")
+        self.digitaal_adres = DigitaalAdresFactory.create(
+            partij=self.partij, betrokkene=None
+        )
+        self.vertegenwoordigde = VertegenwoordigdenFactory.create(
+            vertegenwoordigende_partij=self.partij,
+            vertegenwoordigde_partij__voorkeurs_digitaal_adres=None,
+        ).vertegenwoordigde_partij
+
+    def get_results(self, **params) -> list:
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["results"]
+
+    def test_fields(self):
+        results = self.get_results(fields="uuid,nummer")
+
+        self.assertEqual(
+            results[-1], {"uuid": str(self.partij.uuid), "nummer": "1234567890"}
+        )
+
+    def test_fields_multiple_params(self):
+        response = self.client.get(f"{self.url}?fields=uuid&fields=interneNotitie")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"][-1],
+            {"uuid": str(self.partij.uuid), "interneNotitie": "notitie"},
+        )
+
+    def test_fields_gegevensgroep(self):
+        results = self.get_results(fields="bezoekadres")
+
+        self.assertEqual(list(results[-1]), ["bezoekadres"])
+        self.assertEqual(results[-1]["bezoekadres"]["straatnaam"], "Kalverstraat")
+        self.assertEqual(results[-1]["bezoekadres"]["huisnummer"], 1)
+
+    def test_fields_partij_identificatie(self):
+        results = self.get_results(fields="partijIdentificatie")
+
+        self.assertEqual(list(results[-1]), ["partijIdentificatie"])
+        self.assertEqual(
+            results[-1]["partijIdentificatie"]["contactnaam"]["achternaam"], "Vries"
+        )
+
+    def test_fields_relations(self):
+        results = self.get_results(fields="digitaleAdressen,vertegenwoordigden")
+
+        self.assertEqual(
+            results[-1],
+            {
+                "digitaleAdressen": [
+                    {
+                        "uuid": str(self.digitaal_adres.uuid),
+                        "url": "http://testserver"
+                        + reverse(
+                            "klantinteracties:digitaaladres-detail",
+                            kwargs={"uuid": str(self.digitaal_adres.uuid)},
+                        ),
+                    }
+                ],
+                "vertegenwoordigden": [
+                    {
+                        "uuid": str(self.vertegenwoordigde.uuid),
+                        "url": "http://testserver"
+                        + reverse(
+                            "klantinteracties:partij-detail",
+                            kwargs={"uuid": str(self.vertegenwoordigde.uuid)},
+                        ),
+                    }
+                ],
+            },
+        )
+
+    def test_fields_detail(self):
+        url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(self.partij.uuid)}
+        )
+        response = self.client.get(url, {"fields": "nummer,soortPartij"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(), {"nummer": "1234567890", "soortPartij": "persoon"}
+        )
+
+    def test_fields_expand(self):
+        results = self.get_results(fields="nummer", expand="digitaleAdressen")
+
+        self.assertEqual(
+            set(results[-1]), {"nummer", "url", "digitaleAdressen", "_expand"}
+        )
+        self.assertEqual(
+            results[-1]["_expand"]["digitaleAdressen"][0]["uuid"],
+            str(self.digitaal_adres.uuid),
+        )
+
+    def test_fields_unknown(self):
+        response = self.client.get(self.url, {"fields": "uuid,onbekend"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "fields")
+        self.assertEqual(error["code"], "unknown-fields")
+
+    def test_fields_queries(self):
+        # the token is cached after the first request
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as all_fields:
+            self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {"fields": "uuid,nummer"})
+
+        self.assertLess(len(queries), len(all_fields))
+        # only the count and the partijen are queried
+        self.assertEqual(len(queries), 2)
+        select = queries.captured_queries[-1]["sql"]
+        self.assertIn('"klantinteracties_partij"."nummer"', select)
+        self.assertNotIn('"klantinteracties_partij"."interne_notitie"', select)
+        self.assertNotIn("JOIN", select)
+
+    def test_fields_cache_per_field(self):
+        get_sources_of_field.cache_clear()
+
+        self.get_results(fields="uuid,nummer")
+        self.get_results(fields="uuid,interneNotitie")
+        self.get_results(fields="nummer,interneNotitie")
+
+        # the sources are cached per field, not per combination of fields
+        self.assertEqual(get_sources_of_field.cache_info().currsize, 3)
+
+
+class KlantcontactFieldsTests(APITestCase):
+    url = reverse("klantinteracties:klantcontact-list")
+
+    def setUp(self):
+        super().setUp()
+        self.klantcontact = KlantcontactFactory.create(onderwerp="vraag")
+        self.actor = MedewerkerFactory.create().actor
+        ActorKlantcontactFactory.create(
+            actor=self.actor, klantcontact=self.klantcontact
+        )
+        BetrokkeneFactory.create(klantcontact=self.klantcontact, partij=None)
+
+    def test_fields(self):
+        response = self.client.get(
+            self.url, {"fields": "onderwerp,hadBetrokkenActoren"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [result] = response.json()["results"]
+        self.assertEqual(list(result), ["hadBetrokkenActoren", "onderwerp"])
+        self.assertEqual(result["onderwerp"], "vraag")
+        self.assertEqual(result["hadBetrokkenActoren"][0]["uuid"], str(self.actor.uuid))
+
+    def test_fields_cursor(self):
+        KlantcontactFactory.create()
+
+        response = self.client.get(
+            self.url, {"fields": "uuid", "cursor": "", "pageSize": 1}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first = response.json()["results"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(response.json()["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second = response.json()["results"]
+        self.assertEqual(len(first + second), 2)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(queries), 1)
+
+    def test_fields_constant_queries(self):
+        params = {"fields": "uuid,hadBetrokkenActoren,hadBetrokkenen"}
+        self.client.get(self.url, params)
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(self.url, params)
+
+        for _ in range(3):
+            klantcontact = KlantcontactFactory.create()
+            ActorKlantcontactFactory.create(klantcontact=klantcontact)
+            BetrokkeneFactory.create(klantcontact=klantcontact, partij=None)
+
+        with CaptureQueriesContext(connection) as multiple:
+            response = self.client.get(self.url, params)
+
+        self.assertEqual(response.json()["count"], 4)
+        self.assertEqual(len(multiple), len(single))
@@ -76,6 +76,23 @@ class KanaalValidatorAPITestCase(ClearCachesMixin, APITestCase, VCRTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    @patch(
+        "openklant.components.klantinteracties.api.validators.ReferentielijstenConfig.get_solo"
+    )
+    def test_kanalen_are_retrieved_once(self, mock_get_solo):
+        mock_get_solo.return_value = self.config
+        url = reverse("klantinteracties:klantcontact-list", kwargs={"version": "1"})
+
+        for nummer in ("0000000001", "0000000002"):
+            with self.subTest(nummer=nummer):
+                data = {**self.initial_data, "nummer": nummer}
+
+                response = self.client.post(url, data, format="json")
+
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(self.cassette.play_count, 1)
+
     @patch(
         "openklant.components.klantinteracties.api.validators.ReferentielijstenConfig.get_solo"
     )
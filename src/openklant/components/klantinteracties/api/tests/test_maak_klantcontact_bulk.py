@@ -0,0 +1,302 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.api.tests.factories import (
+    BetrokkeneDataFactory,
+    KlantContactDataFactory,
+    OnderwerpObjectDataFactory,
+)
+from openklant.components.klantinteracties.models.constants import Wijzigingsactie
+from openklant.components.klantinteracties.models.klantcontacten import (
+    Betrokkene,
+    Klantcontact,
+    Onderwerpobject,
+)
+from openklant.components.klantinteracties.models.tests.factories import (
+    KlantcontactFactory,
+    PartijFactory,
+)
+from openklant.components.klantinteracties.models.wijzigingen import Wijziging
+from openklant.components.token.tests.api_testcase import APITestCase
+
+
+def get_maak_klantcontact(**kwargs) -> dict:
+    return {
+        "klantcontact": KlantContactDataFactory.create(nummer=None),
+        "betrokkene": BetrokkeneDataFactory.create(),
+        "onderwerpobject": OnderwerpObjectDataFactory.create(),
+        **kwargs,
+    }
+
+
+class MaakKlantcontactBulkTests(APITestCase):
+    url = reverse("klantinteracties:maak-klantcontact-bulk")
+
+    def test_create(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        was_klantcontact = KlantcontactFactory.create()
+        data = [
+            get_maak_klantcontact(
+                betrokkene=BetrokkeneDataFactory.create(
+                    wasPartij={"uuid": str(partij.uuid)}
+                ),
+                onderwerpobject=OnderwerpObjectDataFactory.create(
+                    wasKlantcontact={"uuid": str(was_klantcontact.uuid)}
+                ),
+            ),
+            {"klantcontact": KlantContactDataFactory.create(nummer="1234567890")},
+        ]
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        first, second = Klantcontact.objects.exclude(pk=was_klantcontact.pk).order_by(
+            "pk"
+        )
+        betrokkene = Betrokkene.objects.get()
+        onderwerpobject = Onderwerpobject.objects.get()
+        self.assertEqual(betrokkene.klantcontact, first)
+        self.assertEqual(betrokkene.partij, partij)
+        self.assertEqual(betrokkene.bezoekadres_straatnaam, "straat")
+        self.assertEqual(betrokkene.contactnaam_voornaam, "Phil")
+        self.assertEqual(onderwerpobject.klantcontact, first)
+        self.assertEqual(onderwerpobject.was_klantcontact, was_klantcontact)
+        self.assertEqual(
+            onderwerpobject.onderwerpobjectidentificator_object_id, "objectId"
+        )
+        self.assertEqual(second.nummer, "1234567890")
+        self.assertEqual(second.onderwerp, "changed")
+
+        def get_reference(name, obj) -> dict:
+            url = reverse(f"klantinteracties:{name}-detail", kwargs={"uuid": obj.uuid})
+            return {"uuid": str(obj.uuid), "url": f"http://testserver{url}"}
+
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "index": 0,
+                    "resultaat": "aangemaakt",
+                    "klantcontact": get_reference("klantcontact", first),
+                    "betrokkene": get_reference("betrokkene", betrokkene),
+                    "onderwerpobject": get_reference(
+                        "onderwerpobject", onderwerpobject
+                    ),
+                    "fouten": None,
+                },
+                {
+                    "index": 1,
+                    "resultaat": "aangemaakt",
+                    "klantcontact": get_reference("klantcontact", second),
+                    "betrokkene": None,
+                    "onderwerpobject": None,
+                    "fouten": None,
+                },
+            ],
+        )
+
+    def test_versies_and_wijzigingen(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        versie = partij.versie
+        Wijziging.objects.all().delete()
+
+        response = self.client.post(
+            self.url,
+            [
+                get_maak_klantcontact(
+                    betrokkene=BetrokkeneDataFactory.create(
+                        wasPartij={"uuid": str(partij.uuid)}
+                    )
+                )
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        partij.refresh_from_db()
+        self.assertNotEqual(partij.versie, versie)
+        self.assertEqual(
+            sorted(Wijziging.objects.values_list("resource", "actie")),
+            [
+                ("betrokkene", Wijzigingsactie.aangemaakt),
+                ("klantcontact", Wijzigingsactie.aangemaakt),
+                ("onderwerpobject", Wijzigingsactie.aangemaakt),
+                ("partij", Wijzigingsactie.gewijzigd),
+            ],
+        )
+
+    def test_invalid_items_are_skipped(self):
+        response = self.client.post(
+            self.url,
+            [
+                get_maak_klantcontact(
+                    betrokkene=BetrokkeneDataFactory.create(
+                        wasPartij={"uuid": "6a0f0f9b-5b9a-4d2c-9d1e-8d4a0b1e2c3f"}
+                    ),
+                    onderwerpobject=OnderwerpObjectDataFactory.create(
+                        wasKlantcontact={"uuid": "0b0f0f9b-5b9a-4d2c-9d1e-8d4a0b1e2c3f"}
+                    ),
+                ),
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(kanaal="")
+                ),
+                get_maak_klantcontact(),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["resultaat"] for item in data], ["ongeldig", "ongeldig", "aangemaakt"]
+        )
+        self.assertEqual(
+            data[0]["fouten"],
+            {
+                "betrokkene": {"wasPartij": {"uuid": ["Partij object bestaat niet."]}},
+                "onderwerpobject": {
+                    "wasKlantcontact": {"uuid": ["Klantcontact object bestaat niet."]}
+                },
+            },
+        )
+        self.assertIn("kanaal", data[1]["fouten"]["klantcontact"])
+        self.assertEqual(
+            str(Klantcontact.objects.get().uuid), data[2]["klantcontact"]["uuid"]
+        )
+
+    def test_nummer(self):
+        KlantcontactFactory.create(nummer="1000000000")
+
+        response = self.client.post(
+            self.url,
+            [
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(nummer="1000000000")
+                ),
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(nummer="2000000000")
+                ),
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(nummer="2000000000")
+                ),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["fouten"] for item in data],
+            [
+                {
+                    "klantcontact": {
+                        "nummer": [
+                            "Er bestaat al een klantcontact met eenzelfde nummer."
+                        ]
+                    }
+                },
+                None,
+                {
+                    "klantcontact": {
+                        "nummer": ["`nummer` komt meerdere keren voor in het verzoek."]
+                    }
+                },
+            ],
+        )
+        self.assertEqual(Klantcontact.objects.count(), 2)
+
+    def test_referentienummer(self):
+        KlantcontactFactory.create(referentienummer="1000000000")
+
+        response = self.client.post(
+            self.url,
+            [
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(
+                        nummer="3000000001", referentienummer="1000000000"
+                    )
+                ),
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(
+                        nummer="3000000002", referentienummer="2000000000"
+                    )
+                ),
+                get_maak_klantcontact(
+                    klantcontact=KlantContactDataFactory.create(
+                        nummer="3000000003", referentienummer="2000000000"
+                    )
+                ),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["fouten"] for item in data],
+            [
+                {
+                    "klantcontact": {
+                        "referentienummer": [
+                            "Er bestaat al een klantcontact met eenzelfde "
+                            "referentienummer."
+                        ]
+                    }
+                },
+                None,
+                {
+                    "klantcontact": {
+                        "referentienummer": [
+                            "`referentienummer` komt meerdere keren voor in het "
+                            "verzoek."
+                        ]
+                    }
+                },
+            ],
+        )
+        self.assertEqual(
+            Klantcontact.objects.filter(referentienummer="2000000000").count(), 1
+        )
+
+    def test_number_of_queries(self):
+        def bulk(count):
+            partijen = [
+                PartijFactory.create(voorkeurs_digitaal_adres=None)
+                for _ in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.url,
+                    [
+                        get_maak_klantcontact(
+                            betrokkene=BetrokkeneDataFactory.create(
+                                wasPartij={"uuid": str(partij.uuid)}
+                            )
+                        )
+                        for partij in partijen
+                    ],
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        # the first request authenticates the token
+        bulk(1)
+
+        self.assertEqual(bulk(2), bulk(20))
+        self.assertEqual(Betrokkene.objects.count(), 23)
+
+    def test_no_list(self):
+        response = self.client.post(self.url, get_maak_klantcontact())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(KLANTCONTACTEN_BULK_MAX_SIZE=1)
+    def test_max_size(self):
+        response = self.client.post(
+            self.url, [get_maak_klantcontact(), get_maak_klantcontact()]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Klantcontact.objects.exists())
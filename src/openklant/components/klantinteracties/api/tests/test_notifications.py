@@ -3,7 +3,7 @@ from unittest.mock import patch
 from django.test import override_settings
 
 from freezegun import freeze_time
-from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.models import NotificationsConfig, NotificationTypes
 from rest_framework import status
 from vng_api_common.tests import reverse
 from zgw_consumers.constants import APITypes
@@ -20,10 +20,12 @@ from openklant.components.klantinteracties.models.tests.factories import (
     DigitaalAdresFactory,
     InterneTaakFactory,
     KlantcontactFactory,
+    KvkNummerPartijIdentificatorFactory,
     PartijFactory,
     RekeningnummerFactory,
 )
 from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.utils.models import OutboxNotification
 
 
 class NotificationsConfigTestCase:
@@ -172,6 +174,50 @@ class SendNotificationPartijTestCase(NotificationsConfigTestCase, APITestCase):
             None,
         )
 
+    def test_send_notification_bulk(self, m):
+        KvkNummerPartijIdentificatorFactory.create(partij=self.partij)
+        data = [
+            {
+                "interneNotitie": "bijgewerkt",
+                "soortPartij": SoortPartij.organisatie.value,
+                "partijIdentificatie": {"naam": "string"},
+                "partijIdentificatoren": [
+                    {
+                        "partijIdentificator": {
+                            "codeObjecttype": "niet_natuurlijk_persoon",
+                            "codeSoortObjectId": "kvk_nummer",
+                            "objectId": kvk_nummer,
+                            "codeRegister": "hr",
+                        }
+                    }
+                ],
+                "indicatieActief": True,
+            }
+            for kvk_nummer in ["12345678", "87654321"]
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("klantinteracties:partij-bulk"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(
+            [call.args[0]["actie"] for call in m.call_args_list], ["update", "create"]
+        )
+        self.assertEqual(
+            [call.args[0]["resourceUrl"] for call in m.call_args_list],
+            [result["partij"]["url"] for result in results],
+        )
+        self.assertEqual(
+            m.call_args_list[0].args[0]["kenmerken"],
+            {
+                "nummer": "1298329191",
+                "interneNotitie": "bijgewerkt",
+                "soortPartij": "organisatie",
+            },
+        )
+
 
 @freeze_time("2024-2-2T00:00:00Z")
 @override_settings(NOTIFICATIONS_DISABLED=False, LOG_NOTIFICATIONS_IN_DB=False)
@@ -454,3 +500,149 @@ class SendNotificationKlantContactTestCase(NotificationsConfigTestCase, APITestC
             },
             None,
         )
+
+    def test_send_notifications_maak_klantcontact_bulk(self, m):
+        url = reverse("klantinteracties:maak-klantcontact-bulk")
+        data = [
+            {
+                "klantcontact": KlantContactDataFactory.create(nummer=nummer),
+                "betrokkene": BetrokkeneDataFactory.create(),
+            }
+            for nummer in ["1000000001", "1000000002"]
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(m.call_count, 2)
+        for call, item in zip(m.call_args_list, response.json()):
+            self.assertEqual(
+                call.args[0],
+                {
+                    "kanaal": "klantcontacten",
+                    "hoofdObject": item["klantcontact"]["url"],
+                    "resource": "klantcontact",
+                    "resourceUrl": item["klantcontact"]["url"],
+                    "actie": "create",
+                    "aanmaakdatum": "2024-02-02T00:00:00Z",
+                    "kenmerken": {
+                        "hoofdOnderwerpType": "",
+                        "indicatieContactGelukt": False,
+                        "verdereActieOndernomen": False,
+                    },
+                },
+            )
+
+
+@freeze_time("2024-2-2T00:00:00Z")
+@override_settings(
+    NOTIFICATIONS_DISABLED=False,
+    LOG_NOTIFICATIONS_IN_DB=False,
+    NOTIFICATIONS_OUTBOX_ENABLED=True,
+)
+@patch("notifications_api_common.viewsets.send_notification.delay")
+class OutboxNotificationTestCase(NotificationsConfigTestCase, APITestCase):
+    def test_notification_is_stored_in_outbox(self, m):
+        url = reverse("klantinteracties:partij-list")
+        data = {
+            "nummer": "123456789",
+            "interneNotitie": "interneNotitie",
+            "digitaleAdressen": [],
+            "voorkeursDigitaalAdres": None,
+            "rekeningnummers": [],
+            "voorkeursRekeningnummer": None,
+            "soortPartij": SoortPartij.organisatie.value,
+            "partijIdentificatie": {"naam": "string"},
+            "voorkeurstaal": "ndl",
+            "indicatieActief": True,
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        m.assert_not_called()
+
+        notification = OutboxNotification.objects.get()
+        self.assertEqual(notification.type, NotificationTypes.notification)
+        self.assertEqual(notification.message["actie"], "create")
+        self.assertEqual(notification.message["resourceUrl"], response.json()["url"])
+
+    def test_bulk_notifications_are_stored_in_outbox(self, m):
+        data = [
+            {
+                "soortPartij": SoortPartij.organisatie.value,
+                "partijIdentificatie": {"naam": "string"},
+                "partijIdentificatoren": [
+                    {
+                        "partijIdentificator": {
+                            "codeObjecttype": "niet_natuurlijk_persoon",
+                            "codeSoortObjectId": "kvk_nummer",
+                            "objectId": kvk_nummer,
+                            "codeRegister": "hr",
+                        }
+                    }
+                ],
+                "indicatieActief": True,
+            }
+            for kvk_nummer in ["12345678", "87654321"]
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("klantinteracties:partij-bulk"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        m.assert_not_called()
+        self.assertEqual(OutboxNotification.objects.count(), 2)
+
+    def test_failed_operation_is_not_stored_in_outbox(self, m):
+        partij = PartijFactory.create()
+        url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(partij.uuid)}
+        )
+
+        response = self.client.patch(url, {"soortPartij": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_maak_klantcontact_notification_is_stored_in_outbox(self, m):
+        url = reverse("klantinteracties:maak-klantcontact-list")
+        data = {
+            "klantcontact": KlantContactDataFactory.create(),
+            "betrokkene": BetrokkeneDataFactory.create(),
+            "onderwerpobject": OnderwerpObjectDataFactory.create(),
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        m.assert_not_called()
+        notification = OutboxNotification.objects.get()
+        self.assertEqual(notification.message["resource"], "klantcontact")
+        self.assertEqual(
+            notification.message["resourceUrl"], response.json()["klantcontact"]["url"]
+        )
+
+    def test_maak_klantcontact_bulk_notifications_are_stored_in_outbox(self, m):
+        url = reverse("klantinteracties:maak-klantcontact-bulk")
+        data = [
+            {"klantcontact": KlantContactDataFactory.create(nummer=nummer)}
+            for nummer in ["1000000001", "1000000002"]
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        m.assert_not_called()
+        self.assertEqual(
+            sorted(
+                OutboxNotification.objects.values_list(
+                    "message__resourceUrl", flat=True
+                )
+            ),
+            sorted(item["klantcontact"]["url"] for item in response.json()),
+        )
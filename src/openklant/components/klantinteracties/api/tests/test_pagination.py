@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+
+from rest_framework import status
+from vng_api_common.tests import get_validation_errors, reverse
+from vng_api_common.viewsets import UNKNOWN_PARAMETERS_CODE
+
+from openklant.components.klantinteracties.models.tests.factories import (
+    KlantcontactFactory,
+    PartijFactory,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+
+
+class CursorPaginationTests(APITestCase):
+    def get_all_pages(self, url, params):
+        """
+        follow the next links and return the uuids of the results per page
+        """
+        pages = []
+        response = self.client.get(url, params)
+
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+
+            pages.append([result["uuid"] for result in data["results"]])
+            if not data["next"]:
+                return pages, data
+
+            response = self.client.get(data["next"])
+
+    def test_klantcontacten(self):
+        plaatsgevonden_op = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # klantcontacten with the same `plaatsgevonden_op` are ordered by their pk
+        klantcontacten = [
+            KlantcontactFactory.create(
+                plaatsgevonden_op=plaatsgevonden_op + timedelta(microseconds=i // 2)
+            )
+            for i in range(7)
+        ]
+        expected = [str(klantcontact.uuid) for klantcontact in reversed(klantcontacten)]
+        url = reverse("klantinteracties:klantcontact-list")
+
+        pages, last_page = self.get_all_pages(url, {"cursor": "", "pageSize": 3})
+
+        self.assertEqual(pages, [expected[:3], expected[3:6], expected[6:]])
+
+        # and back again
+        response = self.client.get(last_page["previous"])
+        data = response.json()
+
+        self.assertEqual([result["uuid"] for result in data["results"]], expected[3:6])
+
+        response = self.client.get(data["previous"])
+        data = response.json()
+
+        self.assertEqual([result["uuid"] for result in data["results"]], expected[:3])
+        self.assertIsNone(data["previous"])
+        self.assertIsNotNone(data["next"])
+
+    def test_partijen(self):
+        partijen = PartijFactory.create_batch(5)
+        expected = [str(partij.uuid) for partij in reversed(partijen)]
+        url = reverse("klantinteracties:partij-list")
+
+        pages, _ = self.get_all_pages(url, {"cursor": "", "pageSize": 2})
+
+        self.assertEqual(pages, [expected[:2], expected[2:4], expected[4:]])
+
+    def test_cursor_with_filters(self):
+        KlantcontactFactory.create_batch(3, kanaal="email")
+        KlantcontactFactory.create_batch(3, kanaal="telefoon")
+        url = reverse("klantinteracties:klantcontact-list")
+
+        pages, _ = self.get_all_pages(
+            url, {"cursor": "", "pageSize": 2, "kanaal": "email"}
+        )
+
+        self.assertEqual([len(page) for page in pages], [2, 1])
+
+    def test_page_number_pagination_is_default(self):
+        KlantcontactFactory.create_batch(3)
+        url = reverse("klantinteracties:klantcontact-list")
+
+        response = self.client.get(url, {"pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertIn("page=2", data["next"])
+
+    def test_invalid_cursor(self):
+        url = reverse("klantinteracties:klantcontact-list")
+
+        for cursor in ("invalid", "eyJwIjogWzFdfQ==", "eyJwIjpbIngiLCAxXX0="):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(url, {"cursor": cursor})
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unknown_query_params_with_cursor(self):
+        url = reverse("klantinteracties:klantcontact-list")
+
+        response = self.client.get(url, {"cursor": "", "unknown": "1"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], UNKNOWN_PARAMETERS_CODE)
@@ -0,0 +1,184 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.constants import SoortDigitaalAdres
+from openklant.components.klantinteracties.models import DigitaalAdres
+from openklant.components.klantinteracties.models.constants import Wijzigingsactie
+from openklant.components.klantinteracties.models.tests.factories import (
+    BetrokkeneFactory,
+    DigitaalAdresFactory,
+    KlantcontactFactory,
+    PartijFactory,
+)
+from openklant.components.klantinteracties.wijzigingen import record_wijzigingen
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.utils.response_cache import get_cache
+
+
+@override_settings(API_RESPONSE_CACHE_TIMEOUT=60)
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        get_cache().clear()
+
+        self.partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        self.digitaal_adres = DigitaalAdresFactory.create(
+            partij=self.partij,
+            betrokkene=None,
+            soort_digitaal_adres=SoortDigitaalAdres.email,
+            adres="test@example.com",
+        )
+        self.url = reverse("klantinteracties:digitaaladres-list")
+        self.params = {"verstrektDoorPartij__uuid": str(self.partij.uuid)}
+
+    def get(self, url=None, params=None, **kwargs):
+        response = self.client.get(
+            url or self.url, self.params if params is None else params, **kwargs
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def get_adressen(self, **kwargs) -> list:
+        return [result["adres"] for result in self.get(**kwargs).json()["results"]]
+
+    def test_cached(self):
+        response = self.get()
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.get()
+
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(dict(cached.items()), dict(response.items()))
+        self.assertFalse(
+            [query for query in queries if "klantinteracties_" in query["sql"]]
+        )
+
+    def test_normalised_query_params(self):
+        params = {**self.params, "page": 1}
+        self.get(params=params)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get(params=dict(reversed(params.items())))
+
+        self.assertFalse(
+            [query for query in queries if "klantinteracties_" in query["sql"]]
+        )
+
+    def test_other_query_params(self):
+        other = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        DigitaalAdresFactory.create(
+            partij=other, betrokkene=None, adres="ander@example.com"
+        )
+
+        self.assertEqual(self.get_adressen(), ["test@example.com"])
+        self.assertEqual(
+            self.get_adressen(params={"verstrektDoorPartij__uuid": str(other.uuid)}),
+            ["ander@example.com"],
+        )
+
+    def test_invalidated_by_save(self):
+        self.assertEqual(self.get_adressen(), ["test@example.com"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.digitaal_adres.adres = "nieuw@example.com"
+            self.digitaal_adres.save()
+
+        self.assertEqual(self.get_adressen(), ["nieuw@example.com"])
+
+    def test_invalidated_by_delete(self):
+        self.assertEqual(self.get_adressen(), ["test@example.com"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.digitaal_adres.delete()
+
+        self.assertEqual(self.get_adressen(), [])
+
+    def test_invalidated_by_api(self):
+        detail_url = reverse(
+            "klantinteracties:digitaaladres-detail",
+            kwargs={"uuid": str(self.digitaal_adres.uuid)},
+        )
+        self.get(detail_url, {})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(detail_url, {"adres": "nieuw@example.com"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get(detail_url, {}).json()["adres"], "nieuw@example.com")
+        self.assertEqual(self.get_adressen(), ["nieuw@example.com"])
+
+    def test_invalidated_by_bulk_operation(self):
+        self.assertEqual(self.get_adressen(), ["test@example.com"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            adressen = DigitaalAdres.objects.filter(pk=self.digitaal_adres.pk)
+            adressen.update(adres="nieuw@example.com")
+            record_wijzigingen(
+                DigitaalAdres,
+                adressen.values_list("uuid", flat=True),
+                Wijzigingsactie.gewijzigd,
+            )
+
+        self.assertEqual(self.get_adressen(), ["nieuw@example.com"])
+
+    def test_not_invalidated_before_commit(self):
+        self.get()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            DigitaalAdresFactory.create(partij=self.partij, betrokkene=None)
+
+        self.assertEqual(self.get_adressen(), ["test@example.com"])
+        self.assertTrue(callbacks)
+
+    def test_invalidated_by_related_model(self):
+        klantcontact = KlantcontactFactory.create()
+        url = reverse("klantinteracties:klantcontact-list")
+        params = {"hadBetrokkene__wasPartij__uuid": str(self.partij.uuid)}
+        self.assertEqual(self.get(url, params).json()["count"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BetrokkeneFactory.create(klantcontact=klantcontact, partij=self.partij)
+
+        self.assertEqual(self.get(url, params).json()["count"], 1)
+
+    def test_not_modified(self):
+        url = reverse(
+            "klantinteracties:partij-detail", kwargs={"uuid": str(self.partij.uuid)}
+        )
+        etag = self.get(url, {})["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(
+            [query for query in queries if "klantinteracties_" in query["sql"]]
+        )
+
+    def test_expand_not_cached(self):
+        params = {**self.params, "expand": "verstrektDoorBetrokkene"}
+        self.get(params=params)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get(params=params)
+
+        self.assertTrue(
+            [query for query in queries if "klantinteracties_" in query["sql"]]
+        )
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.get()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get()
+
+        self.assertTrue(
+            [query for query in queries if "klantinteracties_" in query["sql"]]
+        )
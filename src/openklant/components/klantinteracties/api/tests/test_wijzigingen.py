@@ -0,0 +1,300 @@
+from unittest.mock import patch
+
+from django.db import connection
+
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from vng_api_common.tests import reverse
+
+from openklant.components.klantinteracties.api.tests.partijen.test_partij_bulk import (
+    get_persoon,
+)
+from openklant.components.klantinteracties.models.constants import (
+    WijzigingResource,
+    Wijzigingsactie,
+)
+from openklant.components.klantinteracties.models.partijen import Partij
+from openklant.components.klantinteracties.models.tests.factories import (
+    DigitaalAdresFactory,
+    KlantcontactFactory,
+    MedewerkerFactory,
+    PartijFactory,
+)
+from openklant.components.klantinteracties.models.wijzigingen import (
+    SnapshotXmin,
+    Wijziging,
+)
+from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.components.token.tests.factories.token import TokenAuthFactory
+
+
+class WijzigingRecordTests(APITestCase):
+    def get_wijzigingen(self) -> list:
+        return [
+            (resource, str(uuid), actie)
+            for resource, uuid, actie in Wijziging.objects.order_by("id").values_list(
+                "resource", "resource_uuid", "actie"
+            )
+        ]
+
+    def test_partij(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        partij.interne_notitie = "gewijzigd"
+        partij.save()
+        partij.delete()
+
+        self.assertEqual(
+            self.get_wijzigingen(),
+            [
+                ("partij", str(partij.uuid), Wijzigingsactie.aangemaakt),
+                ("partij", str(partij.uuid), Wijzigingsactie.gewijzigd),
+                ("partij", str(partij.uuid), Wijzigingsactie.verwijderd),
+            ],
+        )
+
+    def test_related_objects(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        Wijziging.objects.all().delete()
+
+        digitaal_adres = DigitaalAdresFactory.create(partij=partij, betrokkene=None)
+
+        # the digitale adressen are part of the representation of the partij
+        self.assertEqual(
+            self.get_wijzigingen(),
+            [
+                ("partij", str(partij.uuid), Wijzigingsactie.gewijzigd),
+                ("digitaaladres", str(digitaal_adres.uuid), Wijzigingsactie.aangemaakt),
+            ],
+        )
+        Wijziging.objects.all().delete()
+
+        partij.delete()
+
+        # the deletions of the related objects are recorded as well
+        self.assertEqual(
+            sorted(self.get_wijzigingen()),
+            [
+                ("digitaaladres", str(digitaal_adres.uuid), Wijzigingsactie.verwijderd),
+                ("partij", str(partij.uuid), Wijzigingsactie.verwijderd),
+            ],
+        )
+
+    def test_standaard_adres(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        digitaal_adres = DigitaalAdresFactory.create(
+            partij=partij, betrokkene=None, is_standaard_adres=True
+        )
+        Wijziging.objects.all().delete()
+
+        DigitaalAdresFactory.create(
+            partij=partij,
+            betrokkene=None,
+            soort_digitaal_adres=digitaal_adres.soort_digitaal_adres,
+            is_standaard_adres=True,
+        )
+
+        self.assertIn(
+            ("digitaaladres", str(digitaal_adres.uuid), Wijzigingsactie.gewijzigd),
+            self.get_wijzigingen(),
+        )
+
+    def test_actor(self):
+        medewerker = MedewerkerFactory.create()
+        Wijziging.objects.all().delete()
+
+        medewerker.functie = "gewijzigd"
+        medewerker.save()
+
+        self.assertEqual(
+            self.get_wijzigingen(),
+            [("actor", str(medewerker.actor.uuid), Wijzigingsactie.gewijzigd)],
+        )
+        Wijziging.objects.all().delete()
+
+        medewerker.actor.delete()
+
+        self.assertEqual(
+            self.get_wijzigingen(),
+            [("actor", str(medewerker.actor.uuid), Wijzigingsactie.verwijderd)],
+        )
+
+    def test_bulk_upsert(self):
+        url = reverse("klantinteracties:partij-bulk")
+
+        response = self.client.post(url, [get_persoon()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        partij = Partij.objects.get()
+        identificator = partij.partijidentificator_set.get()
+        self.assertEqual(
+            self.get_wijzigingen(),
+            [
+                ("partij", str(partij.uuid), Wijzigingsactie.aangemaakt),
+                (
+                    "partijidentificator",
+                    str(identificator.uuid),
+                    Wijzigingsactie.aangemaakt,
+                ),
+            ],
+        )
+        Wijziging.objects.all().delete()
+
+        response = self.client.post(url, [get_persoon(achternaam="Gewijzigd")])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            ("partij", str(partij.uuid), Wijzigingsactie.gewijzigd),
+            self.get_wijzigingen(),
+        )
+
+
+# the test databases of the parallel test runner share the cluster, so only the running
+# transactions of the current database are taken into account
+DATABASE_SNAPSHOT_XMIN = (
+    "COALESCE("
+    "(SELECT min((pg_snapshot_xmax(pg_current_snapshot())::text::bigint >> 32 << 32)"
+    " + backend_xid::text::bigint) FROM pg_stat_activity"
+    " WHERE datname = current_database() AND backend_xid IS NOT NULL), "
+    "pg_snapshot_xmax(pg_current_snapshot())::text::bigint)"
+)
+
+
+class WijzigingenFeedTests(APITransactionTestCase):
+    """
+    The changes are only returned when their transaction is older than all running
+    transactions, so these tests can't run in a transaction.
+    """
+
+    url = reverse("klantinteracties:wijziging-list")
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(SnapshotXmin, "template", DATABASE_SNAPSHOT_XMIN)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.token_auth = TokenAuthFactory.create()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token_auth.token)
+
+    def test_feed(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+        klantcontact = KlantcontactFactory.create()
+        partij.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertEqual(
+            [
+                (item["resource"], item["uuid"], item["url"], item["actie"])
+                for item in data["results"]
+            ],
+            [
+                (
+                    "partij",
+                    str(partij.uuid),
+                    "http://testserver"
+                    + reverse(
+                        "klantinteracties:partij-detail", kwargs={"uuid": partij.uuid}
+                    ),
+                    "aangemaakt",
+                ),
+                (
+                    "klantcontact",
+                    str(klantcontact.uuid),
+                    "http://testserver"
+                    + reverse(
+                        "klantinteracties:klantcontact-detail",
+                        kwargs={"uuid": klantcontact.uuid},
+                    ),
+                    "aangemaakt",
+                ),
+                (
+                    "partij",
+                    str(partij.uuid),
+                    "http://testserver"
+                    + reverse(
+                        "klantinteracties:partij-detail", kwargs={"uuid": partij.uuid}
+                    ),
+                    "verwijderd",
+                ),
+            ],
+        )
+
+    def test_sinds(self):
+        partijen = [
+            PartijFactory.create(voorkeurs_digitaal_adres=None) for _ in range(3)
+        ]
+
+        response = self.client.get(self.url, {"pageSize": 2})
+
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNotNone(data["next"])
+
+        response = self.client.get(data["next"])
+
+        data = response.json()
+        self.assertEqual(data["results"][0]["uuid"], str(partijen[2].uuid))
+        self.assertIsNone(data["next"])
+
+        # nothing changed since
+        sinds = data["sinds"]
+        response = self.client.get(self.url, {"sinds": sinds})
+
+        self.assertEqual(response.json(), {"next": None, "sinds": sinds, "results": []})
+
+        partijen[0].delete()
+        response = self.client.get(self.url, {"sinds": sinds})
+
+        data = response.json()
+        self.assertEqual(
+            [(item["uuid"], item["actie"]) for item in data["results"]],
+            [(str(partijen[0].uuid), "verwijderd")],
+        )
+
+    def test_running_transaction(self):
+        other_connection = connection.copy()
+        self.addCleanup(other_connection.close)
+        other_connection.set_autocommit(False)
+        with other_connection.cursor() as cursor:
+            # the transaction is assigned an ID
+            cursor.execute("SELECT pg_current_xact_id()")
+
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+
+        response = self.client.get(self.url)
+
+        # the change could be followed by a change of the older transaction
+        self.assertEqual(response.json(), {"next": None, "sinds": None, "results": []})
+
+        other_connection.rollback()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json()["results"][0]["uuid"], str(partij.uuid))
+
+    def test_filter_resource(self):
+        PartijFactory.create(voorkeurs_digitaal_adres=None)
+        klantcontact = KlantcontactFactory.create()
+
+        response = self.client.get(
+            self.url, {"resource": WijzigingResource.klantcontact}
+        )
+
+        self.assertEqual(
+            [item["uuid"] for item in response.json()["results"]],
+            [str(klantcontact.uuid)],
+        )
+
+    def test_invalid_sinds(self):
+        response = self.client.get(self.url, {"sinds": "ongeldig"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unauthenticated(self):
+        self.client.credentials()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
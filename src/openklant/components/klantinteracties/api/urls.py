@@ -30,6 +30,9 @@ from openklant.components.klantinteracties.api.viewsets.partijen import (
 from openklant.components.klantinteracties.api.viewsets.rekeningnummers import (
     RekeningnummerViewSet,
 )
+from openklant.components.klantinteracties.api.viewsets.wijzigingen import (
+    WijzigingViewSet,
+)
 
 from ...utils.views import (
     DeprecationRedirectView,
@@ -72,6 +75,12 @@ urlpatterns = [
         include(
             [
                 re_path(r"^", include(router.urls)),
+                # the change feed has no detail endpoint
+                path(
+                    "wijzigingen",
+                    WijzigingViewSet.as_view({"get": "list"}),
+                    name="wijziging-list",
+                ),
                 path(
                     "", router.APIRootView.as_view(), name="api-root-klantinteracties"
                 ),
@@ -32,10 +32,10 @@ from openklant.components.klantinteracties.models.partijen import (
     PartijIdentificator,
 )
 from openklant.components.klantinteracties.models.rekeningnummers import Rekeningnummer
+from openklant.config.kanalen import kanalen_index
 from openklant.config.models import ReferentielijstenConfig
-from openklant.utils.converters import parse_datetime
+from openklant.utils.identity_map import get_object
 from openklant.utils.validators import validate_phone_number
-from referentielijsten_client.client import get_referentielijsten_client
 
 logger = structlog.get_logger(__name__)
 
@@ -71,35 +71,35 @@ def actor_is_valid_instance(value):
 
 def actor_exists(value):
     try:
-        Actor.objects.get(uuid=str(value))
+        get_object(Actor, value)
     except Actor.DoesNotExist:
         raise serializers.ValidationError(_("Actor object bestaat niet."))
 
 
 def betrokkene_exists(value):
     try:
-        Betrokkene.objects.get(uuid=str(value))
+        get_object(Betrokkene, value)
     except Betrokkene.DoesNotExist:
         raise serializers.ValidationError(_("Betrokkene object bestaat niet."))
 
 
 def bijlage_exists(value):
     try:
-        Bijlage.objects.get(uuid=str(value))
+        get_object(Bijlage, value)
     except Bijlage.DoesNotExist:
         raise serializers.ValidationError(_("Bijlage object bestaat niet."))
 
 
 def categorie_relatie_exists(value):
     try:
-        CategorieRelatie.objects.get(uuid=str(value))
+        get_object(CategorieRelatie, value)
     except CategorieRelatie.DoesNotExist:
         raise serializers.ValidationError(_("CategorieRelatie object bestaat niet."))
 
 
 def categorie_exists(value):
     try:
-        Categorie.objects.get(uuid=str(value))
+        get_object(Categorie, value)
     except Categorie.DoesNotExist:
         raise serializers.ValidationError(_("Categorie object bestaat niet."))
 
@@ -113,28 +113,28 @@ def contactpersoon_exists(value):
 
 def digitaal_adres_exists(value):
     try:
-        DigitaalAdres.objects.get(uuid=str(value))
+        get_object(DigitaalAdres, value)
     except DigitaalAdres.DoesNotExist:
         raise serializers.ValidationError(_("DigitaalAdres object bestaat niet."))
 
 
 def internetaak_exists(value):
     try:
-        InterneTaak.objects.get(uuid=str(value))
+        get_object(InterneTaak, value)
     except InterneTaak.DoesNotExist:
         raise serializers.ValidationError(_("InterneTaak object bestaat niet."))
 
 
 def klantcontact_exists(value):
     try:
-        Klantcontact.objects.get(uuid=str(value))
+        get_object(Klantcontact, value)
     except Klantcontact.DoesNotExist:
         raise serializers.ValidationError(_("Klantcontact object bestaat niet."))
 
 
 def onderwerpobject_exists(value):
     try:
-        Onderwerpobject.objects.get(uuid=(str(value)))
+        get_object(Onderwerpobject, value)
     except Onderwerpobject.DoesNotExist:
         raise serializers.ValidationError(_("Onderwerpobject object bestaat niet."))
 
@@ -155,7 +155,7 @@ def partij_is_organisatie(value):
     # Validate if partij intance exists.
     partij_exists(value)
 
-    partij = Partij.objects.get(uuid=str(value))
+    partij = get_object(Partij, value)
     if partij.soort_partij != SoortPartij.organisatie:
         raise serializers.ValidationError(
             _("Partij object moet het soort 'organisatie' hebben.")
@@ -164,21 +164,21 @@ def partij_is_organisatie(value):
 
 def partij_exists(value):
     try:
-        Partij.objects.get(uuid=str(value))
+        get_object(Partij, value)
     except Partij.DoesNotExist:
         raise serializers.ValidationError(_("Partij object bestaat niet."))
 
 
 def partij_identificator_exists(value):
     try:
-        PartijIdentificator.objects.get(uuid=str(value))
+        get_object(PartijIdentificator, value)
     except PartijIdentificator.DoesNotExist:
         raise serializers.ValidationError(_("PartijIdentificator object bestaat niet."))
 
 
 def Rekeningnummer_exists(value):
     try:
-        Rekeningnummer.objects.get(uuid=str(value))
+        get_object(Rekeningnummer, value)
     except Rekeningnummer.DoesNotExist:
         raise serializers.ValidationError(_("Rekeningnummer object bestaat niet."))
 
@@ -204,24 +204,21 @@ class KanaalValidator:
         if not config.enabled:
             return value
 
-        if not config.service:
+        if not config.service_id:
             logger.warning("missing_referentielijsten_service")
             raise InvalidReferentielijstenConfiguration(
                 "`kanaal` validation using Referentielijsten API is enabled, but no service is configured."
             )
 
         try:
-            with get_referentielijsten_client(config.service) as client:
-                raw_items = client.get_cached_items_by_tabel_code(
-                    config.kanalen_tabel_code
-                )
+            snapshot = kanalen_index.get_snapshot(config)
         except (RequestException, Exception):
             logger.exception("failed_to_fetch_kanalen_from_referentielijsten")
             raise ValidationError(
                 "Failed to retrieve valid channels from the Referentielijsten API to validate `kanaal`."
             )
 
-        if not raw_items:
+        if not snapshot.codes:
             logger.warning(
                 "no_kanalen_found_in_referentielijsten",
                 tabel_code=config.kanalen_tabel_code,
@@ -230,33 +227,8 @@ class KanaalValidator:
                 "No channels to validate `kanaal` were found for the configured tabel_code in the Referentielijsten API."
             )
 
-        now = datetime.now(timezone.utc)
-
-        kanalen = []
-
-        for item in raw_items:
-            begin = item.get("begindatumGeldigheid")
-            eind = item.get("einddatumGeldigheid")
-
-            begin_dt = parse_datetime(begin)
-            eind_dt = parse_datetime(eind)
-
-            if begin_dt and now < begin_dt:
-                continue
-            if eind_dt and now >= eind_dt:
-                continue
-            if begin_dt and eind_dt and not (begin_dt <= now < eind_dt):
-                continue
-
-            code = item.get("code")
-            if code:
-                kanalen.append(code)
-        if not kanalen:
-            raise ValidationError(
-                f"'{value}' is not a valid kanaal. Allowed values: {', '.join(kanalen)}"
-            )
-
-        if value not in kanalen:
+        kanalen, valid_kanalen = snapshot.get_valid_kanalen(datetime.now(timezone.utc))
+        if value not in valid_kanalen:
             raise ValidationError(
                 f"'{value}' is not a valid kanaal. Allowed values: {', '.join(kanalen)}"
             )
@@ -3,8 +3,6 @@ from django.db import transaction
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.pagination import DynamicPageSizePagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openklant.components.klantinteracties.api.filterset.actoren import ActorenFilterSet
 from openklant.components.klantinteracties.api.serializers.actoren import (
@@ -18,6 +16,8 @@ from openklant.components.klantinteracties.metrics import (
 from openklant.components.klantinteracties.models.actoren import Actor
 from openklant.components.token.authentication import TokenAuthentication
 from openklant.components.token.permission import TokenPermissions
+from openklant.components.utils.pagination import DynamicPageSizePagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
 
 logger = structlog.get_logger(__name__)
 
@@ -3,8 +3,6 @@ from django.db import transaction
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.pagination import DynamicPageSizePagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openklant.components.klantinteracties.api.filterset.digitaal_adres import (
     DigitaalAdresDetailFilterSet,
@@ -22,7 +20,9 @@ from openklant.components.klantinteracties.models.digitaal_adres import Digitaal
 from openklant.components.token.authentication import TokenAuthentication
 from openklant.components.token.permission import TokenPermissions
 from openklant.components.utils.api import get_related_object_uuid
-from openklant.components.utils.mixins import ExpandMixin
+from openklant.components.utils.mixins import CachedResponseMixin, ExpandMixin
+from openklant.components.utils.pagination import DynamicPageSizePagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
 
 logger = structlog.get_logger(__name__)
 
@@ -54,7 +54,9 @@ logger = structlog.get_logger(__name__)
         description="Verwijder een digitaal adres.",
     ),
 )
-class DigitaalAdresViewSet(CheckQueryParamsMixin, ExpandMixin, viewsets.ModelViewSet):
+class DigitaalAdresViewSet(
+    CheckQueryParamsMixin, CachedResponseMixin, ExpandMixin, viewsets.ModelViewSet
+):
     """
     Digitaal adres dat een betrokkene bij klantcontact verstrekte
     voor gebruik bij opvolging van een klantcontact.
@@ -2,10 +2,7 @@ from django.db import transaction
 
 import structlog
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import viewsets
-from vng_api_common.pagination import DynamicPageSizePagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openklant.components.klantinteracties.api.filterset.internetaken import (
     InternetaakFilterSet,
@@ -23,6 +20,9 @@ from openklant.components.klantinteracties.models.internetaken import InterneTaa
 from openklant.components.token.authentication import TokenAuthentication
 from openklant.components.token.permission import TokenPermissions
 from openklant.components.utils.api import get_related_object_uuid
+from openklant.components.utils.pagination import DynamicPageSizePagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
+from openklant.utils.notifications import NotificationViewSetMixin
 
 logger = structlog.get_logger(__name__)
 
@@ -65,7 +65,7 @@ class InterneTaakViewSet(
 
     queryset = (
         InterneTaak.objects.order_by("-pk")
-        .prefetch_related("actoren")
+        .prefetch_related(*InterneTaakSerializer.prefetch_related_lookups)
         .select_related("klantcontact")
     )
     serializer_class = InterneTaakSerializer
@@ -1,20 +1,20 @@
 from django.conf import settings
 from django.db import models, transaction
 from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
 
 import structlog
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.cloudevents import process_cloudevent
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from vng_api_common.pagination import DynamicPageSizePagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openklant.cloud_events.constants import (
     ZAAK_GEKOPPELD,
@@ -33,9 +33,13 @@ from openklant.components.klantinteracties.api.serializers.klantcontacten import
     BetrokkeneSerializer,
     BijlageSerializer,
     KlantcontactSerializer,
+    MaakKlantcontactBulkResultSerializer,
+    MaakKlantcontactBulkSerializer,
     MaakKlantcontactSerializer,
     OnderwerpobjectSerializer,
+    bulk_maak_klantcontacten,
 )
+from openklant.components.klantinteracties.constants import BulkResultaat
 from openklant.components.klantinteracties.kanalen import KANAAL_KLANTCONTACT
 from openklant.components.klantinteracties.metrics import (
     betrokkenen_create_counter,
@@ -56,9 +60,22 @@ from openklant.components.klantinteracties.models.klantcontacten import (
 from openklant.components.token.authentication import TokenAuthentication
 from openklant.components.token.models import TokenAuth
 from openklant.components.token.permission import TokenPermissions
-from openklant.components.utils.api import get_related_object_uuid
-from openklant.components.utils.mixins import ExpandMixin
-from openklant.utils.notifications import MultipleNotificationCreateMixin
+from openklant.components.utils.api import get_detail_url, get_related_object_uuid
+from openklant.components.utils.mixins import (
+    CachedResponseMixin,
+    CompiledRepresentationMixin,
+    ConditionalRequestMixin,
+    ExpandMixin,
+    ExportMixin,
+    FieldsMixin,
+)
+from openklant.components.utils.pagination import DynamicPageSizePagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
+from openklant.utils.notifications import (
+    MultipleNotificationCreateMixin,
+    NotificationViewSetMixin,
+    schedule_cloudevent,
+)
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -90,9 +107,31 @@ logger = structlog.stdlib.get_logger(__name__)
         summary="Verwijder een klant contact.",
         description="Verwijder een klant contact.",
     ),
+    export=extend_schema(
+        summary="Exporteer klanten contacten.",
+        description=(
+            "Exporteer alle (gefilterde) klanten contacten in één response, als "
+            "NDJSON (één JSON-object per regel) of CSV. De response wordt "
+            "gestreamd, zodat ook grote aantallen in één verzoek kunnen worden "
+            "opgehaald."
+        ),
+        filters=True,
+        responses={
+            (200, "application/x-ndjson"): KlantcontactSerializer,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
+    ),
 )
 class KlantcontactViewSet(
-    CheckQueryParamsMixin, ExpandMixin, NotificationViewSetMixin, viewsets.ModelViewSet
+    CheckQueryParamsMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    ExpandMixin,
+    CompiledRepresentationMixin,
+    FieldsMixin,
+    NotificationViewSetMixin,
+    viewsets.ModelViewSet,
 ):
     """
     Contact tussen een klant of een vertegenwoordiger van een
@@ -105,7 +144,9 @@ class KlantcontactViewSet(
         "bijlage_set",
         "betrokkene_set",
         "internetaak_set",
-        "actorklantcontact_set",
+        "actorklantcontact_set__actor__geautomatiseerdeactor",
+        "actorklantcontact_set__actor__medewerker",
+        "actorklantcontact_set__actor__organisatorischeeenheid",
         "onderwerpobject_set",
     )
     serializer_class = KlantcontactSerializer
@@ -213,7 +254,9 @@ class KlantcontactViewSet(
         description="Verwijder een betrokkene.",
     ),
 )
-class BetrokkeneViewSet(CheckQueryParamsMixin, ExpandMixin, viewsets.ModelViewSet):
+class BetrokkeneViewSet(
+    CheckQueryParamsMixin, CachedResponseMixin, ExpandMixin, viewsets.ModelViewSet
+):
     """
     Ofwel betrokkenheid van een partij bij een klantcontact, eventueel aangevuld met
     specifiek voor opvolging van dat klantcontact te gebruiken contactgegevens, ofwel
@@ -375,6 +418,25 @@ class OnderwerpobjectViewSet(CheckQueryParamsMixin, viewsets.ModelViewSet):
     authentication_classes = (TokenAuthentication,)
     permission_classes = (TokenPermissions,)
 
+    def schedule_zaak_cloudevent(
+        self, event_type: str, instance: Onderwerpobject, identificator: dict
+    ) -> None:
+        zaak_uuid = identificator.get("object_id")
+        schedule_cloudevent(
+            event_type=event_type,
+            subject=zaak_uuid,
+            data={
+                "zaak": f"urn:uuid:{zaak_uuid}",
+                "linkTo": get_detail_url(
+                    "klantinteracties:onderwerpobject-detail",
+                    instance.uuid,
+                    request=self.request,
+                ),
+                "label": str(instance.klantcontact),
+                "linkObjectType": "Onderwerpobject",
+            },
+        )
+
     @transaction.atomic
     def perform_create(self, serializer):
         super().perform_create(serializer)
@@ -402,23 +464,8 @@ class OnderwerpobjectViewSet(CheckQueryParamsMixin, viewsets.ModelViewSet):
             and settings.ENABLE_CLOUD_EVENTS
             and instance.klantcontact is not None
         ):
-            link_to_url = reverse(
-                "klantinteracties:onderwerpobject-detail",
-                kwargs={
-                    "uuid": str(instance.uuid),
-                    "version": self.request.version or "1",
-                },
-            )
-
-            process_cloudevent(
-                event_type=ZAAK_GEKOPPELD,
-                subject=instance.onderwerpobjectidentificator.get("object_id"),
-                data={
-                    "zaak": f"urn:uuid:{instance.onderwerpobjectidentificator.get('object_id')}",
-                    "linkTo": self.request.build_absolute_uri(link_to_url),
-                    "label": str(instance.klantcontact),
-                    "linkObjectType": "Onderwerpobject",
-                },
+            self.schedule_zaak_cloudevent(
+                ZAAK_GEKOPPELD, instance, instance.onderwerpobjectidentificator
             )
 
     @transaction.atomic
@@ -459,47 +506,9 @@ class OnderwerpobjectViewSet(CheckQueryParamsMixin, viewsets.ModelViewSet):
         identificator_changed = old_ident != new_ident
 
         if settings.ENABLE_CLOUD_EVENTS and was_zaak and identificator_changed:
-            link_to_url = reverse(
-                "klantinteracties:onderwerpobject-detail",
-                kwargs={
-                    "uuid": str(old_instance.uuid),
-                    "version": self.request.version or "1",
-                },
-            )
-
-            transaction.on_commit(
-                lambda: process_cloudevent(
-                    event_type=ZAAK_ONTKOPPELD,
-                    subject=old_ident.get("object_id"),
-                    data={
-                        "zaak": f"urn:uuid:{old_ident.get('object_id')}",
-                        "linkTo": self.request.build_absolute_uri(link_to_url),
-                        "label": str(old_instance.klantcontact),
-                        "linkObjectType": "Onderwerpobject",
-                    },
-                )
-            )
+            self.schedule_zaak_cloudevent(ZAAK_ONTKOPPELD, old_instance, old_ident)
         if settings.ENABLE_CLOUD_EVENTS and is_zaak_now and identificator_changed:
-            link_to_url = reverse(
-                "klantinteracties:onderwerpobject-detail",
-                kwargs={
-                    "uuid": str(instance.uuid),
-                    "version": self.request.version or "1",
-                },
-            )
-
-            transaction.on_commit(
-                lambda: process_cloudevent(
-                    event_type=ZAAK_GEKOPPELD,
-                    subject=new_ident.get("object_id"),
-                    data={
-                        "zaak": f"urn:uuid:{new_ident.get('object_id')}",
-                        "linkTo": self.request.build_absolute_uri(link_to_url),
-                        "label": str(instance.klantcontact),
-                        "linkObjectType": "Onderwerpobject",
-                    },
-                )
-            )
+            self.schedule_zaak_cloudevent(ZAAK_GEKOPPELD, instance, new_ident)
 
     @transaction.atomic
     def destroy(self, request, *args, **kwargs):
@@ -527,25 +536,8 @@ class OnderwerpobjectViewSet(CheckQueryParamsMixin, viewsets.ModelViewSet):
             and soort_object_id == "uuid"
             and instance.klantcontact is not None
         ):
-            link_to_url = reverse(
-                "klantinteracties:onderwerpobject-detail",
-                kwargs={
-                    "uuid": str(instance.uuid),
-                    "version": request.version or "1",
-                },
-            )
-
-            transaction.on_commit(
-                lambda: process_cloudevent(
-                    event_type=ZAAK_ONTKOPPELD,
-                    subject=instance.onderwerpobjectidentificator.get("object_id"),
-                    data={
-                        "zaak": f"urn:uuid:{instance.onderwerpobjectidentificator.get('object_id')}",
-                        "linkTo": request.build_absolute_uri(link_to_url),
-                        "label": str(instance.klantcontact),
-                        "linkObjectType": "Onderwerpobject",
-                    },
-                )
+            self.schedule_zaak_cloudevent(
+                ZAAK_ONTKOPPELD, instance, instance.onderwerpobjectidentificator
             )
 
         if cascade:
@@ -811,6 +803,7 @@ class MaakKlantcontactViewSet(
         "klantcontact": {
             "notifications_kanaal": KANAAL_KLANTCONTACT,
             "model": Klantcontact,
+            "action": "create",
         },
     }
 
@@ -834,3 +827,112 @@ class MaakKlantcontactViewSet(
             betrokkene_uuid=str(betrokkene.uuid) if betrokkene else None,
             onderwerpobject_uuid=str(onderwerpobject.uuid) if onderwerpobject else None,
         )
+
+    @extend_schema(
+        summary="Maak meerdere klantcontacten aan.",
+        description=(
+            "Maak meerdere klantcontacten in één verzoek aan, elk met een optionele "
+            "betrokkene en een optioneel onderwerpobject. De aangemaakte objecten "
+            "worden automatisch aan elkaar gekoppeld.\n\n"
+            "Per klantcontact wordt het resultaat teruggegeven, ongeldige "
+            "klantcontacten worden overgeslagen."
+        ),
+        request=MaakKlantcontactBulkSerializer(many=True),
+        responses={200: MaakKlantcontactBulkResultSerializer(many=True)},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="_bulk",
+        url_name="bulk",
+        filter_backends=[],
+        pagination_class=None,
+    )
+    def bulk(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            raise ValidationError(
+                {"non_field_errors": [_("Verwacht een lijst met klantcontacten.")]},
+                code="invalid",
+            )
+        if len(request.data) > settings.KLANTCONTACTEN_BULK_MAX_SIZE:
+            raise ValidationError(
+                {
+                    "non_field_errors": [
+                        _(
+                            "Er kunnen maximaal %(max_size)s klantcontacten worden "
+                            "verwerkt."
+                        )
+                        % {"max_size": settings.KLANTCONTACTEN_BULK_MAX_SIZE}
+                    ]
+                },
+                code="max-size",
+            )
+
+        context = self.get_serializer_context()
+        item_serializers = [
+            MaakKlantcontactBulkSerializer(data=item, context=context)
+            for item in request.data
+        ]
+        is_valid = [serializer.is_valid() for serializer in item_serializers]
+
+        with transaction.atomic():
+            created = iter(
+                bulk_maak_klantcontacten(
+                    [
+                        serializer.validated_data
+                        for serializer, valid in zip(item_serializers, is_valid)
+                        if valid
+                    ]
+                )
+            )
+            results = [
+                next(created) if valid else serializer.errors
+                for serializer, valid in zip(item_serializers, is_valid)
+            ]
+
+            items = []
+            for index, result in enumerate(results):
+                if isinstance(result, tuple):
+                    klantcontact, betrokkene, onderwerpobject = result
+                    items.append(
+                        {
+                            "index": index,
+                            "resultaat": BulkResultaat.aangemaakt,
+                            "klantcontact": klantcontact,
+                            "betrokkene": betrokkene,
+                            "onderwerpobject": onderwerpobject,
+                            "fouten": None,
+                        }
+                    )
+                else:
+                    items.append(
+                        {
+                            "index": index,
+                            "resultaat": BulkResultaat.ongeldig,
+                            "klantcontact": None,
+                            "betrokkene": None,
+                            "onderwerpobject": None,
+                            "fouten": result,
+                        }
+                    )
+            data = MaakKlantcontactBulkResultSerializer(
+                items, many=True, context=context
+            ).data
+
+            notifications = [
+                (item, {"klantcontact": result[0]})
+                for item, result in zip(data, results)
+                if isinstance(result, tuple)
+            ]
+            if notifications:
+                self.notify_batch(status.HTTP_200_OK, notifications)
+
+        logger.info(
+            "klantcontacten_bulk_geregistreerd",
+            created=len(notifications),
+            invalid=len(data) - len(notifications),
+            token_identifier=getattr(request.auth, "identifier", None),
+            token_application=getattr(request.auth, "application", None),
+        )
+
+        return Response(data)
@@ -1,16 +1,20 @@
+from django.conf import settings
 from django.db import transaction
+from django.utils.translation import gettext_lazy as _
 
 import structlog
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
-from rest_framework import viewsets
-from vng_api_common.pagination import DynamicPageSizePagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 from openklant.components.klantinteracties.api.filterset.partijen import (
     CategorieRelatieFilterSet,
     PartijDetailFilterSet,
     PartijFilterSet,
+    PartijZoekFilterSet,
     VertegenwoordigdenFilterSet,
 )
 from openklant.components.klantinteracties.api.schema import (
@@ -20,10 +24,14 @@ from openklant.components.klantinteracties.api.schema import (
 from openklant.components.klantinteracties.api.serializers.partijen import (
     CategorieRelatieSerializer,
     CategorieSerializer,
+    PartijBulkResultSerializer,
+    PartijBulkSerializer,
     PartijIdentificatorSerializer,
     PartijSerializer,
     VertegenwoordigdenSerializer,
+    bulk_upsert_partijen,
 )
+from openklant.components.klantinteracties.constants import BulkResultaat
 from openklant.components.klantinteracties.kanalen import KANAAL_PARTIJ
 from openklant.components.klantinteracties.metrics import (
     partijen_create_counter,
@@ -40,8 +48,21 @@ from openklant.components.klantinteracties.models.partijen import (
 from openklant.components.token.authentication import TokenAuthentication
 from openklant.components.token.permission import TokenPermissions
 from openklant.components.utils.api import get_related_object_uuid
-from openklant.components.utils.mixins import ExpandMixin
+from openklant.components.utils.mixins import (
+    CachedResponseMixin,
+    CompiledRepresentationMixin,
+    ConditionalRequestMixin,
+    ExpandMixin,
+    ExportMixin,
+    FieldsMixin,
+)
+from openklant.components.utils.pagination import DynamicPageSizePagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
 from openklant.utils.decorators import handle_db_exceptions
+from openklant.utils.notifications import (
+    BulkNotificationMixin,
+    NotificationViewSetMixin,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -73,9 +94,32 @@ logger = structlog.get_logger(__name__)
         summary="Verwijder een partij.",
         description="Verwijder een partij.",
     ),
+    export=extend_schema(
+        summary="Exporteer partijen.",
+        description=(
+            "Exporteer alle (gefilterde) partijen in één response, als "
+            "NDJSON (één JSON-object per regel) of CSV. De response wordt "
+            "gestreamd, zodat ook grote aantallen in één verzoek kunnen worden "
+            "opgehaald."
+        ),
+        filters=True,
+        responses={
+            (200, "application/x-ndjson"): PartijSerializer,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
+    ),
 )
 class PartijViewSet(
-    CheckQueryParamsMixin, NotificationViewSetMixin, ExpandMixin, viewsets.ModelViewSet
+    CheckQueryParamsMixin,
+    BulkNotificationMixin,
+    NotificationViewSetMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    ExpandMixin,
+    CompiledRepresentationMixin,
+    FieldsMixin,
+    viewsets.ModelViewSet,
 ):
     """Persoon of organisatie waarmee de gemeente een relatie heeft."""
 
@@ -91,10 +135,10 @@ class PartijViewSet(
         .prefetch_related(
             "betrokkene_set",
             "digitaaladres_set",
-            "categorierelatie_set",
+            "categorierelatie_set__categorie",
             "partijidentificator_set",
             "rekeningnummer_set",
-            "vertegenwoordigende",
+            "vertegenwoordigende__vertegenwoordigde_partij",
         )
     )
     serializer_class = PartijSerializer
@@ -111,8 +155,13 @@ class PartijViewSet(
         """
         if self.detail:
             return PartijDetailFilterSet
+        if self.action == "zoek":
+            return PartijZoekFilterSet
         return PartijFilterSet
 
+    def include_allowed(self):
+        return super().include_allowed() or self.action == "zoek"
+
     @transaction.atomic
     def perform_create(self, serializer):
         super().perform_create(serializer)
@@ -169,6 +218,132 @@ class PartijViewSet(
             token_application=getattr(token_auth, "application", None),
         )
 
+    @extend_schema(
+        summary="Maak partijen aan of werk ze bij.",
+        description=(
+            "Maak meerdere partijen in één verzoek aan of werk ze bij. Een partij "
+            "wordt bijgewerkt als een van de opgegeven `partijIdentificatoren` al "
+            "bestaat, anders wordt de partij aangemaakt. De gegevens van een "
+            "bestaande partij worden in zijn geheel vervangen, de "
+            "`partijIdentificatie` alleen als deze is opgegeven. "
+            "`partijIdentificatoren` die nog niet bestaan worden aan de partij "
+            "toegevoegd.\n\n"
+            "Per partij wordt het resultaat teruggegeven, ongeldige partijen worden "
+            "overgeslagen."
+        ),
+        request=PartijBulkSerializer(many=True),
+        responses={200: PartijBulkResultSerializer(many=True)},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="_bulk",
+        url_name="bulk",
+        filter_backends=[],
+        pagination_class=None,
+    )
+    def bulk(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            raise ValidationError(
+                {"non_field_errors": [_("Verwacht een lijst met partijen.")]},
+                code="invalid",
+            )
+        if len(request.data) > settings.PARTIJEN_BULK_MAX_SIZE:
+            raise ValidationError(
+                {
+                    "non_field_errors": [
+                        _("Er kunnen maximaal %(max_size)s partijen worden verwerkt.")
+                        % {"max_size": settings.PARTIJEN_BULK_MAX_SIZE}
+                    ]
+                },
+                code="max-size",
+            )
+
+        context = self.get_serializer_context()
+        serializers = [
+            PartijBulkSerializer(data=item, context=context) for item in request.data
+        ]
+        is_valid = [serializer.is_valid() for serializer in serializers]
+
+        with transaction.atomic():
+            upserted = iter(
+                bulk_upsert_partijen(
+                    [
+                        serializer.validated_data
+                        for serializer, valid in zip(serializers, is_valid)
+                        if valid
+                    ]
+                )
+            )
+            results = [
+                next(upserted) if valid else serializer.errors
+                for serializer, valid in zip(serializers, is_valid)
+            ]
+
+            items = []
+            for index, result in enumerate(results):
+                if isinstance(result, tuple):
+                    partij, created = result
+                    items.append(
+                        {
+                            "index": index,
+                            "resultaat": BulkResultaat.aangemaakt
+                            if created
+                            else BulkResultaat.bijgewerkt,
+                            "partij": partij,
+                            "fouten": None,
+                        }
+                    )
+                else:
+                    items.append(
+                        {
+                            "index": index,
+                            "resultaat": BulkResultaat.ongeldig,
+                            "partij": None,
+                            "fouten": result,
+                        }
+                    )
+            data = PartijBulkResultSerializer(items, many=True, context=context).data
+
+            notifications = [
+                (item["partij"], result[0], "create" if result[1] else "update")
+                for item, result in zip(data, results)
+                if isinstance(result, tuple)
+            ]
+            if notifications:
+                self.notify_bulk(status.HTTP_200_OK, notifications)
+
+        created = sum(item["resultaat"] == BulkResultaat.aangemaakt for item in data)
+        updated = len(notifications) - created
+        partijen_create_counter.add(created)
+        partijen_update_counter.add(updated)
+        logger.info(
+            "partijen_bulk_upserted",
+            created=created,
+            updated=updated,
+            invalid=len(data) - len(notifications),
+            token_identifier=getattr(request.auth, "identifier", None),
+            token_application=getattr(request.auth, "application", None),
+        )
+
+        return Response(data)
+
+    @extend_schema(
+        summary="Zoek partijen.",
+        description=(
+            "Zoek partijen op (een deel van) de naam, een bezoek- of "
+            "correspondentieadres, een digitaal adres of het object ID van een "
+            "partij-identificator. Alle woorden in de zoekopdracht moeten voorkomen, "
+            "van het laatste woord mag ook alleen het begin zijn opgegeven. De "
+            "partijen die het best overeenkomen worden als eerste teruggegeven."
+        ),
+        filters=True,
+        responses=PartijSerializer(many=True),
+    )
+    @action(detail=False, methods=["get"], url_path="_zoek", url_name="zoek")
+    def zoek(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
 
 @extend_schema(tags=["vertegenwoordigingen"])
 @extend_schema_view(
@@ -0,0 +1,48 @@
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import mixins, viewsets
+
+from openklant.components.klantinteracties.api.filterset.wijzigingen import (
+    WijzigingFilterSet,
+)
+from openklant.components.klantinteracties.api.serializers.wijzigingen import (
+    WijzigingSerializer,
+)
+from openklant.components.klantinteracties.models.wijzigingen import (
+    SnapshotXmin,
+    Wijziging,
+)
+from openklant.components.token.authentication import TokenAuthentication
+from openklant.components.token.permission import TokenPermissions
+from openklant.components.utils.pagination import FeedPagination
+from openklant.components.utils.viewsets import CheckQueryParamsMixin
+
+
+@extend_schema(tags=["wijzigingen"])
+@extend_schema_view(
+    list=extend_schema(
+        summary="Alle wijzigingen opvragen.",
+        description=(
+            "Alle aangemaakte, gewijzigde en verwijderde resources opvragen, in de "
+            "volgorde waarin de wijzigingen zijn vastgelegd. Begin zonder `sinds` "
+            "en geef bij de volgende verzoeken de waarde van `sinds` uit de vorige "
+            "response mee, om alleen de nieuwe wijzigingen op te vragen. Een "
+            "resource kan meerdere keren voorkomen, de laatste wijziging is de "
+            "actuele."
+        ),
+    ),
+)
+class WijzigingViewSet(
+    CheckQueryParamsMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """Aanmaak, wijziging of verwijdering van een resource."""
+
+    # only the changes of the transactions which are older than all running
+    # transactions are returned, so later changes are never committed before them
+    queryset = Wijziging.objects.filter(transactie__lt=SnapshotXmin()).order_by(
+        "transactie", "id"
+    )
+    serializer_class = WijzigingSerializer
+    pagination_class = FeedPagination
+    filterset_class = WijzigingFilterSet
+    authentication_classes = (TokenAuthentication,)
+    permission_classes = (TokenPermissions,)
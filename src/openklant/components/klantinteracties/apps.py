@@ -5,4 +5,8 @@ class KlantinteractiesConfig(AppConfig):
     name = "openklant.components.klantinteracties"
 
     def ready(self):
-        from . import metrics  # noqa
+        from openklant.components.utils.response_cache import connect_signals
+
+        from . import metrics, signals  # noqa
+
+        connect_signals(self)
@@ -6,3 +6,9 @@ class SoortDigitaalAdres(TextChoices):
     email = "email", _("Email")
     telefoonnummer = "telefoonnummer", _("Telefoonnummer")
     overig = "overig", _("Overig")
+
+
+class BulkResultaat(TextChoices):
+    aangemaakt = "aangemaakt", _("Het object is aangemaakt.")
+    bijgewerkt = "bijgewerkt", _("Het object is bijgewerkt.")
+    ongeldig = "ongeldig", _("Het object is ongeldig en niet verwerkt.")
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-10-18 13:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('klantinteracties', '0048_klantcontact_hoofd_onderwerp_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='klantcontact',
+            index=models.Index(fields=['plaatsgevonden_op', 'id'], name='klantcontact_plaatsgevonden'),
+        ),
+    ]
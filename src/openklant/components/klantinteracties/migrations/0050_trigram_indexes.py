@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-10-18 14:45
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+import openklant.utils.operations
+
+
+class Migration(migrations.Migration):
+    # the indexes are created concurrently, so the tables can be written to meanwhile
+    atomic = False
+
+    dependencies = [
+        ('klantinteracties', '0049_klantcontact_plaatsgevonden_op_index'),
+    ]
+
+    operations = [
+        openklant.utils.operations.CreateExtensionIfAvailable('pg_trgm'),
+        openklant.utils.operations.AddExtensionIndexConcurrently(
+            model_name='digitaaladres',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('adres'), name='gin_trgm_ops'), name='digitaaladres_adres_trgm'),
+            extension='pg_trgm',
+        ),
+        openklant.utils.operations.AddExtensionIndexConcurrently(
+            model_name='klantcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('onderwerp'), name='gin_trgm_ops'), name='klantcontact_onderwerp_trgm'),
+            extension='pg_trgm',
+        ),
+        openklant.utils.operations.AddExtensionIndexConcurrently(
+            model_name='klantcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('inhoud'), name='gin_trgm_ops'), name='klantcontact_inhoud_trgm'),
+            extension='pg_trgm',
+        ),
+        openklant.utils.operations.AddExtensionIndexConcurrently(
+            model_name='klantcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('reactie'), name='gin_trgm_ops'), name='klantcontact_reactie_trgm'),
+            extension='pg_trgm',
+        ),
+    ]
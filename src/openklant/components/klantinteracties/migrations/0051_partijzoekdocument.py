@@ -0,0 +1,109 @@
+# Generated by Django 5.2.17 on 2026-10-18 14:54
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+# a copy of the text of the search documents as built by `zoeken.get_zoektekst` when
+# this migration was written, so later changes don't affect the migration
+ADRES_FIELDS = (
+    "straatnaam",
+    "huisnummer",
+    "huisnummertoevoeging",
+    "postcode",
+    "stad",
+    "adresregel1",
+    "adresregel2",
+    "adresregel3",
+)
+CONTACTNAAM_FIELDS = (
+    "contactnaam_voorletters",
+    "contactnaam_voornaam",
+    "contactnaam_voorvoegsel_achternaam",
+    "contactnaam_achternaam",
+)
+POSTCODE_RE = re.compile(r"^(\d{4})\s*([a-zA-Z]{2})$")
+
+
+def get_postcode_variants(postcode):
+    match = POSTCODE_RE.match(postcode.strip())
+    if not match:
+        return [postcode]
+    digits, letters = match.groups()
+    return [f"{digits}{letters}", f"{digits} {letters}"]
+
+
+def get_zoektekst(partij):
+    values = []
+
+    for prefix in ("bezoekadres", "correspondentieadres"):
+        for field in ADRES_FIELDS:
+            value = getattr(partij, f"{prefix}_{field}")
+            if field == "postcode" and value:
+                values += get_postcode_variants(value)
+            elif value:
+                values.append(str(value))
+
+    for related in ("persoon", "contactpersoon"):
+        if instance := getattr(partij, related, None):
+            values += [getattr(instance, field) for field in CONTACTNAAM_FIELDS]
+
+    if organisatie := getattr(partij, "organisatie", None):
+        values.append(organisatie.naam)
+
+    values += [
+        digitaal_adres.adres for digitaal_adres in partij.digitaaladres_set.all()
+    ]
+    values += [
+        identificator.partij_identificator_object_id
+        for identificator in partij.partijidentificator_set.all()
+    ]
+
+    return " ".join(value for value in values if value)
+
+
+def create_zoekdocumenten(apps, schema_editor):
+    Partij = apps.get_model("klantinteracties", "Partij")
+    PartijZoekdocument = apps.get_model("klantinteracties", "PartijZoekdocument")
+
+    partijen = (
+        Partij.objects.order_by("pk")
+        .select_related("persoon", "contactpersoon", "organisatie")
+        .prefetch_related("digitaaladres_set", "partijidentificator_set")
+    )
+    last_pk = 0
+    while batch := list(partijen.filter(pk__gt=last_pk)[:BATCH_SIZE]):
+        PartijZoekdocument.objects.bulk_create(
+            PartijZoekdocument(partij=partij, tekst=get_zoektekst(partij))
+            for partij in batch
+        )
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('klantinteracties', '0050_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartijZoekdocument',
+            fields=[
+                ('partij', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='zoekdocument', serialize=False, to='klantinteracties.partij', verbose_name='partij')),
+                ('tekst', models.TextField(blank=True, help_text='Namen, adressen, digitale adressen en partij-identificatoren van de partij.', verbose_name='tekst')),
+                ('vector', models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('tekst', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField())),
+            ],
+            options={
+                'verbose_name': 'partij zoekdocument',
+                'verbose_name_plural': 'partij zoekdocumenten',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['vector'], name='partijzoekdocument_vector')],
+            },
+        ),
+        migrations.RunPython(create_zoekdocumenten, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-10-18 15:35
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('klantinteracties', '0051_partijzoekdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='klantcontact',
+            name='versie',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, help_text='Versie van het object, die wijzigt bij elke wijziging van het object of de gerelateerde objecten.', verbose_name='versie'),
+        ),
+        migrations.AddField(
+            model_name='partij',
+            name='versie',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, help_text='Versie van het object, die wijzigt bij elke wijziging van het object of de gerelateerde objecten.', verbose_name='versie'),
+        ),
+    ]
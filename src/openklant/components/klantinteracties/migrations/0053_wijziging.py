@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-10-18 16:00
+
+import django.db.models.functions.datetime
+import openklant.components.klantinteracties.models.wijzigingen
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('klantinteracties', '0052_versie'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Wijziging',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('transactie', models.BigIntegerField(db_default=openklant.components.klantinteracties.models.wijzigingen.CurrentTransactionId(), editable=False, help_text='ID van de database-transactie waarin de wijziging is gedaan.', verbose_name='transactie')),
+                ('tijdstip', models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='Begin van de transactie waarin de wijziging is gedaan.', verbose_name='tijdstip')),
+                ('resource', models.CharField(choices=[('actor', 'Actor'), ('actorklantcontact', 'Actor klantcontact'), ('betrokkene', 'Betrokkene'), ('bijlage', 'Bijlage'), ('categorie', 'Categorie'), ('categorierelatie', 'Categorie relatie'), ('digitaaladres', 'Digitaal adres'), ('internetaak', 'Interne taak'), ('klantcontact', 'Klantcontact'), ('onderwerpobject', 'Onderwerpobject'), ('partij', 'Partij'), ('partijidentificator', 'Partij-identificator'), ('rekeningnummer', 'Rekeningnummer'), ('vertegenwoordigden', 'Vertegenwoordigden')], help_text='Soort resource die is gewijzigd.', max_length=20, verbose_name='resource')),
+                ('resource_uuid', models.UUIDField(help_text='Unieke (technische) identificatiecode van de resource.', verbose_name='resource UUID')),
+                ('actie', models.CharField(choices=[('aangemaakt', 'Aangemaakt'), ('gewijzigd', 'Gewijzigd'), ('verwijderd', 'Verwijderd')], help_text='Of de resource is aangemaakt, gewijzigd of verwijderd.', max_length=10, verbose_name='actie')),
+            ],
+            options={
+                'verbose_name': 'wijziging',
+                'verbose_name_plural': 'wijzigingen',
+                'indexes': [models.Index(fields=['transactie', 'id'], name='wijziging_transactie_id')],
+            },
+        ),
+    ]
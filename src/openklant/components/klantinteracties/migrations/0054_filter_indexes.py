@@ -0,0 +1,44 @@
+# Generated by Django 5.2.17 on 2026-10-18 17:34
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the indexes are created concurrently, so the tables can be written to meanwhile
+    atomic = False
+
+    dependencies = [
+        ('klantinteracties', '0053_wijziging'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='actor',
+            index=models.Index(fields=['actoridentificator_object_id'], name='actor_object_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='bijlage',
+            index=models.Index(fields=['bijlageidentificator_object_id'], name='bijlage_object_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='digitaaladres',
+            index=models.Index(fields=['adres'], name='digitaaladres_adres'),
+        ),
+        AddIndexConcurrently(
+            model_name='onderwerpobject',
+            index=models.Index(fields=['onderwerpobjectidentificator_object_id'], name='onderwerpobject_object_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='partij',
+            index=models.Index(fields=['bezoekadres_nummeraanduiding_id'], name='partij_bezoekadres_bag'),
+        ),
+        AddIndexConcurrently(
+            model_name='partij',
+            index=models.Index(fields=['correspondentieadres_nummeraanduiding_id'], name='partij_correspondentie_bag'),
+        ),
+        AddIndexConcurrently(
+            model_name='partijidentificator',
+            index=models.Index(fields=['partij_identificator_object_id'], name='partijidentificator_object_id'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-10-18 17:52
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+import openklant.utils.operations
+
+
+class Migration(migrations.Migration):
+    # the trigram index is created concurrently, so the table can be written to
+    atomic = False
+
+    dependencies = [
+        ('klantinteracties', '0054_filter_indexes'),
+    ]
+
+    operations = [
+        openklant.utils.operations.AddExtensionIndexConcurrently(
+            model_name='partijzoekdocument',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('tekst'), name='gin_trgm_ops'), name='partijzoekdocument_tekst_trgm'),
+            extension='pg_trgm',
+        ),
+    ]
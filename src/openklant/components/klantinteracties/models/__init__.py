@@ -4,3 +4,4 @@ from .internetaken import *  # noqa
 from .klantcontacten import *  # noqa
 from .partijen import *  # noqa
 from .rekeningnummers import *  # noqa
+from .wijzigingen import *  # noqa
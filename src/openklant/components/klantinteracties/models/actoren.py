@@ -88,6 +88,12 @@ class Actor(models.Model):
     class Meta:
         verbose_name = _("actor")
         verbose_name_plural = _("actoren")
+        indexes = [
+            # the actor of a medewerker is looked up by its id in the source system
+            models.Index(
+                fields=["actoridentificator_object_id"], name="actor_object_id"
+            ),
+        ]
 
     def __str__(self):
         return self.naam
@@ -63,3 +63,26 @@ class PartijIdentificatorCodeObjectType(TextChoices):
 class PartijIdentificatorCodeRegister(TextChoices):
     brp = "brp", _("BRP")
     hr = "hr", _("HR")
+
+
+class Wijzigingsactie(TextChoices):
+    aangemaakt = "aangemaakt", _("Aangemaakt")
+    gewijzigd = "gewijzigd", _("Gewijzigd")
+    verwijderd = "verwijderd", _("Verwijderd")
+
+
+class WijzigingResource(TextChoices):
+    actor = "actor", _("Actor")
+    actorklantcontact = "actorklantcontact", _("Actor klantcontact")
+    betrokkene = "betrokkene", _("Betrokkene")
+    bijlage = "bijlage", _("Bijlage")
+    categorie = "categorie", _("Categorie")
+    categorierelatie = "categorierelatie", _("Categorie relatie")
+    digitaaladres = "digitaaladres", _("Digitaal adres")
+    internetaak = "internetaak", _("Interne taak")
+    klantcontact = "klantcontact", _("Klantcontact")
+    onderwerpobject = "onderwerpobject", _("Onderwerpobject")
+    partij = "partij", _("Partij")
+    partijidentificator = "partijidentificator", _("Partij-identificator")
+    rekeningnummer = "rekeningnummer", _("Rekeningnummer")
+    vertegenwoordigden = "vertegenwoordigden", _("Vertegenwoordigden")
@@ -1,11 +1,15 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from openklant.components.klantinteracties.constants import SoortDigitaalAdres
+from openklant.components.klantinteracties.models.constants import Wijzigingsactie
 from openklant.components.klantinteracties.models.klantcontacten import Betrokkene
 from openklant.components.klantinteracties.models.partijen import Partij
+from openklant.components.klantinteracties.wijzigingen import record_wijzigingen
 from openklant.components.utils.mixins import APIMixin
 
 REFERENTIE_UNIQUENESS_CONDITION = models.Q(referentie__gt="") & models.Q(
@@ -98,6 +102,16 @@ class DigitaalAdres(APIMixin, models.Model):
                 condition=REFERENTIE_UNIQUENESS_CONDITION,
             ),
         ]
+        indexes = [
+            # exact lookups of an address, like an e-mail address or phone number
+            models.Index(fields=["adres"], name="digitaaladres_adres"),
+            # trigram index for the `icontains` filters, which are compared in upper
+            # case by Django
+            GinIndex(
+                OpClass(Upper("adres"), name="gin_trgm_ops"),
+                name="digitaaladres_adres_trgm",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.betrokkene} - {self.adres}"
@@ -106,10 +120,16 @@ class DigitaalAdres(APIMixin, models.Model):
         if self.is_standaard_adres:
             # Because there can only be one default address per `soort_digitaal_adres`
             # and `partij`, mark all other addresses as non-default
-            DigitaalAdres.objects.filter(
+            standaard_adressen = DigitaalAdres.objects.filter(
                 soort_digitaal_adres=self.soort_digitaal_adres,
                 partij=self.partij,
                 is_standaard_adres=True,
-            ).update(is_standaard_adres=False)
+            ).exclude(pk=self.pk)
+            record_wijzigingen(
+                DigitaalAdres,
+                standaard_adressen.values_list("uuid", flat=True),
+                Wijzigingsactie.gewijzigd,
+            )
+            standaard_adressen.update(is_standaard_adres=False)
 
         super().save(*args, **kwargs)
@@ -1,14 +1,16 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import validate_integer
 from django.db import models
 from django.db.models import CheckConstraint, Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.descriptors import GegevensGroepType
 
-from openklant.components.utils.mixins import APIMixin
+from openklant.components.utils.mixins import APIMixin, VersionMixin
 from openklant.utils.help_text import mark_deprecated
 
 from .constants import Klantcontrol
@@ -16,7 +18,7 @@ from .mixins import BezoekadresMixin, ContactnaamMixin, CorrespondentieadresMixi
 from .validators import validate_metadata
 
 
-class Klantcontact(APIMixin, models.Model):
+class Klantcontact(APIMixin, VersionMixin, models.Model):
     uuid = models.UUIDField(
         unique=True,
         default=uuid.uuid4,
@@ -146,6 +148,27 @@ class Klantcontact(APIMixin, models.Model):
                 ),
             )
         ]
+        indexes = [
+            # used by the ordering and cursor pagination of the list endpoint
+            models.Index(
+                fields=["plaatsgevonden_op", "id"],
+                name="klantcontact_plaatsgevonden",
+            ),
+            # trigram indexes for the `icontains` filters, which are compared in upper
+            # case by Django
+            GinIndex(
+                OpClass(Upper("onderwerp"), name="gin_trgm_ops"),
+                name="klantcontact_onderwerp_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("inhoud"), name="gin_trgm_ops"),
+                name="klantcontact_inhoud_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("reactie"), name="gin_trgm_ops"),
+                name="klantcontact_reactie_trgm",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.onderwerp} - ({self.nummer})" if self.nummer else self.onderwerp
@@ -291,6 +314,13 @@ class Onderwerpobject(models.Model):
     class Meta:
         verbose_name = _("onderwerpobject")
         verbose_name_plural = _("onderwerpobjecten")
+        indexes = [
+            # the klantcontacten about an object (like a zaak) are looked up by its id
+            models.Index(
+                fields=["onderwerpobjectidentificator_object_id"],
+                name="onderwerpobject_object_id",
+            ),
+        ]
 
     def __str__(self):
         soort_object = self.onderwerpobjectidentificator_code_soort_object_id
@@ -363,6 +393,11 @@ class Bijlage(APIMixin, models.Model):
     class Meta:
         verbose_name = _("bijlage")
         verbose_name_plural = _("bijlagen")
+        indexes = [
+            models.Index(
+                fields=["bijlageidentificator_object_id"], name="bijlage_object_id"
+            ),
+        ]
 
     def __str__(self):
         soort_object = self.bijlageidentificator_code_soort_object_id
@@ -1,13 +1,16 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_integer
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.descriptors import GegevensGroepType
 
-from openklant.components.utils.mixins import APIMixin
+from openklant.components.utils.mixins import APIMixin, VersionMixin
 from openklant.utils.help_text import mark_deprecated
 
 from .constants import (
@@ -19,7 +22,7 @@ from .constants import (
 from .mixins import BezoekadresMixin, ContactnaamMixin, CorrespondentieadresMixin
 
 
-class Partij(APIMixin, BezoekadresMixin, CorrespondentieadresMixin):
+class Partij(APIMixin, VersionMixin, BezoekadresMixin, CorrespondentieadresMixin):
     uuid = models.UUIDField(
         unique=True,
         default=uuid.uuid4,
@@ -101,6 +104,17 @@ class Partij(APIMixin, BezoekadresMixin, CorrespondentieadresMixin):
     class Meta:
         verbose_name = _("partij")
         verbose_name_plural = _("partijen")
+        indexes = [
+            # the partijen of an address are looked up by its BAG nummeraanduiding
+            models.Index(
+                fields=["bezoekadres_nummeraanduiding_id"],
+                name="partij_bezoekadres_bag",
+            ),
+            models.Index(
+                fields=["correspondentieadres_nummeraanduiding_id"],
+                name="partij_correspondentie_bag",
+            ),
+        ]
 
     def __str__(self):
         return self.nummer if self.nummer else str(self.uuid)
@@ -424,6 +438,14 @@ class PartijIdentificator(models.Model):
                 ),
             ),
         ]
+        indexes = [
+            # the unique constraints start with the code objecttype, which the
+            # `partijIdentificator__objectId` filters don't include
+            models.Index(
+                fields=["partij_identificator_object_id"],
+                name="partijidentificator_object_id",
+            ),
+        ]
 
     def clean_sub_identificator_van(self):
         if self.sub_identificator_van and self.sub_identificator_van == self:
@@ -445,3 +467,45 @@ class PartijIdentificator(models.Model):
 
     def __str__(self):
         return f"{self.partij_identificator_code_soort_object_id} - {self.partij_identificator_object_id}"
+
+
+class PartijZoekdocument(models.Model):
+    """
+    The searchable texts of a partij and its related objects, kept up to date by the
+    signals in ``klantinteracties.signals``.
+    """
+
+    partij = models.OneToOneField(
+        Partij,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="zoekdocument",
+        verbose_name=_("partij"),
+    )
+    tekst = models.TextField(
+        _("tekst"),
+        help_text=_(
+            "Namen, adressen, digitale adressen en partij-identificatoren van de partij."
+        ),
+        blank=True,
+    )
+    vector = models.GeneratedField(
+        expression=SearchVector("tekst", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        verbose_name = _("partij zoekdocument")
+        verbose_name_plural = _("partij zoekdocumenten")
+        indexes = [
+            GinIndex(fields=["vector"], name="partijzoekdocument_vector"),
+            # trigram index to find parts of words, compared in upper case by Django
+            GinIndex(
+                OpClass(Upper("tekst"), name="gin_trgm_ops"),
+                name="partijzoekdocument_tekst_trgm",
+            ),
+        ]
+
+    def __str__(self):
+        return str(self.partij)
@@ -0,0 +1,73 @@
+from django.db import models
+from django.db.models.functions import Now
+from django.utils.translation import gettext_lazy as _
+
+from .constants import WijzigingResource, Wijzigingsactie
+
+
+class CurrentTransactionId(models.Func):
+    """
+    The ID of the current transaction, which is assigned when the transaction starts
+    writing.
+    """
+
+    template = "pg_current_xact_id()::text::bigint"
+    output_field = models.BigIntegerField()
+
+
+class SnapshotXmin(models.Func):
+    """
+    The ID of the oldest transaction which is still running, all transactions with a
+    lower ID are committed or rolled back.
+    """
+
+    template = "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+    output_field = models.BigIntegerField()
+
+
+class Wijziging(models.Model):
+    """
+    A change of a resource, recorded in the same transaction as the change itself by
+    the signals in ``klantinteracties.signals``.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    transactie = models.BigIntegerField(
+        _("transactie"),
+        db_default=CurrentTransactionId(),
+        editable=False,
+        help_text=_("ID van de database-transactie waarin de wijziging is gedaan."),
+    )
+    tijdstip = models.DateTimeField(
+        _("tijdstip"),
+        db_default=Now(),
+        editable=False,
+        help_text=_("Begin van de transactie waarin de wijziging is gedaan."),
+    )
+    resource = models.CharField(
+        _("resource"),
+        max_length=20,
+        choices=WijzigingResource.choices,
+        help_text=_("Soort resource die is gewijzigd."),
+    )
+    resource_uuid = models.UUIDField(
+        _("resource UUID"),
+        help_text=_("Unieke (technische) identificatiecode van de resource."),
+    )
+    actie = models.CharField(
+        _("actie"),
+        max_length=10,
+        choices=Wijzigingsactie.choices,
+        help_text=_("Of de resource is aangemaakt, gewijzigd of verwijderd."),
+    )
+
+    class Meta:
+        verbose_name = _("wijziging")
+        verbose_name_plural = _("wijzigingen")
+        indexes = [
+            # the order of the change feed
+            models.Index(fields=["transactie", "id"], name="wijziging_transactie_id"),
+        ]
+
+    def __str__(self):
+        return f"{self.resource} {self.resource_uuid} {self.actie}"
@@ -0,0 +1,236 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import (
+    Actor,
+    ActorKlantcontact,
+    Betrokkene,
+    Bijlage,
+    Categorie,
+    CategorieRelatie,
+    Contactpersoon,
+    DigitaalAdres,
+    GeautomatiseerdeActor,
+    InterneTaak,
+    Klantcontact,
+    Medewerker,
+    Onderwerpobject,
+    Organisatie,
+    OrganisatorischeEenheid,
+    Partij,
+    PartijIdentificator,
+    Persoon,
+    Rekeningnummer,
+    Vertegenwoordigden,
+)
+from .models.constants import Wijzigingsactie
+from .versies import schedule_versie_update, update_versies
+from .wijzigingen import record_wijziging, record_wijzigingen
+from .zoeken import schedule_zoekdocument_update
+
+# the models which are part of the search document of their partij
+ZOEKDOCUMENT_MODELS = (
+    Contactpersoon,
+    DigitaalAdres,
+    Organisatie,
+    Persoon,
+    PartijIdentificator,
+)
+
+
+# the related objects which are part of the representation of a partij or klantcontact,
+# with their foreign keys to the partij or klantcontact
+VERSIE_RELATIONS = {
+    ActorKlantcontact: {Klantcontact: "klantcontact_id"},
+    Betrokkene: {Partij: "partij_id", Klantcontact: "klantcontact_id"},
+    Bijlage: {Klantcontact: "klantcontact_id"},
+    CategorieRelatie: {Partij: "partij_id"},
+    Contactpersoon: {Partij: "partij_id"},
+    DigitaalAdres: {Partij: "partij_id"},
+    InterneTaak: {Klantcontact: "klantcontact_id"},
+    Onderwerpobject: {Klantcontact: "klantcontact_id"},
+    Organisatie: {Partij: "partij_id"},
+    PartijIdentificator: {Partij: "partij_id"},
+    Persoon: {Partij: "partij_id"},
+    Rekeningnummer: {Partij: "partij_id"},
+    Vertegenwoordigden: {Partij: "vertegenwoordigende_partij_id"},
+}
+
+# the objects which are part of the representation through another relation, with the
+# lookups from the partij or klantcontact
+VERSIE_LOOKUPS = {
+    Actor: {Klantcontact: "actorklantcontact__actor"},
+    Categorie: {Partij: "categorierelatie__categorie"},
+    GeautomatiseerdeActor: {
+        Klantcontact: "actorklantcontact__actor__geautomatiseerdeactor"
+    },
+    Medewerker: {Klantcontact: "actorklantcontact__actor__medewerker"},
+    OrganisatorischeEenheid: {
+        Klantcontact: "actorklantcontact__actor__organisatorischeeenheid"
+    },
+}
+
+# the resources of which the changes are part of the change feed, the changes of
+# partijen and klantcontacten through their related objects are recorded together with
+# their versions
+WIJZIGING_MODELS = (
+    Actor,
+    ActorKlantcontact,
+    Betrokkene,
+    Bijlage,
+    Categorie,
+    CategorieRelatie,
+    DigitaalAdres,
+    InterneTaak,
+    Klantcontact,
+    Onderwerpobject,
+    Partij,
+    PartijIdentificator,
+    Rekeningnummer,
+    Vertegenwoordigden,
+)
+
+# the objects which are part of the representation of an actor
+ACTOR_MODELS = (GeautomatiseerdeActor, Medewerker, OrganisatorischeEenheid)
+
+
+@receiver(post_save, sender=Partij, dispatch_uid="partij.update_zoekdocument")
+def update_partij_zoekdocument(sender, instance: Partij, **kwargs):
+    schedule_zoekdocument_update(instance.pk)
+
+
+def update_related_zoekdocument(sender, instance, **kwargs):
+    origin = kwargs.get("origin")
+    # the search document is deleted together with the partij
+    if isinstance(origin, Partij) or (
+        isinstance(origin, QuerySet) and origin.model is Partij
+    ):
+        return
+
+    if instance.partij_id:
+        schedule_zoekdocument_update(instance.partij_id)
+
+
+for model in ZOEKDOCUMENT_MODELS:
+    for signal in (post_save, post_delete):
+        signal.connect(
+            update_related_zoekdocument,
+            sender=model,
+            dispatch_uid=f"{model._meta.model_name}.update_zoekdocument",
+        )
+
+
+def update_previous_versie(sender, instance, raw=False, **kwargs):
+    """
+    Change the version of the previous partij or klantcontact of an object which is
+    moved to another one.
+    """
+    if raw or instance._state.adding:
+        return
+
+    relations = VERSIE_RELATIONS[sender]
+    previous = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list(*relations.values())
+        .first()
+    )
+    if previous is None:
+        return
+
+    for (model, field), previous_pk in zip(relations.items(), previous):
+        if previous_pk is not None and previous_pk != getattr(instance, field):
+            schedule_versie_update(model, previous_pk)
+
+
+def update_related_versie(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    origin = kwargs.get("origin")
+    for model, field in VERSIE_RELATIONS[sender].items():
+        pk = getattr(instance, field)
+        # the version is deleted together with the object
+        if pk is None or (isinstance(origin, model) and origin.pk == pk):
+            continue
+
+        schedule_versie_update(model, pk)
+
+
+def update_versie_by_lookup(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    for model, lookup in VERSIE_LOOKUPS[sender].items():
+        update_versies(model._default_manager.filter(**{lookup: instance.pk}))
+
+
+for model in VERSIE_RELATIONS:
+    model_name = model._meta.model_name
+    pre_save.connect(
+        update_previous_versie,
+        sender=model,
+        dispatch_uid=f"{model_name}.update_previous_versie",
+    )
+    for signal in (post_save, post_delete):
+        signal.connect(
+            update_related_versie,
+            sender=model,
+            dispatch_uid=f"{model_name}.update_related_versie",
+        )
+
+for model in VERSIE_LOOKUPS:
+    post_save.connect(
+        update_versie_by_lookup,
+        sender=model,
+        dispatch_uid=f"{model._meta.model_name}.update_versie_by_lookup",
+    )
+
+
+def record_saved_wijziging(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    actie = Wijzigingsactie.aangemaakt if created else Wijzigingsactie.gewijzigd
+    record_wijziging(instance, actie)
+
+
+def record_deleted_wijziging(sender, instance, **kwargs):
+    record_wijziging(instance, Wijzigingsactie.verwijderd)
+
+
+def record_actor_wijziging(sender, instance, raw=False, **kwargs):
+    origin = kwargs.get("origin")
+    # the deletion of the actor itself is recorded
+    if raw or isinstance(origin, Actor):
+        return
+    if isinstance(origin, QuerySet) and origin.model is Actor:
+        return
+
+    record_wijzigingen(
+        Actor,
+        Actor.objects.filter(pk=instance.actor_id).values_list("uuid", flat=True),
+        Wijzigingsactie.gewijzigd,
+    )
+
+
+for model in WIJZIGING_MODELS:
+    model_name = model._meta.model_name
+    post_save.connect(
+        record_saved_wijziging,
+        sender=model,
+        dispatch_uid=f"{model_name}.record_saved_wijziging",
+    )
+    post_delete.connect(
+        record_deleted_wijziging,
+        sender=model,
+        dispatch_uid=f"{model_name}.record_deleted_wijziging",
+    )
+
+for model in ACTOR_MODELS:
+    for signal in (post_save, post_delete):
+        signal.connect(
+            record_actor_wijziging,
+            sender=model,
+            dispatch_uid=f"{model._meta.model_name}.record_actor_wijziging",
+        )
@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from vng_api_common.tests import reverse
 
@@ -11,6 +14,13 @@ from openklant.components.klantinteracties.models.tests.factories import (
     PartijFactory,
 )
 from openklant.components.token.tests.api_testcase import APITestCase
+from openklant.utils.metrics import (
+    api_db_duration_histogram,
+    api_db_queries_histogram,
+    api_expand_depth_histogram,
+    api_request_duration_histogram,
+    api_response_size_histogram,
+)
 
 from ..metrics import (
     actoren_create_counter,
@@ -291,3 +301,127 @@ class InterneTaakTests(APITestCase):
             {},
         )
         mock_add.assert_called_once_with(1)
+
+
+@patch.object(
+    api_expand_depth_histogram, "record", wraps=api_expand_depth_histogram.record
+)
+@patch.object(
+    api_response_size_histogram, "record", wraps=api_response_size_histogram.record
+)
+@patch.object(
+    api_db_duration_histogram, "record", wraps=api_db_duration_histogram.record
+)
+@patch.object(api_db_queries_histogram, "record", wraps=api_db_queries_histogram.record)
+@patch.object(
+    api_request_duration_histogram,
+    "record",
+    wraps=api_request_duration_histogram.record,
+)
+class APIRequestMetricsTests(APITestCase):
+    def test_list(
+        self,
+        duration_record: MagicMock,
+        queries_record: MagicMock,
+        db_duration_record: MagicMock,
+        size_record: MagicMock,
+        expand_record: MagicMock,
+    ):
+        KlantcontactFactory.create()
+        url = reverse("klantinteracties:klantcontact-list")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, {"expand": "hadBetrokkenen.wasPartij,gingOverOnderwerpobjecten"}
+            )
+
+        attributes = {
+            "view": "klantinteracties:klantcontact-list",
+            "http.request.method": "GET",
+            "action": "list",
+            "http.response.status_code": 200,
+        }
+        duration_record.assert_called_once_with(ANY, attributes=attributes)
+        queries_record.assert_called_once_with(len(queries), attributes=attributes)
+        db_duration_record.assert_called_once_with(ANY, attributes=attributes)
+        size_record.assert_called_once_with(
+            len(response.content), attributes=attributes
+        )
+        expand_record.assert_called_once_with(2, attributes=attributes)
+        self.assertGreater(duration_record.call_args.args[0], 0)
+        self.assertGreater(db_duration_record.call_args.args[0], 0)
+        self.assertLess(
+            db_duration_record.call_args.args[0], duration_record.call_args.args[0]
+        )
+
+    def test_detail_route(
+        self,
+        duration_record: MagicMock,
+        queries_record: MagicMock,
+        db_duration_record: MagicMock,
+        size_record: MagicMock,
+        expand_record: MagicMock,
+    ):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+
+        self.client.patch(
+            reverse(
+                "klantinteracties:partij-detail", kwargs={"uuid": str(partij.uuid)}
+            ),
+            {"soortPartij": "ongeldig"},
+        )
+
+        # the attributes don't contain the UUID of the partij
+        duration_record.assert_called_once_with(
+            ANY,
+            attributes={
+                "view": "klantinteracties:partij-detail",
+                "http.request.method": "PATCH",
+                "action": "partial_update",
+                "http.response.status_code": 400,
+            },
+        )
+        expand_record.assert_called_once_with(0, attributes=ANY)
+
+    def test_custom_action(
+        self,
+        duration_record: MagicMock,
+        queries_record: MagicMock,
+        db_duration_record: MagicMock,
+        size_record: MagicMock,
+        expand_record: MagicMock,
+    ):
+        response = self.client.get(reverse("klantinteracties:partij-export"))
+
+        self.assertEqual(
+            duration_record.call_args.kwargs["attributes"]["action"], "export"
+        )
+        # the size of a streaming response is unknown
+        self.assertTrue(response.streaming)
+        size_record.assert_not_called()
+
+    def test_viewset_without_expand(
+        self,
+        duration_record: MagicMock,
+        queries_record: MagicMock,
+        db_duration_record: MagicMock,
+        size_record: MagicMock,
+        expand_record: MagicMock,
+    ):
+        self.client.get(reverse("klantinteracties:actor-list"))
+
+        duration_record.assert_called_once()
+        expand_record.assert_not_called()
+
+    def test_other_views(
+        self,
+        duration_record: MagicMock,
+        queries_record: MagicMock,
+        db_duration_record: MagicMock,
+        size_record: MagicMock,
+        expand_record: MagicMock,
+    ):
+        self.client.get("/admin/login/")
+
+        duration_record.assert_not_called()
+        queries_record.assert_not_called()
@@ -425,3 +425,48 @@ class TestValidateBagId(BaseMigrationTest):
         )
         self.assertNotEqual(records[0].bezoekadres_nummeraanduiding_id, "ABC")
         self.assertNotEqual(records[0].correspondentieadres_nummeraanduiding_id, "DEF")
+
+
+class TestPartijZoekdocument(BaseMigrationTest):
+    app = "klantinteracties"
+    migrate_from = "0050_trigram_indexes"
+    migrate_to = "0051_partijzoekdocument"
+
+    def test_create_zoekdocumenten(self):
+        Partij = self.old_app_state.get_model("klantinteracties", "Partij")
+        Persoon = self.old_app_state.get_model("klantinteracties", "Persoon")
+        DigitaalAdres = self.old_app_state.get_model(
+            "klantinteracties", "DigitaalAdres"
+        )
+
+        partij = Partij.objects.create(
+            nummer="0000000001",
+            soort_partij="persoon",
+            indicatie_actief=True,
+            bezoekadres_postcode="1234AB",
+            bezoekadres_stad="Amsterdam",
+        )
+        Persoon.objects.create(
+            partij=partij,
+            contactnaam_voornaam="Jan",
+            contactnaam_achternaam="Jansen",
+        )
+        DigitaalAdres.objects.create(
+            partij=partij, soort_digitaal_adres="email", adres="jan@example.com"
+        )
+        Partij.objects.create(
+            nummer="0000000002", soort_partij="organisatie", indicatie_actief=True
+        )
+
+        self._perform_migration()
+
+        PartijZoekdocument = self.apps.get_model(
+            "klantinteracties", "PartijZoekdocument"
+        )
+        self.assertEqual(
+            dict(PartijZoekdocument.objects.values_list("partij__nummer", "tekst")),
+            {
+                "0000000001": "1234AB 1234 AB Amsterdam Jan Jansen jan@example.com",
+                "0000000002": "",
+            },
+        )
@@ -0,0 +1,66 @@
+"""
+Versions of partijen and klantcontacten, used for the ETags of the API.
+
+The version of an object changes when the object is saved (see ``VersionMixin``) and
+when one of the related objects which are part of its representation is saved or
+deleted (see ``signals``).
+"""
+
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Set, Type
+
+from django.db.models import Model, QuerySet
+
+from .models.constants import Wijzigingsactie
+from .wijzigingen import record_wijzigingen
+
+# the objects of which the version is changed at the end of a `deferred_versies`
+# block
+_deferred_versies: ContextVar[Optional[Dict[Type[Model], Set[int]]]] = ContextVar(
+    "deferred_versies", default=None
+)
+
+
+def update_versies(queryset: QuerySet) -> None:
+    """
+    Change the version of the objects with a single query, the representation of the
+    objects changed so the change is recorded in the change feed as well.
+    """
+    record_wijzigingen(
+        queryset.model,
+        queryset.values_list("uuid", flat=True),
+        Wijzigingsactie.gewijzigd,
+    )
+    queryset.update(versie=uuid.uuid4())
+
+
+def schedule_versie_update(model: Type[Model], pk: int) -> None:
+    """
+    Change the version of the object, or at the end of the surrounding
+    `deferred_versies` block.
+    """
+    deferred = _deferred_versies.get()
+    if deferred is None:
+        update_versies(model._default_manager.filter(pk=pk))
+    else:
+        deferred[model].add(pk)
+
+
+@contextmanager
+def deferred_versies() -> Iterator[None]:
+    """
+    Change the versions of the objects which are changed in the block at once, at the
+    end of the block, for example when many related objects are deleted.
+    """
+    deferred = defaultdict(set)
+    token = _deferred_versies.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_versies.reset(token)
+
+    for model, pks in deferred.items():
+        update_versies(model._default_manager.filter(pk__in=pks))
@@ -0,0 +1,46 @@
+"""
+The change feed of the resources of the API.
+
+Every creation, change and deletion of a resource is recorded as a ``Wijziging`` in the
+same transaction (see ``signals``). The changes are ordered by the ID of their
+transaction: the feed only returns the changes of transactions which are older than
+the oldest running transaction, so a change which is committed later never ends up
+before a change which was already returned.
+"""
+
+from typing import Iterable, Type
+from uuid import UUID
+
+from django.db.models import Model
+
+from openklant.components.utils.response_cache import schedule_generation_bump
+
+from .models.constants import Wijzigingsactie
+from .models.wijzigingen import Wijziging
+
+
+def get_resource(model: Type[Model]) -> str:
+    return model._meta.model_name
+
+
+def record_wijziging(instance: Model, actie: Wijzigingsactie) -> None:
+    Wijziging.objects.create(
+        resource=get_resource(type(instance)),
+        resource_uuid=instance.uuid,
+        actie=actie,
+    )
+
+
+def record_wijzigingen(
+    model: Type[Model], uuids: Iterable[UUID], actie: Wijzigingsactie
+) -> None:
+    """
+    Record a change of each of the objects with a single query, for operations which
+    don't send signals like ``QuerySet.update`` and ``bulk_create``. The cached
+    responses of the model are invalidated as well.
+    """
+    schedule_generation_bump(model)
+    resource = get_resource(model)
+    Wijziging.objects.bulk_create(
+        Wijziging(resource=resource, resource_uuid=uuid, actie=actie) for uuid in uuids
+    )
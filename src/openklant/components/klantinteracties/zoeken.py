@@ -0,0 +1,171 @@
+"""
+Search documents of partijen, used by the ``/partijen/_zoek`` endpoint.
+
+Every partij has a ``PartijZoekdocument`` with the names of the partij, its adressen,
+digitale adressen and the object ids of its partij-identificatoren. The document is
+searched with a full text query for (the start of) words and a trigram index for
+parts of words.
+"""
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional, Set
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+
+from .models import Partij, PartijZoekdocument
+
+ADRES_FIELDS = (
+    "straatnaam",
+    "huisnummer",
+    "huisnummertoevoeging",
+    "postcode",
+    "stad",
+    "adresregel1",
+    "adresregel2",
+    "adresregel3",
+)
+CONTACTNAAM_FIELDS = (
+    "contactnaam_voorletters",
+    "contactnaam_voornaam",
+    "contactnaam_voorvoegsel_achternaam",
+    "contactnaam_achternaam",
+)
+
+# the partijen of which the search document is updated at the end of a
+# `deferred_zoekdocumenten` block
+_deferred_partij_ids: ContextVar[Optional[Set[int]]] = ContextVar(
+    "deferred_partij_ids", default=None
+)
+
+POSTCODE_RE = re.compile(r"^(\d{4})\s*([a-zA-Z]{2})$")
+# characters which have a meaning in a raw tsquery
+TSQUERY_SPECIAL_CHARS_RE = re.compile(r"[&|!():*<>'\\]")
+
+
+def get_postcode_variants(postcode: str) -> List[str]:
+    """
+    Return the postcode with and without a space, so both can be found.
+    """
+    match = POSTCODE_RE.match(postcode.strip())
+    if not match:
+        return [postcode]
+    digits, letters = match.groups()
+    return [f"{digits}{letters}", f"{digits} {letters}"]
+
+
+def get_zoektekst(partij: Partij) -> str:
+    values = []
+
+    for prefix in ("bezoekadres", "correspondentieadres"):
+        for field in ADRES_FIELDS:
+            value = getattr(partij, f"{prefix}_{field}")
+            if field == "postcode" and value:
+                values += get_postcode_variants(value)
+            elif value:
+                values.append(str(value))
+
+    for related in ("persoon", "contactpersoon"):
+        if instance := getattr(partij, related, None):
+            values += [getattr(instance, field) for field in CONTACTNAAM_FIELDS]
+
+    if organisatie := getattr(partij, "organisatie", None):
+        values.append(organisatie.naam)
+
+    values += [
+        digitaal_adres.adres for digitaal_adres in partij.digitaaladres_set.all()
+    ]
+    values += [
+        identificator.partij_identificator_object_id
+        for identificator in partij.partijidentificator_set.all()
+    ]
+
+    return " ".join(value for value in values if value)
+
+
+def update_zoekdocumenten(partij_ids: Iterable[int]) -> None:
+    """
+    Create or update the search documents of the partijen, with a constant number of
+    queries.
+    """
+    partijen = (
+        Partij.objects.filter(pk__in=set(partij_ids))
+        .select_related("persoon", "contactpersoon", "organisatie")
+        .prefetch_related("digitaaladres_set", "partijidentificator_set")
+    )
+    PartijZoekdocument.objects.bulk_create(
+        [
+            PartijZoekdocument(partij=partij, tekst=get_zoektekst(partij))
+            for partij in partijen
+        ],
+        update_conflicts=True,
+        unique_fields=["partij"],
+        update_fields=["tekst"],
+    )
+
+
+def schedule_zoekdocument_update(partij_id: int) -> None:
+    """
+    Update the search document of the partij, or at the end of the surrounding
+    `deferred_zoekdocumenten` block.
+    """
+    deferred = _deferred_partij_ids.get()
+    if deferred is None:
+        update_zoekdocumenten([partij_id])
+    else:
+        deferred.add(partij_id)
+
+
+@contextmanager
+def deferred_zoekdocumenten() -> Iterator[None]:
+    """
+    Update the search documents which are changed in the block at once, at the end
+    of the block, for example when many related objects of a partij are deleted.
+    """
+    partij_ids = set()
+    token = _deferred_partij_ids.set(partij_ids)
+    try:
+        yield
+    finally:
+        _deferred_partij_ids.reset(token)
+
+    update_zoekdocumenten(partij_ids)
+
+
+def get_search_query(value: str) -> SearchQuery | None:
+    """
+    Return a query which matches all words in the value, the last word may be
+    incomplete.
+    """
+    words = TSQUERY_SPECIAL_CHARS_RE.sub(" ", value).split()
+    if not words:
+        return None
+
+    return SearchQuery(
+        " & ".join([*words[:-1], f"{words[-1]}:*"]),
+        search_type="raw",
+        config="simple",
+    )
+
+
+def search_partijen(queryset: QuerySet, value: str) -> QuerySet:
+    """
+    Filter the partijen on the search documents, ordered by relevance.
+    """
+    query = get_search_query(value)
+    if query is None:
+        return queryset.none()
+
+    return (
+        queryset.filter(
+            Q(zoekdocument__vector=query)
+            | Q(zoekdocument__tekst__icontains=value.strip())
+        )
+        # `ts_rank` returns a `real`, which is cast so the rank in a pagination
+        # cursor is compared exactly
+        .annotate(rank=Cast(SearchRank(F("zoekdocument__vector"), query), FloatField()))
+        .order_by("-rank", "-pk")
+    )
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class TokenConfig(AppConfig):
+    name = "openklant.components.token"
+
+    def ready(self):
+        from . import signals  # noqa
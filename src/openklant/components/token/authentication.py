@@ -6,11 +6,9 @@ from rest_framework.authentication import TokenAuthentication as _TokenAuthentic
 
 class TokenAuthentication(_TokenAuthentication):
     def authenticate_credentials(self, key):
-        from .models import TokenAuth
+        from .cache import get_token
 
-        try:
-            token = TokenAuth.objects.get(token=key)
-        except TokenAuth.DoesNotExist:
+        if (token := get_token(key)) is None:
             raise exceptions.AuthenticationFailed(_("Invalid token."))
 
         return (None, token)
@@ -0,0 +1,72 @@
+"""
+Cache of the API tokens, to authenticate requests without querying the database.
+
+Tokens are cached per process for ``TOKEN_CACHE_TIMEOUT`` seconds and optionally in
+the shared cache configured with ``TOKEN_CACHE_ALIAS``. Saving or deleting a token
+clears the cache of the current process and the shared cache, the caches of other
+processes expire within the timeout.
+"""
+
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import TokenAuth
+
+CACHE_KEY_PREFIX = "tokenauth"
+
+# mapping of the token hash to the expiry time and the token
+_local_cache: Dict[str, Tuple[float, TokenAuth]] = {}
+
+
+def get_cache_key(key: str) -> str:
+    # the tokens are not stored as is in the (shared) cache
+    return f"{CACHE_KEY_PREFIX}:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+def _get_shared_cache():
+    if settings.TOKEN_CACHE_ALIAS:
+        return caches[settings.TOKEN_CACHE_ALIAS]
+    return None
+
+
+def get_token(key: str) -> Optional[TokenAuth]:
+    """
+    Return the token with the key, or ``None`` if it doesn't exist.
+    """
+    timeout = settings.TOKEN_CACHE_TIMEOUT
+    if not timeout:
+        return TokenAuth.objects.filter(token=key).first()
+
+    cache_key = get_cache_key(key)
+    now = time.monotonic()
+
+    if (entry := _local_cache.get(cache_key)) and entry[0] > now:
+        return entry[1]
+
+    shared_cache = _get_shared_cache()
+    token = shared_cache.get(cache_key) if shared_cache else None
+    if token is None:
+        token = TokenAuth.objects.filter(token=key).first()
+        # unknown tokens are not cached, so new tokens can be used immediately
+        if token is None:
+            return None
+
+        if shared_cache:
+            shared_cache.set(cache_key, token, timeout=timeout)
+
+    _local_cache[cache_key] = (now + timeout, token)
+    return token
+
+
+def clear_token_cache(*keys: str) -> None:
+    """
+    Clear the cache of this process and remove the tokens from the shared cache.
+    """
+    _local_cache.clear()
+
+    if shared_cache := _get_shared_cache():
+        shared_cache.delete_many([get_cache_key(key) for key in keys if key])
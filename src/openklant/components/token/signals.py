@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import clear_token_cache
+from .models import TokenAuth
+
+
+@receiver(pre_save, sender=TokenAuth, dispatch_uid="tokenauth.clear_previous_token")
+def clear_previous_token(sender, instance: TokenAuth, **kwargs) -> None:
+    # the previous value of a changed token is only known before saving
+    if instance.pk is not None and settings.TOKEN_CACHE_ALIAS:
+        previous = sender.objects.filter(pk=instance.pk).values_list("token", flat=True)
+        clear_token_cache(*previous)
+
+
+@receiver(post_save, sender=TokenAuth, dispatch_uid="tokenauth.clear_token")
+@receiver(post_delete, sender=TokenAuth, dispatch_uid="tokenauth.clear_token")
+def clear_token(sender, instance: TokenAuth, **kwargs) -> None:
+    clear_token_cache(instance.token)
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from rest_framework.exceptions import AuthenticationFailed
+
+from openklant.components.token.authentication import TokenAuthentication
+from openklant.components.token.cache import _local_cache, clear_token_cache
+from openklant.components.token.tests.factories.token import TokenAuthFactory
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "tokens": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tokens",
+    },
+}
+
+
+@override_settings(TOKEN_CACHE_TIMEOUT=60, TOKEN_CACHE_ALIAS="")
+class TokenCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_token_cache)
+        self.authentication = TokenAuthentication()
+
+    def test_cached_token_is_authenticated_without_queries(self):
+        token = TokenAuthFactory.create()
+
+        with self.assertNumQueries(1):
+            _, token_auth = self.authentication.authenticate_credentials(token.token)
+
+        with self.assertNumQueries(0):
+            _, cached_token_auth = self.authentication.authenticate_credentials(
+                token.token
+            )
+
+        self.assertEqual(token_auth, token)
+        self.assertEqual(cached_token_auth, token)
+
+    def test_unknown_token_is_not_cached(self):
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials("unknown")
+
+        token = TokenAuthFactory.create(token="unknown")
+
+        _, token_auth = self.authentication.authenticate_credentials("unknown")
+
+        self.assertEqual(token_auth, token)
+
+    def test_changed_token_is_removed_from_cache(self):
+        token = TokenAuthFactory.create()
+        previous_key = token.token
+        self.authentication.authenticate_credentials(previous_key)
+
+        token.token = "changed"
+        token.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(previous_key)
+
+    def test_deleted_token_is_removed_from_cache(self):
+        token = TokenAuthFactory.create()
+        self.authentication.authenticate_credentials(token.token)
+
+        token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(token.token)
+
+    def test_cached_token_expires(self):
+        token = TokenAuthFactory.create()
+
+        with patch("openklant.components.token.cache.time.monotonic", return_value=0):
+            self.authentication.authenticate_credentials(token.token)
+
+        with (
+            patch("openklant.components.token.cache.time.monotonic", return_value=61),
+            self.assertNumQueries(1),
+        ):
+            self.authentication.authenticate_credentials(token.token)
+
+    def test_cached_token_is_not_stored_as_is(self):
+        token = TokenAuthFactory.create()
+
+        self.authentication.authenticate_credentials(token.token)
+
+        self.assertEqual(len(_local_cache), 1)
+        self.assertNotIn(token.token, next(iter(_local_cache)))
+
+    @override_settings(TOKEN_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        token = TokenAuthFactory.create()
+        self.authentication.authenticate_credentials(token.token)
+
+        with self.assertNumQueries(1):
+            self.authentication.authenticate_credentials(token.token)
+
+    @override_settings(CACHES=LOCMEM_CACHES, TOKEN_CACHE_ALIAS="tokens")
+    def test_shared_cache(self):
+        self.addCleanup(caches["tokens"].clear)
+        token = TokenAuthFactory.create()
+        self.authentication.authenticate_credentials(token.token)
+
+        # another process only has to use the shared cache
+        _local_cache.clear()
+
+        with self.assertNumQueries(0):
+            _, token_auth = self.authentication.authenticate_credentials(token.token)
+
+        self.assertEqual(token_auth, token)
+
+        previous_key = token.token
+        token.token = "changed"
+        token.save()
+        _local_cache.clear()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate_credentials(previous_key)
@@ -1,3 +1,14 @@
+from uuid import UUID
+
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from openklant.utils.identity_map import prefetch_objects
+
+# valid value for the `uuid` path converter, which is replaced by the actual uuid
+URL_UUID_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
+
+
 def get_related_object_uuid(obj: object, attr: str) -> str | None:
     """
     Extract the UUID as a string from a related object.
@@ -9,3 +20,78 @@ def get_related_object_uuid(obj: object, attr: str) -> str | None:
     related_obj = getattr(obj, attr, None)
     uuid = getattr(related_obj, "uuid", None)
     return str(uuid) if uuid else None
+
+
+def get_detail_url(view_name: str, uuid: UUID | str, request=None, **kwargs) -> str:
+    """
+    Build the URL of the detail endpoint of a resource, identified by its UUID.
+
+    The URLs of the resources of a single endpoint only differ in their UUID, so the
+    URL is reversed once per request (for each view name and API version) and
+    formatted with the UUID afterwards. The URL parts are cached on the request.
+
+    :param view_name: The name of the detail endpoint.
+    :param uuid: The UUID of the resource.
+    :param request: The request to build the absolute URL for.
+    :param kwargs: Additional URL kwargs, these are not cached.
+    :return: The (absolute) URL of the resource.
+    """
+    if request is None or kwargs:
+        return reverse(view_name, kwargs={"uuid": uuid, **kwargs}, request=request)
+
+    # DRF requests wrap the Django request, which is shared by the view and renderer
+    http_request = getattr(request, "_request", request)
+    if not hasattr(http_request, "_detail_url_cache"):
+        http_request._detail_url_cache = {}
+
+    key = (view_name, getattr(request, "version", None))
+    if key not in http_request._detail_url_cache:
+        url = reverse(view_name, kwargs={"uuid": URL_UUID_PLACEHOLDER}, request=request)
+        parts = url.split(URL_UUID_PLACEHOLDER)
+        http_request._detail_url_cache[key] = parts if len(parts) == 2 else None
+
+    if (parts := http_request._detail_url_cache[key]) is None:
+        return reverse(view_name, kwargs={"uuid": uuid}, request=request)
+
+    prefix, suffix = parts
+    return f"{prefix}{uuid}{suffix}"
+
+
+class HyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Hyperlinked identity field which builds the URL with `get_detail_url`.
+    """
+
+    def get_url(self, obj, view_name, request, format):
+        if self.lookup_field != "uuid" or self.lookup_url_kwarg != "uuid" or format:
+            return super().get_url(obj, view_name, request, format)
+
+        # unsaved objects will not yet have a valid URL
+        if hasattr(obj, "pk") and obj.pk in (None, ""):
+            return None
+
+        return get_detail_url(view_name, obj.uuid, request=request)
+
+
+class HyperlinkedModelSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_url_field = HyperlinkedIdentityField
+
+
+class ReferenceListSerializer(serializers.ListSerializer):
+    """
+    List of references to other resources by their UUID, the referenced objects are
+    looked up with a single query before the references are validated one by one.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            prefetch_objects(
+                self.child.Meta.model,
+                [
+                    item["uuid"]
+                    for item in data
+                    if isinstance(item, dict) and "uuid" in item
+                ],
+            )
+
+        return super().to_internal_value(data)
@@ -0,0 +1,303 @@
+"""
+Compiled representations: the field tree of a serializer is walked once per response
+into a flat plan of attribute getters and converters, which renders the objects of a
+list straight to camelCase dicts.
+
+DRF looks up the fields, their sources and their representations again for every
+object (and every nested object) of a list, after which the renderer walks the whole
+response again to camelize the keys. The compiled plan produces the same (camelized)
+representation: the keys are camelized once, the fields of which the representation
+is known (like plain strings, UUIDs and the URLs of the resources) are converted
+directly, all other fields and the serializers which define their own representation
+fall back to DRF and are camelized afterwards.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db.models.manager import BaseManager
+
+from djangorestframework_camel_case.settings import api_settings as camel_case_settings
+from djangorestframework_camel_case.util import (
+    camelize,
+    camelize_re,
+    underscore_to_camel,
+)
+from rest_framework.fields import (
+    CharField,
+    Field,
+    IntegerField,
+    SkipField,
+    UUIDField,
+    is_simple_callable,
+)
+from rest_framework.relations import Hyperlink, PKOnlyObject
+from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+from vng_api_common.polymorphism import PolymorphicSerializer
+from vng_api_common.serializers import (
+    GegevensGroepSerializer,
+    field_allows_empty_values,
+)
+
+from .api import HyperlinkedIdentityField, get_detail_url
+
+Render = Callable[[Any], Any]
+
+# the functions which compile a serializer, per `to_representation` method they
+# replace
+COMPILERS: Dict[Callable, Callable[[BaseSerializer], Render]] = {}
+
+
+def register_compiler(to_representation: Callable):
+    """
+    Register the function which compiles the serializers with the given
+    ``to_representation`` method.
+    """
+
+    def decorator(compiler: Callable[[BaseSerializer], Render]):
+        COMPILERS[to_representation] = compiler
+        return compiler
+
+    return decorator
+
+
+def compile_serializer(serializer: BaseSerializer) -> Render:
+    """
+    Return a function which renders an object like ``serializer.to_representation``,
+    with camelized keys.
+    """
+    compiler = COMPILERS.get(type(serializer).to_representation)
+    if compiler is None:
+        return camelized(serializer.to_representation)
+    return compiler(serializer)
+
+
+def camelized(to_representation: Render) -> Render:
+    options = camel_case_settings.JSON_UNDERSCOREIZE
+    return lambda value: camelize(to_representation(value), **options)
+
+
+def camelize_field_name(field_name: str) -> Tuple[str, bool]:
+    """
+    Return the camelized key of a field, and whether its value is camelized, like
+    ``camelize`` does for each key of a dict.
+    """
+    options = camel_case_settings.JSON_UNDERSCOREIZE
+    ignore_fields = options.get("ignore_fields") or ()
+    ignore_keys = options.get("ignore_keys") or ()
+
+    key = field_name
+    if "_" in field_name:
+        key = re.sub(camelize_re, underscore_to_camel, field_name)
+
+    camelize_value = field_name not in ignore_fields and key not in ignore_fields
+    if field_name in ignore_keys or key in ignore_keys:
+        key = field_name
+    return key, camelize_value
+
+
+def is_compiled(data: Any) -> bool:
+    return isinstance(getattr(data, "serializer", None), CompiledListSerializer)
+
+
+def is_compiled_response(data: Any) -> bool:
+    """
+    Return whether the data of a response contains a list which is rendered by the
+    ``CompiledListSerializer``, like the results of a paginated response.
+    """
+    return is_compiled(data) or (
+        isinstance(data, dict) and any(map(is_compiled, data.values()))
+    )
+
+
+def camelize_response(data: Any) -> Any:
+    """
+    Camelize the data of a response, except for the compiled lists which are
+    camelized already.
+    """
+    options = camel_case_settings.JSON_UNDERSCOREIZE
+    if is_compiled(data):
+        return data
+    if not isinstance(data, dict):
+        return camelize(data, **options)
+
+    ret = OrderedDict()
+    for key, value in data.items():
+        if is_compiled(value):
+            ret[camelize_field_name(key)[0]] = value
+        else:
+            ret.update(camelize({key: value}, **options))
+    return ret
+
+
+def get_getter(field: Field) -> Callable[[Any], Any]:
+    if type(field).get_attribute is not Field.get_attribute:
+        return field.get_attribute
+
+    if not field.source_attrs:
+        return lambda instance: instance
+
+    if len(field.source_attrs) > 1:
+        return field.get_attribute
+
+    (attr,) = field.source_attrs
+
+    def get(instance):
+        try:
+            if isinstance(instance, Mapping):
+                value = instance[attr]
+            else:
+                value = getattr(instance, attr)
+        except Exception:
+            # missing values, defaults and related objects which don't exist
+            return field.get_attribute(instance)
+
+        if is_simple_callable(value):
+            return field.get_attribute(instance)
+        return value
+
+    return get
+
+
+def get_converter(field: Field, camelize_value: bool = True) -> Render:
+    field_class = type(field)
+
+    if not camelize_value:
+        return field.to_representation
+
+    if isinstance(field, ListSerializer):
+        if field_class.to_representation is not ListSerializer.to_representation:
+            return camelized(field.to_representation)
+
+        render = compile_serializer(field.child)
+        return lambda data: [
+            render(item)
+            for item in (data.all() if isinstance(data, BaseManager) else data)
+        ]
+
+    if isinstance(field, BaseSerializer):
+        return compile_serializer(field)
+
+    if field_class is CharField:
+        return str
+    if field_class is IntegerField:
+        return int
+    if field_class is UUIDField and field.uuid_format == "hex_verbose":
+        return str
+
+    if (
+        isinstance(field, HyperlinkedIdentityField)
+        and field_class.get_url is HyperlinkedIdentityField.get_url
+        and field.lookup_field == "uuid"
+        and field.lookup_url_kwarg == "uuid"
+        and "request" in field.context
+        and not field.context.get("format")
+    ):
+        view_name = field.view_name
+        request = field.context["request"]
+
+        def get_url(obj):
+            # unsaved objects will not yet have a valid URL
+            if obj.pk in (None, ""):
+                return None
+            return Hyperlink(get_detail_url(view_name, obj.uuid, request=request), obj)
+
+        return get_url
+
+    return camelized(field.to_representation)
+
+
+@register_compiler(Serializer.to_representation)
+def compile_fields(serializer: Serializer) -> Render:
+    plan: List[Tuple[str, Callable, Render]] = []
+    for field in serializer._readable_fields:
+        key, camelize_value = camelize_field_name(field.field_name)
+        plan.append((key, get_getter(field), get_converter(field, camelize_value)))
+
+    def render(instance) -> dict:
+        ret = {}
+        for key, get, convert in plan:
+            try:
+                attribute = get(instance)
+            except SkipField:
+                continue
+
+            if isinstance(attribute, PKOnlyObject):
+                check_for_none = attribute.pk
+            else:
+                check_for_none = attribute
+
+            if check_for_none is None:
+                ret[key] = None
+            else:
+                ret[key] = convert(attribute)
+        return ret
+
+    return render
+
+
+@register_compiler(GegevensGroepSerializer.to_representation)
+def compile_gegevensgroep(serializer: GegevensGroepSerializer) -> Render:
+    plan: List[Tuple[str, str, Render]] = []
+    for field in serializer._readable_fields:
+        key, camelize_value = camelize_field_name(field.field_name)
+        plan.append((field.field_name, key, get_converter(field, camelize_value)))
+    # an empty gegevensgroep with fields which don't allow empty values is rendered
+    # as `null`
+    null_if_empty = serializer.allow_null and not all(
+        field_allows_empty_values(field) for field in serializer.fields.values()
+    )
+
+    def render(instance) -> Optional[dict]:
+        ret = {}
+        for field_name, key, convert in plan:
+            attribute = instance[field_name]
+            ret[key] = None if attribute is None else convert(attribute)
+
+        if null_if_empty and all(value in ("", None) for value in ret.values()):
+            return None
+        return ret
+
+    return render
+
+
+@register_compiler(PolymorphicSerializer.to_representation)
+def compile_polymorphic(serializer: PolymorphicSerializer) -> Render:
+    render_fields = compile_fields(serializer)
+
+    discriminator = serializer.discriminator
+    if discriminator is None:
+        return render_fields
+
+    renderers = {}
+    for value, mapping_serializer in discriminator.mapping.items():
+        if mapping_serializer is None or isinstance(mapping_serializer, tuple):
+            continue
+
+        mapping_serializer.root._context = serializer.context
+        renderers[value] = compile_serializer(mapping_serializer)
+
+    discriminator_field = discriminator.discriminator_field
+
+    def render(instance) -> dict:
+        ret = render_fields(instance)
+        render_extra = renderers.get(getattr(instance, discriminator_field))
+        if render_extra is not None and (extra := render_extra(instance)):
+            ret.update(extra)
+        return ret
+
+    return render
+
+
+class CompiledListSerializer(ListSerializer):
+    """
+    List serializer which renders its objects with the representation compiled from
+    the child serializer. The keys are camelized already, see ``camelize_response``.
+    """
+
+    def to_representation(self, data):
+        render = compile_serializer(self.child)
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        return [render(item) for item in iterable]
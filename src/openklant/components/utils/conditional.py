@@ -0,0 +1,48 @@
+"""
+Conditional requests: strong ETags which are derived from the version of the objects
+in a response, instead of the rendered response body, so a request can be answered
+with ``304 Not Modified`` before the objects are serialized.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable, Tuple
+
+from django.db.models import QuerySet
+from django.utils.http import parse_etags, quote_etag
+
+WEAK_PREFIX = "W/"
+
+
+def get_etag(versions: Iterable[Tuple[Any, Any]], *extra: Any) -> str:
+    """
+    Return a strong ETag for the ``(pk, version)`` pairs of the objects, and the extra
+    values which determine the representation, like the query parameters.
+    """
+    data = json.dumps(
+        [list(versions), *extra], default=str, separators=(",", ":"), sort_keys=True
+    )
+    return quote_etag(hashlib.md5(data.encode(), usedforsecurity=False).hexdigest())
+
+
+def etag_matches(header: str, etag: str, weak: bool = False) -> bool:
+    """
+    Return whether the ETag matches one of the ETags of an ``If-Match`` or
+    ``If-None-Match`` header. ``If-None-Match`` uses the weak comparison, which
+    ignores the weak indicator.
+    """
+    etags = parse_etags(header)
+    if "*" in etags:
+        return True
+
+    if weak:
+        etags = [value.removeprefix(WEAK_PREFIX) for value in etags]
+    return etag in etags
+
+
+def defer_prefetch(queryset: QuerySet) -> Tuple[QuerySet, Tuple]:
+    """
+    Return the queryset without its prefetch lookups and the lookups, so the related
+    objects are only prefetched when they are used.
+    """
+    return queryset.prefetch_related(None), queryset._prefetch_related_lookups
@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+from functools import cache
 from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from django.db import models
+from django.db.models import ForeignObjectRel, Prefetch
 from django.utils.module_loading import import_string
 
 import structlog
@@ -12,6 +14,7 @@ from rest_framework.serializers import (
     Field,
     HyperlinkedModelSerializer,
     ListSerializer,
+    ModelSerializer,
     Serializer,
 )
 from rest_framework_inclusions.core import InclusionLoader
@@ -25,10 +28,14 @@ from openklant.utils.converters import (
     snake_to_camel_converter,
 )
 
+from .compiled import camelize_response, is_compiled_response
+
 logger = structlog.stdlib.get_logger(__name__)
 
 EXPAND_KEY = "_expand"
 
+Lookup = Union[str, Prefetch]
+
 
 class InclusionNode:
     """
@@ -49,6 +56,7 @@ class InclusionNode:
         self.many = many
         self.parent = parent
         self._children = []
+        self._child_ids = set()
 
         if self.parent:
             self.parent.add_child(self)
@@ -58,6 +66,7 @@ class InclusionNode:
 
     def add_child(self, node: "InclusionNode"):
         self._children.append(node)
+        self._child_ids.add(node.id)
 
     def display_children(self) -> dict:
         """
@@ -89,38 +98,48 @@ class InclusionNode:
         return data
 
     def has_child(self, id) -> bool:
-        return any(child.id == id for child in self._children)
+        return id in self._child_ids
 
 
 class InclusionTree:
     """
     strictly speaking it's not a tree but a collection of nodes
     It's a little helper class to display nested inclusions
+
+    The nodes are indexed by their id (the URL of the object), because the same
+    object can occur multiple times in the tree (for example a partij that is
+    the betrokkene of several klantcontacten). Adding a node is therefore linear
+    in the number of nodes that share its parent id, instead of in the size of
+    the whole tree.
     """
 
     def __init__(self):
-        self._nodes = []
+        self._root_nodes: List[InclusionNode] = []
+        self._nodes_by_id: Dict[Optional[str], List[InclusionNode]] = {}
+
+    def _index_node(self, node: InclusionNode) -> None:
+        self._nodes_by_id.setdefault(node.id, []).append(node)
 
     def add_node(
         self, id: str, value: dict, label: str, many: bool, parent_id: str = None
     ) -> None:
         if not parent_id:
             node = InclusionNode(id, value, label, many)
-            self._nodes.append(node)
+            self._root_nodes.append(node)
+            self._index_node(node)
             return
 
         parent_nodes = [
-            n for n in self._nodes if n.id == parent_id and not n.has_child(id)
+            n for n in self._nodes_by_id.get(parent_id, []) if not n.has_child(id)
         ]
         for parent_node in parent_nodes:
             node = InclusionNode(id, value, label, many, parent=parent_node)
-            self._nodes.append(node)
+            self._index_node(node)
 
     def display_tree(self) -> dict:
         result = {}
-        root_nodes = [n for n in self._nodes if n.parent is None]
 
-        for node in root_nodes:
+        for node in self._root_nodes:
             result[node.id] = node.display_children()
 
         return result
@@ -139,6 +158,47 @@ class ExpandLoader(InclusionLoader):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def get_prefetch_lookups(self, serializer_class: Type[Serializer]) -> List[Lookup]:
+        """
+        Return the related lookups which should be prefetched on a queryset of the
+        serializer model, to render the requested inclusions with a constant number
+        of queries per expand level.
+
+        :param serializer_class: serializer class with 'inclusion_serializers'
+        :return list of lookups which can be passed to 'prefetch_related'
+        """
+        inclusion_serializers = getattr(serializer_class, "inclusion_serializers", {})
+        lookups: Dict[str, Lookup] = {}
+
+        for inclusion in inclusion_serializers:
+            path = tuple(inclusion.split("."))
+            if not self._is_allowed(path):
+                continue
+
+            for lookup in _get_inclusion_prefetch_lookups(serializer_class, path):
+                key = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+                if isinstance(lookup, Prefetch):
+                    lookups[key] = lookup
+                else:
+                    lookups.setdefault(key, lookup)
+
+        # lookups with a custom queryset must be handled before the lookups that
+        # traverse the same relation, otherwise Django prefetches it without the queryset
+        return sorted(
+            lookups.values(), key=lambda lookup: not isinstance(lookup, Prefetch)
+        )
+
+    def _is_allowed(self, path: Tuple[str, ...]) -> bool:
+        """
+        nested inclusions are only loaded if all their parents are requested as well
+        """
+        if self.allowed_paths is None:
+            return True
+
+        return all(
+            path[:depth] in self.allowed_paths for depth in range(1, len(path) + 1)
+        )
+
     def inclusions_dict(self, serializer: Serializer) -> dict:
         """
         The method is used by the renderer.
@@ -332,6 +392,108 @@ class ExpandLoader(InclusionLoader):
         yield obj
 
 
+def _get_relation(model: Type[models.Model], name: str) -> Optional[models.Field]:
+    """
+    return the (reverse) relation of the model, which can be accessed with 'name'
+    """
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+
+        if isinstance(field, ForeignObjectRel):
+            accessor = field.get_accessor_name()
+        else:
+            accessor = field.name
+
+        if accessor == name:
+            return field
+
+    return None
+
+
+def _prefix_lookup(prefix: str, lookup: Lookup) -> Lookup:
+    if isinstance(lookup, Prefetch):
+        return Prefetch(f"{prefix}__{lookup.prefetch_through}", lookup.queryset)
+
+    return f"{prefix}__{lookup}"
+
+
+@cache
+def get_serializer_prefetch_lookups(
+    serializer_class: Type[Serializer],
+) -> Tuple[Lookup, ...]:
+    """
+    Return the related lookups that are used to render an instance with the serializer.
+
+    The lookups are derived from the relational fields of the serializer (including
+    the nested serializers and the polymorphic fields of the discriminator).
+    Relations which are used elsewhere, for example in a 'SerializerMethodField', can be
+    declared with the 'prefetch_related_lookups' attribute of the serializer.
+    """
+    serializer = serializer_class()
+    model = serializer.Meta.model
+
+    lookups = list(getattr(serializer, "prefetch_related_lookups", ()))
+    seen = {
+        lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        for lookup in lookups
+    }
+
+    fields = list(serializer.fields.values())
+    discriminator = getattr(serializer, "discriminator", None)
+    if discriminator is not None and discriminator.group_field:
+        fields += [
+            group_serializer.fields[discriminator.group_field]
+            for group_serializer in discriminator.mapping.values()
+            if group_serializer is not None
+        ]
+
+    for field in fields:
+        name = field.source.split(".")[0]
+        if name in seen or _get_relation(model, name) is None:
+            continue
+
+        seen.add(name)
+        lookups.append(name)
+
+        nested = field.child if isinstance(field, ListSerializer) else field
+        if isinstance(nested, ModelSerializer):
+            lookups += [
+                _prefix_lookup(name, lookup)
+                for lookup in get_serializer_prefetch_lookups(type(nested))
+            ]
+
+    return tuple(lookups)
+
+
+@cache
+def _get_inclusion_prefetch_lookups(
+    serializer_class: Type[Serializer], path: Tuple[str, ...]
+) -> Tuple[Lookup, ...]:
+    """
+    Return the related lookups to load and render the inclusion of 'path'
+    """
+    inclusion_serializers = serializer_class.inclusion_serializers
+    serializer = serializer_class()
+    relations = []
+
+    for depth, name in enumerate(path, start=1):
+        field = serializer.fields[name]
+        relations.append(field.source.replace(".", "__"))
+
+        inclusion_serializer = inclusion_serializers[".".join(path[:depth])]
+        if isinstance(inclusion_serializer, str):
+            inclusion_serializer = import_string(inclusion_serializer)
+
+        serializer = inclusion_serializer()
+
+    relation = "__".join(relations)
+    return (relation,) + tuple(
+        _prefix_lookup(relation, lookup)
+        for lookup in get_serializer_prefetch_lookups(type(serializer))
+    )
+
+
 class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
     """
     Ensure that the InclusionJSONRenderer produces camelCase and properly loads loose fk
@@ -340,6 +502,16 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
 
     loader_class = ExpandLoader
 
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not is_compiled_response(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # the compiled lists are camelized already, and are only used without
+        # inclusions
+        return super(CamelCaseJSONRenderer, self).render(
+            camelize_response(data), accepted_media_type, renderer_context
+        )
+
     def _render_inclusions(self, data, renderer_context):
         renderer_context = renderer_context or {}
         response = renderer_context.get("response")
@@ -378,7 +550,13 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
                 return None
 
         request = renderer_context.get("request")
-        inclusion_loader = self.loader_class(get_allowed_paths(request, view=view))
+        allowed_paths = get_allowed_paths(request, view=view)
+        # nothing is expanded, which also allows to leave out the `url` with the
+        # `fields` query parameter
+        if allowed_paths is not None and not allowed_paths:
+            return None
+
+        inclusion_loader = self.loader_class(allowed_paths)
         inclusions = inclusion_loader.inclusions_dict(serializer)
 
         if isinstance(serializer_data, list):
@@ -400,7 +578,7 @@ def get_allowed_paths(request, view=None):
     else:
         include = request.GET.get("include") if request else None
 
-    if include is None:
+    if not include:
         # nothing is allowed
         return set()
     if include == "*":
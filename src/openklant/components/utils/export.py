@@ -0,0 +1,84 @@
+"""
+Streaming exports of the whole (filtered) result set of a list endpoint, as NDJSON or
+CSV. The objects are read with a server-side cursor and serialized per chunk, so the
+memory usage doesn't depend on the size of the result set.
+"""
+
+import csv
+import json
+from itertools import batched
+from typing import Any, Callable, Iterator, List
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.enums import TextChoices
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from djangorestframework_camel_case.util import camelize
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ExportFormat(TextChoices):
+    ndjson = "ndjson", _("NDJSON, één JSON-object per regel")
+    csv = "csv", _("CSV, met een kolom per veld")
+
+
+CONTENT_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+class Echo:
+    """
+    File-like object which returns the written value, so the rows of a ``csv.writer``
+    can be streamed.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_chunks(
+    queryset: QuerySet, serialize: Callable[[List], List[dict]], chunk_size: int
+) -> Iterator[List[dict]]:
+    """
+    Yield the serialized objects of the queryset per chunk. The related objects of
+    the queryset are prefetched per chunk as well.
+
+    The objects are read in a transaction, otherwise PostgreSQL materializes the
+    whole result set of the server-side cursor when it's opened.
+    """
+    with transaction.atomic(using=queryset.db):
+        for chunk in batched(queryset.iterator(chunk_size=chunk_size), chunk_size):
+            yield serialize(list(chunk))
+
+
+def stream_ndjson(chunks: Iterator[List[dict]]) -> Iterator[bytes]:
+    renderer = CamelCaseJSONRenderer()
+    for data in chunks:
+        yield b"".join(renderer.render(item) + b"\n" for item in data)
+
+
+def get_csv_value(value: Any) -> Any:
+    # nested objects and lists are written as JSON
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=JSONEncoder, separators=(",", ":"))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else value
+
+
+def stream_csv(chunks: Iterator[List[dict]], columns: List[str]) -> Iterator[str]:
+    """
+    Yield the rows of the objects, the columns are the (camelCase) field names.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+
+    for data in chunks:
+        yield "".join(
+            writer.writerow([get_csv_value(item.get(column)) for column in columns])
+            for item in camelize(data)
+        )
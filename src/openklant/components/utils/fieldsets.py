@@ -0,0 +1,190 @@
+"""
+Sparse fieldsets: render only the fields of a resource which are requested with the
+``fields`` query parameter, and only load the columns and relations these fields use.
+"""
+
+from functools import cache
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch, QuerySet
+
+from rest_framework.serializers import Serializer
+from vng_api_common.descriptors import GegevensGroepType
+
+from openklant.utils.converters import snake_to_camel_converter
+
+FIELDS_SEPARATOR = ","
+
+
+def get_field_names(serializer: Serializer) -> List[str]:
+    """
+    Return the names of the fields which can be requested, including the group field
+    of a polymorphic serializer.
+    """
+    names = list(serializer.fields)
+    discriminator = getattr(type(serializer), "discriminator", None)
+    if discriminator is not None and discriminator.group_field:
+        names.append(discriminator.group_field)
+    return names
+
+
+def parse_fields(
+    values: List[str], serializer: Serializer
+) -> Tuple[Set[str], Set[str]]:
+    """
+    Return the (snake case) names of the requested fields and the requested names
+    which are unknown.
+    """
+    names = {
+        snake_to_camel_converter(name): name for name in get_field_names(serializer)
+    }
+    requested = {
+        name.strip()
+        for value in values
+        for name in value.split(FIELDS_SEPARATOR)
+        if name.strip()
+    }
+    return (
+        {names[name] for name in requested if name in names},
+        requested - names.keys(),
+    )
+
+
+def prune_serializer(serializer: Serializer, fields: Set[str]) -> None:
+    """
+    Remove the fields which aren't requested from the serializer instance.
+    """
+    for name in list(serializer.fields):
+        if name not in fields:
+            serializer.fields.pop(name)
+
+    discriminator = getattr(type(serializer), "discriminator", None)
+    if (
+        discriminator is not None
+        and discriminator.group_field
+        and discriminator.group_field not in fields
+    ):
+        # the group field isn't one of the fields, it's added by the discriminator
+        serializer.discriminator = None
+
+
+@cache
+def get_sources_of_field(
+    serializer_class: Type[Serializer], name: str
+) -> FrozenSet[str]:
+    """
+    Return the names of the model fields and relations which are used to render the
+    field. The result is cached per field (rather than per combination of requested
+    fields), so the size of the cache is bounded by the number of fields.
+
+    The sources of fields without a source, like a ``SerializerMethodField``, can be
+    declared with the ``field_sources`` attribute of the serializer.
+    """
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    declared = getattr(serializer, "field_sources", {})
+    sources = set()
+
+    discriminator = getattr(serializer, "discriminator", None)
+    if discriminator is not None and discriminator.group_field == name:
+        sources.add(discriminator.discriminator_field)
+        sources.update(
+            group_serializer.fields[discriminator.group_field].source
+            for group_serializer in discriminator.mapping.values()
+            if group_serializer is not None
+        )
+
+    if name not in serializer.fields:
+        return frozenset(sources)
+
+    if name in declared:
+        sources.update(declared[name])
+        return frozenset(sources)
+
+    source = serializer.fields[name].source.split(".")[0]
+    if source == "*":
+        return frozenset(sources)
+
+    group = getattr(model, source, None)
+    if isinstance(group, GegevensGroepType):
+        sources.update(field.name for field in group.mapping.values())
+    else:
+        sources.add(source)
+
+    return frozenset(sources)
+
+
+def get_field_sources(
+    serializer_class: Type[Serializer], fields: FrozenSet[str]
+) -> FrozenSet[str]:
+    """
+    Return the names of the model fields and relations which are used to render the
+    fields.
+    """
+    return frozenset().union(
+        *(get_sources_of_field(serializer_class, name) for name in fields)
+    )
+
+
+def _get_root(lookup: str | Prefetch) -> str:
+    if isinstance(lookup, Prefetch):
+        lookup = lookup.prefetch_through
+    return lookup.split("__")[0]
+
+
+def _get_select_related_lookups(
+    select_related: dict, prefix: str = ""
+) -> Iterator[str]:
+    for name, nested in select_related.items():
+        yield f"{prefix}{name}"
+        yield from _get_select_related_lookups(nested, prefix=f"{prefix}{name}__")
+
+
+def trim_queryset(
+    queryset: QuerySet, sources: FrozenSet[str], columns: Optional[Set[str]] = None
+) -> QuerySet:
+    """
+    Remove the related lookups which aren't used by the sources from the queryset, and
+    only load the columns of the sources (and the extra ``columns``).
+    """
+    model = queryset.model
+    columns = set(columns or ())
+    # the ordering fields are used by the cursor of the pagination
+    columns.update(
+        field.lstrip("-").split("__")[0]
+        for field in queryset.query.order_by
+        if isinstance(field, str)
+    )
+
+    prefetch_lookups = [
+        lookup
+        for lookup in queryset._prefetch_related_lookups
+        if _get_root(lookup) in sources
+    ]
+    queryset = queryset.prefetch_related(None).prefetch_related(*prefetch_lookups)
+
+    selected_roots = set()
+    if isinstance(queryset.query.select_related, dict):
+        select_related_lookups = [
+            lookup
+            for lookup in _get_select_related_lookups(queryset.query.select_related)
+            if _get_root(lookup) in sources
+        ]
+        selected_roots = {_get_root(lookup) for lookup in select_related_lookups}
+        queryset = queryset.select_related(None)
+        if select_related_lookups:
+            queryset = queryset.select_related(*select_related_lookups)
+
+    only = {"pk"}
+    for name in sources | columns:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+
+        # relations which are selected must be loaded as well
+        if field.concrete or name in selected_roots:
+            only.add(name)
+
+    return queryset.only(*only)
@@ -1,20 +1,58 @@
+import uuid
+from functools import cached_property
+from typing import FrozenSet, Optional
+
+from django.conf import settings
 from django.core.validators import (
     MaxValueValidator,
     MinLengthValidator,
     MinValueValidator,
 )
-from django.db import models
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
 from vng_api_common.descriptors import GegevensGroepType
+from vng_api_common.exceptions import PreconditionFailed
 
+from openklant.utils.converters import snake_to_camel_converter
+from openklant.utils.replicas import request_replica
 from openklant.utils.validators import (
     validate_bag_id,
     validate_country,
     validate_postal_code,
 )
 
-from .expansion import ExpandJSONRenderer
+from .compiled import CompiledListSerializer
+from .conditional import defer_prefetch, etag_matches, get_etag
+from .expansion import ExpandJSONRenderer, get_allowed_paths
+from .export import (
+    CONTENT_TYPES,
+    ExportFormat,
+    iter_chunks,
+    stream_csv,
+    stream_ndjson,
+)
+from .fieldsets import (
+    get_field_names,
+    get_field_sources,
+    parse_fields,
+    prune_serializer,
+    trim_queryset,
+)
+from .response_cache import (
+    capture_models,
+    get_cache,
+    get_cache_key,
+    get_generations,
+    get_tracked_labels,
+)
 
 
 class APIMixin:
@@ -26,7 +64,7 @@ class APIMixin:
     """
 
     def get_absolute_api_url(self, request=None, **kwargs) -> str:
-        from rest_framework.reverse import reverse
+        from .api import get_detail_url
 
         """
         Build the absolute URL of the object in the API.
@@ -35,16 +73,41 @@ class APIMixin:
         resource_name = self._meta.model_name
         app_name = request.resolver_match.app_name
 
-        reverse_kwargs = {"uuid": self.uuid}
-        reverse_kwargs.update(**kwargs)
-
-        url = reverse(
+        return get_detail_url(
             f"{app_name}:{resource_name}-detail",
-            kwargs=reverse_kwargs,
+            self.uuid,
             request=request,
+            **kwargs,
         )
 
-        return url
+
+class VersionMixin(models.Model):
+    """
+    Keep a version of the object, which changes every time the object is saved.
+
+    The version of an object is also changed when a related object which is part of
+    its representation in the API changes, see the ``signals`` of the component.
+    """
+
+    versie = models.UUIDField(
+        _("versie"),
+        help_text=_(
+            "Versie van het object, die wijzigt bij elke wijziging van het object of "
+            "de gerelateerde objecten."
+        ),
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.versie = uuid.uuid4()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "versie"}
+
+        super().save(*args, **kwargs)
 
 
 class ExpandMixin:
@@ -57,6 +120,398 @@ class ExpandMixin:
     def get_requested_inclusions(self, request):
         return ",".join(request.GET.getlist(self.expand_param))
 
+    def get_queryset(self):
+        """
+        prefetch the objects of the requested inclusions, to avoid loading them
+        separately for each object of the (paginated) queryset
+        """
+        queryset = super().get_queryset()
+
+        request = getattr(self, "request", None)
+        if request is None or not self.include_allowed():
+            return queryset
+
+        loader = ExpandJSONRenderer.loader_class(get_allowed_paths(request, view=self))
+        if lookups := loader.get_prefetch_lookups(self.get_serializer_class()):
+            queryset = queryset.prefetch_related(*lookups)
+
+        return queryset
+
+
+class FieldsMixin:
+    """
+    Render only the fields requested with the ``fields`` query parameter, and only
+    load the columns and relations which are used by these fields.
+
+    Must be placed after the ``ExpandMixin``, so the relations of the expanded
+    resources are prefetched regardless of the requested fields.
+    """
+
+    fields_param = "fields"
+
+    def fields_allowed(self) -> bool:
+        return self.request.method == "GET"
+
+    @cached_property
+    def requested_fields(self) -> Optional[FrozenSet[str]]:
+        request = getattr(self, "request", None)
+        if (
+            request is None
+            or self.fields_param not in request.GET
+            or not self.fields_allowed()
+        ):
+            return None
+
+        serializer = self.get_serializer_class()()
+        fields, unknown = parse_fields(
+            request.GET.getlist(self.fields_param), serializer
+        )
+        if unknown:
+            raise ValidationError(
+                {
+                    self.fields_param: _("Onbekende velden: %s")
+                    % ", ".join(sorted(unknown))
+                },
+                code="unknown-fields",
+            )
+        if not fields:
+            return None
+
+        # the expanded resources are added to the objects by their url
+        if isinstance(self, ExpandMixin) and self.get_requested_inclusions(request):
+            allowed_paths = get_allowed_paths(request, view=self)
+            if allowed_paths is None:
+                allowed_paths = [
+                    tuple(inclusion.split("."))
+                    for inclusion in serializer.inclusion_serializers
+                ]
+            fields |= {"url", *(path[0] for path in allowed_paths)}
+
+        return frozenset(fields)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.requested_fields is None:
+            return queryset
+
+        columns = {self.lookup_field}
+        if isinstance(self, ConditionalRequestMixin):
+            columns.add(self.version_field)
+
+        sources = get_field_sources(self.get_serializer_class(), self.requested_fields)
+        return trim_queryset(queryset, sources, columns=columns)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.requested_fields is not None:
+            prune_serializer(
+                getattr(serializer, "child", serializer), self.requested_fields
+            )
+        return serializer
+
+
+class CompiledRepresentationMixin:
+    """
+    Render the objects of a list with the representation compiled from the serializer
+    (see ``compiled``), if the ``API_COMPILED_REPRESENTATION`` setting is enabled.
+
+    Must be placed before the ``FieldsMixin``, so the representation is compiled from
+    the pruned serializer. Lists with expanded resources are rendered by the
+    serializers.
+    """
+
+    def compiled_representation_allowed(self) -> bool:
+        if not settings.API_COMPILED_REPRESENTATION or self.request.method != "GET":
+            return False
+        return not (
+            isinstance(self, ExpandMixin)
+            and self.get_requested_inclusions(self.request)
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        if not kwargs.get("many") or not self.compiled_representation_allowed():
+            return super().get_serializer(*args, **kwargs)
+
+        # the child serializer is pruned by the `FieldsMixin` before it's compiled
+        kwargs["many"] = False
+        child = super().get_serializer(**kwargs)
+        return CompiledListSerializer(*args, child=child, context=child.context)
+
+
+class CachedResponseMixin:
+    """
+    Cache the responses of the list and detail endpoints in the shared cache, if the
+    ``API_RESPONSE_CACHE_TIMEOUT`` setting is set (see ``response_cache``).
+
+    Must be placed before the other mixins which implement ``list`` and ``retrieve``,
+    so a cached response is returned before anything is queried. Responses with
+    expanded resources are not cached, these are partly queried by the renderer.
+    """
+
+    def response_cache_allowed(self) -> bool:
+        if not settings.API_RESPONSE_CACHE_TIMEOUT or self.request.method != "GET":
+            return False
+        return not (
+            isinstance(self, ExpandMixin)
+            and self.get_requested_inclusions(self.request)
+        )
+
+    def get_response_cache_key(self) -> str:
+        request = self.request
+        component = request.resolver_match.namespace
+        return get_cache_key(
+            # the host and scheme are part of the URLs in the response
+            request.build_absolute_uri(request.path),
+            sorted(request.GET.lists()),
+            getattr(settings, f"{component.upper()}_API_VERSION", ""),
+            request.accepted_media_type,
+        )
+
+    def get_cached_response(self, entry: dict) -> Response:
+        etag = entry["headers"].get("ETag")
+        header = self.request.headers.get("If-None-Match")
+        if etag and header is not None and etag_matches(header, etag, weak=True):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response = Response(status=entry["status"], headers=entry["headers"])
+        # setting the content marks the response as rendered
+        response.content = entry["content"]
+        return response
+
+    def cache_response(self, view, request, *args, **kwargs):
+        if not self.response_cache_allowed():
+            return view(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_response_cache_key()
+        entry = cache.get(key)
+        if entry and get_generations(entry["generations"]) == entry["generations"]:
+            return self.get_cached_response(entry)
+
+        # the generations are read before the objects, so a change which is committed
+        # in between invalidates the response
+        generations = get_generations(get_tracked_labels())
+        with capture_models() as labels:
+            response = view(request, *args, **kwargs)
+            # render the response here, so the queries of the renderer are captured
+            response = self.finalize_response(request, response, *args, **kwargs)
+            response.render()
+
+        # a replica may not have the latest changes yet
+        if response.status_code == status.HTTP_200_OK and request_replica.get() is None:
+            entry = {
+                "generations": {label: generations[label] for label in labels},
+                "status": response.status_code,
+                "content": response.content,
+                "headers": dict(response.items()),
+            }
+            cache.set(key, entry, timeout=settings.API_RESPONSE_CACHE_TIMEOUT)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cache_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cache_response(super().retrieve, request, *args, **kwargs)
+
+
+class ConditionalRequestMixin:
+    """
+    Support conditional requests with strong ETags, which are derived from the version
+    of the objects (see ``VersionMixin``) and the query parameters.
+
+    A ``GET`` request with an ``If-None-Match`` header which matches the ETag is
+    answered with ``304 Not Modified`` before the related objects are prefetched and
+    the objects are serialized. The ETag of a list is derived from the objects on the
+    page and the pagination. A ``PUT`` or ``PATCH`` request with an ``If-Match`` header
+    which doesn't match the current ETag fails with ``412 Precondition Failed``.
+    """
+
+    version_field = "versie"
+
+    def conditional_request_allowed(self) -> bool:
+        # the version of an object doesn't include the expanded resources
+        return not (
+            isinstance(self, ExpandMixin)
+            and self.get_requested_inclusions(self.request)
+        )
+
+    def get_etag(self, versions, *extra) -> str:
+        return get_etag(versions, sorted(self.request.GET.lists()), *extra)
+
+    def get_versions(self, objects) -> list:
+        return [(obj.pk, getattr(obj, self.version_field)) for obj in objects]
+
+    def is_not_modified(self, etag: str) -> bool:
+        header = self.request.headers.get("If-None-Match")
+        return header is not None and etag_matches(header, etag, weak=True)
+
+    def get_not_modified_response(self, etag: str) -> Response:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    def list(self, request, *args, **kwargs):
+        if not self.conditional_request_allowed():
+            return super().list(request, *args, **kwargs)
+
+        queryset, lookups = defer_prefetch(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            objects = list(queryset)
+            etag = self.get_etag(self.get_versions(objects))
+        else:
+            objects = page
+            # the count and links of the pagination are part of the response as well
+            pagination = self.paginator.get_paginated_response([]).data
+            etag = self.get_etag(self.get_versions(objects), pagination)
+
+        if self.is_not_modified(etag):
+            return self.get_not_modified_response(etag)
+
+        prefetch_related_objects(objects, *lookups)
+        serializer = self.get_serializer(objects, many=True)
+        if page is None:
+            response = Response(serializer.data)
+        else:
+            response = self.get_paginated_response(serializer.data)
+
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.conditional_request_allowed():
+            return super().retrieve(request, *args, **kwargs)
+
+        queryset, lookups = defer_prefetch(self.filter_queryset(self.get_queryset()))
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        self.check_object_permissions(request, instance)
+
+        etag = self.get_etag(self.get_versions([instance]))
+        if self.is_not_modified(etag):
+            return self.get_not_modified_response(etag)
+
+        prefetch_related_objects([instance], *lookups)
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data, headers={"ETag": etag})
+
+    def check_if_match(self) -> None:
+        """
+        Compare the ``If-Match`` header with the current ETag, the object is locked
+        until the end of the transaction so it can't be changed in between.
+        """
+        header = self.request.headers.get("If-Match")
+        if header is None:
+            return
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        versions = (
+            self.get_queryset()
+            .select_related(None)
+            .prefetch_related(None)
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .select_for_update()
+            .values_list("pk", self.version_field)
+        )
+        # a missing object results in a 404 response
+        if versions and not etag_matches(header, self.get_etag(versions)):
+            raise PreconditionFailed(
+                _(
+                    "De resource is gewijzigd, de `If-Match` header komt niet overeen "
+                    "met de huidige ETag."
+                )
+            )
+
+    def update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            self.check_if_match()
+            response = super().update(request, *args, **kwargs)
+
+        if etag := getattr(self, "etag", None):
+            response["ETag"] = etag
+        return response
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+
+        # the version is also changed by the related objects which are updated
+        serializer.instance.refresh_from_db(fields=[self.version_field])
+        self.etag = self.get_etag(self.get_versions([serializer.instance]))
+
+
+class ExportMixin:
+    """
+    Stream the whole (filtered) result set as NDJSON or CSV with the ``_export``
+    action. The objects are read with a server-side cursor and serialized per
+    ``export_chunk_size`` objects, the related objects are prefetched per chunk.
+    """
+
+    export_format_param = "formaat"
+    export_chunk_size = 500
+
+    def get_export_format(self) -> ExportFormat:
+        value = self.request.query_params.get(
+            self.export_format_param, ExportFormat.ndjson
+        )
+        if value not in ExportFormat.values:
+            raise ValidationError(
+                {
+                    self.export_format_param: _("Ongeldig formaat, kies uit: %s")
+                    % ", ".join(ExportFormat.values)
+                },
+                code="invalid-choice",
+            )
+        return ExportFormat(value)
+
+    def get_export_columns(self) -> list:
+        serializer = self.get_serializer(many=True).child
+        requested_fields = getattr(self, "requested_fields", None)
+        return [
+            snake_to_camel_converter(name)
+            for name in get_field_names(serializer)
+            if requested_fields is None or name in requested_fields
+        ]
+
+    def get_export_filename(self, export_format: ExportFormat) -> str:
+        return f"{self.queryset.model._meta.verbose_name_plural}.{export_format}"
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="_export",
+        url_name="export",
+        pagination_class=None,
+    )
+    def export(self, request, *args, **kwargs):
+        self._check_query_params(request)
+        if isinstance(self, ExpandMixin) and self.get_requested_inclusions(request):
+            raise ValidationError(
+                {self.expand_param: _("`expand` wordt niet ondersteund bij export.")},
+                code="unsupported",
+            )
+
+        export_format = self.get_export_format()
+        queryset = self.filter_queryset(self.get_queryset())
+        # the database is selected now, the response is streamed after the request
+        queryset = queryset.using(queryset.db)
+
+        def serialize(objects):
+            return self.get_serializer(objects, many=True).data
+
+        chunks = iter_chunks(queryset, serialize, self.export_chunk_size)
+        if export_format == ExportFormat.csv:
+            content = stream_csv(chunks, self.get_export_columns())
+        else:
+            content = stream_ndjson(chunks)
+
+        filename = self.get_export_filename(export_format)
+        return StreamingHttpResponse(
+            content,
+            content_type=CONTENT_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
 
 def create_prefixed_adresmixin(prefix: str):
     """Dynamically mreate a Mixin with a prefix for Adres fields"""
@@ -0,0 +1,315 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from vng_api_common.pagination import (
+    DynamicPageSizePagination as _DynamicPageSizePagination,
+)
+
+Ordering = List[Tuple[str, bool]]
+
+
+class Cursor(NamedTuple):
+    position: List[Any]
+    reverse: bool
+
+
+class DynamicPageSizePagination(_DynamicPageSizePagination):
+    """
+    Page number pagination with an opt-in cursor (keyset) pagination mode.
+
+    The cursor mode is used if the ``cursor`` query parameter is provided, an empty
+    value returns the first page. Instead of an offset, the cursor contains the values
+    of the ordering fields of the first or last result of a page, and the next or
+    previous page is selected by filtering on these values. This keeps deep pages as
+    fast as the first one. The results are not counted in the cursor mode.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Cursor van de op te vragen pagina, gebruik een lege waarde voor de eerste "
+        "pagina. Als een cursor wordt gebruikt, wordt het totaal aantal resultaten "
+        "(`count`) niet teruggegeven."
+    )
+    invalid_cursor_message = _("Ongeldige cursor.")
+
+    cursor_mode = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        self.base_url = remove_query_param(
+            request.build_absolute_uri(), self.page_query_param
+        )
+        self.ordering = get_ordering(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor.reverse
+        if reverse:
+            queryset = queryset.order_by(
+                *(f"{'' if desc else '-'}{field}" for field, desc in self.ordering)
+            )
+        if cursor is not None:
+            try:
+                queryset = queryset.filter(
+                    get_position_filter(self.ordering, cursor.position, reverse)
+                )
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+
+        page_size = self.get_page_size(request)
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        self.page = results[:page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(Cursor(self.get_position(self.page[-1]), False))
+
+    def get_previous_link(self):
+        if not self.cursor_mode:
+            return super().get_previous_link()
+
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor(Cursor(self.get_position(self.page[0]), True))
+
+    def get_position(self, instance) -> List[Any]:
+        return [getattr(instance, field) for field, _desc in self.ordering]
+
+    def decode_cursor(self, request) -> Optional[Cursor]:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+
+        try:
+            tokens = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            cursor = Cursor(position=tokens["p"], reverse=bool(tokens.get("r")))
+        except (BinasciiError, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(cursor.position, list) or len(cursor.position) != len(
+            self.ordering
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        tokens = {"p": cursor.position}
+        if cursor.reverse:
+            tokens["r"] = 1
+
+        # `str` keeps the full precision of datetimes and formats UUIDs
+        encoded = urlsafe_b64encode(
+            json.dumps(tokens, default=str, separators=(",", ":")).encode("ascii")
+        ).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["required"] = ["results"]
+        return paginated_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {"type": "string"},
+            }
+        ]
+
+
+class FeedPagination(_DynamicPageSizePagination):
+    """
+    Keyset pagination for feeds which are read from the start, and then continued
+    with the ``sinds`` query parameter.
+
+    The position after the last result is always returned, also when there are no
+    (more) results, so a client can continue from there later on.
+    """
+
+    page_query_param = "sinds"
+    page_query_description = _(
+        "Geef de resultaten na deze positie terug, gebruik de waarde van `sinds` uit "
+        "de vorige response. Zonder deze parameter wordt vanaf het begin begonnen."
+    )
+    invalid_position_message = _("Ongeldige waarde voor `sinds`.")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = get_ordering(queryset)
+
+        self.position = self.decode_position(request)
+        if self.position is not None:
+            try:
+                queryset = queryset.filter(
+                    get_position_filter(self.ordering, self.position, reverse=False)
+                )
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_position_message)
+
+        page_size = self.get_page_size(request)
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        if self.page:
+            self.position = [
+                getattr(self.page[-1], field) for field, _desc in self.ordering
+            ]
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "sinds": self.encode_position(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.page_query_param,
+            self.encode_position(),
+        )
+
+    def get_previous_link(self):
+        return None
+
+    def decode_position(self, request) -> Optional[List[Any]]:
+        encoded = request.query_params.get(self.page_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+        except (BinasciiError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_position_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_position_message)
+
+        return position
+
+    def encode_position(self) -> Optional[str]:
+        if self.position is None:
+            return None
+
+        return urlsafe_b64encode(
+            json.dumps(self.position, default=str, separators=(",", ":")).encode(
+                "ascii"
+            )
+        ).decode("ascii")
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "description": _(
+                        "De URL van de volgende pagina, als er op dit moment meer "
+                        "resultaten zijn."
+                    ),
+                },
+                "sinds": {
+                    "type": "string",
+                    "nullable": True,
+                    "description": _(
+                        "De positie na het laatste resultaat, om later de volgende "
+                        "resultaten op te vragen."
+                    ),
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        # the position is not a page number
+        parameters[0]["schema"] = {"type": "string"}
+        return parameters
+
+
+def get_ordering(queryset: QuerySet) -> Ordering:
+    """
+    Return the ordering fields of the queryset and whether they are descending.
+
+    The primary key is added if it's not part of the ordering, so every object has a
+    unique position.
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    fields = [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+
+    if not any(field in ("pk", queryset.model._meta.pk.name) for field, _ in fields):
+        fields.append(("pk", fields[-1][1] if fields else False))
+
+    return fields
+
+
+def get_position_filter(ordering: Ordering, position: List[Any], reverse: bool) -> Q:
+    """
+    Select the objects after the position, for example ``a <= x AND (a < x OR (a = x
+    AND pk < y))`` for the ordering ``-a, -pk``. The redundant range on the first
+    field allows the database to use a (composite) index on the ordering fields.
+    """
+    position_filter = Q()
+    for index, (field, descending) in enumerate(ordering):
+        lookup = "gt" if descending == reverse else "lt"
+        condition = Q(**{f"{field}__{lookup}": position[index]})
+        for (previous_field, _desc), value in zip(ordering[:index], position):
+            condition &= Q(**{previous_field: value})
+        position_filter |= condition
+
+    first_field, descending = ordering[0]
+    lookup = "gte" if descending == reverse else "lte"
+    return Q(**{f"{first_field}__{lookup}": position[0]}) & position_filter
@@ -0,0 +1,161 @@
+"""
+Shared cache of the responses of the list and detail endpoints.
+
+A response is cached under a key derived from its URL (the route and the normalised
+query parameters), the API version and the media type. The models of which the tables
+were read to build the response are stored with it, together with the generation of
+each of these models at the start of the request. The generation of a model is a
+counter in the cache which is incremented after every transaction which saves or
+deletes objects of the model (see ``connect_signals``), so a cached response is only
+used as long as none of its models changed since.
+"""
+
+import hashlib
+import json
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import Dict, Iterable, Iterator, Set, Type
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, models, router, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+CACHE_KEY_PREFIX = "response-cache"
+
+# the tables which are read by a query, Django quotes the names of the tables
+TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+"([^"]+)"')
+
+# the on_delete handlers which change the related objects without sending signals
+SET_ON_DELETE = (models.SET_NULL, models.SET_DEFAULT)
+
+# the labels of the models of which the generations are tracked, by table
+_tracked_models: Dict[str, str] = {}
+
+
+def get_cache():
+    return caches[settings.API_RESPONSE_CACHE_ALIAS]
+
+
+def get_generation_key(label: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:generation:{label}"
+
+
+def get_generations(labels: Iterable[str]) -> Dict[str, int]:
+    """
+    Return the current generation of each of the models. A generation which is
+    missing (or evicted) starts at the current time, so it doesn't match the
+    generations stored with the cached responses.
+    """
+    cache = get_cache()
+    keys = {get_generation_key(label): label for label in labels}
+    generations = cache.get_many(keys)
+    for key in keys.keys() - generations.keys():
+        cache.add(key, time.time_ns(), timeout=None)
+        generations[key] = cache.get(key)
+    return {keys[key]: generation for key, generation in generations.items()}
+
+
+def bump_generations(labels: Iterable[str]) -> None:
+    cache = get_cache()
+    for label in labels:
+        key = get_generation_key(label)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def schedule_generation_bump(*model_classes: Type[models.Model]) -> None:
+    """
+    Increment the generations of the models after the current transaction is
+    committed, so a response which is built meanwhile is not cached under the new
+    generation.
+    """
+    if not settings.API_RESPONSE_CACHE_TIMEOUT:
+        return
+
+    for model in model_classes:
+        transaction.on_commit(
+            partial(bump_generations, [model._meta.label_lower]),
+            using=router.db_for_write(model),
+        )
+
+
+def bump_generation(sender: Type[models.Model], **kwargs) -> None:
+    schedule_generation_bump(sender)
+
+
+def bump_deleted_generation(sender: Type[models.Model], **kwargs) -> None:
+    # the objects which refer to the deleted object are changed without signals
+    schedule_generation_bump(
+        sender,
+        *{
+            relation.related_model
+            for relation in sender._meta.related_objects
+            if relation.on_delete in SET_ON_DELETE
+        },
+    )
+
+
+def bump_m2m_generation(sender: Type[models.Model], action: str, **kwargs) -> None:
+    if action.startswith("post_"):
+        schedule_generation_bump(sender)
+
+
+def connect_signals(app_config: AppConfig) -> None:
+    """
+    Track the generations of the models of the app, called when the app is ready.
+    """
+    for model in app_config.get_models(include_auto_created=True):
+        label = model._meta.label_lower
+        _tracked_models[model._meta.db_table] = label
+
+        post_save.connect(
+            bump_generation, sender=model, dispatch_uid=f"{label}.bump_generation"
+        )
+        post_delete.connect(
+            bump_deleted_generation,
+            sender=model,
+            dispatch_uid=f"{label}.bump_generation",
+        )
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                bump_m2m_generation,
+                sender=field.remote_field.through,
+                dispatch_uid=f"{label}.{field.name}.bump_generation",
+            )
+
+
+def get_tracked_labels() -> Set[str]:
+    return set(_tracked_models.values())
+
+
+@contextmanager
+def capture_models() -> Iterator[Set[str]]:
+    """
+    Collect the labels of the tracked models of which the tables are read by the
+    queries in the block, on all databases.
+    """
+    labels = set()
+
+    def capture(execute, sql, params, many, context):
+        labels.update(
+            _tracked_models[table]
+            for table in TABLE_RE.findall(sql)
+            if table in _tracked_models
+        )
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(capture))
+        yield labels
+
+
+def get_cache_key(*parts) -> str:
+    data = json.dumps(parts, default=str, separators=(",", ":"))
+    return f"{CACHE_KEY_PREFIX}:response:{hashlib.sha256(data.encode()).hexdigest()}"
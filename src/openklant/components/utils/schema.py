@@ -15,7 +15,9 @@ from vng_api_common.constants import VERSION_HEADER
 from openklant.utils.converters import snake_to_camel_converter
 
 from .expansion import EXPAND_KEY
-from .mixins import ExpandMixin
+from .export import ExportFormat
+from .fieldsets import get_field_names
+from .mixins import ConditionalRequestMixin, ExpandMixin, ExportMixin, FieldsMixin
 
 
 class AutoSchema(_AutoSchema):
@@ -120,6 +122,16 @@ class AutoSchema(_AutoSchema):
 
         return super().get_filter_backends()
 
+    def _get_filter_parameters(self):
+        parameters = super()._get_filter_parameters()
+        if isinstance(self.view, ExportMixin) and self.view.action == "export":
+            # the export doesn't support expand
+            expand_param = getattr(self.view, "expand_param", None)
+            parameters = [
+                param for param in parameters if param["name"] != expand_param
+            ]
+        return parameters
+
     def get_response_serializers(
         self,
     ):
@@ -133,7 +145,110 @@ class AutoSchema(_AutoSchema):
         params = super().get_override_parameters()
         version_headers = self.get_version_headers()
 
-        return params + version_headers
+        return (
+            params
+            + version_headers
+            + self.get_fields_parameters()
+            + self.get_conditional_headers()
+            + self.get_export_parameters()
+        )
+
+    def get_conditional_headers(self) -> list[OpenApiParameter]:
+        """Add the headers of conditional requests"""
+        if not isinstance(self.view, ConditionalRequestMixin):
+            return []
+
+        etag_header = OpenApiParameter(
+            name="ETag",
+            type=str,
+            location=OpenApiParameter.HEADER,
+            response=[200],
+            description=_(
+                "De ETag van de response, die wijzigt als de resource(s) in de "
+                "response wijzigen. Wordt niet teruggegeven als de `expand` "
+                "parameter wordt gebruikt."
+            ),
+        )
+        if self.method == "GET" and self.view.action in ("list", "retrieve"):
+            return [
+                OpenApiParameter(
+                    name="If-None-Match",
+                    type=str,
+                    location=OpenApiParameter.HEADER,
+                    required=False,
+                    description=_(
+                        "Voer een conditioneel verzoek uit. Als de huidige ETag "
+                        "voorkomt in de opgegeven ETag(s), wordt een lege response "
+                        "met status 304 teruggegeven."
+                    ),
+                ),
+                etag_header,
+            ]
+        if self.method in ("PUT", "PATCH"):
+            return [
+                OpenApiParameter(
+                    name="If-Match",
+                    type=str,
+                    location=OpenApiParameter.HEADER,
+                    required=False,
+                    description=_(
+                        "Werk de resource alleen bij als de huidige ETag voorkomt in "
+                        "de opgegeven ETag(s), anders wordt een response met status "
+                        "412 teruggegeven."
+                    ),
+                ),
+                etag_header,
+            ]
+        return []
+
+    def get_fields_parameters(self) -> list[OpenApiParameter]:
+        """Add the `fields` query parameter of sparse fieldsets"""
+        if self.method != "GET" or not isinstance(self.view, FieldsMixin):
+            return []
+
+        serializer = self.view.get_serializer_class()()
+        return [
+            OpenApiParameter(
+                name=self.view.fields_param,
+                type=build_array_type(
+                    {
+                        "type": "string",
+                        "enum": [
+                            snake_to_camel_converter(name)
+                            for name in get_field_names(serializer)
+                        ],
+                    }
+                ),
+                location=OpenApiParameter.QUERY,
+                style="form",
+                explode=False,
+                description=_(
+                    "Geef alleen de gespecifieerde velden van de resource terug, "
+                    "bijvoorbeeld `uuid,nummer`. Velden die niet worden opgevraagd, "
+                    "worden ook niet uit de database geladen."
+                ),
+            )
+        ]
+
+    def get_export_parameters(self) -> list[OpenApiParameter]:
+        """Add the format query parameter of the export"""
+        if not isinstance(self.view, ExportMixin) or self.view.action != "export":
+            return []
+
+        return [
+            OpenApiParameter(
+                name=self.view.export_format_param,
+                type=str,
+                enum=ExportFormat.values,
+                default=ExportFormat.ndjson.value,
+                location=OpenApiParameter.QUERY,
+                description=_(
+                    "Het formaat van de export: `ndjson` voor één JSON-object per "
+                    "regel, of `csv` met een kolom per veld. Geneste velden worden "
+                    "in CSV als JSON weergegeven."
+                ),
+            )
+        ]
 
     def get_version_headers(self) -> list[OpenApiParameter]:
         return [
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.test import SimpleTestCase
+
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
+from rest_framework.versioning import URLPathVersioning
+
+from ..api import get_detail_url
+
+VIEW_NAME = "klantinteracties:partij-detail"
+
+
+def get_request() -> Request:
+    request = Request(APIRequestFactory().get("/klantinteracties/api/v1/partijen"))
+    request.version = "1"
+    request.versioning_scheme = URLPathVersioning()
+    return request
+
+
+class GetDetailUrlTests(SimpleTestCase):
+    def test_url_is_equal_to_reversed_url(self):
+        request = get_request()
+        uuid = uuid4()
+
+        self.assertEqual(
+            get_detail_url(VIEW_NAME, uuid, request=request),
+            reverse(VIEW_NAME, kwargs={"uuid": uuid}, request=request),
+        )
+        self.assertEqual(
+            get_detail_url(VIEW_NAME, uuid, request=request),
+            f"http://testserver/klantinteracties/api/v1/partijen/{uuid}",
+        )
+
+    def test_url_is_reversed_once_per_request(self):
+        request = get_request()
+
+        with patch("openklant.components.utils.api.reverse", wraps=reverse) as mock:
+            urls = [get_detail_url(VIEW_NAME, uuid4(), request=request) for _ in "abc"]
+            get_detail_url("klantinteracties:betrokkene-detail", uuid4(), request)
+
+        self.assertEqual(len(set(urls)), 3)
+        self.assertEqual(mock.call_count, 2)
+
+        with patch("openklant.components.utils.api.reverse", wraps=reverse) as mock:
+            get_detail_url(VIEW_NAME, uuid4(), request=get_request())
+
+        self.assertEqual(mock.call_count, 1)
+
+    def test_url_without_request(self):
+        uuid = uuid4()
+
+        self.assertEqual(
+            get_detail_url(VIEW_NAME, uuid, version="1"),
+            f"/klantinteracties/api/v1/partijen/{uuid}",
+        )
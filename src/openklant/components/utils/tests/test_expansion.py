@@ -0,0 +1,89 @@
+from django.test import SimpleTestCase
+
+from ..expansion import EXPAND_KEY, InclusionTree
+
+
+class InclusionTreeTests(SimpleTestCase):
+    def test_display_nested_inclusions(self):
+        tree = InclusionTree()
+        tree.add_node(id="kc1", value={}, label="", many=False)
+        tree.add_node(
+            id="b1",
+            value={"url": "b1"},
+            label="betrokkenen",
+            many=True,
+            parent_id="kc1",
+        )
+        tree.add_node(
+            id="p1", value={"url": "p1"}, label="partij", many=False, parent_id="b1"
+        )
+
+        self.assertEqual(
+            tree.display_tree(),
+            {
+                "kc1": {
+                    "betrokkenen": [
+                        {"url": "b1", EXPAND_KEY: {"partij": {"url": "p1"}}},
+                    ]
+                }
+            },
+        )
+
+    def test_child_is_added_to_every_parent_with_same_id(self):
+        tree = InclusionTree()
+        tree.add_node(id="kc1", value={}, label="", many=False)
+        tree.add_node(id="kc2", value={}, label="", many=False)
+        # the same partij is expanded under two klantcontacten
+        for parent in ("kc1", "kc2"):
+            tree.add_node(
+                id="p1",
+                value={"url": "p1"},
+                label="partijen",
+                many=True,
+                parent_id=parent,
+            )
+        tree.add_node(
+            id="da1", value={"url": "da1"}, label="adres", many=False, parent_id="p1"
+        )
+
+        expected = {
+            "partijen": [{"url": "p1", EXPAND_KEY: {"adres": {"url": "da1"}}}],
+        }
+        self.assertEqual(tree.display_tree(), {"kc1": expected, "kc2": expected})
+
+    def test_duplicate_child_is_ignored(self):
+        tree = InclusionTree()
+        tree.add_node(id="kc1", value={}, label="", many=False)
+        for _ in range(2):
+            tree.add_node(
+                id="b1",
+                value={"url": "b1"},
+                label="betrokkenen",
+                many=True,
+                parent_id="kc1",
+            )
+
+        self.assertEqual(tree.display_tree(), {"kc1": {"betrokkenen": [{"url": "b1"}]}})
+
+    def test_empty_inclusions(self):
+        tree = InclusionTree()
+        tree.add_node(id="kc1", value={}, label="", many=False)
+        tree.add_node(id="b1", value={}, label="", many=False)
+        tree.add_node(
+            id=None, value=None, label="betrokkenen", many=True, parent_id="kc1"
+        )
+        tree.add_node(id=None, value=None, label="partij", many=False, parent_id="b1")
+
+        self.assertEqual(
+            tree.display_tree(),
+            {"kc1": {"betrokkenen": []}, "b1": {"partij": None}},
+        )
+
+    def test_unknown_parent_is_ignored(self):
+        tree = InclusionTree()
+        tree.add_node(id="kc1", value={}, label="", many=False)
+        tree.add_node(
+            id="b1", value={"url": "b1"}, label="betrokkenen", many=True, parent_id="x"
+        )
+
+        self.assertEqual(tree.display_tree(), {"kc1": {}})
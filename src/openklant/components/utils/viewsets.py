@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+from rest_framework.request import Request
+from vng_api_common.viewsets import (
+    CheckQueryParamsMixin as _CheckQueryParamsMixin,
+)
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Validate that the query params in the request are known, including the cursor
+    query param of the `DynamicPageSizePagination`, the fields query param of the
+    `FieldsMixin` and the format query param of the export of the `ExportMixin`.
+    """
+
+    def _check_query_params(self, request: Request) -> None:
+        extra_query_params = {
+            getattr(self.paginator, "cursor_query_param", None),
+            getattr(self, "fields_param", None),
+            getattr(self, "export_format_param", None)
+            if self.action == "export"
+            else None,
+        } & request.query_params.keys()
+        if not extra_query_params:
+            return super()._check_query_params(request)
+
+        query_params = request.query_params.copy()
+        for query_param in extra_query_params:
+            del query_params[query_param]
+        # only the query params of the request are validated
+        return super()._check_query_params(SimpleNamespace(query_params=query_params))
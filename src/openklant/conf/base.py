@@ -1,4 +1,5 @@
 import os
+from copy import deepcopy
 
 from maykin_common.config import config  # noqa
 from notifications_api_common.settings import *  # noqa
@@ -35,7 +36,12 @@ INSTALLED_APPS = INSTALLED_APPS + [
     "localflavor",
 ]
 
-MIDDLEWARE += ["openklant.utils.middleware.APIVersionHeaderMiddleware"]
+MIDDLEWARE += [
+    "openklant.utils.middleware.APIMetricsMiddleware",
+    "openklant.utils.middleware.APIVersionHeaderMiddleware",
+    "openklant.utils.middleware.ReplicaMiddleware",
+    "openklant.utils.middleware.IdentityMapMiddleware",
+]
 
 ENABLE_CLOUD_EVENTS = config(
     "ENABLE_CLOUD_EVENTS",
@@ -70,6 +76,70 @@ NOTIFICATION_NUMBER_OF_DAYS_RETAINED = config(
     ),
 )
 
+#
+# Database replicas
+#
+DB_REPLICA_HOSTS = config(
+    "DB_REPLICA_HOSTS",
+    default=[],
+    split=True,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "Comma separated list of read replicas of the PostgreSQL database, as "
+            "``host`` or ``host:port``. The reads of ``GET`` and ``HEAD`` requests on "
+            "the API are sent to a replica, the other database settings are the same "
+            "as for the primary database."
+        ),
+    ),
+)
+DB_REPLICA_MAX_LAG = config(
+    "DB_REPLICA_MAX_LAG",
+    default=5,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "The maximum number of seconds a replica may lag behind the primary "
+            "database. Replicas which lag further behind, or can't be reached, are "
+            "skipped until they have caught up."
+        ),
+    ),
+)
+DB_REPLICA_LAG_CHECK_INTERVAL = config(
+    "DB_REPLICA_LAG_CHECK_INTERVAL",
+    default=10,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text="The number of seconds between the lag checks of a replica.",
+    ),
+)
+DB_REPLICA_PINNING_WINDOW = config(
+    "DB_REPLICA_PINNING_WINDOW",
+    default=5,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "The number of seconds after a write request during which the reads of "
+            "the same client (API token) use the primary database, so the client "
+            "reads its own writes."
+        ),
+    ),
+)
+
+DATABASE_REPLICAS = []
+for index, replica_host in enumerate(DB_REPLICA_HOSTS):
+    host, _, port = replica_host.partition(":")
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **deepcopy(DATABASES["default"]),
+        "HOST": host,
+        "PORT": int(port) if port else DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["openklant.utils.replicas.ReplicaRouter"]
+
 #
 # SECURITY settings
 #
@@ -141,6 +211,106 @@ CELERY_TASK_SOFT_TIME_LIMIT = config(
     ),
 )  # soft
 
+#
+# Token authentication
+#
+TOKEN_CACHE_TIMEOUT = config(
+    "TOKEN_CACHE_TIMEOUT",
+    default=60,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of seconds an API token is cached by every process after "
+            "it was looked up, ``0`` disables the cache. Changes to and removal of "
+            "tokens reach all processes within this time."
+        ),
+    ),
+)
+TOKEN_CACHE_ALIAS = config(
+    "TOKEN_CACHE_ALIAS",
+    default="",
+    documentation=DocumentationParams(
+        help_text=(
+            "The cache (from the ``CACHES`` setting) which is shared by all "
+            "processes to cache API tokens, for example ``default``. If empty, the "
+            "tokens are only cached per process."
+        ),
+    ),
+)
+
+#
+# Klantinteracties
+#
+PARTIJEN_BULK_MAX_SIZE = config(
+    "PARTIJEN_BULK_MAX_SIZE",
+    default=1000,
+    documentation=DocumentationParams(
+        help_text=(
+            "The maximum number of partijen which can be created or updated in one "
+            "request to the ``/partijen/_bulk`` endpoint."
+        ),
+    ),
+)
+KLANTCONTACTEN_BULK_MAX_SIZE = config(
+    "KLANTCONTACTEN_BULK_MAX_SIZE",
+    default=1000,
+    documentation=DocumentationParams(
+        help_text=(
+            "The maximum number of klantcontacten which can be created in one request "
+            "to the ``/maak-klantcontact/_bulk`` endpoint."
+        ),
+    ),
+)
+API_COMPILED_REPRESENTATION = config(
+    "API_COMPILED_REPRESENTATION",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "Render the lists of partijen and klantcontacten with a representation "
+            "which is compiled from the serializers once per request, instead of "
+            "serializing every object field by field. The responses are identical."
+        ),
+    ),
+)
+API_RESPONSE_CACHE_TIMEOUT = config(
+    "API_RESPONSE_CACHE_TIMEOUT",
+    default=0,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of seconds the responses of the list and detail endpoints of "
+            "partijen, klantcontacten, betrokkenen and digitale adressen are cached, "
+            "``0`` disables the cache. A cached response is no longer used as soon as "
+            "one of the objects it was built from is changed."
+        ),
+    ),
+)
+API_RESPONSE_CACHE_ALIAS = config(
+    "API_RESPONSE_CACHE_ALIAS",
+    default="default",
+    documentation=DocumentationParams(
+        help_text=(
+            "The cache (from the ``CACHES`` setting) of the API responses. It must be "
+            "shared by all processes (like Redis), otherwise the changes made by one "
+            "process don't invalidate the responses cached by the others."
+        ),
+    ),
+)
+
+#
+# Referentielijsten
+#
+REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL = config(
+    "REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL",
+    default=300,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of seconds after which the kanalen from the Referentielijsten "
+            "API, used to validate ``Klantcontact.kanaal``, are refreshed in the "
+            "background. The previous kanalen are used while refreshing. ``0`` "
+            "retrieves the kanalen for every validation."
+        ),
+    ),
+)
+
 #
 # Notifications
 #
@@ -155,6 +325,65 @@ NOTIFICATIONS_DISABLED = config(
         ),
     ),
 )
+NOTIFICATIONS_OUTBOX_ENABLED = config(
+    "NOTIFICATIONS_OUTBOX_ENABLED",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "Store the notifications and cloud events in an outbox table, in the "
+            "same transaction as the API operation, instead of scheduling a Celery "
+            "task per notification. The outbox is sent in batches by the "
+            "``send_outbox_notifications`` task, which requires Celery beat."
+        ),
+    ),
+)
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config(
+    "NOTIFICATIONS_OUTBOX_BATCH_SIZE",
+    default=100,
+    documentation=DocumentationParams(
+        help_text="The number of notifications claimed from the outbox at once.",
+    ),
+)
+NOTIFICATIONS_OUTBOX_COALESCE_WINDOW = config(
+    "NOTIFICATIONS_OUTBOX_COALESCE_WINDOW",
+    default=0,
+    documentation=DocumentationParams(
+        help_text=(
+            "The minimum number of seconds cloud events stay in the outbox. A "
+            "``zaak-gekoppeld`` and ``zaak-ontkoppeld`` event for the same link "
+            "which are sent in the same batch cancel each other out, a larger "
+            "window makes this more likely at the cost of a later delivery."
+        ),
+    ),
+)
+NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT = config(
+    "NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT",
+    default=300,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of seconds after which notifications which were claimed from "
+            "the outbox, but not sent (for example because the worker crashed), are "
+            "claimed again."
+        ),
+    ),
+)
+NOTIFICATIONS_OUTBOX_INTERVAL = config(
+    "NOTIFICATIONS_OUTBOX_INTERVAL",
+    default=10,
+    documentation=DocumentationParams(
+        help_text="The number of seconds between the runs of the outbox task.",
+    ),
+)
+
+#
+# Celery beat
+#
+CELERY_BEAT_SCHEDULE = {}
+if NOTIFICATIONS_OUTBOX_ENABLED:
+    CELERY_BEAT_SCHEDULE["send-outbox-notifications"] = {
+        "task": "openklant.utils.tasks.send_outbox_notifications",
+        "schedule": NOTIFICATIONS_OUTBOX_INTERVAL,
+    }
 
 #
 # django-upgrade-check
@@ -0,0 +1,174 @@
+"""
+Process-local index of the ``kanalen`` in the Referentielijsten API.
+
+The kanalen are fetched once per process and refreshed in the background every
+``REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL`` seconds, the previous kanalen are used
+while refreshing or if refreshing fails. Only if no kanalen were fetched yet, they
+are fetched while validating.
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+import structlog
+
+from openklant.utils.converters import parse_datetime
+from referentielijsten_client.client import (
+    ReferentielijstenClient,
+    get_referentielijsten_client,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+Window = Tuple[Optional[datetime], Optional[datetime]]
+IndexKey = Tuple[Optional[int], str]
+
+
+@dataclass
+class KanalenSnapshot:
+    """
+    The kanalen of a tabel, with the windows in which they are valid.
+    """
+
+    codes: Tuple[str, ...]
+    windows: Tuple[Window, ...]
+    fetched_at: float
+    # the moments at which the valid kanalen change, sorted
+    boundaries: List[datetime] = field(init=False)
+    # the valid kanalen between two boundaries, computed when needed
+    _segments: Dict[int, Tuple[List[str], FrozenSet[str]]] = field(
+        init=False, default_factory=dict
+    )
+
+    def __post_init__(self):
+        self.boundaries = sorted(
+            {moment for window in self.windows for moment in window if moment}
+        )
+
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> "KanalenSnapshot":
+        kanalen = [
+            (
+                item["code"],
+                (
+                    parse_datetime(item.get("begindatumGeldigheid")),
+                    parse_datetime(item.get("einddatumGeldigheid")),
+                ),
+            )
+            for item in items
+            if item.get("code")
+        ]
+        return cls(
+            codes=tuple(code for code, _window in kanalen),
+            windows=tuple(window for _code, window in kanalen),
+            fetched_at=time.monotonic(),
+        )
+
+    def get_valid_kanalen(self, now: datetime) -> Tuple[List[str], FrozenSet[str]]:
+        """
+        Return the kanalen which are valid at the moment, as list and set.
+        """
+        segment = bisect_right(self.boundaries, now)
+        if segment not in self._segments:
+            kanalen = [
+                code
+                for code, (begin, end) in zip(self.codes, self.windows)
+                if (begin is None or begin <= now) and (end is None or now < end)
+            ]
+            self._segments[segment] = (kanalen, frozenset(kanalen))
+        return self._segments[segment]
+
+
+def fetch_snapshot(client: ReferentielijstenClient, tabel_code: str) -> KanalenSnapshot:
+    with client:
+        items = client.get_items_by_tabel_code(tabel_code)
+    return KanalenSnapshot.from_items(items)
+
+
+class KanalenIndex:
+    def __init__(self):
+        self._snapshots: Dict[IndexKey, KanalenSnapshot] = {}
+        self._refreshing: Set[IndexKey] = set()
+        self._lock = threading.Lock()
+        # snapshots fetched before the index was cleared are discarded
+        self._generation = 0
+
+    def get_snapshot(self, config) -> KanalenSnapshot:
+        """
+        Return the kanalen of the tabel of the ``ReferentielijstenConfig``.
+
+        :raises RequestException: if the kanalen were not fetched yet and can't be
+          retrieved.
+        """
+        interval = settings.REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL
+        key = (config.service_id, config.kanalen_tabel_code)
+
+        snapshot = self._snapshots.get(key) if interval else None
+        if snapshot is None:
+            snapshot = fetch_snapshot(
+                get_referentielijsten_client(config.service),
+                config.kanalen_tabel_code,
+            )
+            if interval:
+                self._snapshots[key] = snapshot
+        elif time.monotonic() - snapshot.fetched_at >= interval:
+            self._start_refresh(key, config)
+
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._refreshing.clear()
+            self._generation += 1
+
+    def _start_refresh(self, key: IndexKey, config) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            generation = self._generation
+
+        try:
+            # the client is built here, so the thread doesn't query the database
+            client = get_referentielijsten_client(config.service)
+            thread = threading.Thread(
+                target=self._refresh,
+                args=(key, client, config.kanalen_tabel_code, generation),
+                daemon=True,
+            )
+            thread.start()
+        except Exception:
+            logger.exception("failed_to_refresh_kanalen_from_referentielijsten")
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh(
+        self,
+        key: IndexKey,
+        client: ReferentielijstenClient,
+        tabel_code: str,
+        generation: int,
+    ) -> None:
+        try:
+            snapshot = fetch_snapshot(client, tabel_code)
+        except Exception:
+            logger.exception("failed_to_refresh_kanalen_from_referentielijsten")
+            # the stale kanalen are used until the next attempt
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                snapshot = replace(snapshot, fetched_at=time.monotonic())
+
+        with self._lock:
+            self._refreshing.discard(key)
+            if snapshot is not None and generation == self._generation:
+                self._snapshots[key] = snapshot
+
+
+kanalen_index = KanalenIndex()
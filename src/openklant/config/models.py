@@ -10,6 +10,7 @@ from solo.models import SingletonModel
 from zgw_consumers.models import Service
 
 from openklant.components.klantinteracties.models import Klantcontact
+from openklant.config.kanalen import kanalen_index
 from referentielijsten_client.client import (
     REFERENTIELIJST_CLIENT_CACHE_PREFIX,
     get_referentielijsten_client,
@@ -82,6 +83,7 @@ class ReferentielijstenConfig(SingletonModel):
             cache.delete(
                 f"{REFERENTIELIJST_CLIENT_CACHE_PREFIX}{self.kanalen_tabel_code}"
             )
+        kanalen_index.clear()
         return super().save(*args, **kwargs)
 
     @property
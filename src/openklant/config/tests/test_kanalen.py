@@ -0,0 +1,154 @@
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from requests.exceptions import Timeout
+from zgw_consumers.test.factories import ServiceFactory
+
+from openklant.tests.utils.cache import ClearCachesMixin
+
+from ..kanalen import KanalenSnapshot, kanalen_index
+from ..models import ReferentielijstenConfig
+
+ITEMS = [
+    {"code": "email"},
+    {"code": "phone", "einddatumGeldigheid": "2025-01-01T00:00:00Z"},
+    {"code": "chat", "begindatumGeldigheid": "2024-07-01T00:00:00Z"},
+    {"code": ""},
+]
+
+
+def at(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+class RecordingThread(threading.Thread):
+    started = []
+
+    def start(self):
+        self.started.append(self)
+        super().start()
+
+
+class KanalenSnapshotTests(TestCase):
+    def test_valid_kanalen(self):
+        snapshot = KanalenSnapshot.from_items(ITEMS)
+
+        self.assertEqual(snapshot.codes, ("email", "phone", "chat"))
+        self.assertEqual(
+            snapshot.get_valid_kanalen(at("2024-01-01"))[0], ["email", "phone"]
+        )
+        self.assertEqual(
+            snapshot.get_valid_kanalen(at("2024-07-01"))[0], ["email", "phone", "chat"]
+        )
+        self.assertEqual(
+            snapshot.get_valid_kanalen(at("2025-01-01"))[0], ["email", "chat"]
+        )
+        self.assertEqual(
+            snapshot.get_valid_kanalen(at("2025-01-01"))[1], {"email", "chat"}
+        )
+
+    def test_valid_kanalen_are_computed_once_per_window(self):
+        snapshot = KanalenSnapshot.from_items(ITEMS)
+
+        self.assertIs(
+            snapshot.get_valid_kanalen(at("2024-08-01")),
+            snapshot.get_valid_kanalen(at("2024-12-31")),
+        )
+
+
+@override_settings(REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL=300)
+@patch("openklant.config.kanalen.time.monotonic", return_value=0)
+class KanalenIndexTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.service = ServiceFactory.create(api_root="http://localhost:8004/api/v1")
+
+    def setUp(self):
+        super().setUp()
+        self.config = ReferentielijstenConfig(
+            service=self.service, enabled=True, kanalen_tabel_code="KANAAL"
+        )
+        RecordingThread.started = []
+
+    def refresh(self):
+        with patch("openklant.config.kanalen.threading.Thread", RecordingThread):
+            snapshot = kanalen_index.get_snapshot(self.config)
+
+        for thread in RecordingThread.started:
+            thread.join()
+
+        return snapshot
+
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_kanalen_are_fetched_once(self, mock_fetch, mock_monotonic):
+        mock_fetch.return_value = KanalenSnapshot.from_items(ITEMS)
+
+        first = kanalen_index.get_snapshot(self.config)
+        second = kanalen_index.get_snapshot(self.config)
+
+        self.assertIs(first, second)
+        mock_fetch.assert_called_once()
+
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_stale_kanalen_are_refreshed_in_background(
+        self, mock_fetch, mock_monotonic
+    ):
+        stale = KanalenSnapshot.from_items(ITEMS)
+        mock_monotonic.return_value = 300
+        fresh = KanalenSnapshot.from_items(ITEMS[:1])
+        mock_fetch.side_effect = [stale, fresh]
+        kanalen_index.get_snapshot(self.config)
+
+        snapshot = self.refresh()
+
+        # the stale kanalen are used while refreshing
+        self.assertIs(snapshot, stale)
+        self.assertEqual(len(RecordingThread.started), 1)
+        self.assertIs(kanalen_index.get_snapshot(self.config), fresh)
+
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_stale_kanalen_are_used_if_refresh_fails(self, mock_fetch, mock_monotonic):
+        stale = KanalenSnapshot.from_items(ITEMS)
+        mock_fetch.side_effect = [stale, Timeout()]
+        kanalen_index.get_snapshot(self.config)
+
+        mock_monotonic.return_value = 300
+        self.refresh()
+
+        snapshot = kanalen_index.get_snapshot(self.config)
+
+        self.assertEqual(snapshot.codes, stale.codes)
+        # the next attempt is after the interval
+        self.assertEqual(snapshot.fetched_at, 300)
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_fetch_fails_without_kanalen(self, mock_fetch, mock_monotonic):
+        mock_fetch.side_effect = Timeout()
+
+        with self.assertRaises(Timeout):
+            kanalen_index.get_snapshot(self.config)
+
+    @override_settings(REFERENTIELIJSTEN_KANALEN_REFRESH_INTERVAL=0)
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_index_disabled(self, mock_fetch, mock_monotonic):
+        mock_fetch.return_value = KanalenSnapshot.from_items(ITEMS)
+
+        kanalen_index.get_snapshot(self.config)
+        kanalen_index.get_snapshot(self.config)
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @patch("openklant.config.kanalen.fetch_snapshot")
+    def test_saving_config_clears_index(self, mock_fetch, mock_monotonic):
+        mock_fetch.return_value = KanalenSnapshot.from_items(ITEMS)
+        kanalen_index.get_snapshot(self.config)
+
+        ReferentielijstenConfig.get_solo().save()
+        kanalen_index.get_snapshot(self.config)
+
+        self.assertEqual(mock_fetch.call_count, 2)
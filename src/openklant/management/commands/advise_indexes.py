@@ -0,0 +1,266 @@
+import json
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Tuple, Type
+
+from django import forms
+from django.apps import apps
+from django.core.exceptions import EmptyResultSet
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Model, QuerySet
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from django_filters import Filter, FilterSet
+from django_filters.rest_framework import DjangoFilterBackend
+
+COMPONENTS = ("klantinteracties", "contactgegevens")
+URLCONF = "openklant.components.{}.api.urls"
+
+# the scans which read the whole table, and filter the rows afterwards
+FULL_SCANS = ("Seq Scan", "Index Scan", "Index Only Scan")
+
+
+@dataclass
+class FullScan:
+    table: str
+    condition: str
+    suggestions: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FilterReport:
+    name: str
+    value: str
+    scans: List[FullScan] = field(default_factory=list)
+    error: str = ""
+
+
+def get_list_views(component: str) -> Iterator[Tuple[str, type]]:
+    """
+    Yield the URL names and classes of the viewsets with a list endpoint.
+    """
+
+    def walk(patterns, namespace: str):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(
+                    pattern.url_patterns,
+                    pattern.namespace or namespace,
+                )
+            elif isinstance(pattern, URLPattern):
+                actions = getattr(pattern.callback, "actions", None) or {}
+                if actions.get("get") == "list":
+                    yield f"{namespace}:{pattern.name}", pattern.callback.cls
+
+    seen = set()
+    for name, view_class in walk(
+        get_resolver(URLCONF.format(component)).url_patterns, component
+    ):
+        if view_class not in seen:
+            seen.add(view_class)
+            yield name, view_class
+
+
+def get_filterset_class(view_class: type) -> Optional[Type[FilterSet]]:
+    queryset = getattr(view_class, "queryset", None)
+    if queryset is None:
+        return None
+
+    view = view_class(action="list", request=None, format_kwarg=None, kwargs={})
+    return DjangoFilterBackend().get_filterset_class(view, queryset)
+
+
+def get_value(filter: Filter) -> Optional[str]:
+    """
+    Return a representative value for the filter, based on its form field.
+    """
+    form_field = filter.field
+    if isinstance(form_field, (forms.NullBooleanField, forms.BooleanField)):
+        return "true"
+    if isinstance(form_field, forms.UUIDField):
+        return str(uuid.uuid4())
+    if isinstance(form_field, forms.URLField):
+        return f"https://example.com/api/v1/objecten/{uuid.uuid4()}"
+    if isinstance(form_field, forms.ChoiceField):
+        choices = [str(value) for value, _label in form_field.choices if value]
+        return choices[0] if choices else None
+    if isinstance(form_field, forms.DateTimeField):
+        return datetime.now().isoformat()
+    if isinstance(form_field, forms.DateField):
+        return date.today().isoformat()
+    if isinstance(form_field, (forms.IntegerField, forms.DecimalField)):
+        return "1"
+    if isinstance(form_field, forms.CharField):
+        # long enough to use a trigram index
+        return "voorbeeld"
+    return None
+
+
+def iter_plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def explain(queryset: QuerySet) -> dict:
+    return json.loads(queryset.explain(format="json"))[0]["Plan"]
+
+
+def get_full_scans(plan: dict) -> List[FullScan]:
+    """
+    Return the scans of the plan which filter the rows of a table without an index
+    condition.
+    """
+    return [
+        FullScan(table=node["Relation Name"], condition=node["Filter"])
+        for node in iter_plan_nodes(plan)
+        if node["Node Type"] in FULL_SCANS
+        and "Filter" in node
+        and "Index Cond" not in node
+    ]
+
+
+def get_model(table: str) -> Optional[Type[Model]]:
+    for model in apps.get_models():
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def suggest_indexes(scan: FullScan) -> List[str]:
+    """
+    Suggest an index for the columns which are filtered by a full scan. Django
+    compares ``icontains`` and ``iexact`` lookups in upper case, these get a trigram
+    and an expression index.
+    """
+    model = get_model(scan.table)
+    if model is None:
+        return []
+
+    columns = [
+        model_field.column
+        for model_field in model._meta.concrete_fields
+        if re.search(rf"\b{re.escape(model_field.column)}\b", scan.condition)
+    ]
+    suggestions = []
+    plain_columns = []
+    for column in columns:
+        if not re.search(rf"upper\(\(?{re.escape(column)}\b", scan.condition):
+            plain_columns.append(column)
+        elif "~~" in scan.condition:
+            suggestions.append(
+                f"CREATE INDEX CONCURRENTLY ON {scan.table} "
+                f"USING gin (UPPER({column}) gin_trgm_ops);"
+            )
+        else:
+            suggestions.append(
+                f"CREATE INDEX CONCURRENTLY ON {scan.table} (UPPER({column}));"
+            )
+
+    if plain_columns:
+        suggestions.append(
+            f"CREATE INDEX CONCURRENTLY ON {scan.table} ({', '.join(plain_columns)});"
+        )
+    return suggestions
+
+
+def check_filter(
+    filterset_class: Type[FilterSet], queryset: QuerySet, name: str, filter: Filter
+) -> Optional[FilterReport]:
+    value = get_value(filter)
+    if value is None:
+        return FilterReport(name, "", error="no representative value")
+
+    filterset = filterset_class({name: value}, queryset=queryset)
+    if not filterset.is_valid():
+        return FilterReport(name, value, error=str(dict(filterset.errors)))
+
+    filtered = filterset.qs.order_by()
+    try:
+        filtered_sql = str(filtered.query)
+    except EmptyResultSet:
+        return FilterReport(name, value, error="the value matches nothing")
+
+    # filters like `expand` don't change the query
+    if filtered_sql == str(queryset.order_by().query):
+        return None
+
+    report = FilterReport(name, value, scans=get_full_scans(explain(filtered)))
+    for scan in report.scans:
+        scan.suggestions = suggest_indexes(scan)
+    return report
+
+
+class Command(BaseCommand):
+    help = """
+    Check which filters of the list endpoints can't use an index.
+
+    Every filter of the FilterSets of the list endpoints is applied with a
+    representative value, after which `EXPLAIN (FORMAT JSON)` shows whether a table
+    is scanned as a whole to filter the rows. Sequential scans are disabled while
+    explaining (unless --allow-seqscan is given), so the result doesn't depend on the
+    amount of data: a table is only scanned if no index can be used.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--component",
+            dest="components",
+            action="append",
+            choices=COMPONENTS,
+            help="The component to check, all components by default.",
+        )
+        parser.add_argument(
+            "--allow-seqscan",
+            action="store_true",
+            help="Let the planner choose sequential scans, to check the actual plans "
+            "of a database with production data.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        full_scans = 0
+        with transaction.atomic():
+            if not options["allow_seqscan"]:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for component in options["components"] or COMPONENTS:
+                for name, view_class in get_list_views(component):
+                    full_scans += self.check_view(name, view_class)
+
+        if full_scans:
+            self.stdout.write(
+                self.style.WARNING(f"{full_scans} filters can't use an index.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("All filters can use an index."))
+
+    def check_view(self, name: str, view_class: type) -> int:
+        filterset_class = get_filterset_class(view_class)
+        if filterset_class is None:
+            return 0
+
+        self.stdout.write(f"{name} ({filterset_class.__name__})")
+        queryset = view_class.queryset.all()
+        full_scans = 0
+        for filter_name, filter in filterset_class.base_filters.items():
+            report = check_filter(filterset_class, queryset, filter_name, filter)
+            if report is None:
+                continue
+
+            if report.error:
+                self.stdout.write(f"  {report.name}: skipped, {report.error}")
+            elif report.scans:
+                full_scans += 1
+                self.stdout.write(self.style.WARNING(f"  {report.name}={report.value}"))
+                for scan in report.scans:
+                    self.stdout.write(f"    {scan.table}: {scan.condition}")
+                    for suggestion in scan.suggestions:
+                        self.stdout.write(f"      {suggestion}")
+            elif self.verbosity > 1:
+                self.stdout.write(f"  {report.name}: index")
+        return full_scans
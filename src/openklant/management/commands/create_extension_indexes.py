@@ -0,0 +1,93 @@
+from typing import Iterator, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.migrations.loader import MigrationLoader
+
+from openklant.utils.operations import (
+    AddExtensionIndexConcurrently,
+    create_index_if_not_exists,
+    extension_is_available,
+    extension_is_installed,
+)
+
+
+def get_extension_indexes(
+    loader: MigrationLoader,
+) -> Iterator[Tuple[str, str, models.Index, str]]:
+    """
+    Yield the app label, model name, index and extension of the indexes which are
+    added by the applied migrations with ``AddExtensionIndexConcurrently``.
+    """
+    for key in sorted(loader.applied_migrations):
+        migration = loader.graph.nodes.get(key)
+        if migration is None:
+            continue
+
+        for operation in migration.operations:
+            if isinstance(operation, AddExtensionIndexConcurrently):
+                yield (
+                    migration.app_label,
+                    operation.model_name_lower,
+                    operation.index,
+                    operation.extension,
+                )
+
+
+class Command(BaseCommand):
+    help = """
+    Create the indexes which the migrations skipped because their PostgreSQL extension
+    (like `pg_trgm`) wasn't installed.
+
+    The extensions are installed if they are available on the database server, after
+    which the missing indexes are created with `CREATE INDEX CONCURRENTLY IF NOT
+    EXISTS`. Existing indexes are left alone, so the command can be run again safely.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to create the indexes in.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        loader = MigrationLoader(connection)
+        state = loader.project_state()
+
+        # the indexes are created concurrently, which can't be done in a transaction
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for app_label, model_name, index, extension in get_extension_indexes(
+                loader
+            ):
+                model_state = state.models[app_label, model_name]
+                # indexes which are removed by a later migration are skipped
+                if index.name not in {i.name for i in model_state.options["indexes"]}:
+                    continue
+
+                if not self.install_extension(schema_editor, extension):
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"{index.name}: skipped, the extension {extension} is "
+                            "not available."
+                        )
+                    )
+                    continue
+
+                model = state.apps.get_model(app_label, model_name)
+                if create_index_if_not_exists(schema_editor, model, index):
+                    self.stdout.write(self.style.SUCCESS(f"{index.name}: created"))
+                else:
+                    self.stdout.write(f"{index.name}: exists")
+
+    def install_extension(self, schema_editor, extension: str) -> bool:
+        if extension_is_installed(schema_editor, extension):
+            return True
+        if not extension_is_available(schema_editor, extension):
+            return False
+
+        schema_editor.execute(
+            f"CREATE EXTENSION IF NOT EXISTS {schema_editor.quote_name(extension)}"
+        )
+        return True
@@ -3,7 +3,10 @@
 
 
 import os
-from dataclasses import asdict, fields as dataclass_fields
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields as dataclass_fields
+from pathlib import Path
 from typing import Any, Tuple
 from urllib.parse import parse_qs, urlparse
 
@@ -12,11 +15,13 @@ from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.management import CommandError
 from django.core.management.base import BaseCommand, CommandParser
 
+import requests
 from rest_framework.fields import URLValidator
 from rest_framework.reverse import reverse_lazy
 
 from openklant.components.token.models import TokenAuth
-from openklant.migration.client import Client
+from openklant.migration.checkpoint import Checkpoint
+from openklant.migration.client import Client, create_session
 from openklant.migration.utils import (
     MIGRATION_TOKEN_IDENTIFIER,
     _generate_dummy_token,
@@ -40,13 +45,17 @@ PARTIJEN_PATH = reverse_lazy(
 )
 
 
-def _retrieve_klanten(url: str, access_token: str) -> Tuple[list[Klant], str | None]:
+def _retrieve_klanten(
+    url: str, access_token: str, session: requests.Session | None = None
+) -> Tuple[list[Klant], str | None]:
     klanten_path = "/klanten/api/v1/klanten"
 
     _url = urlparse(url)
     _params = parse_qs(_url.query)
 
-    client = LegacyOpenKlantClient(f"{_url.scheme}://{_url.netloc}", access_token)
+    client = LegacyOpenKlantClient(
+        f"{_url.scheme}://{_url.netloc}", access_token, session=session
+    )
     response_data = client.retrieve(_url.path or klanten_path, params=_params)
 
     if not isinstance(response_data, dict):
@@ -56,7 +65,7 @@ def _retrieve_klanten(url: str, access_token: str) -> Tuple[list[Klant], str | N
     items = response_data.get("results", [])
     klanten = []
 
-    generic_client = Client()
+    generic_client = Client(session)
 
     for data in items:
         klant = Klant(
@@ -83,49 +92,137 @@ def _retrieve_klanten(url: str, access_token: str) -> Tuple[list[Klant], str | N
     return klanten, next_url
 
 
-def _save_klanten(url: str, token: TokenAuth, klanten: list[Klant]) -> list[str]:
-    if not klanten:
-        logger.info("no_klanten_to_save")
-        return []
+def _save_klant(openklant_client: OpenKlantClient, klant: Klant) -> str | None:
+    digitaal_adres = klant.to_digitaal_adres_email()
+    digitaal_adres_ref = None
 
-    logger.info("creating_klanten_v2_api", count=len(klanten))
+    if digitaal_adres:
+        digitaal_adres_data = digitaal_adres.dict()
+        digitaal_adres_data["referentie"] = "portaalvoorkeur"
+        _data = openklant_client.create(DIGITALE_ADDRESSEN_PATH, digitaal_adres_data)
 
-    openklant_client = OpenKlantClient(url, token)
-    created_klanten = []
+        if not isinstance(_data, dict):
+            logger.error(
+                "invalid_data_for_digitaal_adres",
+                data=_data,
+                action="skipping_klant",
+            )
+            return
 
-    for klant in klanten:
-        digitaal_adres = klant.to_digitaal_adres_email()
-        digitaal_adres_ref = None
+        digitaal_adres_ref = _data.get("uuid")
 
-        if digitaal_adres:
-            digitaal_adres_data = digitaal_adres.dict()
-            digitaal_adres_data["referentie"] = "portaalvoorkeur"
-            _data = openklant_client.create(
-                DIGITALE_ADDRESSEN_PATH, digitaal_adres_data
-            )
+    partij = klant.to_partij(digitaal_adres=digitaal_adres_ref)
 
-            if not isinstance(_data, dict):
-                logger.error(
-                    "invalid_data_for_digitaal_adres",
-                    data=_data,
-                    action="skipping_klant",
-                )
-                continue
+    if not partij:
+        logger.error("unable_to_create_partij", klant=asdict(klant))
+        return
 
-            digitaal_adres_ref = _data.get("uuid")
+    response_data = openklant_client.create(PARTIJEN_PATH, partij.dict())
 
-        partij = klant.to_partij(digitaal_adres=digitaal_adres_ref)
+    if response_data and "url" in response_data:
+        return response_data["url"]
 
-        if not partij:
-            logger.error("unable_to_create_partij", klant=asdict(klant))
-            continue
 
-        response_data = openklant_client.create(PARTIJEN_PATH, partij.dict())
+@dataclass
+class Progress:
+    created_klanten: list[str] = field(default_factory=list)
+    pages: int = 0
+    start: float = field(default_factory=time.monotonic)
 
-        if response_data and "url" in response_data:
-            created_klanten.append(response_data["url"])
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.start
+        rate = len(self.created_klanten) / elapsed if elapsed else 0
+        return (
+            f"Migrated {len(self.created_klanten)} klanten from {self.pages} pages "
+            f"in {elapsed:.1f} seconds ({rate:.1f} klanten per second)."
+        )
+
+
+def _migrate(
+    v2_url: str,
+    access_token: str,
+    token: str,
+    checkpoint: Checkpoint,
+    workers: int,
+    progress: Progress,
+) -> None:
+    """
+    Migrate the klanten page by page, starting at the next page of the checkpoint.
+
+    The klanten of a page are saved by ``workers`` threads. With more than one
+    worker, the next page is retrieved while saving the klanten of the current page.
+    Klanten which were migrated already according to the checkpoint are skipped.
+    """
+    prefetch = workers > 1
+    # one connection per worker and one to retrieve the next page
+    session = create_session(pool_size=workers + 1)
+    openklant_client = OpenKlantClient(v2_url, token, session=session)
+
+    # the klanten which are being saved, with their index in the page
+    futures: dict[Future, Tuple[int, Klant]] = {}
+
+    with (
+        session,
+        ThreadPoolExecutor(max_workers=1) as prefetcher,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+        try:
+            next_page = prefetcher.submit(
+                _retrieve_klanten, checkpoint.next_url, access_token, session
+            )
 
-    return created_klanten
+            while next_page is not None:
+                klanten, next_url = next_page.result()
+                next_page = None
+                if next_url and prefetch:
+                    next_page = prefetcher.submit(
+                        _retrieve_klanten, next_url, access_token, session
+                    )
+
+                klanten = [
+                    klant for klant in klanten if klant.url not in checkpoint.migrated
+                ]
+                logger.info("creating_klanten_v2_api", count=len(klanten))
+
+                futures = {
+                    executor.submit(_save_klant, openklant_client, klant): (
+                        index,
+                        klant,
+                    )
+                    for index, klant in enumerate(klanten)
+                }
+                partij_urls: list[str | None] = [None] * len(klanten)
+
+                for future in as_completed(futures):
+                    index, klant = futures[future]
+                    partij_urls[index] = partij_url = future.result()
+
+                    if partij_url and klant.url:
+                        checkpoint.add_klant(klant.url, partij_url)
+
+                progress.created_klanten.extend(filter(None, partij_urls))
+                progress.pages += 1
+                checkpoint.complete_page(next_url)
+
+                if next_url and not prefetch:
+                    next_page = prefetcher.submit(
+                        _retrieve_klanten, next_url, access_token, session
+                    )
+        except BaseException:
+            # don't start saving the remaining klanten when interrupted, but record
+            # the klanten which are saved meanwhile, so they aren't saved again when
+            # the migration resumes
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            for future, (index, klant) in futures.items():
+                if future.cancelled() or future.exception() is not None:
+                    continue
+
+                partij_url = future.result()
+                if partij_url and klant.url and klant.url not in checkpoint.migrated:
+                    checkpoint.add_klant(klant.url, partij_url)
+            raise
 
 
 class Command(BaseCommand):
@@ -144,6 +241,22 @@ class Command(BaseCommand):
             help="URL of the Klantinteracties API",
         )
 
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of klanten which are saved in the Klantinteracties API at "
+            "the same time",
+        )
+
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            metavar="migration.checkpoint",
+            help="File in which the progress is stored. If the file exists, the "
+            "migration resumes where it was interrupted",
+        )
+
     def handle(self, *args: Any, **options: Any) -> str | None:
         client_id = os.getenv("CLIENT_ID")
         secret = os.getenv("SECRET")
@@ -167,25 +280,41 @@ class Command(BaseCommand):
         else:
             access_token = os.getenv("ACCESS_TOKEN")
 
-        next_url: str | None = ""
+        if options["workers"] < 1:
+            raise CommandError("The number of workers must be at least 1.")
 
         if not access_token:
             raise ImproperlyConfigured("An access token is required to acces V1")
 
+        try:
+            checkpoint = Checkpoint(v1_url, options["checkpoint"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if checkpoint.completed:
+            self.stderr.write("The migration in the checkpoint is completed already.")
+            return
+
         dummy_token = _generate_dummy_token()
-        results = []
+        progress = Progress()
 
         try:
-            while next_url is not None:
-                klanten, next_url = _retrieve_klanten(
-                    v1_url if next_url == "" else next_url, access_token
+            with checkpoint:
+                _migrate(
+                    v2_url,
+                    access_token,
+                    dummy_token,
+                    checkpoint,
+                    options["workers"],
+                    progress,
                 )
-                results.extend(_save_klanten(v2_url, dummy_token, klanten))
         finally:
+            self.stderr.write(progress.report())
+
             dummy_tokens = TokenAuth.objects.filter(
                 application=MIGRATION_TOKEN_IDENTIFIER
             )
 
             dummy_tokens.delete()
 
-        return "\n".join(results)
+        return "\n".join(progress.created_klanten)
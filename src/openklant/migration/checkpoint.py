@@ -0,0 +1,99 @@
+import json
+import os
+from pathlib import Path
+from typing import IO
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class Checkpoint:
+    """
+    Progress of a migration, stored in a file so an interrupted migration can resume.
+
+    The file contains a JSON object per line, which is either the URL of the next
+    page to migrate (``{"next": ...}``) or a migrated klant (``{"klant": ...,
+    "partij": ...}``). Lines are only appended, so the file stays valid if the
+    migration is interrupted while writing it.
+    """
+
+    v1_url: str
+    next_url: str | None
+    migrated: dict[str, str]
+
+    _file: IO[str] | None
+
+    def __init__(self, v1_url: str, path: Path | None = None) -> None:
+        self.v1_url = v1_url
+        self.next_url = v1_url
+        self.migrated = {}
+        self.path = path
+        self._file = None
+
+        if path and path.exists():
+            self._load(path)
+
+    def _load(self, path: Path) -> None:
+        with path.open() as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("skipping_incomplete_checkpoint_line", line=line)
+                    continue
+
+                if "v1_url" in entry and entry["v1_url"] != self.v1_url:
+                    raise ValueError(
+                        f"The checkpoint {path} belongs to a migration of "
+                        f"{entry['v1_url']}"
+                    )
+                if "next" in entry:
+                    self.next_url = entry["next"]
+                if "klant" in entry:
+                    self.migrated[entry["klant"]] = entry["partij"]
+
+    def __enter__(self) -> "Checkpoint":
+        if self.path:
+            is_new = not self.path.exists()
+            # an interrupted migration can leave an incomplete last line, which the
+            # next entry shouldn't be appended to
+            is_incomplete = not is_new and not self._ends_with_newline(self.path)
+            self._file = self.path.open("a")
+            if is_new:
+                self._write({"v1_url": self.v1_url})
+            elif is_incomplete:
+                self._file.write("\n")
+        return self
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with path.open("rb") as file:
+            if file.seek(0, os.SEEK_END) == 0:
+                return True
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def __exit__(self, *exc_info) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry: dict) -> None:
+        # every entry is flushed, so the klanten which are saved are recorded even if
+        # the migration crashes halfway a page
+        if self._file:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    @property
+    def completed(self) -> bool:
+        return self.next_url is None
+
+    def add_klant(self, klant_url: str, partij_url: str) -> None:
+        self.migrated[klant_url] = partij_url
+        self._write({"klant": klant_url, "partij": partij_url})
+
+    def complete_page(self, next_url: str | None) -> None:
+        self.next_url = next_url
+        self._write({"next": next_url})
@@ -4,11 +4,29 @@ import requests
 import structlog
 from djangorestframework_camel_case.parser import CamelCaseJSONParser, ParseError
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from requests.adapters import HTTPAdapter
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Return a session which keeps up to ``pool_size`` connections per host open, to
+    reuse them for the requests of multiple threads.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class Client:
+    session: requests.Session | None
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        self.session = session
+
     def _request(
         self,
         method: str,
@@ -30,7 +48,7 @@ class Client:
             headers.update({"Content-Type": "application/json"})
 
         try:
-            response = requests.request(
+            response = (self.session or requests).request(
                 method, url, data=_data, params=params, headers=headers
             )
 
@@ -70,7 +88,11 @@ class BaseOpenKlantClient(Client):
 
     headers: dict
 
-    def __init__(self, base_url: str, token: str) -> None:
+    def __init__(
+        self, base_url: str, token: str, session: requests.Session | None = None
+    ) -> None:
+        super().__init__(session)
+
         self.token = token
         self.base_url = base_url
 
@@ -1,14 +1,81 @@
+import argparse
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KLANTEN_PATH = "/klanten/api/v1/klanten"
+
+
+def generate_bsn(number: int) -> str:
+    """
+    Return a BSN which passes the elfproef, based on ``number``.
+    """
+    while True:
+        digits = [int(digit) for digit in f"{number:08d}"[-8:]]
+        check = sum(digit * (9 - index) for index, digit in enumerate(digits)) % 11
+        if check < 10:
+            return "".join(map(str, digits)) + str(check)
+        number += 1
+
+
+def generate_klant(base_url: str, number: int) -> dict:
+    return {
+        "url": f"{base_url}{KLANTEN_PATH}/{number}",
+        "voornaam": "Willy",
+        "voorvoegselAchternaam": "",
+        "achternaam": f"Wever {number}",
+        "emailadres": f"klant{number}@example.com",
+        "telefoonnummer": "",
+        "subject": "",
+        "subjectType": "natuurlijk_persoon",
+        "subjectIdentificatie": {
+            "inpBsn": generate_bsn(10_000_000 + number * 12),
+            "voorletters": "W",
+        },
+    }
 
 
 class JSONServer(BaseHTTPRequestHandler):
+    # the number of klanten in the list of klanten and the size of a page
+    klanten = 0
+    page_size = 100
+
     def do_GET(self) -> None:
         self.send_response(200)
         self.send_header("Content-type", "application/json")
         self.end_headers()
 
-        data = {
+        url = urlparse(self.path)
+        if url.path == KLANTEN_PATH:
+            data = self.get_klanten(int(parse_qs(url.query).get("page", ["1"])[0]))
+        else:
+            data = self.get_subject()
+
+        json_data = json.dumps(data)
+
+        self.wfile.write(json_data.encode("utf-8"))
+
+    def get_klanten(self, page: int) -> dict:
+        base_url = f"http://{self.headers['Host']}"
+
+        start = (page - 1) * self.page_size
+        end = min(start + self.page_size, self.klanten)
+
+        return {
+            "count": self.klanten,
+            "next": (
+                f"{base_url}{KLANTEN_PATH}?page={page + 1}"
+                if end < self.klanten
+                else None
+            ),
+            "previous": None,
+            "results": [
+                generate_klant(base_url, number) for number in range(start, end)
+            ],
+        }
+
+    def get_subject(self) -> dict:
+        return {
             "inpBsn": "024325818",
             "anpIdentificatie": "107",
             "inpANummer": "",
@@ -22,11 +89,23 @@ class JSONServer(BaseHTTPRequestHandler):
             "subVerblijfBuitenland": None,
         }
 
-        json_data = json.dumps(data)
-
-        self.wfile.write(json_data.encode("utf-8"))
+    def log_message(self, format, *args) -> None:
+        pass
 
 
 if __name__ == "__main__":
-    server = HTTPServer(("localhost", 8010), JSONServer)
+    parser = argparse.ArgumentParser(
+        description="Serve subjects and a list of generated klanten of Open Klant 1.0"
+    )
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument(
+        "--klanten", type=int, default=0, help="Number of klanten to serve"
+    )
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    JSONServer.klanten = args.klanten
+    JSONServer.page_size = args.page_size
+
+    server = ThreadingHTTPServer(("localhost", args.port), JSONServer)
     server.serve_forever()
@@ -99,6 +99,7 @@ class Vestiging(Subject):  # SoortPartij.organisatie
 
 @dataclass
 class Klant:
+    url: Optional[str] = None
     subject: Optional[str] = None
     subject_identificatie: Optional[dict] = None
     subject_type: Optional[str] = None
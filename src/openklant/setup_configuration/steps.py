@@ -6,6 +6,7 @@ from django_setup_configuration.configuration import BaseConfigurationStep
 from django_setup_configuration.exceptions import ConfigurationRunFailed
 from zgw_consumers.models import Service
 
+from openklant.components.token.cache import clear_token_cache
 from openklant.components.token.models import TokenAuth
 from openklant.config.models import ReferentielijstenConfig
 from openklant.setup_configuration.models import TokenAuthGroupConfigurationModel
@@ -88,6 +89,9 @@ class TokenAuthConfigurationStep(
 
             logger.info("token_configuration_success", token_identifier=item.identifier)
 
+        # the tokens are saved with signals, but make sure no outdated token is used
+        clear_token_cache(*(item.token for item in model.items))
+
 
 class ReferentielijstenConfigurationStep(
     BaseConfigurationStep[ReferentielijstenConfigurationModel]
@@ -1,13 +1,16 @@
 from pathlib import Path
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from django_setup_configuration.exceptions import (
     ConfigurationRunFailed,
     PrerequisiteFailed,
 )
 from django_setup_configuration.test_utils import execute_single_step
+from rest_framework.exceptions import AuthenticationFailed
 
+from openklant.components.token.authentication import TokenAuthentication
+from openklant.components.token.cache import clear_token_cache
 from openklant.components.token.models import TokenAuth
 from openklant.components.token.tests.factories.token import TokenAuthFactory
 from openklant.setup_configuration.steps import TokenAuthConfigurationStep
@@ -101,6 +104,34 @@ class TokenAuthConfigurationStepTests(TestCase):
         self.assertEqual(third_token.application, "")
         self.assertEqual(third_token.administration, "")
 
+    @override_settings(TOKEN_CACHE_TIMEOUT=60)
+    def test_replaced_token_is_removed_from_cache(self):
+        self.addCleanup(clear_token_cache)
+        TokenAuthFactory(
+            identifier="token-1",
+            token="ba9d233e95e04c4a8a661a27daffe7c9bd019067",
+            contact_person="Person 4",
+            email="person-4@example.com",
+        )
+        authentication = TokenAuthentication()
+        authentication.authenticate_credentials(
+            "ba9d233e95e04c4a8a661a27daffe7c9bd019067"
+        )
+
+        test_file_path = str(TEST_FILES / "token_existing_tokens.yaml")
+
+        execute_single_step(TokenAuthConfigurationStep, yaml_source=test_file_path)
+
+        with self.assertRaises(AuthenticationFailed):
+            authentication.authenticate_credentials(
+                "ba9d233e95e04c4a8a661a27daffe7c9bd019067"
+            )
+
+        _, token = authentication.authenticate_credentials(
+            "18b2b74ef994314b84021d47b9422e82b685d82f"
+        )
+        self.assertEqual(token.identifier, "token-1")
+
     def test_with_all_fields(self):
         TokenAuthFactory(
             identifier="token-1",
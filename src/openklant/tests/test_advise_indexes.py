@@ -0,0 +1,86 @@
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from openklant.management.commands.advise_indexes import FullScan, suggest_indexes
+
+
+class AdviseIndexesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the planner can't tell a full index scan from an index condition on a table
+        # which was analyzed while empty, truncating resets the statistics (and is
+        # rolled back with the test)
+        tables = [
+            model._meta.db_table
+            for model in apps.get_app_config("klantinteracties").get_models()
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {', '.join(tables)} CASCADE")
+
+    def call_command(self, *args) -> str:
+        stdout = StringIO()
+        call_command("advise_indexes", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_report(self):
+        output = self.call_command("--component", "klantinteracties", "-v", "2")
+
+        self.assertIn("klantinteracties:partij-list (PartijFilterSet)", output)
+        # filters of which the columns aren't indexed
+        self.assertIn("  soort_partij=persoon\n", output)
+        self.assertIn(
+            "CREATE INDEX CONCURRENTLY ON klantinteracties_partij (soort_partij);",
+            output,
+        )
+        # filters of which the columns are indexed
+        self.assertIn("  partij_identificator__object_id: index\n", output)
+        self.assertIn("  bezoekadres_nummeraanduiding_id: index\n", output)
+        self.assertIn("  onderwerpobjectidentificator_object_id: index\n", output)
+        self.assertIn("filters can't use an index.", output)
+
+    def test_suggest_indexes(self):
+        suggestions = suggest_indexes(
+            FullScan(
+                table="klantinteracties_actor",
+                condition="(upper((naam)::text) ~~ '%VOORBEELD%'::text)",
+            )
+        )
+
+        self.assertEqual(
+            suggestions,
+            [
+                "CREATE INDEX CONCURRENTLY ON klantinteracties_actor "
+                "USING gin (UPPER(naam) gin_trgm_ops);"
+            ],
+        )
+
+    def test_suggest_indexes_multiple_columns(self):
+        suggestions = suggest_indexes(
+            FullScan(
+                table="klantinteracties_klantcontact",
+                condition=(
+                    "((upper((onderwerp)::text) ~~ '%VRAAG%'::text) AND "
+                    "(upper(inhoud) ~~ '%VRAAG%'::text) AND "
+                    "((kanaal)::text = 'email'::text))"
+                ),
+            )
+        )
+
+        self.assertEqual(
+            suggestions,
+            [
+                "CREATE INDEX CONCURRENTLY ON klantinteracties_klantcontact "
+                "USING gin (UPPER(onderwerp) gin_trgm_ops);",
+                "CREATE INDEX CONCURRENTLY ON klantinteracties_klantcontact "
+                "USING gin (UPPER(inhoud) gin_trgm_ops);",
+                "CREATE INDEX CONCURRENTLY ON klantinteracties_klantcontact (kanaal);",
+            ],
+        )
+
+    def test_suggest_indexes_unknown_table(self):
+        self.assertEqual(suggest_indexes(FullScan(table="unknown", condition="")), [])
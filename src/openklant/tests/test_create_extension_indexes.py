@@ -0,0 +1,46 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+INDEX_NAME = "klantcontact_onderwerp_trgm"
+
+
+class CreateExtensionIndexesTests(TransactionTestCase):
+    def get_index_names(self) -> set[str]:
+        with connection.cursor() as cursor:
+            return set(
+                connection.introspection.get_constraints(
+                    cursor, "klantinteracties_klantcontact"
+                )
+            )
+
+    def extension_is_available(self) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+            )
+            return cursor.fetchone() is not None
+
+    def call_command(self) -> str:
+        stdout = StringIO()
+        call_command("create_extension_indexes", stdout=stdout)
+        return stdout.getvalue()
+
+    def test_skipped_indexes_are_created(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+        output = self.call_command()
+        # running the command again doesn't change anything
+        repeated_output = self.call_command()
+
+        if self.extension_is_available():
+            self.assertIn(f"{INDEX_NAME}: created", output)
+            self.assertIn(f"{INDEX_NAME}: exists", repeated_output)
+            self.assertIn(INDEX_NAME, self.get_index_names())
+        else:
+            self.assertIn(f"{INDEX_NAME}: skipped", output)
+            self.assertIn(f"{INDEX_NAME}: skipped", repeated_output)
+            self.assertNotIn(INDEX_NAME, self.get_index_names())
@@ -1,6 +1,11 @@
+import json
 import os
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
 from io import StringIO
 from pathlib import Path
+from typing import Tuple
 from unittest.mock import patch
 
 from django.conf import settings
@@ -34,6 +39,9 @@ from openklant.components.klantinteracties.models.tests.factories import (
     PartijFactory,
 )
 from openklant.components.token.models import TokenAuth
+from openklant.management.commands import migrate_to_v2
+from openklant.migration.checkpoint import Checkpoint
+from openklant.migration.test_server import KLANTEN_PATH, JSONServer
 from openklant.migration.utils import generate_jwt_token
 
 LIVE_SERVER_HOST = "localhost"
@@ -791,3 +799,157 @@ class MigrateTestCase(VCRMixin, LiveServerTestCase):
         digitaal_adressen = DigitaalAdres.objects.filter(partij=partij)
 
         self.assertEqual(digitaal_adressen.count(), 0)
+
+
+@patch.object(JSONServer, "page_size", 10)
+@patch.object(JSONServer, "klanten", 25)
+class ConcurrentMigrateTestCase(LiveServerTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.v1_server = ThreadingHTTPServer(("localhost", 0), JSONServer)
+        threading.Thread(target=self.v1_server.serve_forever, daemon=True).start()
+        self.addCleanup(self.v1_server.server_close)
+        self.addCleanup(self.v1_server.shutdown)
+        self.v1_url = "http://localhost:{}".format(self.v1_server.server_address[1])
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.checkpoint = Path(tempdir.name) / "migration.checkpoint"
+
+        patcher = patch.dict(
+            os.environ, {"ACCESS_TOKEN": generate_jwt_token("migration", "foobar")}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_partij_url(self, partij) -> str:
+        return self.live_server_url + reverse(
+            "klantinteracties:partij-detail",
+            kwargs={"uuid": str(partij.uuid)},
+        )
+
+    def _migrate(self, *args: str) -> Tuple[list[str], str]:
+        stdout = StringIO()
+        stderr = StringIO()
+
+        call_command(
+            "migrate_to_v2",
+            self.v1_url,
+            self.live_server_url,
+            "--workers=4",
+            *args,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        return stdout.getvalue().splitlines(), stderr.getvalue()
+
+    def test_concurrent_run(self):
+        output, report = self._migrate()
+
+        partijen = Partij.objects.order_by("nummer")
+
+        self.assertEqual(partijen.count(), 25)
+        self.assertEqual(DigitaalAdres.objects.count(), 25)
+        self.assertCountEqual(
+            output,
+            [self._get_partij_url(partij) for partij in partijen],
+        )
+        self.assertIn("Migrated 25 klanten from 3 pages", report)
+        self.assertFalse(TokenAuth.objects.exists())
+
+    def test_checkpoint(self):
+        output, _report = self._migrate("--checkpoint", str(self.checkpoint))
+
+        with self.checkpoint.open() as file:
+            entries = [json.loads(line) for line in file]
+
+        self.assertEqual(entries[0], {"v1_url": self.v1_url})
+        self.assertEqual(
+            [entry["next"] for entry in entries if "next" in entry],
+            [
+                f"{self.v1_url}{KLANTEN_PATH}?page=2",
+                f"{self.v1_url}{KLANTEN_PATH}?page=3",
+                None,
+            ],
+        )
+        self.assertCountEqual(
+            [entry["partij"] for entry in entries if "klant" in entry], output
+        )
+
+    def test_resume_from_checkpoint(self):
+        migrated = PartijFactory.create_batch(11)
+        with self.checkpoint.open("w") as file:
+            file.write(json.dumps({"v1_url": self.v1_url}) + "\n")
+            for number, partij in enumerate(migrated):
+                entry = {
+                    "klant": f"{self.v1_url}{KLANTEN_PATH}/{number}",
+                    "partij": self._get_partij_url(partij),
+                }
+                file.write(json.dumps(entry) + "\n")
+                if number == 9:
+                    next_url = f"{self.v1_url}{KLANTEN_PATH}?page=2"
+                    file.write(json.dumps({"next": next_url}) + "\n")
+            # interrupted while writing
+            file.write('{"klant": ')
+
+        output, report = self._migrate("--checkpoint", str(self.checkpoint))
+
+        self.assertEqual(Partij.objects.count(), 25)
+        self.assertEqual(len(output), 14)
+        self.assertIn("Migrated 14 klanten from 2 pages", report)
+
+        # the klanten after the incomplete line are recorded as well
+        checkpoint = Checkpoint(self.v1_url, self.checkpoint)
+        self.assertCountEqual(
+            checkpoint.migrated.values(),
+            [self._get_partij_url(partij) for partij in Partij.objects.all()],
+        )
+
+        # the migration is completed
+        output, report = self._migrate("--checkpoint", str(self.checkpoint))
+
+        self.assertEqual(output, [])
+        self.assertEqual(Partij.objects.count(), 25)
+        self.assertIn("completed already", report)
+
+    def test_interrupted(self):
+        save_klant = migrate_to_v2._save_klant
+
+        def interrupted_save_klant(client, klant):
+            if klant.url.endswith(f"{KLANTEN_PATH}/14"):
+                raise RuntimeError("interrupted")
+            return save_klant(client, klant)
+
+        with (
+            patch.object(migrate_to_v2, "_save_klant", interrupted_save_klant),
+            self.assertRaises(RuntimeError),
+        ):
+            self._migrate("--checkpoint", str(self.checkpoint))
+
+        # the klanten which were saved are recorded, including the ones which were
+        # still being saved when the migration was interrupted
+        checkpoint = Checkpoint(self.v1_url, self.checkpoint)
+        self.assertCountEqual(
+            checkpoint.migrated.values(),
+            [self._get_partij_url(partij) for partij in Partij.objects.all()],
+        )
+
+        output, _report = self._migrate("--checkpoint", str(self.checkpoint))
+
+        self.assertEqual(Partij.objects.count(), 25)
+        self.assertEqual(len(checkpoint.migrated) + len(output), 25)
+
+    def test_checkpoint_of_other_migration(self):
+        with self.checkpoint.open("w") as file:
+            file.write(json.dumps({"v1_url": "http://localhost:8000"}) + "\n")
+
+        with self.assertRaises(CommandError):
+            self._migrate("--checkpoint", str(self.checkpoint))
+
+        self.assertEqual(Partij.objects.count(), 0)
+
+    def test_invalid_number_of_workers(self):
+        with self.assertRaises(CommandError):
+            self._migrate("--workers=0")
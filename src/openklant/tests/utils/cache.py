@@ -1,5 +1,7 @@
 from django.core.cache import caches
 
+from openklant.config.kanalen import kanalen_index
+
 
 class ClearCachesMixin:
     def setUp(self):
@@ -10,3 +12,4 @@ class ClearCachesMixin:
     def _clear_caches(self):
         for cache in caches.all():
             cache.clear()
+        kanalen_index.clear()
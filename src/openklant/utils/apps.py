@@ -5,4 +5,5 @@ class UtilsConfig(AppConfig):
     name = "openklant.utils"
 
     def ready(self):
+        from . import metrics  # noqa
         from . import query  # noqa
@@ -0,0 +1,91 @@
+"""
+Identity map of the objects which are looked up by their UUID during a request.
+
+The validators of the references in the API (like ``partij_exists``) resolve the
+referenced objects, after which ``create`` and ``update`` of the serializers reuse them
+instead of querying them again. The references in a list (like the digitale adressen
+of a partij) are looked up with a single query by ``prefetch_objects``. The identity
+map is set up for each request by the ``IdentityMapMiddleware``, outside of a request
+the objects are simply queried.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional, Type, TypeVar
+from uuid import UUID
+
+from django.db.models import Model
+
+M = TypeVar("M", bound=Model)
+
+IdentityMap = Dict[Type[Model], Dict[UUID, Optional[Model]]]
+
+# the objects of the current request per model and UUID, `None` for the UUIDs of
+# objects which don't exist
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "identity_map", default=None
+)
+
+
+@contextmanager
+def identity_map() -> Iterator[None]:
+    token = _identity_map.set(defaultdict(dict))
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def prefetch_objects(model: Type[Model], uuids: Iterable[UUID | str]) -> None:
+    """
+    Look up the objects with the given UUIDs which aren't in the identity map yet with
+    a single query. Invalid UUIDs are skipped, they are rejected by the validation.
+    """
+    objects = _identity_map.get()
+    if objects is None:
+        return
+
+    missing = set()
+    for uuid in uuids:
+        try:
+            uuid = UUID(str(uuid))
+        except ValueError:
+            continue
+
+        if uuid not in objects[model]:
+            missing.add(uuid)
+
+    if not missing:
+        return
+
+    found = {obj.uuid: obj for obj in model._default_manager.filter(uuid__in=missing)}
+    for uuid in missing:
+        objects[model][uuid] = found.get(uuid)
+
+
+def get_object(model: Type[M], uuid: UUID | str) -> M:
+    """
+    Return the object with the given UUID, from the identity map if it was looked up
+    before during the request.
+
+    :raises model.DoesNotExist: if the object doesn't exist.
+    """
+    try:
+        uuid = UUID(str(uuid))
+    except ValueError:
+        raise model.DoesNotExist(f"{uuid!r} is not a valid UUID.")
+
+    objects = _identity_map.get()
+    if objects is None:
+        return model._default_manager.get(uuid=uuid)
+
+    if uuid not in objects[model]:
+        objects[model][uuid] = model._default_manager.filter(uuid=uuid).first()
+
+    if (obj := objects[model][uuid]) is None:
+        raise model.DoesNotExist(
+            f"{model._meta.object_name} matching query does not exist."
+        )
+
+    return obj
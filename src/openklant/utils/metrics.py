@@ -0,0 +1,65 @@
+from collections.abc import Collection
+
+from django.db.models import Count
+
+from opentelemetry import metrics
+
+from .models import OutboxNotification
+
+meter = metrics.get_meter("openklant.utils")
+
+
+def count_outbox_notifications(
+    options: metrics.CallbackOptions,
+) -> Collection[metrics.Observation]:
+    counts = OutboxNotification.objects.values_list("type").annotate(count=Count("id"))
+    return tuple(
+        metrics.Observation(count, {"scope": "global", "type": type})
+        for type, count in counts.order_by()
+    )
+
+
+meter.create_observable_gauge(
+    name="openklant.notifications.outbox_size",
+    description="The number of notifications and cloud events in the outbox.",
+    unit=r"{notification}",
+    callbacks=[count_outbox_notifications],
+)
+
+outbox_delivery_lag_histogram = meter.create_histogram(
+    "openklant.notifications.outbox_delivery_lag",
+    description="Time between storing a notification in the outbox and sending it.",
+    unit="s",
+)
+outbox_coalesced_counter = meter.create_counter(
+    "openklant.notifications.outbox_coalesced",
+    description="Amount of cloud events in the outbox that cancelled each other out.",
+    unit="1",
+)
+
+# API requests, per route and action
+api_request_duration_histogram = meter.create_histogram(
+    "openklant.api.request.duration",
+    description="Duration of the requests on the API.",
+    unit="s",
+)
+api_db_queries_histogram = meter.create_histogram(
+    "openklant.api.db.queries",
+    description="Number of database queries of a request on the API.",
+    unit=r"{query}",
+)
+api_db_duration_histogram = meter.create_histogram(
+    "openklant.api.db.duration",
+    description="Total duration of the database queries of a request on the API.",
+    unit="s",
+)
+api_response_size_histogram = meter.create_histogram(
+    "openklant.api.response.size",
+    description="Size of the (non-streaming) response body of a request on the API.",
+    unit="By",
+)
+api_expand_depth_histogram = meter.create_histogram(
+    "openklant.api.expand.depth",
+    description="Deepest level of the resources expanded by a request on the API.",
+    unit=r"{level}",
+)
@@ -1,14 +1,35 @@
+import time
+from contextlib import ExitStack
 from typing import Dict, Optional
 
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
 
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
+from rest_framework.views import APIView
 from vng_api_common.middleware import (
     VERSION_HEADER,
     APIVersionHeaderMiddleware as _APIVersionHeaderMiddleware,
 )
 
+from .identity_map import identity_map
+from .metrics import (
+    api_db_duration_histogram,
+    api_db_queries_histogram,
+    api_expand_depth_histogram,
+    api_request_duration_histogram,
+    api_response_size_histogram,
+)
+from .replicas import (
+    is_pinned_to_primary,
+    pin_to_primary,
+    request_replica,
+    select_replica,
+)
+
 
 def get_version_mapping() -> Dict[str, str]:
     apis = (
@@ -53,3 +74,138 @@ class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
             if path.startswith(prefix):
                 return version
         return None
+
+
+class ReplicaMiddleware:
+    """
+    Read from a replica of the database for ``GET`` and ``HEAD`` requests on the API
+    views (see ``ReplicaRouter``).
+
+    After an unsafe request, the reads of the same client go to the primary database
+    for ``DB_REPLICA_PINNING_WINDOW`` seconds, so the client reads its own writes.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = request_replica.set(None)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_replica.reset(token)
+
+        if request.method not in SAFE_METHODS:
+            pin_to_primary(request)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None)
+        if (
+            request.method in ("GET", "HEAD")
+            and view_class is not None
+            and issubclass(view_class, APIView)
+            and not is_pinned_to_primary(request)
+        ):
+            request_replica.set(select_replica())
+
+
+class IdentityMapMiddleware:
+    """
+    Share the objects which are looked up by their UUID between the validators and
+    the serializers during a request (see ``identity_map``).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map():
+            return self.get_response(request)
+
+
+class QueryMetrics:
+    """
+    Database ``execute_wrapper`` which counts the queries and their total duration.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+def get_expand_depth(expand: str) -> int:
+    return max((len(path.split(".")) for path in expand.split(",") if path), default=0)
+
+
+class APIMetricsMiddleware:
+    """
+    Record the duration, the number of queries and their total duration, the size of
+    the response and the ``expand`` depth of the requests on the API views.
+
+    The measurements are attributed to the name of the URL (not the path) and the
+    action of the viewset, so the number of distinct attributes stays small.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryMetrics()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(queries))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        # set by `process_view` for the API views
+        attributes = getattr(request, "_metrics_attributes", None)
+        if attributes is None:
+            return response
+
+        attributes = {**attributes, "http.response.status_code": response.status_code}
+        api_request_duration_histogram.record(duration, attributes=attributes)
+        api_db_queries_histogram.record(queries.count, attributes=attributes)
+        api_db_duration_histogram.record(queries.duration, attributes=attributes)
+        if not response.streaming:
+            api_response_size_histogram.record(
+                len(response.content), attributes=attributes
+            )
+
+        expand_param = getattr(request, "_metrics_expand_param", None)
+        if expand_param is not None:
+            api_expand_depth_histogram.record(
+                get_expand_depth(",".join(request.GET.getlist(expand_param))),
+                attributes=attributes,
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None or not issubclass(view_class, APIView):
+            return
+
+        # the mapping of the HTTP methods to the actions of a viewset, a HEAD request
+        # is handled by the action of GET
+        actions = getattr(view_func, "actions", None) or {}
+        method = request.method.lower()
+        request._metrics_attributes = {
+            "view": request.resolver_match.view_name,
+            "http.request.method": request.method,
+            "action": actions.get("get" if method == "head" else method, method),
+        }
+        request._metrics_expand_param = getattr(view_class, "expand_param", None)
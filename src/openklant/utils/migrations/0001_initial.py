@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-10-18 13:57
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxNotification',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='message')),
+                ('type', models.CharField(choices=[('notification', 'Notification'), ('cloudevent', 'Cloudevent')], default='notification', max_length=20, verbose_name='type')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+            ],
+            options={
+                'verbose_name': 'outbox notification',
+                'verbose_name_plural': 'outbox notifications',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-10-18 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utils', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxnotification',
+            name='claimed',
+            field=models.DateTimeField(blank=True, help_text='When the notification was claimed to be sent. A claim which is older than NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT expired.', null=True, verbose_name='claimed'),
+        ),
+    ]
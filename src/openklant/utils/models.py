@@ -0,0 +1,39 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from notifications_api_common.models import NotificationTypes
+
+
+class OutboxNotification(models.Model):
+    """
+    A notification which is not sent yet.
+
+    The notifications are stored in the same transaction as the API operation that
+    triggers them, and sent in batches by the ``send_outbox_notifications`` task.
+    """
+
+    message = models.JSONField(_("message"), encoder=DjangoJSONEncoder)
+    type = models.CharField(
+        _("type"),
+        max_length=20,
+        choices=NotificationTypes,
+        default=NotificationTypes.notification,
+    )
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+    claimed = models.DateTimeField(
+        _("claimed"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "When the notification was claimed to be sent. A claim which is older "
+            "than NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT expired."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("outbox notification")
+        verbose_name_plural = _("outbox notifications")
+
+    def __str__(self):
+        return f"{self.type} {self.pk}"
@@ -1,13 +1,99 @@
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
+from django.conf import settings
 from django.db import models, transaction
 
+import structlog
+from notifications_api_common.cloudevents import (
+    construct_cloudevent,
+    process_cloudevent,
+)
 from notifications_api_common.models import NotificationTypes
+from notifications_api_common.settings import get_setting
 from notifications_api_common.tasks import create_failed_notification, send_notification
-from notifications_api_common.viewsets import NotificationCreateMixin, NotificationMixin
+from notifications_api_common.viewsets import (
+    NotificationCreateMixin,
+    NotificationMixin,
+    NotificationViewSetMixin as _NotificationViewSetMixin,
+)
 
+from .models import OutboxNotification
 
-class MultipleNotificationMixin(NotificationMixin):
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def add_to_outbox(
+    messages: List[dict], type: NotificationTypes = NotificationTypes.notification
+) -> None:
+    """
+    Store the messages in the outbox, in the current transaction.
+    """
+    OutboxNotification.objects.bulk_create(
+        OutboxNotification(message=message, type=type) for message in messages
+    )
+
+
+def schedule_cloudevent(
+    event_type: str, subject: str | None = None, data: dict | None = None
+) -> None:
+    """
+    Store the cloud event in the outbox if ``NOTIFICATIONS_OUTBOX_ENABLED`` is set,
+    otherwise schedule it once the current transaction is committed.
+    """
+    if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+        transaction.on_commit(
+            lambda: process_cloudevent(event_type, subject=subject, data=data)
+        )
+        return
+
+    if not get_setting("NOTIFICATIONS_SOURCE"):
+        logger.warning("no_notification_source_set")
+        return
+
+    add_to_outbox(
+        [construct_cloudevent(event_type, subject=subject, data=data)],
+        NotificationTypes.cloudevent,
+    )
+
+
+def schedule_notifications(messages: List[dict]) -> None:
+    """
+    Store the notifications in the outbox if ``NOTIFICATIONS_OUTBOX_ENABLED`` is set,
+    otherwise schedule a task per notification once the current transaction is
+    committed.
+    """
+    if settings.NOTIFICATIONS_OUTBOX_ENABLED:
+        add_to_outbox(messages)
+        return
+
+    for message in messages:
+        pk = create_failed_notification(message, NotificationTypes.notification)
+
+        transaction.on_commit(
+            lambda msg=message, notification_id=pk: send_notification.delay(
+                msg, notification_id
+            )
+        )
+
+
+class OutboxNotificationMixin(NotificationMixin):
+    """
+    NotificationMixin that stores the notification in the outbox instead of
+    scheduling a task, if ``NOTIFICATIONS_OUTBOX_ENABLED`` is set.
+    """
+
+    def _message(self, data, instance=None):
+        if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+            return super()._message(data, instance=instance)
+
+        add_to_outbox([self.construct_message(data, instance=instance)])
+
+
+class NotificationViewSetMixin(OutboxNotificationMixin, _NotificationViewSetMixin):
+    pass
+
+
+class MultipleNotificationMixin(OutboxNotificationMixin):
     """
     NotificationMixin that adds support for sending notification per object in convenience endpoints.
     """
@@ -23,28 +109,82 @@ class MultipleNotificationMixin(NotificationMixin):
     ) -> None:
         super().notify(status_code, data, instance)
 
-    def _message(self, data, instance=None):
+    def notify_batch(
+        self,
+        status_code: int,
+        objects: List[Tuple[dict, Dict[str, models.Model]]],
+    ) -> None:
+        """
+        Send the notifications of the ``(data, instances)`` of every object of a batch,
+        which are stored or scheduled at once. The instances are the created objects
+        per notification field, so they don't have to be looked up again.
+        """
+        self.notify(status_code, objects)
+
+    def construct_messages(
+        self, data: dict, instances: Dict[str, models.Model | None]
+    ) -> List[dict]:
+        messages = []
         for field, config in self.notification_fields.items():
             field_data = data[field]
             notifications = field_data if isinstance(field_data, list) else [field_data]
 
             for notif in notifications:
                 # build the content of the notification
-                message = self.construct_message(
-                    notif,
-                    instance=instance,
-                    kanaal=config["notifications_kanaal"],
-                    model=config["model"],
-                    action=config.get("action"),
+                messages.append(
+                    self.construct_message(
+                        notif,
+                        instance=instances.get(field),
+                        kanaal=config["notifications_kanaal"],
+                        model=config["model"],
+                        action=config.get("action"),
+                    )
                 )
+        return messages
 
-                pk = create_failed_notification(message, NotificationTypes.notification)
+    def _message(self, data, instance=None):
+        if not isinstance(data, list):
+            instances = dict.fromkeys(self.notification_fields, instance)
+            schedule_notifications(self.construct_messages(data, instances))
+            return
 
-                transaction.on_commit(
-                    lambda msg=message, notification_id=pk: send_notification.delay(
-                        msg, notification_id
-                    )
+        schedule_notifications(
+            [
+                message
+                for object_data, instances in data
+                for message in self.construct_messages(object_data, instances)
+            ]
+        )
+
+
+class BulkNotificationMixin(OutboxNotificationMixin):
+    """
+    NotificationMixin that adds support for sending a notification per object of a
+    bulk operation, which are stored or scheduled at once.
+    """
+
+    def notify_bulk(
+        self,
+        status_code: int,
+        objects: List[Tuple[dict, models.Model, str]],
+    ) -> None:
+        """
+        Send the notifications of the ``(data, instance, action)`` of every object.
+        """
+        self.notify(status_code, objects)
+
+    def _message(self, data, instance=None):
+        if not isinstance(data, list):
+            return super()._message(data, instance=instance)
+
+        schedule_notifications(
+            [
+                self.construct_message(
+                    object_data, instance=object_instance, action=action
                 )
+                for object_data, object_instance, action in data
+            ]
+        )
 
 
 class MultipleNotificationCreateMixin(
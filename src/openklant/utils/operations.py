@@ -0,0 +1,114 @@
+"""
+Migration operations for database objects which depend on an optional PostgreSQL
+extension.
+
+Not every database server ships the contrib extensions (or allows installing them),
+so these operations skip the extension and the indexes that depend on it instead of
+failing the migration. The features using these indexes keep working, only slower.
+"""
+
+from django.contrib.postgres.operations import AddIndexConcurrently, CreateExtension
+from django.db import models
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def extension_is_available(schema_editor, name: str) -> bool:
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def extension_is_installed(schema_editor, name: str) -> bool:
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def get_index_validity(schema_editor, name: str) -> bool | None:
+    """
+    Return whether the index is valid, or ``None`` if it doesn't exist. A concurrent
+    index build which failed leaves an invalid index behind.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indisvalid FROM pg_index JOIN pg_class ON pg_class.oid = indexrelid "
+            "WHERE relname = %s",
+            [name],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def create_index_if_not_exists(
+    schema_editor, model: type[models.Model], index: models.Index
+) -> bool:
+    """
+    Create the index concurrently, unless it exists already. Returns whether the index
+    was created. Must be called outside a transaction.
+    """
+    validity = get_index_validity(schema_editor, index.name)
+    if validity:
+        return False
+    if validity is False:
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(index.name)}"
+        )
+
+    sql = str(index.create_sql(model, schema_editor, concurrently=True))
+    schema_editor.execute(
+        sql.replace(
+            "CREATE INDEX CONCURRENTLY", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1
+        ),
+        params=None,
+    )
+    return True
+
+
+class CreateExtensionIfAvailable(CreateExtension):
+    """
+    Install the extension, if it is available on the database server.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+
+        if not extension_is_available(schema_editor, self.name):
+            logger.warning("database_extension_not_available", extension=self.name)
+            return
+
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"Creates extension {self.name} if available"
+
+
+class AddExtensionIndexConcurrently(AddIndexConcurrently):
+    """
+    Create an index which requires the ``extension``, if the extension is installed.
+
+    The index is always added to the migration state, so the models can declare it.
+    """
+
+    def __init__(self, model_name, index, extension):
+        self.extension = extension
+        super().__init__(model_name, index)
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        kwargs["extension"] = self.extension
+        return name, args, kwargs
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not extension_is_installed(schema_editor, self.extension):
+            logger.warning(
+                "database_index_skipped",
+                index=self.index.name,
+                extension=self.extension,
+            )
+            return
+
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,147 @@
+"""
+Routing of the reads of API requests to read replicas of the database.
+
+The ``ReplicaMiddleware`` selects a replica for ``GET`` and ``HEAD`` requests on the API
+views, unless the client wrote something within the pinning window. The
+``ReplicaRouter`` sends the reads of these requests to the selected replica, and
+everything else (writes, and reads in a transaction) to the primary database.
+Replicas which lag too far behind or can't be reached are skipped.
+"""
+
+import hashlib
+import random
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# whether the replica receives changes from the primary, and the number of seconds it is
+# behind: `0` if all received changes are replayed (and the replica is idle) and `NULL`
+# if nothing was replayed yet. A replica of which the WAL receiver is disconnected
+# replays everything it received, so its lag is only meaningful while it is streaming
+# (the status is visible to superusers and members of `pg_read_all_stats`).
+LAG_QUERY = """
+    SELECT
+        NOT pg_is_in_recovery() OR EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+        ),
+        CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+"""
+
+PINNING_CACHE_PREFIX = "replica-pinning"
+
+# the replica selected for the current request, set by the `ReplicaMiddleware`
+request_replica: ContextVar[Optional[str]] = ContextVar("request_replica", default=None)
+
+# the lags of the replicas checked by this process: alias -> (checked at, lag)
+_replica_lags: Dict[str, Tuple[float, Optional[float]]] = {}
+
+
+def get_replica_lag(alias: str) -> Optional[float]:
+    """
+    Return the number of seconds the replica lags behind, or ``None`` if it can't be
+    reached or doesn't receive changes from the primary. The lag is checked at most once per ``DB_REPLICA_LAG_CHECK_INTERVAL``.
+    """
+    now = time.monotonic()
+    if alias in _replica_lags:
+        checked_at, lag = _replica_lags[alias]
+        if now - checked_at < settings.DB_REPLICA_LAG_CHECK_INTERVAL:
+            return lag
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_QUERY)
+            streaming, lag = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("replica_unavailable", alias=alias, exc_info=True)
+        lag = None
+    else:
+        if not streaming:
+            logger.warning("replica_not_streaming", alias=alias)
+            lag = None
+
+    if lag is not None:
+        lag = float(lag)
+    _replica_lags[alias] = (now, lag)
+    return lag
+
+
+def select_replica() -> Optional[str]:
+    """
+    Return a random replica which is within the ``DB_REPLICA_MAX_LAG``, or ``None`` if
+    there is none.
+    """
+    replicas = []
+    for alias in settings.DATABASE_REPLICAS:
+        lag = get_replica_lag(alias)
+        if lag is not None and lag <= settings.DB_REPLICA_MAX_LAG:
+            replicas.append(alias)
+        else:
+            logger.debug("replica_skipped", alias=alias, lag=lag)
+
+    return random.choice(replicas) if replicas else None
+
+
+def get_pinning_key(request: HttpRequest) -> Optional[str]:
+    # API clients are identified by their token, they don't have a session
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return None
+
+    digest = hashlib.sha256(authorization.encode()).hexdigest()
+    return f"{PINNING_CACHE_PREFIX}:{digest}"
+
+
+def pin_to_primary(request: HttpRequest) -> None:
+    """
+    Send the reads of the client to the primary database during the pinning window,
+    so the client reads its own writes.
+    """
+    if settings.DB_REPLICA_PINNING_WINDOW and (key := get_pinning_key(request)):
+        cache.set(key, True, timeout=settings.DB_REPLICA_PINNING_WINDOW)
+
+
+def is_pinned_to_primary(request: HttpRequest) -> bool:
+    key = get_pinning_key(request)
+    return key is not None and cache.get(key, False)
+
+
+class ReplicaRouter:
+    """
+    Send the reads of the requests for which a replica was selected by the
+    ``ReplicaMiddleware`` to the replica, unless they are part of a transaction.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        replica = request_replica.get()
+        if replica is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+
+        return replica
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # the replicas contain the same data as the primary database
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -6,6 +6,8 @@ from django.utils.module_loading import import_string
 from rest_framework.serializers import Serializer
 from rest_framework_nested.serializers import NestedHyperlinkedRelatedField
 
+from .identity_map import get_object
+
 
 # TODO should be moved to vng-api-common once merged/reviewed
 # in Open Zaak: https://github.com/open-zaak/open-zaak/pull/1037
@@ -89,5 +91,5 @@ def get_field_instance_by_uuid(
     """
     field_value = get_field_value(serializer, attrs, field_name)
     if field_value and not isinstance(field_value, model_class):
-        field_value = model_class.objects.get(uuid=field_value["uuid"])
+        field_value = get_object(model_class, field_value["uuid"])
     return field_value
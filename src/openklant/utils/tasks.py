@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import List, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+import requests
+import structlog
+from celery import shared_task
+from notifications_api_common.models import NotificationsConfig, NotificationTypes
+from notifications_api_common.tasks import (
+    create_failed_notification,
+    send_cloudevent,
+    send_notification,
+)
+
+from openklant.cloud_events.constants import ZAAK_GEKOPPELD, ZAAK_ONTKOPPELD
+
+from .metrics import outbox_coalesced_counter, outbox_delivery_lag_histogram
+from .models import OutboxNotification
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# the endpoint, headers and fallback task per type of notification
+DELIVERY = {
+    NotificationTypes.notification: ("notificaties", {}, send_notification),
+    NotificationTypes.cloudevent: (
+        "cloudevents",
+        {"Content-Type": "application/cloudevents+json"},
+        send_cloudevent,
+    ),
+}
+
+
+def get_coalesced(batch: List[Tuple[int, dict, str]]) -> Set[int]:
+    """
+    Return the pks of the cloud events in the batch which cancel each other out.
+
+    A ``zaak-gekoppeld`` event followed by a ``zaak-ontkoppeld`` event for the same
+    zaak and object means the link only existed in between, so neither of them has to
+    be sent.
+    """
+    linked = {}
+    coalesced = set()
+    for pk, message, type in batch:
+        if type != NotificationTypes.cloudevent:
+            continue
+
+        key = (message.get("subject"), (message.get("data") or {}).get("linkTo"))
+        if message.get("type") == ZAAK_GEKOPPELD:
+            linked[key] = pk
+        elif message.get("type") == ZAAK_ONTKOPPELD and key in linked:
+            coalesced.update((linked.pop(key), pk))
+
+    return coalesced
+
+
+def claim_batch() -> List[Tuple[int, dict, str, datetime]]:
+    """
+    Claim the next batch of the outbox, which isn't claimed by another worker (or of
+    which the claim expired).
+    """
+    now = timezone.now()
+    queryset = OutboxNotification.objects.filter(
+        Q(claimed__isnull=True)
+        | Q(
+            claimed__lte=now
+            - timedelta(seconds=settings.NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT)
+        )
+    ).order_by("pk")
+    if window := settings.NOTIFICATIONS_OUTBOX_COALESCE_WINDOW:
+        queryset = queryset.filter(
+            ~Q(type=NotificationTypes.cloudevent)
+            | Q(created__lte=now - timedelta(seconds=window))
+        )
+
+    with transaction.atomic():
+        batch = list(
+            queryset.select_for_update(skip_locked=True).values_list(
+                "pk", "message", "type", "created"
+            )[: settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE]
+        )
+        OutboxNotification.objects.filter(
+            pk__in=[pk for pk, _message, _type, _created in batch]
+        ).update(claimed=now)
+
+    return batch
+
+
+@shared_task
+def send_outbox_notifications() -> None:
+    """
+    Send the notifications in the outbox, in batches of
+    ``NOTIFICATIONS_OUTBOX_BATCH_SIZE``.
+
+    Every batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` in a short
+    transaction, so multiple workers can send the outbox at the same time without
+    sending a notification twice, and the notifications are sent after the claim is
+    committed, so a slow receiver doesn't hold locks. The notifications are deleted
+    once they are sent, the claim of a batch which isn't sent (because the worker
+    crashed) expires after ``NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT``.
+
+    Cloud events are claimed once they are older than
+    ``NOTIFICATIONS_OUTBOX_COALESCE_WINDOW``, so events that cancel each other out
+    can be dropped. Notifications that can't be sent are handed over to the regular
+    notification tasks, which retry them with a backoff and log them.
+    """
+    client = NotificationsConfig.get_client()
+    if client is None:
+        # the outbox isn't sent, which is an error once it contains notifications
+        if outbox_size := OutboxNotification.objects.count():
+            logger.error("notifications_client_unavailable", outbox_size=outbox_size)
+        return
+
+    batch_size = settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE
+    processed = 0
+
+    while True:
+        batch = claim_batch()
+
+        coalesced = get_coalesced(
+            [(pk, message, type) for pk, message, type, _created in batch]
+        )
+        if coalesced:
+            outbox_coalesced_counter.add(len(coalesced))
+
+        for pk, message, type, created in batch:
+            if pk in coalesced:
+                continue
+
+            outbox_delivery_lag_histogram.record(
+                (timezone.now() - created).total_seconds(), {"type": type}
+            )
+            endpoint, headers, task = DELIVERY[type]
+            try:
+                response = client.post(endpoint, json=message, headers=headers)
+                response.raise_for_status()
+            except requests.RequestException as exc:
+                logger.warning(
+                    "outbox_notification_delivery_failed",
+                    notification_msg=message,
+                    exc_info=exc,
+                )
+                task.delay(message, create_failed_notification(message, type))
+
+        OutboxNotification.objects.filter(
+            pk__in=[pk for pk, _message, _type, _created in batch]
+        ).delete()
+
+        processed += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    if processed:
+        logger.info("outbox_notifications_processed", count=processed)
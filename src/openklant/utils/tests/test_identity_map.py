@@ -0,0 +1,61 @@
+import uuid
+
+from django.test import TestCase
+
+from openklant.components.klantinteracties.models import Partij
+from openklant.components.klantinteracties.models.tests.factories import PartijFactory
+from openklant.utils.identity_map import get_object, identity_map, prefetch_objects
+
+
+class IdentityMapTests(TestCase):
+    def test_get_object(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+
+        with identity_map():
+            with self.assertNumQueries(1):
+                first = get_object(Partij, partij.uuid)
+                second = get_object(Partij, str(partij.uuid))
+
+        self.assertEqual(first, partij)
+        self.assertIs(first, second)
+
+    def test_does_not_exist(self):
+        missing = uuid.uuid4()
+
+        with identity_map():
+            with self.assertNumQueries(1):
+                for _ in range(2):
+                    with self.assertRaises(Partij.DoesNotExist):
+                        get_object(Partij, missing)
+
+            with self.assertNumQueries(0):
+                with self.assertRaises(Partij.DoesNotExist):
+                    get_object(Partij, "ongeldig")
+
+    def test_prefetch_objects(self):
+        partijen = [
+            PartijFactory.create(voorkeurs_digitaal_adres=None) for _ in range(3)
+        ]
+        missing = uuid.uuid4()
+
+        with identity_map():
+            with self.assertNumQueries(1):
+                prefetch_objects(
+                    Partij, [partij.uuid for partij in partijen] + [missing, "ongeldig"]
+                )
+                for partij in partijen:
+                    self.assertEqual(get_object(Partij, partij.uuid), partij)
+                with self.assertRaises(Partij.DoesNotExist):
+                    get_object(Partij, missing)
+
+            # the objects which are looked up before aren't queried again
+            with self.assertNumQueries(0):
+                prefetch_objects(Partij, [partij.uuid for partij in partijen])
+
+    def test_outside_identity_map(self):
+        partij = PartijFactory.create(voorkeurs_digitaal_adres=None)
+
+        with self.assertNumQueries(2):
+            prefetch_objects(Partij, [partij.uuid])
+            get_object(Partij, partij.uuid)
+            get_object(Partij, partij.uuid)
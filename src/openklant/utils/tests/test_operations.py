@@ -0,0 +1,124 @@
+from django.apps import apps
+from django.db import IntegrityError, connection, models
+from django.db.migrations.state import ProjectState
+from django.test import TestCase, TransactionTestCase
+
+from openklant.components.klantinteracties.models import Klantcontact
+from openklant.components.klantinteracties.models.tests.factories import (
+    KlantcontactFactory,
+)
+
+from ..operations import (
+    AddExtensionIndexConcurrently,
+    CreateExtensionIfAvailable,
+    create_index_if_not_exists,
+    get_index_validity,
+)
+
+INDEX_NAME = "test_extension_index"
+
+
+class CreateExtensionIfAvailableTests(TestCase):
+    def test_unavailable_extension_is_skipped(self):
+        operation = CreateExtensionIfAvailable("not_an_extension")
+        state = ProjectState.from_apps(apps)
+
+        with connection.schema_editor() as editor:
+            operation.database_forwards("utils", editor, state, state)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_extension WHERE extname = 'not_an_extension'"
+            )
+            self.assertIsNone(cursor.fetchone())
+
+
+class AddExtensionIndexConcurrentlyTests(TransactionTestCase):
+    def tearDown(self):
+        super().tearDown()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+    def apply(self, extension: str) -> ProjectState:
+        operation = AddExtensionIndexConcurrently(
+            model_name="klantcontact",
+            index=models.Index(fields=["kanaal"], name=INDEX_NAME),
+            extension=extension,
+        )
+        old_state = ProjectState.from_apps(apps)
+        new_state = old_state.clone()
+        operation.state_forwards("klantinteracties", new_state)
+
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_forwards(
+                "klantinteracties", editor, old_state, new_state
+            )
+
+        return new_state
+
+    def get_index_names(self) -> set[str]:
+        with connection.cursor() as cursor:
+            return set(
+                connection.introspection.get_constraints(
+                    cursor, "klantinteracties_klantcontact"
+                )
+            )
+
+    def test_index_is_created_if_extension_is_installed(self):
+        self.apply("plpgsql")
+
+        self.assertIn(INDEX_NAME, self.get_index_names())
+
+    def test_index_is_skipped_without_extension(self):
+        state = self.apply("not_an_extension")
+
+        self.assertNotIn(INDEX_NAME, self.get_index_names())
+        # the index is part of the state, so the migrations match the models
+        self.assertIn(
+            INDEX_NAME,
+            [
+                index.name
+                for index in state.models["klantinteracties", "klantcontact"].options[
+                    "indexes"
+                ]
+            ],
+        )
+
+
+class CreateIndexIfNotExistsTests(TransactionTestCase):
+    def tearDown(self):
+        super().tearDown()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+    def create(self) -> bool:
+        index = models.Index(fields=["kanaal"], name=INDEX_NAME)
+        with connection.schema_editor(atomic=False) as editor:
+            return create_index_if_not_exists(editor, Klantcontact, index)
+
+    def test_index_is_created_once(self):
+        self.assertTrue(self.create())
+        self.assertFalse(self.create())
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, "klantinteracties_klantcontact"
+            )
+        self.assertEqual(constraints[INDEX_NAME]["columns"], ["kanaal"])
+
+    def test_invalid_index_is_recreated(self):
+        # a concurrent build of a unique index fails on duplicates, which leaves an
+        # invalid index behind
+        KlantcontactFactory.create_batch(2, kanaal="email")
+        with self.assertRaises(IntegrityError), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY {INDEX_NAME} "
+                "ON klantinteracties_klantcontact (kanaal)"
+            )
+
+        with connection.schema_editor(atomic=False) as editor:
+            self.assertIs(get_index_validity(editor, INDEX_NAME), False)
+
+        self.assertTrue(self.create())
+        with connection.schema_editor(atomic=False) as editor:
+            self.assertIs(get_index_validity(editor, INDEX_NAME), True)
@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from rest_framework.views import APIView
+
+from openklant.components.klantinteracties.models import Partij
+from openklant.utils import replicas
+from openklant.utils.middleware import ReplicaMiddleware
+from openklant.utils.replicas import (
+    ReplicaRouter,
+    get_replica_lag,
+    request_replica,
+    select_replica,
+)
+
+
+class View(APIView):
+    pass
+
+
+class NonAPIView:
+    pass
+
+
+@override_settings(
+    DATABASE_REPLICAS=["replica_0", "replica_1"],
+    DB_REPLICA_MAX_LAG=5,
+    DB_REPLICA_PINNING_WINDOW=5,
+)
+class ReplicaMiddlewareTests(SimpleTestCase):
+    factory = RequestFactory(headers={"Authorization": "Token 123"})
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        patcher = patch(
+            "openklant.utils.replicas.get_replica_lag",
+            side_effect=lambda alias: {"replica_0": 0, "replica_1": 60}[alias],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_read_database(self, request, view=View) -> str | None:
+        view_func = view.as_view() if view is View else lambda request: None
+        view_func.cls = view
+
+        def get_response(request):
+            middleware.process_view(request, view_func, (), {})
+            return HttpResponse(ReplicaRouter().db_for_read(Partij) or "")
+
+        middleware = ReplicaMiddleware(get_response)
+        return middleware(request).content.decode() or None
+
+    def test_read_from_replica(self):
+        database = self.get_read_database(self.factory.get("/"))
+
+        # the lagging replica is skipped
+        self.assertEqual(database, "replica_0")
+        self.assertIsNone(request_replica.get())
+
+    def test_head_request(self):
+        self.assertEqual(self.get_read_database(self.factory.head("/")), "replica_0")
+
+    def test_non_api_view(self):
+        self.assertIsNone(self.get_read_database(self.factory.get("/"), NonAPIView))
+
+    def test_write_request(self):
+        self.assertIsNone(self.get_read_database(self.factory.post("/")))
+
+    def test_pinned_after_write(self):
+        self.get_read_database(self.factory.patch("/"))
+
+        self.assertIsNone(self.get_read_database(self.factory.get("/")))
+
+        # other clients still read from the replica
+        request = self.factory.get("/", headers={"Authorization": "Token 456"})
+        self.assertEqual(self.get_read_database(request), "replica_0")
+
+    @override_settings(DB_REPLICA_PINNING_WINDOW=0)
+    def test_pinning_disabled(self):
+        self.get_read_database(self.factory.patch("/"))
+
+        self.assertEqual(self.get_read_database(self.factory.get("/")), "replica_0")
+
+    def test_no_replica_available(self):
+        # the replicas can't be reached
+        with patch("openklant.utils.replicas.get_replica_lag", return_value=None):
+            self.assertIsNone(select_replica())
+            self.assertIsNone(self.get_read_database(self.factory.get("/")))
+
+
+class ReplicaRouterTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        replicas._replica_lags.clear()
+        self.addCleanup(replicas._replica_lags.clear)
+
+    def test_read_in_transaction(self):
+        token = request_replica.set("replica_0")
+        self.addCleanup(request_replica.reset, token)
+
+        # test cases are wrapped in a transaction
+        self.assertIsNone(ReplicaRouter().db_for_read(Partij))
+        self.assertEqual(ReplicaRouter().db_for_write(Partij), "default")
+
+    @override_settings(DB_REPLICA_LAG_CHECK_INTERVAL=10)
+    def test_replica_lag(self):
+        # the primary database is not in recovery, so it doesn't lag
+        with self.assertNumQueries(1):
+            self.assertEqual(get_replica_lag("default"), 0)
+
+        # the lag is checked once per interval
+        with self.assertNumQueries(0):
+            self.assertEqual(get_replica_lag("default"), 0)
+
+    def test_replica_not_streaming(self):
+        # a replica of which the WAL receiver is disconnected has replayed everything
+        # it received, which is no lag
+        with patch.object(replicas, "LAG_QUERY", "SELECT false, 0"):
+            self.assertIsNone(get_replica_lag("default"))
+
+        with override_settings(DATABASE_REPLICAS=["default"]):
+            self.assertIsNone(select_replica())
+
+    @override_settings(DATABASE_REPLICAS=["replica_0"])
+    def test_allow_migrate(self):
+        router = ReplicaRouter()
+
+        self.assertFalse(router.allow_migrate("replica_0", "klantinteracties"))
+        self.assertIsNone(router.allow_migrate("default", "klantinteracties"))
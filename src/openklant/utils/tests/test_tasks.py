@@ -0,0 +1,258 @@
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+from notifications_api_common.models import (
+    FailedNotification,
+    NotificationsConfig,
+    NotificationTypes,
+)
+from structlog.testing import capture_logs
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from openklant.cloud_events.constants import ZAAK_GEKOPPELD, ZAAK_ONTKOPPELD
+from openklant.utils.metrics import (
+    count_outbox_notifications,
+    outbox_coalesced_counter,
+    outbox_delivery_lag_histogram,
+)
+from openklant.utils.models import OutboxNotification
+from openklant.utils.notifications import add_to_outbox
+from openklant.utils.tasks import send_outbox_notifications
+
+NOTIFICATIONS_API_ROOT = "https://notificaties-api.vng.cloud/api/v1/"
+
+
+def cloudevent(type, zaak="zaak-1", link_to="https://example.com/onderwerpobject/1"):
+    return {"type": type, "subject": zaak, "data": {"linkTo": link_to}}
+
+
+@override_settings(NOTIFICATIONS_OUTBOX_BATCH_SIZE=2, LOG_NOTIFICATIONS_IN_DB=True)
+class SendOutboxNotificationsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        service = Service.objects.create(
+            api_root=NOTIFICATIONS_API_ROOT,
+            api_type=APITypes.nrc,
+            client_id="test",
+            secret="test",
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.save()
+
+    def test_send_in_batches(self):
+        add_to_outbox([{"kanaal": "partijen", "nummer": i} for i in range(5)])
+        add_to_outbox([{"type": "cloudevent"}], NotificationTypes.cloudevent)
+
+        with requests_mock.Mocker() as m:
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=201)
+            m.post(f"{NOTIFICATIONS_API_ROOT}cloudevents", status_code=201)
+
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                send_outbox_notifications()
+
+        self.assertEqual(
+            [request.json() for request in m.request_history],
+            [{"kanaal": "partijen", "nummer": i} for i in range(5)]
+            + [{"type": "cloudevent"}],
+        )
+        self.assertEqual(
+            m.request_history[-1].headers["Content-Type"],
+            "application/cloudevents+json",
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+        self.assertFalse(FailedNotification.objects.exists())
+        self.assertEqual(callbacks, [])
+
+    @patch("openklant.utils.tasks.send_notification.delay")
+    def test_failed_notification_is_retried(self, mock_delay):
+        add_to_outbox([{"kanaal": "partijen"}])
+
+        with requests_mock.Mocker() as m:
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=500)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                send_outbox_notifications()
+
+        self.assertFalse(OutboxNotification.objects.exists())
+        failed_notification = FailedNotification.objects.get()
+        self.assertEqual(failed_notification.message, {"kanaal": "partijen"})
+        mock_delay.assert_called_once_with(
+            {"kanaal": "partijen"}, failed_notification.pk
+        )
+
+    def test_notifications_are_claimed_with_skip_locked(self):
+        add_to_outbox([{"kanaal": "partijen"}])
+
+        with (
+            requests_mock.Mocker() as m,
+            CaptureQueriesContext(connection) as context,
+        ):
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=201)
+
+            send_outbox_notifications()
+
+        self.assertTrue(
+            any("FOR UPDATE SKIP LOCKED" in query["sql"] for query in context)
+        )
+
+    def test_notifications_are_sent_after_the_claim(self):
+        add_to_outbox([{"kanaal": "partijen"}])
+        savepoints = len(connection.savepoint_ids)
+
+        def notificaties(request, context):
+            # the transaction which claims the batch is committed already
+            self.assertEqual(len(connection.savepoint_ids), savepoints)
+            self.assertIsNotNone(OutboxNotification.objects.get().claimed)
+            context.status_code = 201
+            return {}
+
+        with requests_mock.Mocker() as m:
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", json=notificaties)
+
+            send_outbox_notifications()
+
+        self.assertEqual(m.call_count, 1)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    @override_settings(NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT=60)
+    def test_claimed_notifications_are_skipped(self):
+        with freeze_time("2025-10-10T00:00:00Z"):
+            add_to_outbox([{"kanaal": "partijen", "nummer": 1}])
+            OutboxNotification.objects.update(claimed=timezone.now())
+
+        with freeze_time("2025-10-10T00:00:30Z"):
+            add_to_outbox([{"kanaal": "partijen", "nummer": 2}])
+
+        with requests_mock.Mocker() as m:
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=201)
+
+            with freeze_time("2025-10-10T00:00:30Z"):
+                send_outbox_notifications()
+
+            # the claim of the first notification didn't expire yet
+            self.assertEqual(
+                [request.json() for request in m.request_history],
+                [{"kanaal": "partijen", "nummer": 2}],
+            )
+
+            with freeze_time("2025-10-10T00:01:00Z"):
+                send_outbox_notifications()
+
+        self.assertEqual(
+            m.request_history[-1].json(), {"kanaal": "partijen", "nummer": 1}
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_client_unavailable(self):
+        add_to_outbox([{"kanaal": "partijen"}])
+
+        with (
+            patch.object(NotificationsConfig, "get_client", return_value=None),
+            capture_logs() as cap_logs,
+        ):
+            send_outbox_notifications()
+
+        self.assertEqual(OutboxNotification.objects.count(), 1)
+        self.assertEqual(
+            [(log["event"], log["log_level"], log["outbox_size"]) for log in cap_logs],
+            [("notifications_client_unavailable", "error", 1)],
+        )
+
+    @override_settings(NOTIFICATIONS_OUTBOX_BATCH_SIZE=10)
+    def test_linked_and_unlinked_cloudevents_are_coalesced(self):
+        add_to_outbox(
+            [
+                cloudevent(ZAAK_GEKOPPELD),
+                cloudevent(ZAAK_GEKOPPELD, zaak="zaak-2"),
+                cloudevent(ZAAK_ONTKOPPELD),
+                # unlinked before it was linked (again) is sent
+                cloudevent(ZAAK_ONTKOPPELD, zaak="zaak-3"),
+                cloudevent(ZAAK_GEKOPPELD, zaak="zaak-3"),
+            ],
+            NotificationTypes.cloudevent,
+        )
+
+        with (
+            patch.object(
+                outbox_coalesced_counter, "add", wraps=outbox_coalesced_counter.add
+            ) as mock_add,
+            requests_mock.Mocker() as m,
+        ):
+            m.post(f"{NOTIFICATIONS_API_ROOT}cloudevents", status_code=201)
+
+            send_outbox_notifications()
+
+        self.assertEqual(
+            [request.json() for request in m.request_history],
+            [
+                cloudevent(ZAAK_GEKOPPELD, zaak="zaak-2"),
+                cloudevent(ZAAK_ONTKOPPELD, zaak="zaak-3"),
+                cloudevent(ZAAK_GEKOPPELD, zaak="zaak-3"),
+            ],
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+        mock_add.assert_called_once_with(2)
+
+    @override_settings(NOTIFICATIONS_OUTBOX_COALESCE_WINDOW=60)
+    def test_cloudevents_stay_in_outbox_during_window(self):
+        with freeze_time("2025-10-10T00:00:00Z"):
+            add_to_outbox([cloudevent(ZAAK_GEKOPPELD)], NotificationTypes.cloudevent)
+            add_to_outbox([{"kanaal": "partijen"}])
+
+        with requests_mock.Mocker() as m:
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=201)
+            m.post(f"{NOTIFICATIONS_API_ROOT}cloudevents", status_code=201)
+
+            with freeze_time("2025-10-10T00:00:30Z"):
+                send_outbox_notifications()
+
+            self.assertEqual(
+                [request.url for request in m.request_history],
+                [f"{NOTIFICATIONS_API_ROOT}notificaties"],
+            )
+            self.assertEqual(OutboxNotification.objects.count(), 1)
+
+            with freeze_time("2025-10-10T00:01:00Z"):
+                send_outbox_notifications()
+
+            self.assertEqual(m.call_count, 2)
+            self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_metrics(self):
+        with freeze_time("2025-10-10T00:00:00Z"):
+            add_to_outbox([{"kanaal": "partijen"}] * 2)
+            add_to_outbox([cloudevent(ZAAK_GEKOPPELD)], NotificationTypes.cloudevent)
+
+        observations = count_outbox_notifications(MagicMock())
+
+        self.assertEqual(
+            sorted((obs.attributes["type"], obs.value) for obs in observations),
+            [("cloudevent", 1), ("notification", 2)],
+        )
+
+        with (
+            patch.object(
+                outbox_delivery_lag_histogram,
+                "record",
+                wraps=outbox_delivery_lag_histogram.record,
+            ) as mock_record,
+            requests_mock.Mocker() as m,
+            freeze_time("2025-10-10T00:00:05Z"),
+        ):
+            m.post(f"{NOTIFICATIONS_API_ROOT}notificaties", status_code=201)
+            m.post(f"{NOTIFICATIONS_API_ROOT}cloudevents", status_code=201)
+
+            send_outbox_notifications()
+
+        self.assertEqual(mock_record.call_count, 3)
+        mock_record.assert_called_with(5.0, {"type": "cloudevent"})
+        self.assertEqual(count_outbox_notifications(MagicMock()), ())